@@ -1,6 +1,7 @@
 import unittest
 import sqlite3
 from PySide6.QtWidgets import QApplication
+from Core.database import DatabaseManager
 from Features.Budget_Kategorie.view import (
     BudgetBarChartView,
 )
@@ -66,6 +67,9 @@ class TestBudgetBarChartView(unittest.TestCase):
 
         cls.connection.commit()
 
+        # Der DatabaseManager legt beim Start die Summentabelle an
+        cls.db_manager = DatabaseManager(cls.db_path)
+
         # QApplication nur einmal starten
         cls.app = QApplication([])
 
@@ -74,6 +78,7 @@ class TestBudgetBarChartView(unittest.TestCase):
         """
         Schließt die Verbindung zur Testdatenbank und entfernt die Datenbankdatei.
         """
+        cls.db_manager.close()
         cls.connection.close()
         import os
 
@@ -86,7 +91,7 @@ class TestBudgetBarChartView(unittest.TestCase):
         """
         Erstellt eine Instanz von BudgetBarChartView mit der Testdatenbank.
         """
-        self.view = BudgetBarChartView(self)  # Instanz der BudgetBarChartView
+        self.view = BudgetBarChartView(self.db_manager)  # Instanz der BudgetBarChartView
 
     def tearDown(self):
         """
@@ -94,13 +99,24 @@ class TestBudgetBarChartView(unittest.TestCase):
         """
         self.view.deleteLater()  # Entfernt die View aus der Anwendung, falls nötig
 
-    def fetchall(self, query, params=None):
+    def test_fetch_category_data(self):
         """
-        Führt eine SELECT-Abfrage auf der Testdatenbank aus und gibt die Ergebnisse zurück.
+        Testet, ob die Summentabelle dieselben Werte liefert wie die Summe über 'Haupt'.
         """
-        if params:
-            return self.cursor.execute(query, params).fetchall()
-        return self.cursor.execute(query).fetchall()
+        expected = self.cursor.execute(
+            """
+            SELECT Kategorie.Kategorie, Kategorie.Budget, COALESCE(SUM(Haupt.Transaktion), 0) / 100.0
+            FROM Kategorie
+            LEFT JOIN Haupt ON Kategorie.Kategorie_ID = Haupt.Kategorie_FK
+            WHERE Kategorie.Budget > 0
+            GROUP BY Kategorie.Kategorie_ID, Kategorie.Kategorie, Kategorie.Budget
+            """
+        ).fetchall()
+        data = self.view.fetch_category_data("Alle Kategorien")
+        self.assertEqual(sorted(data), sorted(expected))
+
+        miete = self.view.fetch_category_data("Miete")
+        self.assertEqual([row for row in expected if row[0] == "Miete"], miete)
 
     def test_load_categories(self):
         """
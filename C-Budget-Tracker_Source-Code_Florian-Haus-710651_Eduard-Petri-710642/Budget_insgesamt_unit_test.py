@@ -28,12 +28,8 @@ class TestBudgetDiagrammView(unittest.TestCase):
         self.db_manager = MagicMock()
 
         # Beispieldaten für Budget und Ausgaben
-        self.db_manager.execute.return_value.fetchall.return_value = [
-            (1000,)
-        ]  # Mock für alle Abfragen
-        self.db_manager.execute.return_value.fetchone.return_value = (
-            1000,
-        )  # Mock für einzelne Abfragen
+        self.db_manager.fetch_total_budget.return_value = 1000
+        self.db_manager.fetch_month_expenses.return_value = 1000
 
         # Instanz von BudgetDiagrammView erstellen
         self.view = BudgetDiagrammView(self.db_manager)
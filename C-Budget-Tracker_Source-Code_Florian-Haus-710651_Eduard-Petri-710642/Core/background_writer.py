@@ -0,0 +1,133 @@
+import queue
+import sqlite3
+import threading
+from concurrent.futures import Future
+
+
+class BackgroundWriter:
+    """
+    Führt alle schreibenden Datenbankoperationen in einem eigenen Thread aus.
+
+    Aufträge werden über eine Warteschlange übergeben. Der Thread sammelt alle
+    bereits wartenden Aufträge ein und schreibt sie gemeinsam in einer einzigen
+    Transaktion (Group Commit). Jeder Auftrag erhält ein `Future`, das nach dem
+    Commit erfüllt wird.
+    """
+
+    def __init__(self, db_path, max_batch=200, on_connect=None, on_commit=None):
+        """
+        Args:
+            on_connect (callable): Wird im Writer-Thread mit der neuen Verbindung
+                aufgerufen (z.B. für temporäre Trigger)
+            on_commit (callable): Wird nach jedem Commit mit der Verbindung
+                aufgerufen, noch vor den Futures
+        """
+        self.db_path = db_path
+        self.max_batch = max_batch
+        self.on_connect = on_connect
+        self.on_commit = on_commit
+        self._queue = queue.Queue()
+        self._ready = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name="DatabaseWriter", daemon=True
+        )
+        self._thread.start()
+        self._ready.wait()
+
+    def submit(self, job):
+        """
+        Stellt einen Auftrag in die Warteschlange.
+
+        Args:
+            job (callable): Funktion, die die Writer-Verbindung erhält und
+                ein Ergebnis zurückgibt
+
+        Returns:
+            Future: Wird nach dem Commit mit dem Ergebnis des Auftrags erfüllt
+        """
+        future = Future()
+        self._queue.put((job, future))
+        return future
+
+    def flush(self, timeout=None):
+        """Wartet, bis alle bisher eingestellten Aufträge geschrieben wurden."""
+        self.submit(lambda conn: None).result(timeout)
+
+    def _run(self):
+        # Autocommit-Modus: Transaktionen werden hier explizit gesteuert
+        conn = sqlite3.connect(self.db_path, isolation_level=None)
+        conn.execute("PRAGMA busy_timeout = 5000")
+        if self.on_connect:
+            try:
+                self.on_connect(conn)
+            except Exception as e:
+                print(f"Fehler beim Einrichten der Writer-Verbindung: {e}")
+        self._ready.set()
+
+        while True:
+            item = self._queue.get()
+            if item is None:
+                break
+
+            batch = [item]
+            stop = False
+            while len(batch) < self.max_batch:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    stop = True
+                    break
+                batch.append(item)
+
+            self._write_batch(conn, batch)
+            if stop:
+                break
+
+        conn.close()
+
+    def _write_batch(self, conn, batch):
+        """Schreibt einen Stapel von Aufträgen in einer gemeinsamen Transaktion."""
+        results = []
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            for job, future in batch:
+                # Savepoint pro Auftrag: ein Fehler verwirft nur diesen Auftrag
+                conn.execute("SAVEPOINT auftrag")
+                try:
+                    results.append((future, job(conn), None))
+                    conn.execute("RELEASE auftrag")
+                except Exception as e:
+                    conn.execute("ROLLBACK TO auftrag")
+                    conn.execute("RELEASE auftrag")
+                    results.append((future, None, e))
+            conn.execute("COMMIT")
+        except sqlite3.Error as e:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            print(f"Fehler beim gemeinsamen Schreiben: {e}")
+            for job, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        # Hook vor den Futures: Wer auf ein Future wartet, sieht
+        # danach bereits den Zustand nach dem Commit (z.B. einen invalidierten Cache)
+        if self.on_commit:
+            try:
+                self.on_commit(conn)
+            except Exception as e:
+                print(f"Fehler nach dem Commit: {e}")
+
+        for future, result, error in results:
+            if error is not None:
+                print(f"Fehler bei der Datenbankoperation: {error}")
+                future.set_exception(error)
+            else:
+                future.set_result(result)
+
+    def close(self):
+        """Schreibt alle ausstehenden Aufträge und beendet den Thread."""
+        self._queue.put(None)
+        self._thread.join()
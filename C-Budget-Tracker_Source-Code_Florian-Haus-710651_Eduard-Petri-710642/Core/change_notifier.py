@@ -0,0 +1,44 @@
+from PySide6.QtCore import QObject, Qt, QTimer, Signal
+
+from Core.events import ChangeSet
+
+
+class ChangeNotifier(QObject):
+    """
+    Leitet Änderungs-Ereignisse des DatabaseManagers an die GUI weiter.
+
+    Ereignisse können aus beliebigen Threads kommen (Writer-Thread, Import).
+    Sie werden im GUI-Thread gesammelt und einmal pro Durchlauf der
+    Event-Loop als gemeinsames `ChangeSet` über `changed` gemeldet.
+    """
+
+    changed = Signal(object)
+
+    # Interne Weiterleitung in den GUI-Thread
+    _received = Signal(object)
+
+    def __init__(self, db_manager, parent=None):
+        super().__init__(parent)
+        self.db_manager = db_manager
+        self._pending = []
+        self._scheduled = False
+        self._received.connect(self._collect, Qt.QueuedConnection)
+
+        forward = self._received.emit
+        db_manager.subscribe(forward)
+        # Beim Löschen des Objekts keine Ereignisse mehr annehmen
+        self.destroyed.connect(lambda: db_manager.unsubscribe(forward))
+
+    def _collect(self, events):
+        self._pending.extend(events)
+        if not self._scheduled:
+            # Alle Ereignisse, die bis dahin eintreffen, zusammen melden
+            self._scheduled = True
+            QTimer.singleShot(0, self._flush)
+
+    def _flush(self):
+        self._scheduled = False
+        changes = ChangeSet(self._pending)
+        self._pending = []
+        if changes:
+            self.changed.emit(changes)
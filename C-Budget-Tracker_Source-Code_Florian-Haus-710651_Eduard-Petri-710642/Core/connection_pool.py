@@ -0,0 +1,126 @@
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+
+
+class ConnectionPool:
+    """
+    Begrenzter Pool von SQLite-Lese-Verbindungen.
+
+    Jede Verbindung behält ihren eigenen Page-Cache, solange sie im Pool liegt.
+    Verbindungen werden mit `checkout()` entnommen und mit `checkin()` zurückgegeben.
+    """
+
+    def __init__(self, db_path, max_size=4, cache_size_kib=8192, timeout=5.0):
+        self.db_path = db_path
+        self.max_size = max_size
+        self.cache_size_kib = cache_size_kib
+        self.timeout = timeout
+
+        self._idle = queue.LifoQueue(maxsize=max_size)
+        self._lock = threading.Lock()
+        self._created = 0
+        self._closed = False
+
+        # Zähler für die Pool-Statistik
+        self.hits = 0
+        self.misses = 0
+
+    def _connect(self):
+        """Öffnet eine neue Verbindung mit eigenem Page-Cache."""
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        # Negativer Wert = Größe in KiB statt in Seiten
+        conn.execute(f"PRAGMA cache_size = -{int(self.cache_size_kib)}")
+        conn.execute("PRAGMA query_only = ON")
+        return conn
+
+    def checkout(self):
+        """
+        Entnimmt eine Verbindung aus dem Pool.
+
+        Liegt keine freie Verbindung bereit und ist das Limit noch nicht erreicht,
+        wird eine neue geöffnet (Miss). Sonst wird gewartet, bis eine zurückkommt.
+        """
+        if self._closed:
+            raise sqlite3.ProgrammingError("Der Verbindungspool wurde geschlossen.")
+
+        try:
+            conn = self._idle.get_nowait()
+            with self._lock:
+                self.hits += 1
+            return conn
+        except queue.Empty:
+            pass
+
+        with self._lock:
+            can_create = self._created < self.max_size
+            if can_create:
+                self._created += 1
+                self.misses += 1
+
+        if can_create:
+            try:
+                return self._connect()
+            except sqlite3.Error:
+                with self._lock:
+                    self._created -= 1
+                raise
+
+        # Limit erreicht: auf eine zurückgegebene Verbindung warten
+        try:
+            conn = self._idle.get(timeout=self.timeout)
+        except queue.Empty:
+            raise sqlite3.OperationalError(
+                "Keine freie Datenbankverbindung im Pool verfügbar."
+            )
+        with self._lock:
+            self.hits += 1
+        return conn
+
+    def checkin(self, conn):
+        """Gibt eine Verbindung an den Pool zurück."""
+        if self._closed:
+            conn.close()
+            return
+        # Offene Lesetransaktionen beenden, damit der nächste Nutzer aktuelle Daten sieht
+        if conn.in_transaction:
+            conn.rollback()
+        try:
+            self._idle.put_nowait(conn)
+        except queue.Full:
+            conn.close()
+            with self._lock:
+                self._created -= 1
+
+    @contextmanager
+    def connection(self):
+        """Kontextmanager für `checkout()`/`checkin()`."""
+        conn = self.checkout()
+        try:
+            yield conn
+        finally:
+            self.checkin(conn)
+
+    def stats(self):
+        """Gibt die Pool-Statistik als Dictionary zurück."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "open": self._created,
+                "idle": self._idle.qsize(),
+                "max_size": self.max_size,
+            }
+
+    def close(self):
+        """Schließt alle freien Verbindungen des Pools."""
+        self._closed = True
+        while True:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            conn.close()
+            with self._lock:
+                self._created -= 1
@@ -0,0 +1,170 @@
+import contextlib
+import itertools
+import threading
+
+from PySide6.QtCore import QObject, QRunnable, Qt, QThreadPool, Signal
+
+
+class _LoadJob(QRunnable):
+    """Führt eine Leseabfrage in einem Thread des Pools aus."""
+
+    def __init__(self, loader, request_id, key, fetch):
+        super().__init__()
+        self.loader = loader
+        self.request_id = request_id
+        self.key = key
+        self.fetch = fetch
+
+    def cancelled(self):
+        """True, sobald die Anfrage ersetzt oder abgebrochen wurde."""
+        return not self.loader._is_latest(self.key, self.request_id)
+
+    def run(self):
+        # Bereits überholte Anfragen gar nicht erst ausführen
+        if not self.loader._should_run(self.key, self.request_id):
+            return
+        # Wird die Anfrage ersetzt, bricht SQLite ihre laufende Abfrage ab;
+        # die Exception wird wie ein überholtes Ergebnis verworfen (_deliver)
+        cancellable = getattr(self.loader.db_manager, "cancellable", None)
+        scope = cancellable(self.cancelled) if cancellable else contextlib.nullcontext()
+        try:
+            with scope:
+                result, ok = self.fetch(), True
+        except Exception as e:
+            result, ok = e, False
+        try:
+            self.loader._finished.emit(self.request_id, ok, result)
+        except RuntimeError:
+            pass  # Loader wurde inzwischen gelöscht
+
+
+class DataLoader(QObject):
+    """
+    Asynchroner Lesezugriff auf den DatabaseManager für die Views.
+
+    Abfragen laufen in einem QThreadPool; jeder Thread nutzt eine eigene
+    Verbindung aus dem Lese-Pool des DatabaseManagers. Das Ergebnis wird über
+    ein Signal in den GUI-Thread gebracht und dort an die Callback-Funktion
+    übergeben, sodass die Views ihren bisherigen Zeichen-Code behalten.
+
+    Jede Anfrage hat einen Schlüssel (z.B. pro View und Bereich). Eine neue
+    Anfrage mit demselben Schlüssel ersetzt die ältere: Wartet diese noch,
+    wird sie übersprungen, läuft sie bereits, bricht SQLite ihre Abfrage ab
+    (DatabaseManager.cancellable()) und das Ergebnis wird verworfen.
+    """
+
+    # Anfrage-ID, Erfolg, Ergebnis bzw. Exception
+    _finished = Signal(int, bool, object)
+
+    def __init__(self, db_manager, parent=None, max_threads=None):
+        super().__init__(parent)
+        self.db_manager = db_manager
+        self.thread_pool = QThreadPool(self)
+        if max_threads is None:
+            max_threads = db_manager.read_pool.max_size
+        self.thread_pool.setMaxThreadCount(max_threads)
+
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._latest = {}  # Schlüssel -> neueste Anfrage-ID
+        self._pending = {}  # Anfrage-ID -> (Schlüssel, Callback, Fehler-Callback)
+        self._stats = {"submitted": 0, "delivered": 0, "skipped": 0, "discarded": 0}
+
+        self._finished.connect(self._deliver, Qt.QueuedConnection)
+
+    def load(self, key, fetch, callback, error_callback=None):
+        """
+        Führt `fetch()` im Hintergrund aus und ruft danach `callback(ergebnis)`
+        im GUI-Thread auf.
+
+        Args:
+            key: Schlüssel der Anfrage; ältere Anfragen mit demselben Schlüssel
+                werden abgebrochen
+            fetch (callable): Liest die Daten, z.B. eine Methode des DatabaseManagers
+            callback (callable): Erhält das Ergebnis im GUI-Thread
+            error_callback (callable): Erhält die Exception (Standard: Ausgabe)
+
+        Returns:
+            int: ID der Anfrage
+        """
+        request_id = next(self._ids)
+        with self._lock:
+            self._latest[key] = request_id
+            self._pending[request_id] = (key, callback, error_callback)
+            self._stats["submitted"] += 1
+        self.thread_pool.start(_LoadJob(self, request_id, key, fetch))
+        return request_id
+
+    def _should_run(self, key, request_id):
+        """Prüft im Worker-Thread, ob die Anfrage noch die neueste ihres Schlüssels ist."""
+        with self._lock:
+            if self._latest.get(key) == request_id:
+                return True
+            self._pending.pop(request_id, None)
+            self._stats["skipped"] += 1
+            return False
+
+    def _is_latest(self, key, request_id):
+        with self._lock:
+            return self._latest.get(key) == request_id
+
+    def cancel(self, key):
+        """Bricht die laufende Anfrage eines Schlüssels ab (ihr Ergebnis wird verworfen)."""
+        with self._lock:
+            self._latest.pop(key, None)
+
+    def _deliver(self, request_id, ok, result):
+        with self._lock:
+            entry = self._pending.pop(request_id, None)
+            if entry is None or self._latest.get(entry[0]) != request_id:
+                # Inzwischen durch eine neuere Anfrage ersetzt oder abgebrochen
+                self._stats["discarded"] += 1
+                return
+            key, callback, error_callback = entry
+            del self._latest[key]
+            self._stats["delivered"] += 1
+
+        if ok:
+            self._call(callback, result)
+        elif error_callback:
+            self._call(error_callback, result)
+        else:
+            print(f"Fehler beim Laden der Daten: {result}")
+
+    @staticmethod
+    def _call(callback, result):
+        try:
+            callback(result)
+        except RuntimeError as e:
+            # Die View wurde geschlossen, bevor die Daten ankamen
+            print(f"Daten konnten nicht angezeigt werden: {e}")
+
+    def wait(self, timeout_ms=-1):
+        """Wartet, bis alle gestarteten Abfragen beendet sind (z.B. in Tests)."""
+        return self.thread_pool.waitForDone(timeout_ms)
+
+    def shutdown(self):
+        """Verwirft alle offenen Anfragen und wartet auf laufende Threads."""
+        with self._lock:
+            self._latest.clear()
+            self._pending.clear()
+        self.thread_pool.clear()
+        self.thread_pool.waitForDone()
+
+    def stats(self):
+        """Gibt gestartete, zugestellte, übersprungene und verworfene Anfragen zurück."""
+        with self._lock:
+            return dict(self._stats, active=self.thread_pool.activeThreadCount())
+
+
+def load_data(loader, key, fetch, callback):
+    """
+    Lädt Daten über einen DataLoader oder, ohne Loader, direkt im GUI-Thread.
+
+    So funktionieren die Views auch ohne Hintergrund-Threads (z.B. in Tests
+    mit einem gemockten DatabaseManager).
+    """
+    if loader is None:
+        callback(fetch())
+        return None
+    return loader.load(key, fetch, callback)
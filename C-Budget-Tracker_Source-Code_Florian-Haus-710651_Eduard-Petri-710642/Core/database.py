@@ -1,11 +1,287 @@
+import contextlib
+import re
 import sqlite3
+import threading
+import time
+from array import array
+from datetime import datetime
+from itertools import islice
+
+from Core.background_writer import BackgroundWriter
+from Core.connection_pool import ConnectionPool
+from Core.dates import date_key_range, normalize_date
+from Core.events import collect_changes, setup_change_log
+from Core.migrations import DAY_KEY_SQL, migrate, rebuild_category_months
+from Core.money import from_cents, to_cents
+from Core.profiler import QueryProfiler
+from Core.query_cache import QueryCache
+from Core.search_cache import SearchCache
+from Core.search_pager import SearchPager
+from Core.search_query import compile_query, parse_query
+
+# Spaltenreihenfolge für Transaktionen, die als Tupel übergeben werden
+TRANSACTION_FIELDS = (
+    "Transaktion",
+    "Name_Transaktion",
+    "Kategorie_FK",
+    "Ausgabe_Einnahme",
+    "Datum",
+)
+
+# Einfügen einer Transaktion in der Reihenfolge von TRANSACTION_FIELDS.
+# Der Tagesschlüssel wird gleich mitgeschrieben, damit der Trigger aus
+# Migration 6 keine zusätzliche UPDATE-Anweisung pro Zeile ausführen muss.
+INSERT_TRANSACTION = f"""
+INSERT INTO Haupt (Transaktion, Name_Transaktion, Kategorie_FK, Ausgabe_Einnahme, Datum, Datum_Tag)
+VALUES (?1, ?2, ?3, ?4, ?5, {DAY_KEY_SQL.format(date="?5")})
+"""
+
+# Anweisungen, die nur lesen und daher nie über den Writer-Thread laufen
+READ_KEYWORDS = ("SELECT", "WITH", "PRAGMA", "EXPLAIN", "VALUES")
+
+# Zeilen pro Seite beim seitenweisen Lesen der Übersicht
+PAGE_SIZE = 200
+
+# SQLite-Anweisungen zwischen zwei Prüfungen, ob eine Abfrage abgebrochen wurde
+PROGRESS_STEPS = 1000
+
+# Zeilen der Übersicht: (ID, Betrag in Euro, Name, Kategorie, Typ, Datum, Tag).
+# Tag ist der Tagesschlüssel yyyymmdd, nach dem die Views gruppieren.
+TRANSACTION_COLUMNS = """Haupt.ID,
+            Haupt.Transaktion / 100.0,  -- gespeichert in Cent
+            Haupt.Name_Transaktion,
+            Kategorie.Kategorie,
+            CAST(Haupt.Ausgabe_Einnahme AS INTEGER),
+            Haupt.Datum,
+            Haupt.Datum_Tag"""
+TRANSACTION_WIDTH = 7  # Anzahl der Spalten in TRANSACTION_COLUMNS
+TRANSACTION_ROWS = f"""
+        SELECT {TRANSACTION_COLUMNS}
+        FROM Haupt
+        LEFT JOIN Kategorie ON Haupt.Kategorie_FK = Kategorie.Kategorie_ID
+"""
+
+# Unscharfe Suche: Anzahl der ähnlichsten Namen und ihre Mindestähnlichkeit
+FUZZY_LIMIT = 10
+FUZZY_MIN_SIMILARITY = 0.3
+
+# Ähnlichste Suchwörter (Transaktions- und Kategorienamen) zu einem Begriff.
+# Ähnlichkeit ist der Dice-Koeffizient der Trigrammmengen:
+# 2 * gemeinsame / (Trigramme des Begriffs + Trigramme des Worts).
+# Gelesen werden nur die Trigramme des Begriffs im Index Suchwort_Trigramm.
+FUZZY_MATCHES = """
+        WITH Anfrage(Trigramm) AS (
+            SELECT DISTINCT substr(' ' || lower(?1) || ' ', n, 3)
+            FROM Trigramm_Position WHERE n <= length(?1)
+        ),
+        Kandidat(Suchwort_ID, Gemeinsam) AS (
+            SELECT Suchwort_Trigramm.Suchwort_ID, COUNT(*)
+            FROM Anfrage
+            JOIN Suchwort_Trigramm ON Suchwort_Trigramm.Trigramm = Anfrage.Trigramm
+            GROUP BY Suchwort_Trigramm.Suchwort_ID
+        )
+        SELECT Suchwort.Wort,
+            2.0 * Kandidat.Gemeinsam
+                / ((SELECT COUNT(*) FROM Anfrage) + Suchwort.Trigramme) AS Aehnlichkeit
+        FROM Kandidat
+        JOIN Suchwort ON Suchwort.Suchwort_ID = Kandidat.Suchwort_ID
+        WHERE Aehnlichkeit >= ?2
+        ORDER BY Aehnlichkeit DESC, Suchwort.Anzahl DESC
+        LIMIT ?3
+"""
+
+# Maximale Anzahl Parameter pro IN-Liste (Grenze älterer SQLite-Versionen: 999)
+MAX_IN_PARAMS = 500
 
 
 class DatabaseManager:
-    def __init__(self, db_path):
+    def __init__(
+        self,
+        db_path,
+        read_pool_size=4,
+        background_writer=False,
+        query_cache_kib=4096,
+        search_cache_kib=8192,
+    ):
+        """
+        Args:
+            db_path (str): Pfad zur SQLite-Datenbank
+            read_pool_size (int): Maximale Anzahl lesender Verbindungen
+            background_writer (bool): Schaltet die Datenbank in den WAL-Modus und
+                führt alle Schreibzugriffe in einem eigenen Thread aus
+            query_cache_kib (int): Speichergrenze des Abfrage-Caches (0 = aus)
+            search_cache_kib (int): Speichergrenze des Such-Caches (0 = aus)
+        """
         self.db_path = db_path
-        self.connection = sqlite3.connect(db_path)
+        # Einzige schreibende Verbindung (im Writer-Modus nur noch lesend genutzt).
+        # Sie darf auch aus Worker-Threads (z.B. beim Import) genutzt werden,
+        # der Zugriff wird dann über die Sperre serialisiert.
+        self.connection = sqlite3.connect(db_path, check_same_thread=False)
         self.cursor = self.connection.cursor()
+        self._write_lock = threading.RLock()
+        # Schema auf den aktuellen Stand bringen (Tabellen, Indizes)
+        self.schema_version = migrate(self.connection)
+        # Volltextindex nur nutzen, wenn die Migration ihn anlegen konnte
+        self.fts_enabled = (
+            self.connection.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'Haupt_FTS'"
+            ).fetchone()
+            is not None
+        )
+
+        # Laufzeiten aller Abfragen und Slow-Query-Log (siehe Core.profiler)
+        self.profiler = QueryProfiler()
+
+        # Ergebnisse von Leseabfragen, gültig bis zum nächsten Schreibzugriff
+        self.query_cache = QueryCache(max_bytes=query_cache_kib * 1024)
+        # Treffer der letzten Suchbegriffe, auch für längere Begriffe nutzbar
+        self.search_cache = SearchCache(max_bytes=search_cache_kib * 1024)
+
+        # Änderungsprotokoll der Schreibverbindung für die Änderungs-Ereignisse
+        self._subscribers = []
+        setup_change_log(self.connection)
+
+        self.writer = None
+        if background_writer:
+            # WAL: Leser blockieren nicht hinter dem Schreiber
+            self.connection.execute("PRAGMA journal_mode = WAL")
+            self.connection.execute("PRAGMA synchronous = NORMAL")
+            self.writer = BackgroundWriter(
+                db_path, on_connect=setup_change_log, on_commit=self._after_commit
+            )
+
+        # Lesende Verbindungen kommen aus einem eigenen Pool
+        self.read_pool = ConnectionPool(db_path, max_size=read_pool_size)
+        # Abbruch-Prüfung für alle Leseabfragen eines Threads (siehe cancellable())
+        self._cancel_scope = threading.local()
+
+    @contextlib.contextmanager
+    def cancellable(self, cancelled):
+        """
+        Bricht alle Leseabfragen im aktuellen Thread ab, sobald `cancelled()`
+        True zurückgibt (wie der Parameter `cancelled` von _query()).
+
+        So lassen sich auch Ladefunktionen abbrechen, die mehrere Abfragen
+        zusammensetzen (z.B. im DataLoader).
+        """
+        previous = getattr(self._cancel_scope, "cancelled", None)
+        self._cancel_scope.cancelled = cancelled
+        try:
+            yield
+        finally:
+            self._cancel_scope.cancelled = previous
+
+    def cancel_check(self, cancelled=None):
+        """Gibt `cancelled` zurück, ohne Angabe die Prüfung aus cancellable()."""
+        if cancelled is None:
+            cancelled = getattr(self._cancel_scope, "cancelled", None)
+        return cancelled
+
+    def _query(self, query, params=(), fetch="all", cancelled=None):
+        """
+        Führt eine Leseabfrage über eine Verbindung aus dem Lese-Pool aus.
+
+        Args:
+            fetch (str): "all" für alle Zeilen, "one" für die erste Zeile,
+                "ids" für die erste Spalte aller Zeilen als array("q")
+            cancelled (callable): Bricht die Abfrage ab, sobald sie True
+                zurückgibt (SQLite meldet dann "interrupted")
+
+        Ergebnisse werden im Abfrage-Cache unter (SQL, Parameter, fetch)
+        abgelegt und bis zum nächsten Schreibzugriff wiederverwendet. Mit
+        "ids" wandert jede Zeile direkt aus dem Cursor in das Array, ohne
+        Liste von Tupeln und ohne Abfrage-Cache.
+        """
+        cancelled = self.cancel_check(cancelled)
+        key = (query, tuple(params), fetch)
+        found, result = (False, None) if fetch == "ids" else self.query_cache.get(key)
+        if found:
+            # Kopie, damit Aufrufer den Cache-Eintrag nicht verändern
+            return list(result) if fetch == "all" else result
+
+        # Version vor dem Lesen merken: Schreibt jemand währenddessen, wird
+        # das Ergebnis nicht mehr gespeichert
+        version = self.query_cache.version
+        with self.read_pool.connection() as conn:
+            if cancelled is not None:
+                conn.set_progress_handler(cancelled, PROGRESS_STEPS)
+            start = time.perf_counter()
+            try:
+                cursor = conn.execute(query, params)
+                try:
+                    if fetch == "one":
+                        result = cursor.fetchone()
+                        rows = 0 if result is None else 1
+                    elif fetch == "ids":
+                        result = array("q", (row[0] for row in cursor))
+                        rows = len(result)
+                    else:
+                        result = cursor.fetchall()
+                        rows = len(result)
+                finally:
+                    cursor.close()
+            finally:
+                if cancelled is not None:
+                    conn.set_progress_handler(None, 0)
+            self._record_query(conn, query, params, start, rows)
+
+        if fetch == "ids":
+            return result
+        self.query_cache.put(key, version, result)
+        return list(result) if fetch == "all" else result
+
+    def _record_query(self, conn, query, params, start, rows):
+        """Übergibt Laufzeit und Zeilenzahl einer Abfrage an den Profiler."""
+
+        def explain():
+            plan = conn.execute(f"EXPLAIN QUERY PLAN {query}", params or ())
+            return [row[3] for row in plan]
+
+        duration_ms = (time.perf_counter() - start) * 1000
+        self.profiler.record(query, duration_ms, rows, params, explain)
+
+    def query_stats(self):
+        """Gibt Aufrufe, Laufzeiten (gesamt, p95) und Zeilen pro Abfrage zurück."""
+        return self.profiler.stats()
+
+    def pool_stats(self):
+        """Gibt Treffer und Fehlschläge des Lese-Pools zurück."""
+        return self.read_pool.stats()
+
+    def cache_stats(self):
+        """Gibt Treffer, Fehlschläge und Füllstand des Abfrage-Caches zurück."""
+        return self.query_cache.stats()
+
+    def search_cache_stats(self):
+        """Wie cache_stats(), dazu die Zahl der im Speicher verfeinerten Suchen."""
+        return self.search_cache.stats()
+
+    def subscribe(self, callback):
+        """
+        Registriert eine Funktion für Änderungs-Ereignisse (siehe Core.events).
+
+        Die Funktion erhält nach jedem Commit die Liste der Ereignisse. Sie wird
+        in dem Thread aufgerufen, der geschrieben hat (im Writer-Modus also im
+        Writer-Thread) und muss Arbeit für die GUI selbst weiterreichen.
+        """
+        self._subscribers.append(callback)
+
+    def unsubscribe(self, callback):
+        if callback in self._subscribers:
+            self._subscribers.remove(callback)
+
+    def _after_commit(self, conn):
+        """Invalidiert die Caches und meldet die Änderungen des Commits."""
+        self.query_cache.bump_version()
+        self.search_cache.bump_version()
+        events = collect_changes(conn)
+        if not events:
+            return
+        for callback in list(self._subscribers):
+            try:
+                callback(events)
+            except Exception as e:
+                print(f"Fehler beim Verarbeiten der Änderungs-Ereignisse: {e}")
 
     def fetch_transactions(self):
         """
@@ -13,7 +289,7 @@ class DatabaseManager:
         """
         query = """
         SELECT Haupt.ID, 
-            Haupt.Transaktion, 
+            Haupt.Transaktion / 100.0,  -- gespeichert in Cent
             Haupt.Name_Transaktion, 
             Kategorie.Kategorie, 
             CAST(Haupt.Ausgabe_Einnahme AS INTEGER),
@@ -21,22 +297,290 @@ class DatabaseManager:
         FROM Haupt
         LEFT JOIN Kategorie ON Haupt.Kategorie_FK = Kategorie.Kategorie_ID
         """
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()  # Cursor lokal hier erstellen
-            cursor.execute(query)
-            return cursor.fetchall()
+        return self._query(query)
 
-    def search_transactions(self, search_term):
+    def fetch_transactions_page(self, limit=PAGE_SIZE, after=None):
         """
-        Sucht Transaktionen nach Name, Kategorie, ID oder Datum.
+        Holt eine Seite Transaktionen, die neuesten zuerst (Datum DESC, ID DESC).
+
+        Die Zeilen haben das Format von fetch_transactions() und zusätzlich
+        den Tagesschlüssel Datum_Tag (yyyymmdd) als letzte Spalte.
+
+        Args:
+            limit (int): Maximale Anzahl Zeilen der Seite
+            after (tuple): (Datum, ID) der letzten Zeile der vorherigen Seite;
+                None für die erste Seite
+
+        Die Seite wird über den Index idx_Haupt_Datum_ID direkt hinter der
+        letzten Zeile fortgesetzt (Keyset-Paging), statt mit OFFSET alle
+        vorherigen Zeilen erneut zu lesen.
+        """
+        query = (
+            TRANSACTION_ROWS
+            + """
+        {where}
+        ORDER BY Haupt.Datum DESC, Haupt.ID DESC
+        LIMIT ?
         """
+        )
+        if after is None:
+            return self._query(query.format(where=""), (limit,))
+        where = "WHERE (Haupt.Datum, Haupt.ID) < (?, ?)"
+        return self._query(query.format(where=where), (after[0], after[1], limit))
+
+    def fetch_month_page(self, month, limit=PAGE_SIZE, after=None):
+        """
+        Holt eine Seite Transaktionen eines Monats, die neuesten zuerst
+        (Datum_Tag DESC, ID DESC).
+
+        Die Zeilen haben das Format von fetch_transactions_page(). Der Monat
+        ist ein Bereich auf dem Tagesschlüssel; idx_Haupt_Datum_Tag enthält
+        die ID, liefert also die Sortierung und setzt eine Seite direkt hinter
+        der letzten Zeile der vorherigen fort (Keyset-Paging).
+
+        Args:
+            month (str): Monat im Format yyyy-MM, bei ungültigen Daten die
+                ersten sieben Zeichen des Datums wie in 'Kategorie_Monat'
+            limit (int): Maximale Anzahl Zeilen der Seite
+            after (tuple): (Datum_Tag, ID) der letzten Zeile der vorherigen
+                Seite; None für die erste Seite
+        """
+        day_range = date_key_range(month)
+        if day_range is None:
+            # Ungültige Daten haben keinen Tagesschlüssel: nur nach ID
+            condition = "substr(Haupt.Datum, 1, 7) = ?"
+            params = [month]
+            if after is not None:
+                condition += " AND Haupt.ID < ?"
+                params.append(after[1])
+            order = "Haupt.ID DESC"
+        else:
+            condition = "Haupt.Datum_Tag >= ? AND Haupt.Datum_Tag < ?"
+            params = list(day_range)
+            if after is not None:
+                # Die Fortsetzung ersetzt das Monatsende als obere Grenze
+                condition = "Haupt.Datum_Tag >= ? AND (Haupt.Datum_Tag, Haupt.ID) < (?, ?)"
+                params = [day_range[0], *after]
+            order = "Haupt.Datum_Tag DESC, Haupt.ID DESC"
+        query = TRANSACTION_ROWS + f"WHERE {condition} ORDER BY {order} LIMIT ?"
+        return self._query(query, (*params, limit))
+
+    def fetch_month_totals(self):
+        """
+        Gibt Einnahmen, Ausgaben und Saldo je Monat zurück, neuester Monat zuerst.
+
+        Eine gruppierte Abfrage über die Summentabelle 'Kategorie_Monat'; die
+        Transaktionen selbst werden dafür nicht gelesen.
+
+        Returns:
+            list: Tupel (Monat yyyy-MM, Einnahmen, Ausgaben, Saldo, Anzahl)
+        """
+        query = """
+        SELECT Monat,
+            SUM(CASE WHEN CAST(Ausgabe_Einnahme AS INTEGER) = 1 THEN Summe ELSE 0 END) / 100.0,
+            SUM(CASE WHEN CAST(Ausgabe_Einnahme AS INTEGER) = 1 THEN 0 ELSE Summe END) / 100.0,
+            SUM(CASE WHEN CAST(Ausgabe_Einnahme AS INTEGER) = 1 THEN Summe ELSE -Summe END) / 100.0,
+            SUM(Anzahl)
+        FROM Kategorie_Monat
+        GROUP BY Monat
+        HAVING SUM(Anzahl) > 0
+        ORDER BY Monat DESC
+        """
+        return self._query(query)
+
+    def fetch_day_totals(self, month):
+        """
+        Gibt Ausgaben, Einnahmen und Anzahl je Tag eines Monats zurück (Kalender).
+
+        Eine gruppierte Abfrage über einen Bereich des Tagesschlüssels: Der
+        abdeckende Index idx_Haupt_Tag_Typ_Betrag (Migration 10) liefert Typ
+        und Betrag bereits nach Tagen sortiert, ohne die Tabelle zu lesen.
+
+        Args:
+            month (str): Monat im Format yyyy-MM (auch yyyy-M)
+
+        Returns:
+            list: Tupel (Tagesschlüssel yyyymmdd, Ausgaben, Einnahmen, Anzahl),
+            nur Tage mit Buchungen, aufsteigend
+        """
+        day_range = date_key_range(month)
+        if day_range is None:
+            return []
+        query = """
+        SELECT Datum_Tag,
+            SUM(CASE WHEN CAST(Ausgabe_Einnahme AS INTEGER) = 1 THEN 0 ELSE Transaktion END) / 100.0,
+            SUM(CASE WHEN CAST(Ausgabe_Einnahme AS INTEGER) = 1 THEN Transaktion ELSE 0 END) / 100.0,
+            COUNT(*)
+        FROM Haupt
+        WHERE Datum_Tag >= ? AND Datum_Tag < ?
+        GROUP BY Datum_Tag
+        ORDER BY Datum_Tag
+        """
+        return self._query(query, day_range)
+
+    def fetch_day_transactions(self, day_key):
+        """
+        Holt alle Transaktionen eines Tages, die neuesten zuerst (ID DESC).
+
+        Gleichheit auf dem Tagesschlüssel über idx_Haupt_Datum_Tag; da der
+        Index die ID enthält, kommen die Zeilen ohne Sortierung in der
+        richtigen Reihenfolge. Die Zeilen haben das Format von
+        fetch_transactions_page().
+
+        Args:
+            day_key (int): Tag als yyyymmdd
+        """
+        query = TRANSACTION_ROWS + "WHERE Haupt.Datum_Tag = ? ORDER BY Haupt.ID DESC"
+        return self._query(query, (day_key,))
+
+    def fetch_transactions_by_ids(self, ids, cancelled=None):
+        """
+        Holt die Transaktionen mit den angegebenen IDs im Format der Übersicht.
+
+        Gelöschte IDs fehlen im Ergebnis. So kann die Übersicht nach einer
+        Änderung nur die betroffenen Zeilen nachladen, und SearchPager liest
+        so die Seiten der Suchen nach Relevanz (siehe search_hit_ids()).
+
+        Returns:
+            dict: Transaktions-ID -> Zeile
+        """
+        ids = list(ids)
+        rows = {}
+        for start in range(0, len(ids), MAX_IN_PARAMS):
+            chunk = ids[start : start + MAX_IN_PARAMS]
+            placeholders = ", ".join("?" * len(chunk))
+            query = TRANSACTION_ROWS + f"WHERE Haupt.ID IN ({placeholders})"
+            for row in self._query(query, chunk, cancelled=cancelled):
+                rows[row[0]] = row
+        return rows
+
+    def _search_query(self, search_term, fulltext=True, page_size=None, after=None):
+        """
+        Baut die Abfrage für search_transactions().
+
+        Enthält der Suchbegriff Filter der Suchsprache (cat:, amount>, from:,
+        to:, type:) oder Phrasen in Anführungszeichen, wird er mit
+        Core.search_query übersetzt; die Treffer sind dann nach Datum sortiert.
+
+        Args:
+            fulltext (bool): Volltextindex verwenden, sofern vorhanden
+            page_size (int): Nur die nächsten `page_size` Treffer lesen (siehe
+                search_transactions_page()). Hinter den Spalten von
+                search_transactions() folgen dann die Sortierschlüssel.
+            after (tuple): Sortierschlüssel des letzten Treffers der
+                vorherigen Seite; die Seite beginnt direkt dahinter
+
+        Returns:
+            tuple: (SQL, Parameter, Volltextsuche ja/nein)
+        """
+        fulltext = fulltext and self.fts_enabled
+        parsed = parse_query(search_term)
+        if parsed.is_structured:
+            condition, params = compile_query(parsed, fulltext)
+            # "+" verhindert, dass SQLite für die Sortierung den ganzen
+            # Datumsindex durchläuft, statt über die Filter zu suchen
+            if page_size is None:
+                query = f"""
+        SELECT {TRANSACTION_COLUMNS}
+        FROM Haupt
+        LEFT JOIN Kategorie ON Haupt.Kategorie_FK = Kategorie.Kategorie_ID
+        WHERE {condition}
+        ORDER BY +Haupt.Datum DESC, Haupt.ID DESC
+        """
+                return query, params, fulltext
+
+            if after is not None:
+                # Wie die Sortierung nur prüfen, nicht über den Datumsindex suchen
+                condition = f"({condition}) AND (+Haupt.Datum, +Haupt.ID) < (?, ?)"
+                params = [*params, *after]
+            # Sortiert werden nur (Datum, ID), die Spalten liest erst die Seite
+            query = f"""
+        WITH Seite AS (
+            SELECT Haupt.ID, Haupt.Datum
+            FROM Haupt
+            LEFT JOIN Kategorie ON Haupt.Kategorie_FK = Kategorie.Kategorie_ID
+            WHERE {condition}
+            ORDER BY +Haupt.Datum DESC, Haupt.ID DESC
+            LIMIT ?
+        )
+        SELECT {TRANSACTION_COLUMNS}, Seite.Datum, Seite.ID
+        FROM Seite
+        CROSS JOIN Haupt ON Haupt.ID = Seite.ID
+        LEFT JOIN Kategorie ON Haupt.Kategorie_FK = Kategorie.Kategorie_ID
+        ORDER BY Seite.Datum DESC, Seite.ID DESC
+        """
+            return query, [*params, page_size], fulltext
+
+        hits = self._fulltext_hits(search_term) if fulltext else None
+        if hits is None or page_size is not None:
+            # Seitenweise kommt die Volltextsuche nur nach einem Fehler von
+            # search_hit_ids() hierher und läuft dann per LIKE
+            return (*self._search_like_query(search_term, page_size, after), False)
+
+        hits, params = hits
+        query = f"""
+        WITH Treffer AS ({hits})
+        SELECT Haupt.ID,
+            Haupt.Transaktion / 100.0,
+            Haupt.Name_Transaktion,
+            Kategorie.Kategorie,
+            CAST(Haupt.Ausgabe_Einnahme AS INTEGER),
+            Haupt.Datum,
+            Haupt.Datum_Tag
+        FROM (SELECT ID, MIN(Rang) AS Rang FROM Treffer GROUP BY ID) AS Ergebnis
+        JOIN Haupt ON Haupt.ID = Ergebnis.ID
+        LEFT JOIN Kategorie ON Haupt.Kategorie_FK = Kategorie.Kategorie_ID
+        ORDER BY Ergebnis.Rang, Haupt.ID
+        """
+        return query, params, True
+
+    def _fulltext_hits(self, search_term):
+        """
+        Baut die Treffer der Volltextsuche als Zeilen (ID, Rang).
+
+        Jedes Wort wird als Präfix gesucht; eine exakt passende ID steht vorne,
+        Datumsanfänge liefern alle Buchungen des Zeitraums. Eine ID kann
+        mehrfach vorkommen, es zählt der kleinste Rang.
+
+        Returns:
+            tuple: (SQL, Parameter) oder None, wenn der Begriff nicht per
+            Volltext gesucht wird (Filter der Suchsprache, keine Wörter, kein FTS5)
+        """
+        if not self.fts_enabled or parse_query(search_term).is_structured:
+            return None
+        tokens = re.findall(r"\w+", str(search_term))
+        if not tokens:
+            return None
+
+        # Jedes Wort als Präfix-Phrase; Leerzeichen verknüpft mit UND.
+        # Die Spalte "rank" entspricht bm25() (kleiner = relevanter).
+        match = " ".join('"{}"*'.format(token) for token in tokens)
+        branches = [
+            "SELECT rowid AS ID, rank AS Rang FROM Haupt_FTS WHERE Haupt_FTS MATCH ?"
+        ]
+        params = [match]
+
+        term = str(search_term).strip()
+        if term.isdigit():
+            branches.append("SELECT ID, -1e9 FROM Haupt WHERE ID = ?")
+            params.append(int(term))
+        day_range = date_key_range(term)
+        if day_range:
+            # Bereichsabfrage auf dem Tagesschlüssel, damit der Index greifen kann
+            branches.append("SELECT ID, 0 FROM Haupt WHERE Datum_Tag >= ? AND Datum_Tag < ?")
+            params.extend(day_range)
+        return " UNION ALL ".join(branches), params
+
+    @staticmethod
+    def _search_like_query(search_term, page_size=None, after=None):
         query = """
         SELECT Haupt.ID, 
-            Haupt.Transaktion, 
+            Haupt.Transaktion / 100.0, 
             Haupt.Name_Transaktion, 
             Kategorie.Kategorie, 
             CAST(Haupt.Ausgabe_Einnahme AS INTEGER),
-            Haupt.Datum
+            Haupt.Datum,
+            Haupt.Datum_Tag
         FROM Haupt
         LEFT JOIN Kategorie ON Haupt.Kategorie_FK = Kategorie.Kategorie_ID
         WHERE Haupt.Name_Transaktion LIKE ? 
@@ -46,47 +590,382 @@ class DatabaseManager:
         """
         # Suchbegriff für die SQL-Abfrage vorbereiten
         search_term = f"%{search_term}%"
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute(query, (search_term, search_term, search_term, search_term))
-            return cursor.fetchall()
+        params = (search_term, search_term, search_term, search_term)
+        if page_size is None:
+            return query, params
+
+        # Seitenweise in der Reihenfolge der Tabelle (ID), fortgesetzt hinter der letzten ID
+        keyset = "" if after is None else "WHERE ID > ?"
+        query = f"""
+        SELECT *, ID FROM ({query}) {keyset}
+        ORDER BY ID
+        LIMIT ?
+        """
+        return query, (*params, *(after or ()), page_size)
+
+    def search_transactions(self, search_term):
+        """
+        Sucht Transaktionen nach Name, Kategorie, ID oder Datum.
+
+        Namen und Kategorien werden über den Volltextindex 'Haupt_FTS' gesucht:
+        jedes Wort des Suchbegriffs wird als Präfix gesucht, die Treffer sind
+        nach Relevanz (BM25) sortiert. Eine exakt passende ID steht vorne,
+        Datumsanfänge ("2024-05") liefern alle Buchungen des Zeitraums.
+        Filter wie "cat:Lebensmittel amount>50 from:2024-03" werden über die
+        Indizes gesucht (siehe Core.search_query).
+        Ohne FTS5 wird auf die LIKE-Suche zurückgegriffen.
+
+        Die Zeilen enthalten wie bei fetch_transactions_page() zusätzlich den
+        Tagesschlüssel Datum_Tag.
+
+        Die Treffer landen im Such-Cache (siehe Core.search_cache). Verlängert
+        ein Begriff einen dort gespeicherten ("kau" -> "kaufland"), werden
+        dessen Treffer im Speicher gefiltert; sie behalten dann die
+        Reihenfolge der kürzeren Suche.
+        """
+        rows = self.search_cache.lookup(search_term, self.fts_enabled)
+        if rows is not None:
+            return rows
+
+        version = self.search_cache.version
+        query, params, fulltext = self._search_query(search_term)
+        if not fulltext:
+            rows = self._query(query, params)
+        else:
+            try:
+                rows = self._query(query, params)
+            except sqlite3.Error as e:
+                print(f"Fehler bei der Volltextsuche: {e}")
+                return self.search_transactions_like(search_term)
+        self.search_cache.store(search_term, version, rows, self.fts_enabled)
+        return rows
+
+    def search_transactions_like(self, search_term):
+        """
+        Sucht Transaktionen per LIKE in Name, Kategorie, ID und Datum.
+
+        Fallback, wenn FTS5 nicht verfügbar ist; durchsucht die ganze Tabelle.
+        """
+        query, params, _ = self._search_query(search_term, fulltext=False)
+        return self._query(query, params)
+
+    def fuzzy_matches(self, search_term, limit=FUZZY_LIMIT):
+        """
+        Sucht die Namen, die einem (auch vertippten) Begriff am ähnlichsten sind.
+
+        Returns:
+            list: (Name klein geschrieben, Ähnlichkeit 0..1), ähnlichste zuerst
+        """
+        return self._query(FUZZY_MATCHES, self._fuzzy_params(search_term, limit))
+
+    @staticmethod
+    def _fuzzy_params(search_term, limit):
+        # Reihenfolge wie ?1, ?2, ?3 in FUZZY_MATCHES
+        return (str(search_term).strip(), FUZZY_MIN_SIMILARITY, limit)
+
+    def _fuzzy_query(self, search_term, limit=FUZZY_LIMIT):
+        """
+        Baut die Abfrage der unscharfen Suche: die IDs der Transaktionen, deren
+        Name trotz Tippfehlern zum Suchbegriff passt.
+
+        Gesucht wird über den Trigrammindex (Migration 9) nach den `limit`
+        ähnlichsten Transaktions- und Kategorienamen; geliefert werden deren
+        Transaktionen, die ähnlichsten Namen zuerst, darin die neuesten zuerst.
+
+        Die Transaktionen zu den gefundenen Namen kommen über den Ausdrucksindex
+        idx_Haupt_Name, die zu gefundenen Kategorien über idx_Haupt_Kategorie.
+        CROSS JOIN legt die Reihenfolge fest: SQLite kennt die Zahl der Treffer
+        nicht und würde sonst 'Haupt' durchlaufen. "+Treffer.Wort" nimmt dem
+        Vergleich die TEXT-Affinität, die den Ausdrucksindex ausschließen würde.
+        """
+        query = f"""
+        WITH Treffer(Wort, Aehnlichkeit) AS ({FUZZY_MATCHES}),
+        Ergebnis(ID, Aehnlichkeit) AS (
+            SELECT Haupt.ID, Treffer.Aehnlichkeit
+            FROM Treffer
+            CROSS JOIN Haupt ON lower(Haupt.Name_Transaktion) = +Treffer.Wort
+            UNION ALL
+            SELECT Haupt.ID, Treffer.Aehnlichkeit
+            FROM Treffer
+            CROSS JOIN Kategorie ON lower(Kategorie.Kategorie) = +Treffer.Wort
+            CROSS JOIN Haupt ON Haupt.Kategorie_FK = Kategorie.Kategorie_ID
+        )
+        SELECT Haupt.ID
+        FROM (
+            SELECT ID, MAX(Aehnlichkeit) AS Aehnlichkeit FROM Ergebnis GROUP BY ID
+        ) AS Gefunden
+        JOIN Haupt ON Haupt.ID = Gefunden.ID
+        ORDER BY Gefunden.Aehnlichkeit DESC, Haupt.Datum DESC, Haupt.ID DESC
+        """
+        return query, self._fuzzy_params(search_term, limit)
+
+    def search_hit_ids(self, search_term, fuzzy=False, cancelled=None):
+        """
+        Liest die IDs aller Treffer einer Suche nach Relevanz in ihrer
+        Reihenfolge: Volltextsuche nach (Rang, ID), unscharfe Suche nach
+        Ähnlichkeit, darin die neuesten zuerst (siehe _fuzzy_query()).
+
+        Für diese Sortierungen muss SQLite alle Treffer bewerten und nach ID
+        gruppieren. SearchPager liest die Liste deshalb einmal pro Suche und
+        blättert darin; die Anzahl der Treffer ist ihre Länge. Pro Treffer
+        belegt die Liste 8 Bytes: Sie wird direkt aus dem Cursor gefüllt und
+        nicht im Abfrage-Cache abgelegt.
+
+        Returns:
+            array: IDs (Typ "q"); None, wenn der Begriff nicht nach Relevanz
+            gesucht wird (Filter, LIKE, Fehler der Volltextsuche; dann
+            search_transactions_page()) oder nach einem Abbruch
+        """
+        cancelled = self.cancel_check(cancelled)
+        if fuzzy:
+            query, params = self._fuzzy_query(search_term)
+        else:
+            hits = self._fulltext_hits(search_term)
+            if hits is None:
+                return None
+            query = f"""
+        WITH Treffer AS ({hits[0]})
+        SELECT ID FROM Treffer GROUP BY ID ORDER BY MIN(Rang), ID
+        """
+            params = hits[1]
+        try:
+            ids = self._query(query, params, fetch="ids", cancelled=cancelled)
+        except sqlite3.Error as e:
+            if cancelled is not None and cancelled():
+                return None
+            if fuzzy:
+                raise
+            print(f"Fehler bei der Volltextsuche: {e}")
+            return None
+        if cancelled is not None and cancelled():
+            return None
+        return ids
+
+    def search_transactions_page(self, search_term, page_size=PAGE_SIZE, after=None, cancelled=None):
+        """
+        Liest eine Seite der Treffer von search_transactions().
+
+        Jede Seite ist eine eigene Abfrage mit LIMIT, die direkt hinter dem
+        letzten Treffer der vorherigen Seite fortsetzt (Keyset-Paging), so
+        bleibt der Speicherbedarf auch bei sehr vielen Treffern pro Seite
+        begrenzt. Bei Filtern der Suchsprache wird zuerst die Seite aus Datum
+        und ID bestimmt und erst dann werden deren Zeilen gelesen. Suchen nach
+        Relevanz blättert SearchPager über search_hit_ids(); ein Begriff für
+        die Volltextsuche wird hier per LIKE gesucht.
+
+        Args:
+            page_size (int): Zeilen pro Seite
+            after (tuple): Fortsetzung aus dem vorherigen Aufruf, None für die
+                erste Seite
+            cancelled (callable): Bricht die Abfrage ab (siehe _query())
+
+        Returns:
+            tuple: (Zeilen, Fortsetzung); die Fortsetzung ist None nach der
+            letzten Seite und nach einem Abbruch
+        """
+        cancelled = self.cancel_check(cancelled)
+        fulltext = True
+        if after is not None:
+            # Die Fortsetzung merkt sich, ob die erste Seite per Volltext lief
+            fulltext, after = after[0], after[1:]
+        query, params, fulltext = self._search_query(search_term, fulltext, page_size + 1, after)
+        try:
+            return self._fetch_page(query, params, page_size, (fulltext,), cancelled)
+        except sqlite3.Error as e:
+            if cancelled is not None and cancelled():
+                return [], None
+            if not fulltext or after is not None:
+                raise
+            print(f"Fehler bei der Volltextsuche: {e}")
+            query, params, _ = self._search_query(search_term, False, page_size + 1)
+            return self._fetch_page(query, params, page_size, (False,), cancelled)
+
+    def _fetch_page(self, query, params, page_size, prefix, cancelled):
+        """
+        Liest eine Seite mit einer Zeile Vorschau (LIMIT page_size + 1).
+
+        Die Vorschau zeigt, ob es eine weitere Seite gibt; die Fortsetzung sind
+        `prefix` und die Sortierschlüssel der letzten Zeile der Seite.
+        """
+        rows = self._query(query, params, cancelled=cancelled)
+        if cancelled is not None and cancelled():
+            return [], None
+        after = None
+        if len(rows) > page_size:
+            after = (*prefix, *rows[page_size - 1][TRANSACTION_WIDTH:])
+        return [row[:TRANSACTION_WIDTH] for row in rows[:page_size]], after
+
+    def count_search_results(self, search_term, cancelled=None):
+        """Zählt die Treffer von search_transactions(), ohne sie zu lesen."""
+        cancelled = self.cancel_check(cancelled)
+        query, params, fulltext = self._search_query(search_term)
+        try:
+            return self._count(query, params, cancelled)
+        except sqlite3.Error as e:
+            if cancelled is not None and cancelled():
+                return None
+            if not fulltext:
+                raise
+            print(f"Fehler bei der Volltextsuche: {e}")
+            query, params, _ = self._search_query(search_term, fulltext=False)
+            return self._count(query, params, cancelled)
+
+    def search_pager(self, search_term, fuzzy=False, page_size=PAGE_SIZE):
+        """Blättert seitenweise durch die Treffer einer Suche (siehe Core.search_pager)."""
+        return SearchPager(self, search_term, fuzzy, page_size)
+
+    def _count(self, query, params, cancelled=None):
+        count = f"SELECT COUNT(*) FROM ({query})"
+        result = self._query(count, params, fetch="one", cancelled=cancelled)
+        if cancelled is not None and cancelled():
+            return None
+        return result[0]
 
     def fetch_expenses_per_category(self):
         """
         Holt die Summen der Ausgaben gruppiert nach Kategorien.
+
+        Liest aus der Summentabelle 'Kategorie_Monat' statt über alle Transaktionen.
+        Summiert wird in Cent, erst das Ergebnis wird in Euro umgerechnet.
         """
         query = """
         SELECT Kategorie.Kategorie, 
-               SUM(Haupt.Transaktion) 
-        FROM Haupt
-        LEFT JOIN Kategorie ON Haupt.Kategorie_FK = Kategorie.Kategorie_ID
-        WHERE Haupt.Ausgabe_Einnahme = 0
+               SUM(Kategorie_Monat.Summe) / 100.0
+        FROM Kategorie_Monat
+        LEFT JOIN Kategorie ON Kategorie_Monat.Kategorie_FK = Kategorie.Kategorie_ID
+        WHERE Kategorie_Monat.Ausgabe_Einnahme = '0'
         GROUP BY Kategorie.Kategorie
         """
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()  # Cursor lokal hier erstellen
-            cursor.execute(query)
-            return cursor.fetchall()
+        return self._query(query)
+
+    def fetch_balance(self):
+        """
+        Berechnet den Kontostand (Einnahmen minus Ausgaben).
+
+        Summiert nur die Zeilen der Summentabelle 'Kategorie_Monat', die von
+        den Triggern bei jedem Schreibzugriff aktuell gehalten wird.
+        """
+        query = """
+        SELECT SUM(
+            CASE WHEN CAST(Ausgabe_Einnahme AS INTEGER) = 1 THEN Summe ELSE -Summe END
+        ) / 100.0
+        FROM Kategorie_Monat
+        """
+        row = self._query(query, fetch="one")
+        return row[0] if row and row[0] is not None else 0.0
+
+    def fetch_category_budgets(self, category=None):
+        """
+        Holt Budget und genutzten Betrag je Kategorie mit definiertem Budget.
+
+        Args:
+            category (str): Nur diese Kategorie (None für alle)
+
+        Returns:
+            list: Tupel (Kategorie, Budget, genutzter Betrag)
+        """
+        query = """
+        SELECT 
+            Kategorie.Kategorie, 
+            Kategorie.Budget, 
+            COALESCE(SUM(Kategorie_Monat.Summe), 0) / 100.0 AS UsedBudget
+        FROM Kategorie
+        LEFT JOIN Kategorie_Monat ON Kategorie.Kategorie_ID = Kategorie_Monat.Kategorie_FK
+        WHERE Kategorie.Budget > 0 {filter}
+        GROUP BY Kategorie.Kategorie_ID, Kategorie.Kategorie, Kategorie.Budget
+        """
+        if category is None:
+            return self.fetchall(query.format(filter=""))
+        return self.fetchall(query.format(filter="AND Kategorie.Kategorie = ?"), (category,))
+
+    def fetch_total_budget(self):
+        """Gibt die Summe aller Kategorie-Budgets zurück (None ohne Kategorien)."""
+        row = self._query("SELECT SUM(Budget) FROM Kategorie", fetch="one")
+        return row[0] if row else None
+
+    def fetch_month_expenses(self, month=None):
+        """
+        Gibt die Summe der Ausgaben eines Monats zurück.
+
+        Args:
+            month (str): Monat im Format yyyy-MM (Standard: aktueller Monat)
+        """
+        month = month or datetime.now().strftime("%Y-%m")
+        query = """
+        SELECT SUM(Summe) / 100.0
+        FROM Kategorie_Monat
+        WHERE Ausgabe_Einnahme = '0' AND Monat = ?
+        """
+        row = self._query(query, (month,), fetch="one")
+        return row[0] if row and row[0] is not None else 0
+
+    def rebuild_aggregates(self):
+        """Baut die Summentabelle 'Kategorie_Monat' aus 'Haupt' neu auf."""
+
+        def job(conn):
+            rebuild_category_months(conn)
+
+        if self.writer:
+            return self.writer.submit(job).result()
+        with self._write_lock:
+            try:
+                job(self.connection)
+                self.connection.commit()
+            except sqlite3.Error as e:
+                self.connection.rollback()
+                print(f"Fehler beim Neuaufbau der Summentabelle: {e}")
+            finally:
+                self._after_commit(self.connection)
+
+    @staticmethod
+    def is_write_query(query):
+        """Prüft, ob eine SQL-Anweisung Daten verändert."""
+        return not query.lstrip().upper().startswith(READ_KEYWORDS)
 
     # Summe der Einnahmen pro Kategorie
     def execute(self, query, params=None):
+        """
+        Führt eine SQL-Anweisung aus.
+
+        Im Writer-Modus werden verändernde Anweisungen an den Writer-Thread
+        übergeben; dann wird statt eines Cursors ein `Future` zurückgegeben.
+        """
+        is_write = self.is_write_query(query)
+        if self.writer and is_write:
+
+            def job(conn):
+                start = time.perf_counter()
+                cursor = conn.execute(query, params or ())
+                self._record_query(conn, query, params, start, cursor.rowcount)
+                return {"lastrowid": cursor.lastrowid, "rowcount": cursor.rowcount}
+
+            return self.writer.submit(job)
         try:
-            cursor = self.connection.cursor()
-            if params:
-                cursor.execute(query, params)
-            else:
-                cursor.execute(query)
-            self.connection.commit()  # Änderungen explizit speichern
+            with self._write_lock:
+                start = time.perf_counter()
+                cursor = self.connection.cursor()
+                if params:
+                    cursor.execute(query, params)
+                else:
+                    cursor.execute(query)
+                self.connection.commit()  # Änderungen explizit speichern
+                # Bei Leseabfragen ist die Zeilenzahl erst nach dem Abholen bekannt
+                self._record_query(
+                    self.connection, query, params, start, cursor.rowcount
+                )
             return cursor
         except Exception as e:
             print(f"Fehler bei der Datenbankoperation: {e}")
             return None
+        finally:
+            if is_write:
+                with self._write_lock:
+                    self._after_commit(self.connection)
 
     # Daten aus der Datenbank abfragen
     def fetchall(self, query, params=()):
         try:
-            self.cursor.execute(query, params)
-            return self.cursor.fetchall()
+            return self._query(query, params)
         except sqlite3.Error as e:
             print(f"Fehler bei der Datenbankabfrage: {e}")
             return []
@@ -97,7 +976,7 @@ class DatabaseManager:
 
         Args:
             data (dict): Ein Dictionary mit den Transaktionsdetails:
-                - 'Transaktion' (int): Betrag der Transaktion
+                - 'Transaktion' (float): Betrag der Transaktion in Euro
                 - 'Name_Transaktion' (str): Name der Transaktion
                 - 'Kategorie_FK' (int): ID der Kategorie (FK)
                 - 'Ausgabe_Einnahme' (str): '0' für Ausgabe, '1' für Einnahme
@@ -107,16 +986,17 @@ class DatabaseManager:
         INSERT INTO Haupt (transaktion, name_transaktion, kategorie_fk, ausgabe_einnahme, datum)
         VALUES (?, ?, ?, ?, ?)
         """
-        params = (
-            data["Transaktion"],
-            data["Name_Transaktion"],
-            data["Kategorie_FK"],
-            data["Ausgabe_Einnahme"],
-            data["Datum"],  
-        )
-
         try:
-            self.execute(query, params)
+            params = (
+                to_cents(data["Transaktion"]),
+                data["Name_Transaktion"],
+                data["Kategorie_FK"],
+                data["Ausgabe_Einnahme"],
+                normalize_date(data["Datum"]),
+            )
+            result = self.execute(query, params)
+            if self.writer:
+                return result  # Future, wird nach dem Commit erfüllt
             print("Transaktion erfolgreich hinzugefügt.")
             return True  # Erfolgreich hinzugefügt
         except Exception as e:
@@ -124,6 +1004,135 @@ class DatabaseManager:
             return False  # Fehler beim Hinzufügen
 
 
+    @staticmethod
+    def validate_transaction(row, index=None):
+        """
+        Prüft eine Transaktion und gibt sie als Tupel für das INSERT zurück.
+
+        Der Betrag wird dabei von Euro in ganze Cent umgerechnet.
+
+        Args:
+            row (dict | tuple): Transaktion als Dictionary wie bei `add_transaction`
+                oder als Tupel in der Reihenfolge von TRANSACTION_FIELDS
+            index (int): Position der Zeile, wird nur für Fehlermeldungen genutzt
+
+        Raises:
+            ValueError: Wenn die Transaktion unvollständig oder ungültig ist
+        """
+        position = f" in Zeile {index}" if index is not None else ""
+        try:
+            if isinstance(row, dict):
+                values = tuple(row[field] for field in TRANSACTION_FIELDS)
+            else:
+                values = tuple(row)
+        except KeyError as e:
+            raise ValueError(f"Fehlendes Feld {e}{position}")
+        if len(values) != len(TRANSACTION_FIELDS):
+            raise ValueError(
+                f"Erwartet {len(TRANSACTION_FIELDS)} Felder, erhalten {len(values)}{position}"
+            )
+
+        amount, name, category_id, type_, date = values
+        try:
+            amount = to_cents(amount)
+        except (TypeError, ValueError):
+            raise ValueError(f"Ungültiger Betrag {amount!r}{position}")
+        if amount is None:
+            raise ValueError(f"Fehlender Betrag{position}")
+        if amount < 0:
+            raise ValueError(f"Der Betrag kann nicht negativ sein{position}")
+        if not isinstance(name, str) or not name.strip():
+            raise ValueError(f"Fehlender Name der Transaktion{position}")
+        if str(type_) not in ("0", "1"):
+            raise ValueError(f"Ausgabe_Einnahme muss '0' oder '1' sein{position}")
+        try:
+            date = normalize_date(date)
+        except ValueError:
+            raise ValueError(f"Ungültiges Datum {date!r}{position}")
+
+        return (amount, name.strip(), category_id, str(type_), date)
+
+    @staticmethod
+    def _insert_rows(conn, rows):
+        """Fügt Zeilen mit executemany ein und gibt ihre IDs zurück."""
+        conn.executemany(INSERT_TRANSACTION, rows)
+        # Innerhalb einer Transaktion mit nur einem Schreiber sind die IDs fortlaufend
+        last_id = conn.execute("SELECT last_insert_rowid()").fetchone()[0]
+        return list(range(last_id - len(rows) + 1, last_id + 1))
+
+    def add_transactions(self, transactions, chunk_size=1000):
+        """
+        Fügt viele Transaktionen in Blöcken ein.
+
+        Die Eingabe wird blockweise gelesen, sodass auch Generatoren beliebiger
+        Länge verarbeitet werden können. Jeder Block wird geprüft und dann mit
+        `executemany` in einer eigenen Transaktion geschrieben. Bei einem Fehler
+        bleiben die bereits geschriebenen Blöcke erhalten.
+
+        Args:
+            transactions (iterable): Dictionaries oder Tupel wie bei `validate_transaction`
+            chunk_size (int): Anzahl der Zeilen pro Transaktion
+
+        Returns:
+            dict: 'ids' (Liste der neuen IDs) und 'chunk_timings' (Sekunden pro Block)
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size muss mindestens 1 sein")
+
+        ids = []
+        chunk_timings = []
+        iterator = iter(transactions)
+        offset = 0
+
+        while True:
+            chunk = list(islice(iterator, chunk_size))
+            if not chunk:
+                break
+            start = time.perf_counter()
+            rows = [
+                self.validate_transaction(row, offset + i) for i, row in enumerate(chunk)
+            ]
+            offset += len(chunk)
+
+            if self.writer:
+                chunk_ids = self.writer.submit(
+                    lambda conn, rows=rows: self._insert_rows(conn, rows)
+                ).result()
+            else:
+                with self._write_lock:
+                    try:
+                        self.connection.execute("BEGIN IMMEDIATE")
+                        chunk_ids = self._insert_rows(self.connection, rows)
+                        self.connection.commit()
+                    except sqlite3.Error:
+                        self.connection.rollback()
+                        raise
+                    finally:
+                        self._after_commit(self.connection)
+
+            ids.extend(chunk_ids)
+            chunk_timings.append(time.perf_counter() - start)
+            self.profiler.record(
+                INSERT_TRANSACTION, chunk_timings[-1] * 1000, len(chunk_ids)
+            )
+
+        return {"ids": ids, "chunk_timings": chunk_timings}
+
+    def add_category(self, name, budget=0):
+        """
+        Legt eine neue Kategorie an.
+
+        Returns:
+            int: ID der neuen Kategorie (None bei einem Fehler)
+        """
+        query = "INSERT INTO Kategorie (Kategorie, Budget) VALUES (?, ?)"
+        result = self.execute(query, (name, budget))
+        if result is None:
+            return None
+        if self.writer:
+            return result.result()["lastrowid"]
+        return result.lastrowid
+
     # Transaktion anhand der ID abrufen
     def fetch_transaction_by_id(self, transaction_id):
         query = """
@@ -131,20 +1140,17 @@ class DatabaseManager:
         FROM Haupt
         WHERE ID = ?
         """
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute(query, (transaction_id,))
-            result = cursor.fetchone()
-            if result:
-                return {
-                    "ID": result[0],
-                    "Transaktion": result[1],
-                    "Name_Transaktion": result[2],
-                    "Kategorie_FK": result[3],
-                    "Ausgabe_Einnahme": result[4],
-                    "Datum": result[5],
-                }
-            return None
+        result = self._query(query, (transaction_id,), fetch="one")
+        if result:
+            return {
+                "ID": result[0],
+                "Transaktion": from_cents(result[1]),
+                "Name_Transaktion": result[2],
+                "Kategorie_FK": result[3],
+                "Ausgabe_Einnahme": result[4],
+                "Datum": result[5],
+            }
+        return None
 
     # Transaktion in der Datenbank aktualisieren
     def update_transaction(self, transaction_id, data):
@@ -154,14 +1160,39 @@ class DatabaseManager:
             WHERE id = ?
         """
         params = (
-            data["Transaktion"],
+            to_cents(data["Transaktion"]),
             data["Name_Transaktion"],
             data["Kategorie_FK"],
             data["Ausgabe_Einnahme"],
-            data["Datum"],
+            normalize_date(data["Datum"]),
             transaction_id,
         )
-        self.execute(query, params)
+        return self.execute(query, params)
+
+    def delete_transaction(self, transaction_id):
+        """Löscht eine Transaktion (im Writer-Modus wird ein `Future` zurückgegeben)."""
+        return self.execute("DELETE FROM Haupt WHERE ID = ?", (transaction_id,))
+
+    def commit(self):
+        """
+        Stellt sicher, dass alle bisherigen Änderungen gespeichert sind.
+
+        Im Writer-Modus wird gewartet, bis die Warteschlange abgearbeitet ist.
+        Das blockiert; die GUI wartet stattdessen auf das `Future` von
+        execute() bzw. auf das Änderungs-Ereignis. Gedacht für Tests und
+        das Beenden.
+        """
+        if self.writer:
+            self.writer.flush()
+        else:
+            with self._write_lock:
+                self.connection.commit()
+                self._after_commit(self.connection)
 
     def close(self):
+        # Mit BUDGET_QUERY_STATS=<Datei> werden die Messwerte beim Beenden gespeichert
+        self.profiler.dump_from_env()
+        if self.writer:
+            self.writer.close()
+        self.read_pool.close()
         self.connection.close()
@@ -0,0 +1,96 @@
+import re
+from datetime import datetime
+from functools import lru_cache
+
+# Tage werden als Schlüssel yyyymmdd (INTEGER) übergeben, wie sie die Datenbank
+# in der Spalte Haupt.Datum_Tag speichert. Die Views vergleichen nur diese
+# Schlüssel und parsen keine Datums-Strings mehr.
+
+# Überschrift für Buchungen ohne gültiges Datum (Datum_Tag ist NULL)
+UNKNOWN_DAY_LABEL = "Ohne Datum"
+
+MONTH_NAMES = (
+    "Januar",
+    "Februar",
+    "März",
+    "April",
+    "Mai",
+    "Juni",
+    "Juli",
+    "August",
+    "September",
+    "Oktober",
+    "November",
+    "Dezember",
+)
+
+
+@lru_cache(maxsize=4096)
+def day_label(day_key):
+    """
+    Formatiert einen Tagesschlüssel yyyymmdd als "dd.mm.yyyy".
+
+    Das Ergebnis wird zwischengespeichert, da jede Datumsgruppe der Übersicht
+    und der Suche denselben Tag immer wieder formatiert.
+    """
+    if day_key is None:
+        return UNKNOWN_DAY_LABEL
+    year, rest = divmod(day_key, 10000)
+    month, day = divmod(rest, 100)
+    return f"{day:02d}.{month:02d}.{year:04d}"
+
+
+@lru_cache(maxsize=512)
+def month_label(month):
+    """Formatiert einen Monat "yyyy-MM" als z.B. "Januar 2025"."""
+    try:
+        year, number = (int(part) for part in month.split("-"))
+        return f"{MONTH_NAMES[number - 1]} {year}"
+    except (ValueError, IndexError):
+        return month  # Unbekanntes Format unverändert anzeigen
+
+
+# Suchbegriffe, die wie der Anfang eines Datums aussehen (z.B. "2024", "2024-05")
+DATE_PREFIX = re.compile(r"^\d{4}(-\d{1,2}){0,2}$")
+
+
+def date_key_range(term):
+    """
+    Wandelt einen Datumsanfang in einen Bereich von Tagesschlüsseln (yyyymmdd) um.
+
+    "2024" ergibt das ganze Jahr, "2024-05" den Mai und "2024-05-03" den
+    einzelnen Tag. Monat und Tag dürfen einstellig sein ("2024-5").
+
+    Returns:
+        tuple: (erster Schlüssel, erster Schlüssel danach) oder None
+    """
+    term = str(term).strip()
+    if not DATE_PREFIX.match(term):
+        return None
+    parts = [int(part) for part in term.split("-")]
+    year = parts[0]
+    if len(parts) == 1:
+        return year * 10000, (year + 1) * 10000
+    month = parts[1]
+    if len(parts) == 2:
+        return year * 10000 + month * 100, year * 10000 + (month + 1) * 100
+    start = year * 10000 + month * 100 + parts[2]
+    return start, start + 1
+
+
+@lru_cache(maxsize=4096)
+def normalize_date(date):
+    """
+    Bringt ein Datum yyyy-MM-dd auf zweistellige Monate und Tage, z.B.
+    "2024-5-3" zu "2024-05-03".
+
+    Nur so erhält es einen Tagesschlüssel (siehe DAY_KEY_SQL in
+    Core.migrations); strptime() akzeptiert auch einstellige Angaben. Eine
+    Uhrzeit hinter dem Datum bleibt erhalten. Zwischengespeichert, da ein
+    Import viele Buchungen pro Tag enthält.
+
+    Raises:
+        ValueError: Wenn das Datum nicht mit yyyy-MM-dd beginnt
+    """
+    day, time = re.match(r"([^ T]*)(.*)", str(date).strip(), re.S).groups()
+    return datetime.strptime(day, "%Y-%m-%d").date().isoformat() + time
@@ -0,0 +1,197 @@
+from dataclasses import dataclass
+
+# Protokolltabelle der Schreibverbindung: Jeder Trigger schreibt eine Zeile
+# (Tabelle, Art, ID, Kategorie_FK, Monat). Temporäre Objekte gehören nur zu
+# der Verbindung, die sie anlegt; Lese-Verbindungen sehen sie nicht.
+# Abgeleitete Spalten wie Datum_Tag lösen kein eigenes Ereignis aus.
+CHANGE_LOG_STATEMENTS = (
+    """
+    CREATE TEMP TABLE IF NOT EXISTS Aenderungen (
+        Tabelle TEXT NOT NULL,
+        Art TEXT NOT NULL,
+        ID INTEGER,
+        Kategorie_FK INTEGER,
+        Monat TEXT
+    )
+    """,
+    """
+    CREATE TEMP TRIGGER IF NOT EXISTS aenderung_Haupt_insert AFTER INSERT ON main.Haupt
+    BEGIN
+        INSERT INTO Aenderungen
+        VALUES ('Haupt', 'inserted', NEW.ID, NEW.Kategorie_FK, substr(NEW.Datum, 1, 7));
+    END
+    """,
+    """
+    CREATE TEMP TRIGGER IF NOT EXISTS aenderung_Haupt_update
+    AFTER UPDATE OF ID, Transaktion, Name_Transaktion, Kategorie_FK, Ausgabe_Einnahme, Datum
+    ON main.Haupt
+    BEGIN
+        INSERT INTO Aenderungen
+        VALUES ('Haupt', 'updated', OLD.ID, OLD.Kategorie_FK, substr(OLD.Datum, 1, 7));
+        INSERT INTO Aenderungen
+        VALUES ('Haupt', 'updated', NEW.ID, NEW.Kategorie_FK, substr(NEW.Datum, 1, 7));
+    END
+    """,
+    """
+    CREATE TEMP TRIGGER IF NOT EXISTS aenderung_Haupt_delete AFTER DELETE ON main.Haupt
+    BEGIN
+        INSERT INTO Aenderungen
+        VALUES ('Haupt', 'deleted', OLD.ID, OLD.Kategorie_FK, substr(OLD.Datum, 1, 7));
+    END
+    """,
+    """
+    CREATE TEMP TRIGGER IF NOT EXISTS aenderung_Kategorie_insert AFTER INSERT ON main.Kategorie
+    BEGIN
+        INSERT INTO Aenderungen VALUES ('Kategorie', 'inserted', NEW.Kategorie_ID, NULL, NULL);
+    END
+    """,
+    """
+    CREATE TEMP TRIGGER IF NOT EXISTS aenderung_Kategorie_update AFTER UPDATE ON main.Kategorie
+    BEGIN
+        INSERT INTO Aenderungen VALUES ('Kategorie', 'updated', OLD.Kategorie_ID, NULL, NULL);
+        INSERT INTO Aenderungen VALUES ('Kategorie', 'updated', NEW.Kategorie_ID, NULL, NULL);
+    END
+    """,
+    """
+    CREATE TEMP TRIGGER IF NOT EXISTS aenderung_Kategorie_delete AFTER DELETE ON main.Kategorie
+    BEGIN
+        INSERT INTO Aenderungen VALUES ('Kategorie', 'deleted', OLD.Kategorie_ID, NULL, NULL);
+    END
+    """,
+)
+
+
+@dataclass(frozen=True)
+class TransactionEvent:
+    """
+    Transaktionen wurden geändert.
+
+    Attributes:
+        ids (frozenset): IDs der betroffenen Transaktionen
+        categories (frozenset): betroffene Kategorie-IDs (alte und neue)
+        months (frozenset): betroffene Monate im Format yyyy-MM (alte und neue)
+    """
+
+    ids: frozenset
+    categories: frozenset
+    months: frozenset
+
+
+class TransactionsInserted(TransactionEvent):
+    """Neue Transaktionen wurden eingefügt."""
+
+
+class TransactionsUpdated(TransactionEvent):
+    """Bestehende Transaktionen wurden geändert."""
+
+
+class TransactionsDeleted(TransactionEvent):
+    """Transaktionen wurden gelöscht."""
+
+
+@dataclass(frozen=True)
+class CategoryChanged:
+    """
+    Kategorien wurden angelegt, geändert oder gelöscht.
+
+    Attributes:
+        kind (str): "inserted", "updated" oder "deleted"
+        ids (frozenset): IDs der betroffenen Kategorien
+    """
+
+    kind: str
+    ids: frozenset
+
+
+TRANSACTION_EVENTS = {
+    "inserted": TransactionsInserted,
+    "updated": TransactionsUpdated,
+    "deleted": TransactionsDeleted,
+}
+
+
+def setup_change_log(conn):
+    """Legt Protokolltabelle und temporäre Trigger auf einer Schreibverbindung an."""
+    for statement in CHANGE_LOG_STATEMENTS:
+        conn.execute(statement)
+
+
+def collect_changes(conn):
+    """
+    Liest das Änderungsprotokoll einer Verbindung, leert es und bildet Ereignisse.
+
+    Muss nach dem Commit aufgerufen werden, damit zurückgerollte Änderungen
+    (deren Protokollzeilen mit zurückgerollt werden) nicht gemeldet werden.
+
+    Returns:
+        list: TransactionEvent- und CategoryChanged-Objekte
+    """
+    rows = conn.execute(
+        "SELECT Tabelle, Art, ID, Kategorie_FK, Monat FROM temp.Aenderungen"
+    ).fetchall()
+    if not rows:
+        return []
+    conn.execute("DELETE FROM temp.Aenderungen")
+    if conn.in_transaction:
+        conn.commit()
+
+    grouped = {}
+    for table, kind, row_id, category_id, month in rows:
+        ids, categories, months = grouped.setdefault((table, kind), (set(), set(), set()))
+        ids.add(row_id)
+        if category_id is not None:
+            categories.add(category_id)
+        if month is not None:
+            months.add(month)
+
+    events = []
+    for (table, kind), (ids, categories, months) in grouped.items():
+        if table == "Haupt":
+            events.append(
+                TRANSACTION_EVENTS[kind](
+                    frozenset(ids), frozenset(categories), frozenset(months)
+                )
+            )
+        else:
+            events.append(CategoryChanged(kind, frozenset(ids)))
+    return events
+
+
+class ChangeSet:
+    """
+    Fasst mehrere Ereignisse zusammen, z.B. alle Ereignisse eines Event-Loop-Durchlaufs.
+
+    Views prüfen damit, ob eine Änderung die angezeigten Daten betrifft.
+    """
+
+    def __init__(self, events=()):
+        self.events = list(events)
+        self.transaction_ids = set()
+        self.categories = set()
+        self.months = set()
+        self.category_ids = set()
+        for event in self.events:
+            if isinstance(event, TransactionEvent):
+                self.transaction_ids |= event.ids
+                self.categories |= event.categories
+                self.months |= event.months
+            elif isinstance(event, CategoryChanged):
+                self.category_ids |= event.ids
+
+    @property
+    def transactions_changed(self):
+        return bool(self.transaction_ids)
+
+    @property
+    def categories_changed(self):
+        return bool(self.category_ids)
+
+    def touches_month(self, month):
+        """Prüft, ob Transaktionen des Monats (yyyy-MM) betroffen sind."""
+        return month in self.months
+
+    def __bool__(self):
+        return bool(self.events)
+
+    def __repr__(self):
+        return f"ChangeSet({self.events!r})"
@@ -0,0 +1,326 @@
+import csv
+import io
+import os
+import sqlite3
+import xml.etree.ElementTree as ET
+from datetime import datetime
+from functools import lru_cache
+from itertools import islice
+
+# Mögliche Spaltennamen in Bank-CSV-Dateien für die Felder der Tabelle 'Haupt'
+CSV_COLUMNS = {
+    "Datum": ["Datum", "Buchungstag", "Buchungsdatum", "Valutadatum", "Date"],
+    "Betrag": ["Transaktion", "Betrag", "Umsatz", "Betrag (EUR)", "Amount"],
+    "Name": [
+        "Name_Transaktion",
+        "Beguenstigter/Zahlungspflichtiger",
+        "Empfänger",
+        "Auftraggeber / Begünstigter",
+        "Name",
+        "Verwendungszweck",
+        "Buchungstext",
+    ],
+    "Kategorie": ["Kategorie", "Category"],
+    "Typ": ["Ausgabe_Einnahme"],
+}
+
+DATE_FORMATS = ("%Y-%m-%d", "%d.%m.%Y", "%d.%m.%y", "%d/%m/%Y")
+
+DEFAULT_CATEGORY = "Sonstiges"
+
+
+class _CountingReader(io.RawIOBase):
+    """Liest eine Binärdatei und zählt die bereits gelesenen Bytes."""
+
+    def __init__(self, raw):
+        self.raw = raw
+        self.bytes_read = 0
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        count = self.raw.readinto(buffer)
+        self.bytes_read += count or 0
+        return count
+
+    def close(self):
+        self.raw.close()
+        super().close()
+
+
+def parse_amount(text):
+    """
+    Wandelt einen Betrag aus einer Bankdatei in eine Zahl um.
+
+    Unterstützt deutsche ("1.234,56") und englische ("1,234.56") Schreibweise.
+    """
+    text = str(text).strip().replace("€", "").replace("EUR", "").replace(" ", "")
+    if "," in text and "." in text:
+        # Das zuletzt stehende Zeichen ist das Dezimaltrennzeichen
+        if text.rfind(",") > text.rfind("."):
+            text = text.replace(".", "").replace(",", ".")
+        else:
+            text = text.replace(",", "")
+    else:
+        text = text.replace(",", ".")
+    return float(text)
+
+
+def parse_date(text):
+    """Wandelt ein Datum aus einer Bankdatei in das Format yyyy-MM-dd um."""
+    return _parse_date(str(text).strip()[:10])
+
+
+@lru_cache(maxsize=4096)
+def _parse_date(text):
+    # Kontoauszüge enthalten viele Buchungen pro Tag, daher lohnt der Cache
+    for date_format in DATE_FORMATS:
+        try:
+            return datetime.strptime(text, date_format).strftime("%Y-%m-%d")
+        except ValueError:
+            continue
+    raise ValueError(f"Unbekanntes Datumsformat: {text!r}")
+
+
+def _resolve_columns(fieldnames, columns):
+    """Ordnet jedem Feld die erste passende Spalte der Datei zu."""
+    available = {name.strip().lower(): name for name in fieldnames or []}
+    resolved = {}
+    for field, candidates in columns.items():
+        for candidate in candidates:
+            if candidate.lower() in available:
+                resolved[field] = available[candidate.lower()]
+                break
+    return resolved
+
+
+def sniff_delimiter(sample):
+    """Erkennt das Trennzeichen einer CSV-Datei anhand ihres Anfangs."""
+    try:
+        return csv.Sniffer().sniff(sample, delimiters=";,\t").delimiter
+    except csv.Error:
+        return ";"
+
+
+def iter_csv_records(stream, columns=None, delimiter=";"):
+    """
+    Liest eine CSV-Datei zeilenweise und liefert vereinheitlichte Datensätze.
+
+    Args:
+        stream: Textstream der CSV-Datei
+        columns (dict): Zuordnung wie CSV_COLUMNS
+
+    Yields:
+        dict: Datensatz mit 'Datum', 'Betrag', 'Name', 'Kategorie' und 'Typ'
+    """
+    reader = csv.DictReader(stream, delimiter=delimiter)
+    resolved = _resolve_columns(reader.fieldnames, columns or CSV_COLUMNS)
+    missing = {"Datum", "Betrag", "Name"} - resolved.keys()
+    if missing:
+        raise ValueError(f"Pflichtspalten fehlen in der CSV-Datei: {sorted(missing)}")
+
+    for line in reader:
+        yield {field: line.get(column) for field, column in resolved.items()}
+
+
+def _local_name(tag):
+    """Entfernt den XML-Namespace aus einem Tag-Namen."""
+    return tag.rsplit("}", 1)[-1]
+
+
+def _find_text(element, path):
+    """Sucht Text entlang eines Pfads aus lokalen Tag-Namen (ohne Namespace)."""
+    current = [element]
+    for name in path:
+        current = [
+            child for parent in current for child in parent if _local_name(child.tag) == name
+        ]
+        if not current:
+            return None
+    text = current[0].text
+    return text.strip() if text else None
+
+
+def iter_camt053_records(stream):
+    """
+    Liest einen CAMT.053-Kontoauszug (XML) inkrementell.
+
+    Jeder Buchungseintrag (<Ntry>) wird nach der Verarbeitung aus dem Baum
+    entfernt, sodass der Speicherbedarf unabhängig von der Dateigröße bleibt.
+
+    Yields:
+        dict: Datensatz mit 'Datum', 'Betrag', 'Name', 'Kategorie' und 'Typ'
+    """
+    stack = []
+    for event, element in ET.iterparse(stream, events=("start", "end")):
+        if event == "start":
+            stack.append(element)
+            continue
+
+        stack.pop()
+        if _local_name(element.tag) != "Ntry":
+            continue
+
+        is_credit = _find_text(element, ["CdtDbtInd"]) == "CRDT"
+        party = "Dbtr" if is_credit else "Cdtr"
+        details = ["NtryDtls", "TxDtls"]
+        name = (
+            _find_text(element, details + ["RltdPties", party, "Nm"])
+            or _find_text(element, details + ["RltdPties", party, "Pty", "Nm"])
+            or _find_text(element, details + ["RmtInf", "Ustrd"])
+            or _find_text(element, ["AddtlNtryInf"])
+        )
+        yield {
+            "Datum": _find_text(element, ["BookgDt", "Dt"])
+            or _find_text(element, ["BookgDt", "DtTm"])
+            or _find_text(element, ["ValDt", "Dt"]),
+            "Betrag": _find_text(element, ["Amt"]),
+            "Name": name,
+            "Kategorie": None,
+            "Typ": "1" if is_credit else "0",
+        }
+
+        # Verarbeiteten Eintrag freigeben
+        if stack:
+            stack[-1].remove(element)
+        element.clear()
+
+
+class CategoryResolver:
+    """
+    Löst Kategorienamen in Kategorie-IDs auf.
+
+    Alle vorhandenen Kategorien werden einmal geladen und zwischengespeichert.
+    Unbekannte Namen werden als neue Kategorie angelegt. Schlägt das fehl,
+    bricht der Import mit einem ValueError ab, statt Zeilen ohne Kategorie
+    zu schreiben.
+    """
+
+    def __init__(self, db_manager, default_category=DEFAULT_CATEGORY):
+        self.db_manager = db_manager
+        self.default_category = default_category
+        self._cache = {
+            name.strip().lower(): category_id
+            for category_id, name in db_manager.fetchall(
+                "SELECT Kategorie_ID, Kategorie FROM Kategorie"
+            )
+            if name
+        }
+
+    def resolve(self, name):
+        name = (name or "").strip() or self.default_category
+        key = name.lower()
+        if key not in self._cache:
+            try:
+                category_id = self.db_manager.add_category(name)
+            except sqlite3.Error as e:
+                raise ValueError(f"Kategorie {name!r} konnte nicht angelegt werden: {e}") from e
+            if category_id is None:
+                raise ValueError(f"Kategorie {name!r} konnte nicht angelegt werden")
+            self._cache[key] = category_id
+        return self._cache[key]
+
+
+def parse_record(record):
+    """
+    Wandelt einen vereinheitlichten Datensatz in eine Transaktion für 'Haupt'
+    um, noch ohne Kategorie (siehe CategoryResolver).
+
+    Raises:
+        ValueError: Betrag oder Datum lassen sich nicht lesen
+    """
+    amount = parse_amount(record["Betrag"])
+    type_ = record.get("Typ")
+    if type_ not in ("0", "1"):
+        # Ohne eigene Spalte entscheidet das Vorzeichen über Ausgabe/Einnahme
+        type_ = "1" if amount > 0 else "0"
+    return {
+        "Transaktion": abs(amount),
+        "Name_Transaktion": (record.get("Name") or "").strip() or "Unbekannt",
+        "Ausgabe_Einnahme": type_,
+        "Datum": parse_date(record["Datum"]),
+    }
+
+
+def _readable_transactions(records, resolver, skipped):
+    """
+    Wandelt die Datensätze um und überspringt solche, die sich nicht lesen
+    lassen. Kann eine Kategorie nicht angelegt werden, bricht der Import ab.
+    """
+    for number, record in enumerate(records, start=1):
+        try:
+            transaction = parse_record(record)
+        except ValueError as e:
+            print(f"Datensatz {number} übersprungen: {e}")
+            skipped.append((number, str(e)))
+            continue
+        transaction["Kategorie_FK"] = resolver.resolve(record.get("Kategorie"))
+        yield transaction
+
+
+def detect_format(path):
+    """Erkennt anhand der Dateiendung, ob es sich um CSV oder CAMT.053 handelt."""
+    return "camt053" if path.lower().endswith(".xml") else "csv"
+
+
+def import_file(
+    db_manager,
+    path,
+    file_format=None,
+    chunk_size=1000,
+    progress=None,
+    encoding="utf-8-sig",
+    columns=None,
+    skipped=None,
+):
+    """
+    Importiert eine CSV- oder CAMT.053-Datei in die Datenbank.
+
+    Die Datei wird nie vollständig geladen: Lesen, Umwandeln und Schreiben
+    bilden eine Generator-Kette, geschrieben wird blockweise über
+    `DatabaseManager.add_transactions`.
+
+    Datensätze mit unlesbarem Betrag oder Datum werden übersprungen und in
+    `skipped` gemeldet, statt den Import nach der Hälfte abzubrechen. Fehler
+    der Datenbank oder beim Anlegen einer Kategorie brechen ab; bereits
+    geschriebene Blöcke bleiben dann erhalten.
+
+    Args:
+        progress (callable): Wird nach jedem Block mit
+            (importierte Zeilen, gelesene Bytes, Dateigröße) aufgerufen
+        skipped (list): Erhält für jeden übersprungenen Datensatz
+            (Nummer ab 1, Fehlermeldung)
+
+    Returns:
+        int: Anzahl der importierten Transaktionen
+    """
+    file_format = file_format or detect_format(path)
+    total_bytes = os.path.getsize(path)
+    resolver = CategoryResolver(db_manager)
+
+    with _CountingReader(open(path, "rb", buffering=0)) as counter:
+        buffered = io.BufferedReader(counter)
+        if file_format == "camt053":
+            records = iter_camt053_records(buffered)
+        else:
+            # Trennzeichen am Dateianfang erkennen, ohne ihn zu verbrauchen
+            sample = buffered.peek(8192)[:8192].decode(encoding, errors="ignore")
+            text = io.TextIOWrapper(buffered, encoding=encoding, newline="")
+            records = iter_csv_records(text, columns, sniff_delimiter(sample))
+
+        transactions = _readable_transactions(
+            records, resolver, skipped if skipped is not None else []
+        )
+
+        imported = 0
+        while True:
+            chunk = list(islice(transactions, chunk_size))
+            if not chunk:
+                break
+            db_manager.add_transactions(chunk, chunk_size=chunk_size)
+            imported += len(chunk)
+            if progress:
+                progress(imported, counter.bytes_read, total_bytes)
+
+    return imported
@@ -0,0 +1,749 @@
+import argparse
+import re
+import sqlite3
+
+from Core.dates import normalize_date
+from Core.money import to_cents
+
+
+def _create_base_tables(conn):
+    """Legt die Grundtabellen an, falls die Datenbank noch leer ist."""
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS Kategorie (
+            Kategorie_ID INTEGER NOT NULL UNIQUE,
+            Kategorie TEXT,
+            Budget INTEGER,
+            PRIMARY KEY(Kategorie_ID AUTOINCREMENT)
+        )
+        """
+    )
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS Haupt (
+            ID INTEGER NOT NULL UNIQUE,
+            Transaktion INTEGER NOT NULL,
+            Name_Transaktion TEXT NOT NULL,
+            Kategorie_FK INTEGER NOT NULL DEFAULT 0,
+            Ausgabe_Einnahme TEXT NOT NULL,
+            Datum TEXT NOT NULL,
+            PRIMARY KEY(ID AUTOINCREMENT),
+            FOREIGN KEY (Kategorie_FK) REFERENCES Kategorie(Kategorie_ID) ON UPDATE CASCADE
+        )
+        """
+    )
+
+
+def _create_indexes(conn):
+    """
+    Legt zusammengesetzte, abdeckende Indizes für die Aggregat-Abfragen an.
+
+    - Ausgaben pro Kategorie: Filter auf Ausgabe_Einnahme, Gruppierung nach Kategorie_FK
+    - Budget pro Kategorie: Join über Kategorie_FK, Summe über Transaktion
+    - Monatsbudget: Filter auf Ausgabe_Einnahme und Datum
+    """
+    conn.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_Haupt_Typ_Kategorie
+        ON Haupt (Ausgabe_Einnahme, Kategorie_FK, Transaktion)
+        """
+    )
+    conn.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_Haupt_Kategorie
+        ON Haupt (Kategorie_FK, Transaktion)
+        """
+    )
+    conn.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_Haupt_Typ_Datum
+        ON Haupt (Ausgabe_Einnahme, Datum, Transaktion)
+        """
+    )
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_Kategorie_Name ON Kategorie (Kategorie)"
+    )
+
+
+def _create_search_index(conn):
+    """
+    Legt den Volltextindex 'Haupt_FTS' über Transaktions- und Kategorienamen an.
+
+    Die rowid des Index entspricht Haupt.ID. Trigger auf 'Haupt' und 'Kategorie'
+    halten ihn synchron. Ist FTS5 in der SQLite-Bibliothek nicht verfügbar,
+    wird der Index übersprungen und die Suche nutzt weiterhin LIKE.
+
+    Zusätzlich erhält Datum einen eigenen Index für die Suche nach Zeiträumen.
+    """
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_Haupt_Datum ON Haupt (Datum)")
+    try:
+        conn.execute(
+            """
+            CREATE VIRTUAL TABLE IF NOT EXISTS Haupt_FTS USING fts5(
+                Name_Transaktion,
+                Kategorie,
+                tokenize = 'unicode61 remove_diacritics 2',
+                prefix = '2 3'
+            )
+            """
+        )
+    except sqlite3.OperationalError as e:
+        print(f"Volltextsuche nicht verfügbar, Suche nutzt LIKE: {e}")
+        return
+
+    conn.execute(
+        """
+        INSERT INTO Haupt_FTS (rowid, Name_Transaktion, Kategorie)
+        SELECT Haupt.ID, Haupt.Name_Transaktion, Kategorie.Kategorie
+        FROM Haupt
+        LEFT JOIN Kategorie ON Haupt.Kategorie_FK = Kategorie.Kategorie_ID
+        """
+    )
+    # Einzeln ausführen: executescript würde die laufende Transaktion beenden
+    for trigger in (
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_Haupt_FTS_insert AFTER INSERT ON Haupt
+        BEGIN
+            INSERT INTO Haupt_FTS (rowid, Name_Transaktion, Kategorie)
+            VALUES (
+                NEW.ID,
+                NEW.Name_Transaktion,
+                (SELECT Kategorie FROM Kategorie WHERE Kategorie_ID = NEW.Kategorie_FK)
+            );
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_Haupt_FTS_delete AFTER DELETE ON Haupt
+        BEGIN
+            DELETE FROM Haupt_FTS WHERE rowid = OLD.ID;
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_Haupt_FTS_update
+        AFTER UPDATE OF ID, Name_Transaktion, Kategorie_FK ON Haupt
+        BEGIN
+            DELETE FROM Haupt_FTS WHERE rowid = OLD.ID;
+            INSERT INTO Haupt_FTS (rowid, Name_Transaktion, Kategorie)
+            VALUES (
+                NEW.ID,
+                NEW.Name_Transaktion,
+                (SELECT Kategorie FROM Kategorie WHERE Kategorie_ID = NEW.Kategorie_FK)
+            );
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_Kategorie_FTS_insert AFTER INSERT ON Kategorie
+        BEGIN
+            UPDATE Haupt_FTS SET Kategorie = NEW.Kategorie
+            WHERE rowid IN (SELECT ID FROM Haupt WHERE Kategorie_FK = NEW.Kategorie_ID);
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_Kategorie_FTS_update
+        AFTER UPDATE OF Kategorie_ID, Kategorie ON Kategorie
+        BEGIN
+            UPDATE Haupt_FTS SET Kategorie = NULL
+            WHERE rowid IN (SELECT ID FROM Haupt WHERE Kategorie_FK = OLD.Kategorie_ID);
+            UPDATE Haupt_FTS SET Kategorie = NEW.Kategorie
+            WHERE rowid IN (SELECT ID FROM Haupt WHERE Kategorie_FK = NEW.Kategorie_ID);
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_Kategorie_FTS_delete AFTER DELETE ON Kategorie
+        BEGIN
+            UPDATE Haupt_FTS SET Kategorie = NULL
+            WHERE rowid IN (SELECT ID FROM Haupt WHERE Kategorie_FK = OLD.Kategorie_ID);
+        END
+        """,
+    ):
+        conn.execute(trigger)
+
+
+# Schlüssel einer Zeile in 'Kategorie_Monat' für eine Transaktion (NEW/OLD/Haupt)
+_CATEGORY_MONTH_KEY = (
+    "COALESCE({row}.Kategorie_FK, 0), COALESCE(substr({row}.Datum, 1, 7), ''), "
+    "COALESCE({row}.Ausgabe_Einnahme, '')"
+)
+
+_CATEGORY_MONTH_ADD = f"""
+    INSERT INTO Kategorie_Monat (Kategorie_FK, Monat, Ausgabe_Einnahme, Summe, Anzahl)
+    VALUES ({_CATEGORY_MONTH_KEY.format(row="NEW")}, COALESCE(NEW.Transaktion, 0), 1)
+    ON CONFLICT (Kategorie_FK, Monat, Ausgabe_Einnahme)
+    DO UPDATE SET Summe = Summe + excluded.Summe, Anzahl = Anzahl + 1;
+"""
+
+_CATEGORY_MONTH_REMOVE = f"""
+    UPDATE Kategorie_Monat
+    SET Summe = Summe - COALESCE(OLD.Transaktion, 0), Anzahl = Anzahl - 1
+    WHERE (Kategorie_FK, Monat, Ausgabe_Einnahme) = ({_CATEGORY_MONTH_KEY.format(row="OLD")});
+    DELETE FROM Kategorie_Monat
+    WHERE (Kategorie_FK, Monat, Ausgabe_Einnahme) = ({_CATEGORY_MONTH_KEY.format(row="OLD")})
+    AND Anzahl <= 0;
+"""
+
+
+def rebuild_category_months(conn):
+    """
+    Berechnet die Tabelle 'Kategorie_Monat' vollständig aus 'Haupt' neu.
+
+    Die Trigger halten die Tabelle laufend aktuell; ein Neuaufbau ist nur
+    nach Änderungen an den Triggern oder zum Beheben von Rundungsfehlern nötig.
+    """
+    conn.execute("DELETE FROM Kategorie_Monat")
+    conn.execute(
+        f"""
+        INSERT INTO Kategorie_Monat (Kategorie_FK, Monat, Ausgabe_Einnahme, Summe, Anzahl)
+        SELECT {_CATEGORY_MONTH_KEY.format(row="Haupt")},
+               SUM(COALESCE(Haupt.Transaktion, 0)),
+               COUNT(*)
+        FROM Haupt
+        GROUP BY 1, 2, 3
+        """
+    )
+
+
+def _create_category_months(conn):
+    """
+    Legt die Summentabelle 'Kategorie_Monat' an.
+
+    Sie enthält Summe und Anzahl der Transaktionen je Kategorie, Monat (yyyy-MM)
+    und Ausgabe/Einnahme. Trigger auf 'Haupt' halten sie aktuell, sodass die
+    Diagramme nicht mehr über die gesamte Historie summieren müssen.
+    """
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS Kategorie_Monat (
+            Kategorie_FK INTEGER NOT NULL,
+            Monat TEXT NOT NULL,
+            Ausgabe_Einnahme TEXT NOT NULL,
+            Summe REAL NOT NULL DEFAULT 0,
+            Anzahl INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (Kategorie_FK, Monat, Ausgabe_Einnahme)
+        ) WITHOUT ROWID
+        """
+    )
+    conn.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_Kategorie_Monat_Typ_Monat
+        ON Kategorie_Monat (Ausgabe_Einnahme, Monat, Summe)
+        """
+    )
+    rebuild_category_months(conn)
+
+    for trigger in (
+        f"""
+        CREATE TRIGGER IF NOT EXISTS trg_Haupt_Monat_insert AFTER INSERT ON Haupt
+        BEGIN
+            {_CATEGORY_MONTH_ADD}
+        END
+        """,
+        f"""
+        CREATE TRIGGER IF NOT EXISTS trg_Haupt_Monat_delete AFTER DELETE ON Haupt
+        BEGIN
+            {_CATEGORY_MONTH_REMOVE}
+        END
+        """,
+        f"""
+        CREATE TRIGGER IF NOT EXISTS trg_Haupt_Monat_update
+        AFTER UPDATE OF Transaktion, Kategorie_FK, Ausgabe_Einnahme, Datum ON Haupt
+        BEGIN
+            {_CATEGORY_MONTH_REMOVE}
+            {_CATEGORY_MONTH_ADD}
+        END
+        """,
+    ):
+        conn.execute(trigger)
+
+
+def _cents_or_value(amount):
+    """SQL-Funktion für die Migration: Euro in Cent, unlesbare Werte bleiben erhalten."""
+    try:
+        return to_cents(amount)
+    except ValueError:
+        return amount
+
+
+def _change_column_type(conn, table, column, type_, expression=None):
+    """
+    Ändert den Typ einer Spalte, indem die Tabelle neu aufgebaut wird.
+
+    SQLite kann den Typ einer Spalte nicht direkt ändern. Die Tabelle wird
+    deshalb mit der gespeicherten CREATE-Anweisung (nur mit neuem Typ der
+    Spalte) neu angelegt und umkopiert. IDs, Einschränkungen, der
+    AUTOINCREMENT-Zähler, Indizes und Trigger bleiben erhalten.
+
+    Args:
+        expression (str): SQL-Ausdruck für den neuen Wert (Standard: die Spalte)
+    """
+    create_sql = conn.execute(
+        "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)
+    ).fetchone()[0]
+    new_table = f"{table}_neu"
+    create_sql, replaced = re.subn(
+        rf"((?<!\w)\"?{column}\"?\s+)\w+", rf"\g<1>{type_}", create_sql, count=1
+    )
+    if not replaced:
+        raise sqlite3.OperationalError(f"Spalte {column} nicht in {table} gefunden")
+    create_sql = re.sub(
+        rf"^(\s*CREATE\s+TABLE\s+)[\"`\[]?{table}[\"`\]]?", rf"\g<1>{new_table}", create_sql
+    )
+
+    # Indizes und Trigger, die die Tabelle betreffen, werden danach neu angelegt.
+    # Trigger mit Verweisen auf die Tabelle müssen vor DROP TABLE weg, sonst
+    # schlägt das Umbenennen wegen ungültiger Verweise fehl.
+    indexes = [
+        row[0]
+        for row in conn.execute(
+            "SELECT sql FROM sqlite_master WHERE type = 'index' AND tbl_name = ? AND sql IS NOT NULL",
+            (table,),
+        )
+    ]
+    triggers = conn.execute(
+        "SELECT name, sql FROM sqlite_master WHERE type = 'trigger' "
+        "AND (tbl_name = ? OR instr(sql, ?) > 0)",
+        (table, table),
+    ).fetchall()
+    for name, _ in triggers:
+        conn.execute(f'DROP TRIGGER "{name}"')
+
+    has_sequence = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'sqlite_sequence'"
+    ).fetchone()
+    sequence = None
+    if has_sequence:
+        sequence = conn.execute(
+            "SELECT seq FROM sqlite_sequence WHERE name = ?", (table,)
+        ).fetchone()
+
+    columns = [row[1] for row in conn.execute(f'PRAGMA table_info("{table}")')]
+    values = [
+        (expression or column) if name == column else f'"{name}"' for name in columns
+    ]
+    column_list = ", ".join(f'"{name}"' for name in columns)
+    conn.execute(create_sql)
+    conn.execute(
+        f'INSERT INTO "{new_table}" ({column_list}) SELECT {", ".join(values)} FROM "{table}"'
+    )
+    conn.execute(f'DROP TABLE "{table}"')
+    conn.execute(f'ALTER TABLE "{new_table}" RENAME TO "{table}"')
+    if sequence:
+        conn.execute(
+            "UPDATE sqlite_sequence SET seq = MAX(seq, ?) WHERE name = ?",
+            (sequence[0], table),
+        )
+
+    for statement in indexes + [sql for _, sql in triggers]:
+        conn.execute(statement)
+
+
+def _store_amounts_in_cents(conn):
+    """
+    Speichert Beträge als ganze Cent (INTEGER) statt als Gleitkommazahl.
+
+    'Haupt.Transaktion' wird umgerechnet und 'Kategorie_Monat.Summe' aus den
+    Cent-Beträgen neu berechnet, sodass alle Summen exakt mit Ganzzahlen
+    arbeiten. Die Umrechnung rundet über die Dezimaldarstellung (siehe
+    Core.money.to_cents), da ROUND(x * 100) in SQLite z.B. 0.285 zu 28 macht.
+    """
+    conn.create_function("_to_cents", 1, _cents_or_value, deterministic=True)
+    _change_column_type(
+        conn, "Haupt", "Transaktion", "INTEGER", "_to_cents(Transaktion)"
+    )
+    _change_column_type(conn, "Kategorie_Monat", "Summe", "INTEGER")
+    rebuild_category_months(conn)
+
+
+# Tagesschlüssel yyyymmdd (INTEGER) aus einem Datum, das mit yyyy-MM-dd beginnt.
+# Auch Werte mit Uhrzeit ("2025-01-26 19:47:36") erhalten so denselben Schlüssel;
+# andere Formate ergeben NULL.
+DAY_KEY_SQL = (
+    "(CASE WHEN {date} GLOB '[0-9][0-9][0-9][0-9]-[0-9][0-9]-[0-9][0-9]*' "
+    "THEN CAST(substr({date}, 1, 4) || substr({date}, 6, 2) || substr({date}, 9, 2) AS INTEGER) "
+    "END)"
+)
+
+
+def _create_day_key(conn):
+    """
+    Legt die Spalte 'Haupt.Datum_Tag' (yyyymmdd als INTEGER) mit Index an.
+
+    Datumsfilter werden als Bereich über diese Spalte formuliert, z.B. ein
+    Monat als Datum_Tag >= 20250100 AND Datum_Tag < 20250200, und können so
+    den Index nutzen statt strftime() auf jeder Zeile auszuwerten. Die Trigger
+    setzen den Schlüssel nur, wenn er nicht schon beim Einfügen passend
+    mitgegeben wurde (siehe DatabaseManager.add_transactions).
+
+    Ersetzt den Index auf dem Text-Datum aus Migration 3.
+    """
+    conn.execute("ALTER TABLE Haupt ADD COLUMN Datum_Tag INTEGER")
+    conn.execute(f"UPDATE Haupt SET Datum_Tag = {DAY_KEY_SQL.format(date='Datum')}")
+    conn.execute("DROP INDEX IF EXISTS idx_Haupt_Datum")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_Haupt_Datum_Tag ON Haupt (Datum_Tag)")
+
+    new_key = DAY_KEY_SQL.format(date="NEW.Datum")
+    for trigger in (
+        f"""
+        CREATE TRIGGER IF NOT EXISTS trg_Haupt_Tag_insert AFTER INSERT ON Haupt
+        WHEN NEW.Datum_Tag IS NOT {new_key}
+        BEGIN
+            UPDATE Haupt SET Datum_Tag = {new_key} WHERE ID = NEW.ID;
+        END
+        """,
+        f"""
+        CREATE TRIGGER IF NOT EXISTS trg_Haupt_Tag_update
+        AFTER UPDATE OF Datum, Datum_Tag ON Haupt
+        WHEN NEW.Datum_Tag IS NOT {new_key}
+        BEGIN
+            UPDATE Haupt SET Datum_Tag = {new_key} WHERE ID = NEW.ID;
+        END
+        """,
+    ):
+        conn.execute(trigger)
+
+
+def _create_paging_index(conn):
+    """
+    Legt den Index für das seitenweise Lesen der Übersicht an.
+
+    Die Übersicht liest die Transaktionen sortiert nach (Datum DESC, ID DESC)
+    und setzt jede Seite hinter der letzten Zeile der vorherigen fort
+    (siehe DatabaseManager.fetch_transactions_page). Über diesen Index ist
+    jede Seite ein Bereichszugriff, unabhängig von der Länge der Historie.
+    """
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_Haupt_Datum_ID ON Haupt (Datum, ID)")
+
+
+def _create_filter_indexes(conn):
+    """
+    Legt Indizes für die Filter der Suchsprache an (siehe Core.search_query).
+
+    - amount>/amount<: Bereichsabfrage auf dem Betrag in Cent
+    - cat: mit from:/to:: Kategorie und Zeitraum in einem Index, sodass
+      "Lebensmittel im März" nur die passenden Zeilen liest
+    - cat:: Präfixsuche auf dem Kategorienamen ohne Beachtung der
+      Groß-/Kleinschreibung (LIKE nutzt nur einen Index mit NOCASE)
+    """
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_Haupt_Transaktion ON Haupt (Transaktion)"
+    )
+    conn.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_Haupt_Kategorie_Tag
+        ON Haupt (Kategorie_FK, Datum_Tag)
+        """
+    )
+    conn.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_Kategorie_Name_NOCASE
+        ON Kategorie (Kategorie COLLATE NOCASE)
+        """
+    )
+
+
+# Längste Bezeichnung, deren Trigramme vollständig indiziert werden
+MAX_TRIGRAM_TEXT = 256
+
+# Trigramme eines Suchworts werden aus " wort " gebildet, damit auch Anfang
+# und Ende des Worts als eigene Trigramme zählen ("kino" -> " ki", "kin",
+# "ino", "no "). Die Positionen liefert die Hilfstabelle Trigramm_Position,
+# weil Trigger keine rekursiven CTEs enthalten dürfen.
+_TRIGRAMS = (
+    "SELECT substr(' ' || {word} || ' ', n, 3) FROM Trigramm_Position "
+    "WHERE n <= length({word})"
+)
+
+_TRIGRAM_COUNT = (
+    "(SELECT COUNT(DISTINCT substr(' ' || {word} || ' ', n, 3)) "
+    "FROM Trigramm_Position WHERE n <= length({word}))"
+)
+
+# Ein Vorkommen eines Suchworts hinzufügen. Wort und Trigramme werden nur für
+# ein neues Wort geschrieben, Wiederholungen kosten nur das Hochzählen.
+_SEARCH_WORD_ADD = f"""
+    UPDATE Suchwort SET Anzahl = Anzahl + 1 WHERE Wort = {{word}};
+    INSERT INTO Suchwort (Wort, Anzahl, Trigramme)
+    SELECT {{word}}, 1, {_TRIGRAM_COUNT}
+    WHERE {{word}} IS NOT NULL
+    AND NOT EXISTS (SELECT 1 FROM Suchwort WHERE Wort = {{word}});
+    INSERT OR IGNORE INTO Suchwort_Trigramm (Trigramm, Suchwort_ID)
+    SELECT substr(' ' || {{word}} || ' ', n, 3), Suchwort.Suchwort_ID
+    FROM Suchwort JOIN Trigramm_Position ON n <= length(Suchwort.Wort)
+    WHERE Suchwort.Wort = {{word}} AND Suchwort.Anzahl = 1;
+"""
+
+# Ein Vorkommen entfernen; das letzte entfernt Wort und Trigramme
+_SEARCH_WORD_REMOVE = f"""
+    UPDATE Suchwort SET Anzahl = Anzahl - 1 WHERE Wort = {{word}};
+    DELETE FROM Suchwort_Trigramm
+    WHERE Suchwort_ID = (
+        SELECT Suchwort_ID FROM Suchwort WHERE Wort = {{word}} AND Anzahl <= 0
+    )
+    AND Trigramm IN ({_TRIGRAMS});
+    DELETE FROM Suchwort WHERE Wort = {{word}} AND Anzahl <= 0;
+"""
+
+# Normalisierte Suchwörter aus Transaktions- und Kategorienamen
+SEARCH_WORD_SQL = "lower({name})"
+
+
+def rebuild_search_words(conn):
+    """
+    Berechnet die Suchwörter und ihre Trigramme vollständig neu.
+
+    Die Trigger halten beide Tabellen laufend aktuell; ein Neuaufbau ist nur
+    beim Anlegen oder nach Änderungen an den Triggern nötig.
+    """
+    conn.execute("DELETE FROM Suchwort_Trigramm")
+    conn.execute("DELETE FROM Suchwort")
+    word = SEARCH_WORD_SQL.format(name="Name")
+    conn.execute(
+        f"""
+        INSERT INTO Suchwort (Wort, Anzahl, Trigramme)
+        SELECT Wort, COUNT(*), {_TRIGRAM_COUNT.format(word="Wort")}
+        FROM (
+            SELECT {word} AS Wort FROM (
+                SELECT Name_Transaktion AS Name FROM Haupt
+                UNION ALL
+                SELECT Kategorie FROM Kategorie
+            )
+            WHERE Name IS NOT NULL
+        )
+        GROUP BY Wort
+        """
+    )
+    conn.execute(
+        """
+        INSERT OR IGNORE INTO Suchwort_Trigramm (Trigramm, Suchwort_ID)
+        SELECT substr(' ' || Wort || ' ', n, 3), Suchwort_ID
+        FROM Suchwort JOIN Trigramm_Position ON n <= length(Wort)
+        """
+    )
+
+
+def _create_trigram_index(conn):
+    """
+    Legt den Trigrammindex für die unscharfe Suche an.
+
+    'Suchwort' enthält jeden vorkommenden Transaktions- und Kategorienamen
+    einmal (klein geschrieben) mit der Zahl seiner Vorkommen, und
+    'Suchwort_Trigramm' ordnet jedem Trigramm die Wörter zu, die es enthalten.
+    Ein vertippter Suchbegriff findet so über seine Trigramme die ähnlichsten
+    Namen, ohne 'Haupt' zu lesen (siehe DatabaseManager.fuzzy_matches).
+
+    Da sich Namen stark wiederholen, bleibt der Index auch bei Millionen
+    Transaktionen klein. Trigger auf 'Haupt' und 'Kategorie' halten ihn
+    aktuell; der Ausdrucksindex idx_Haupt_Name findet anschließend die
+    Transaktionen zu den gefundenen Namen.
+    """
+    conn.execute("CREATE TABLE IF NOT EXISTS Trigramm_Position (n INTEGER PRIMARY KEY)")
+    conn.execute(
+        f"""
+        INSERT OR IGNORE INTO Trigramm_Position (n)
+        WITH RECURSIVE Zahl(n) AS (
+            SELECT 1 UNION ALL SELECT n + 1 FROM Zahl WHERE n < {MAX_TRIGRAM_TEXT}
+        )
+        SELECT n FROM Zahl
+        """
+    )
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS Suchwort (
+            Suchwort_ID INTEGER PRIMARY KEY,
+            Wort TEXT NOT NULL UNIQUE,
+            Anzahl INTEGER NOT NULL DEFAULT 0,
+            Trigramme INTEGER NOT NULL DEFAULT 0
+        )
+        """
+    )
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS Suchwort_Trigramm (
+            Trigramm TEXT NOT NULL,
+            Suchwort_ID INTEGER NOT NULL,
+            PRIMARY KEY (Trigramm, Suchwort_ID)
+        ) WITHOUT ROWID
+        """
+    )
+    conn.execute(
+        f"""
+        CREATE INDEX IF NOT EXISTS idx_Haupt_Name
+        ON Haupt ({SEARCH_WORD_SQL.format(name="Name_Transaktion")})
+        """
+    )
+    rebuild_search_words(conn)
+
+    name = {
+        row: SEARCH_WORD_SQL.format(name=f"{row}.Name_Transaktion")
+        for row in ("NEW", "OLD")
+    }
+    category = {
+        row: SEARCH_WORD_SQL.format(name=f"{row}.Kategorie") for row in ("NEW", "OLD")
+    }
+    for trigger in (
+        f"""
+        CREATE TRIGGER IF NOT EXISTS trg_Haupt_Suchwort_insert AFTER INSERT ON Haupt
+        BEGIN
+            {_SEARCH_WORD_ADD.format(word=name["NEW"])}
+        END
+        """,
+        f"""
+        CREATE TRIGGER IF NOT EXISTS trg_Haupt_Suchwort_delete AFTER DELETE ON Haupt
+        BEGIN
+            {_SEARCH_WORD_REMOVE.format(word=name["OLD"])}
+        END
+        """,
+        f"""
+        CREATE TRIGGER IF NOT EXISTS trg_Haupt_Suchwort_update
+        AFTER UPDATE OF Name_Transaktion ON Haupt
+        WHEN {name["OLD"]} IS NOT {name["NEW"]}
+        BEGIN
+            {_SEARCH_WORD_REMOVE.format(word=name["OLD"])}
+            {_SEARCH_WORD_ADD.format(word=name["NEW"])}
+        END
+        """,
+        f"""
+        CREATE TRIGGER IF NOT EXISTS trg_Kategorie_Suchwort_insert AFTER INSERT ON Kategorie
+        BEGIN
+            {_SEARCH_WORD_ADD.format(word=category["NEW"])}
+        END
+        """,
+        f"""
+        CREATE TRIGGER IF NOT EXISTS trg_Kategorie_Suchwort_delete AFTER DELETE ON Kategorie
+        BEGIN
+            {_SEARCH_WORD_REMOVE.format(word=category["OLD"])}
+        END
+        """,
+        f"""
+        CREATE TRIGGER IF NOT EXISTS trg_Kategorie_Suchwort_update
+        AFTER UPDATE OF Kategorie ON Kategorie
+        WHEN {category["OLD"]} IS NOT {category["NEW"]}
+        BEGIN
+            {_SEARCH_WORD_REMOVE.format(word=category["OLD"])}
+            {_SEARCH_WORD_ADD.format(word=category["NEW"])}
+        END
+        """,
+    ):
+        conn.execute(trigger)
+
+
+def _create_calendar_index(conn):
+    """
+    Legt den abdeckenden Index für die Kalenderansicht der Suchleiste an.
+
+    Die Summen je Tag eines Monats (DatabaseManager.fetch_day_totals) lesen
+    damit nur den Index in der Reihenfolge der Tage, ohne für jede Buchung
+    die Tabellenzeile nachzuschlagen.
+    """
+    conn.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_Haupt_Tag_Typ_Betrag
+        ON Haupt (Datum_Tag, Ausgabe_Einnahme, Transaktion)
+        """
+    )
+
+
+def _date_or_value(date):
+    """SQL-Funktion für die Migration: Datum mit führenden Nullen, andere Werte bleiben erhalten."""
+    try:
+        return normalize_date(date)
+    except ValueError:
+        return date
+
+
+def _pad_dates(conn):
+    """
+    Ergänzt führende Nullen in Daten wie "2024-05-3".
+
+    strptime() hat solche Daten beim Speichern akzeptiert, DAY_KEY_SQL gibt
+    ihnen aber keinen Tagesschlüssel. In 'Kategorie_Monat' zählten sie zum
+    Monat, beim Aufklappen des Monats und im Kalender fehlten sie. Die
+    Trigger setzen Datum_Tag und die Summentabelle nach.
+    """
+    conn.create_function("_normalize_date", 1, _date_or_value, deterministic=True)
+    conn.execute(
+        """
+        UPDATE Haupt SET Datum = _normalize_date(Datum)
+        WHERE Datum_Tag IS NULL AND _normalize_date(Datum) IS NOT Datum
+        """
+    )
+
+
+# Liste aller Migrationen: (Version, Beschreibung, Funktion)
+# Neue Migrationen werden immer am Ende mit der nächsten Versionsnummer angehängt.
+MIGRATIONS = [
+    (1, "Grundtabellen anlegen", _create_base_tables),
+    (2, "Indizes für Haupt und Kategorie", _create_indexes),
+    (3, "Volltextindex für die Suche", _create_search_index),
+    (4, "Summentabelle Kategorie_Monat", _create_category_months),
+    (5, "Beträge in Cent", _store_amounts_in_cents),
+    (6, "Tagesschlüssel Datum_Tag", _create_day_key),
+    (7, "Index für seitenweises Lesen", _create_paging_index),
+    (8, "Indizes für die Suchfilter", _create_filter_indexes),
+    (9, "Trigrammindex für die unscharfe Suche", _create_trigram_index),
+    (10, "Index für die Kalenderansicht", _create_calendar_index),
+    (11, "Führende Nullen im Datum", _pad_dates),
+]
+
+
+def get_schema_version(conn):
+    """Liest die in der Datenbank gespeicherte Schema-Version."""
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def migrate(conn, migrations=None):
+    """
+    Führt alle noch nicht angewendeten Migrationen in aufsteigender Reihenfolge aus.
+
+    Jede Migration läuft in einer eigenen Transaktion zusammen mit dem Setzen
+    der neuen Schema-Version (PRAGMA user_version). Schlägt eine Migration fehl,
+    wird sie zurückgerollt und die restlichen werden nicht ausgeführt.
+
+    Returns:
+        int: Die Schema-Version nach dem Durchlauf
+    """
+    migrations = MIGRATIONS if migrations is None else migrations
+    version = get_schema_version(conn)
+
+    for target_version, description, apply in migrations:
+        if target_version <= version:
+            continue
+        try:
+            conn.execute("BEGIN")
+            apply(conn)
+            conn.execute(f"PRAGMA user_version = {int(target_version)}")
+            conn.commit()
+            version = target_version
+            print(f"Migration {target_version} angewendet: {description}")
+        except sqlite3.Error as e:
+            conn.rollback()
+            print(f"Fehler bei Migration {target_version} ({description}): {e}")
+            break
+
+    return version
+
+
+def main():
+    """
+    Bringt eine Datenbank auf den aktuellen Stand, z.B.:
+        python -m Core.migrations dingsbums.db --rebuild-aggregates
+    """
+    parser = argparse.ArgumentParser(description="Schema-Migrationen ausführen")
+    parser.add_argument("db_path", help="Pfad zur SQLite-Datenbank")
+    parser.add_argument(
+        "--rebuild-aggregates",
+        action="store_true",
+        help="Summentabelle Kategorie_Monat neu aufbauen",
+    )
+    args = parser.parse_args()
+
+    conn = sqlite3.connect(args.db_path)
+    print(f"Schema-Version: {migrate(conn)}")
+    if args.rebuild_aggregates:
+        with conn:
+            rebuild_category_months(conn)
+        print("Summentabelle Kategorie_Monat neu aufgebaut.")
+    conn.close()
+
+
+if __name__ == "__main__":
+    main()
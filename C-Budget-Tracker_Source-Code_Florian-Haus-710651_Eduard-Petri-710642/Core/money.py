@@ -0,0 +1,36 @@
+from decimal import ROUND_HALF_UP, Decimal, InvalidOperation
+
+# Beträge werden in der Datenbank als ganze Cent gespeichert (INTEGER).
+# Umgerechnet wird nur an den Rändern: beim Schreiben mit `to_cents`, beim
+# Lesen in SQL mit "/ 100.0" oder in Python mit `from_cents`.
+CENTS_PER_UNIT = 100
+
+
+def to_cents(amount):
+    """
+    Wandelt einen Betrag in Euro in ganze Cent um (kaufmännisch gerundet).
+
+    Floats werden über ihre Dezimaldarstellung umgerechnet, damit z.B. 0.285
+    zu 29 Cent wird und nicht durch die Binärdarstellung zu 28.
+
+    Raises:
+        ValueError: Wenn der Betrag keine Zahl ist
+    """
+    if amount is None:
+        return None
+    if isinstance(amount, str):
+        amount = amount.strip().replace(",", ".")
+    try:
+        value = Decimal(str(amount))
+    except InvalidOperation:
+        raise ValueError(f"Ungültiger Betrag {amount!r}")
+    if not value.is_finite():
+        raise ValueError(f"Ungültiger Betrag {amount!r}")
+    return int((value * CENTS_PER_UNIT).quantize(Decimal(1), rounding=ROUND_HALF_UP))
+
+
+def from_cents(cents):
+    """Wandelt ganze Cent in einen Betrag in Euro um."""
+    if cents is None:
+        return None
+    return cents / CENTS_PER_UNIT
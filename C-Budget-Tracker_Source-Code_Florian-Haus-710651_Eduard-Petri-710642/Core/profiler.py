@@ -0,0 +1,176 @@
+import json
+import os
+import re
+import sys
+import threading
+from collections import deque
+
+# Umgebungsvariablen zur Steuerung ohne Codeänderung
+ENV_ENABLED = "BUDGET_QUERY_PROFILE"  # "0" schaltet die Messung ab
+ENV_SLOW_MS = "BUDGET_SLOW_QUERY_MS"  # Schwelle für das Slow-Query-Log in ms
+ENV_DUMP = "BUDGET_QUERY_STATS"  # Datei (oder "-" für die Konsole) für den Bericht beim Schließen
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"(?<![\w.])-?\d+(?:\.\d+)?(?![\w.])")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def fingerprint(query):
+    """
+    Bildet eine normalisierte Form einer SQL-Anweisung.
+
+    Literale werden durch '?' ersetzt und Leerraum zusammengefasst, sodass
+    dieselbe Abfrage mit anderen Werten denselben Fingerabdruck erhält.
+    """
+    query = _STRING_LITERAL.sub("?", query)
+    query = _NUMBER_LITERAL.sub("?", query)
+    return _WHITESPACE.sub(" ", query).strip()
+
+
+def _percentile(values, fraction):
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))
+    return ordered[index]
+
+
+class _QueryStats:
+    """Messwerte einer Abfrage (eines Fingerabdrucks)."""
+
+    def __init__(self, sample_size):
+        self.calls = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.rows = 0
+        self.samples = deque(maxlen=sample_size)
+
+    def add(self, duration_ms, rows):
+        self.calls += 1
+        self.total_ms += duration_ms
+        self.max_ms = max(self.max_ms, duration_ms)
+        self.rows += rows
+        self.samples.append(duration_ms)
+
+    def as_dict(self):
+        return {
+            "calls": self.calls,
+            "total_ms": round(self.total_ms, 3),
+            "avg_ms": round(self.total_ms / self.calls, 3),
+            "p95_ms": round(_percentile(self.samples, 0.95), 3),
+            "max_ms": round(self.max_ms, 3),
+            "rows": self.rows,
+        }
+
+
+class QueryProfiler:
+    """
+    Sammelt Laufzeiten aller Datenbankabfragen pro Fingerabdruck.
+
+    Pro Abfrage werden Aufrufe, Gesamt- und p95-Laufzeit sowie gelieferte
+    (bzw. bei Schreibzugriffen geänderte) Zeilen gezählt. Abfragen über der
+    Schwelle `slow_ms` landen mit ihrem Ausführungsplan im Slow-Query-Log.
+    """
+
+    def __init__(self, enabled=None, slow_ms=None, sample_size=1000, slow_log_size=100):
+        if enabled is None:
+            enabled = os.environ.get(ENV_ENABLED, "1") != "0"
+        if slow_ms is None:
+            slow_ms = float(os.environ.get(ENV_SLOW_MS, 100))
+        self.enabled = enabled
+        self.slow_ms = slow_ms
+        self.sample_size = sample_size
+        self._lock = threading.Lock()
+        self._stats = {}
+        self.slow_queries = deque(maxlen=slow_log_size)
+
+    def record(self, query, duration_ms, rows=0, params=(), explain=None):
+        """
+        Erfasst eine ausgeführte Abfrage.
+
+        Args:
+            duration_ms (float): Laufzeit in Millisekunden
+            rows (int): Anzahl gelieferter oder geänderter Zeilen
+            explain (callable): Liefert bei langsamen Abfragen den
+                Ausführungsplan (Aufruf nur oberhalb der Schwelle)
+        """
+        if not self.enabled:
+            return
+        key = fingerprint(query)
+        with self._lock:
+            stats = self._stats.get(key)
+            if stats is None:
+                stats = self._stats[key] = _QueryStats(self.sample_size)
+            stats.add(duration_ms, max(rows, 0))
+
+        if duration_ms >= self.slow_ms:
+            plan = []
+            if explain:
+                try:
+                    plan = explain()
+                except Exception as e:
+                    plan = [f"Ausführungsplan nicht verfügbar: {e}"]
+            entry = {
+                "query": key,
+                "params": repr(tuple(params or ())),
+                "duration_ms": round(duration_ms, 3),
+                "plan": plan,
+            }
+            with self._lock:
+                self.slow_queries.append(entry)
+            print(f"Langsame Abfrage ({duration_ms:.1f} ms): {key}")
+
+    def stats(self):
+        """Gibt die Messwerte pro Fingerabdruck zurück, sortiert nach Gesamtlaufzeit."""
+        with self._lock:
+            items = [(key, stats.as_dict()) for key, stats in self._stats.items()]
+        return dict(sorted(items, key=lambda item: item[1]["total_ms"], reverse=True))
+
+    def reset(self):
+        """Verwirft alle Messwerte und das Slow-Query-Log."""
+        with self._lock:
+            self._stats.clear()
+            self.slow_queries.clear()
+
+    def report(self, limit=20):
+        """Erstellt einen lesbaren Bericht der teuersten Abfragen."""
+        lines = [
+            f"{'Aufrufe':>8} {'Gesamt ms':>10} {'p95 ms':>8} {'Zeilen':>9}  Abfrage",
+        ]
+        for key, stats in list(self.stats().items())[:limit]:
+            lines.append(
+                f"{stats['calls']:>8} {stats['total_ms']:>10.1f} {stats['p95_ms']:>8.2f} "
+                f"{stats['rows']:>9}  {key[:120]}"
+            )
+        with self._lock:
+            slow_queries = list(self.slow_queries)
+        if slow_queries:
+            lines.append(f"\nLangsame Abfragen (ab {self.slow_ms:g} ms):")
+            for entry in slow_queries:
+                lines.append(f"{entry['duration_ms']:>10.1f} ms  {entry['query'][:120]}")
+                lines.extend(f"{'':>14}{step}" for step in entry["plan"])
+        return "\n".join(lines)
+
+    def dump(self, target=None):
+        """
+        Schreibt die Messwerte als JSON in eine Datei oder als Bericht auf die Konsole.
+
+        Args:
+            target (str): Dateipfad; "-" oder None für die Konsole
+        """
+        if target in (None, "-"):
+            print(self.report(), file=sys.stdout)
+            return
+        with self._lock:
+            slow_queries = list(self.slow_queries)
+        with open(target, "w", encoding="utf-8") as f:
+            json.dump(
+                {"queries": self.stats(), "slow_queries": slow_queries},
+                f,
+                ensure_ascii=False,
+                indent=2,
+            )
+
+    def dump_from_env(self):
+        """Schreibt den Bericht, falls die Umgebungsvariable BUDGET_QUERY_STATS gesetzt ist."""
+        target = os.environ.get(ENV_DUMP)
+        if target:
+            self.dump(target)
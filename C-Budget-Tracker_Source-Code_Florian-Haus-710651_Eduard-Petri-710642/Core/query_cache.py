@@ -0,0 +1,114 @@
+import sys
+import threading
+from collections import OrderedDict
+
+
+def estimate_size(value):
+    """Schätzt den Speicherbedarf eines Abfrageergebnisses in Bytes."""
+    if value is None:
+        return 0
+    if isinstance(value, (list, tuple)):
+        return sys.getsizeof(value) + sum(estimate_size(item) for item in value)
+    return sys.getsizeof(value)
+
+
+class QueryCache:
+    """
+    LRU-Cache für Ergebnisse von Leseabfragen.
+
+    Jeder Eintrag merkt sich die Datenversion, zu der er gelesen wurde.
+    Nach einem Schreibzugriff wird die Version erhöht; ältere Einträge gelten
+    dann als veraltet und werden beim nächsten Zugriff verworfen. Die Anzahl
+    der Einträge und ihr geschätzter Speicherbedarf sind begrenzt.
+    """
+
+    def __init__(self, max_entries=256, max_bytes=4 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()  # Schlüssel -> (Version, Ergebnis, Größe)
+        self._lock = threading.Lock()
+        self._bytes = 0
+        self.version = 0
+
+        # Zähler für die Cache-Statistik
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def bump_version(self):
+        """Markiert alle bisherigen Einträge als veraltet (nach einem Schreibzugriff)."""
+        with self._lock:
+            self.version += 1
+
+    def get(self, key):
+        """
+        Gibt ein gültiges Ergebnis zurück.
+
+        Returns:
+            tuple: (True, Ergebnis) bei einem Treffer, sonst (False, None)
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return False, None
+            version, result, size = entry
+            if version != self.version:
+                self._remove(key)
+                self.invalidations += 1
+                self.misses += 1
+                return False, None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return True, result
+
+    def put(self, key, version, result, size=None):
+        """
+        Speichert ein Ergebnis, das zur Datenversion `version` gelesen wurde.
+
+        Ergebnisse einer inzwischen überholten Version oder solche, die allein
+        die Speichergrenze überschreiten, werden nicht gespeichert.
+
+        Args:
+            size (int): Bereits geschätzte Größe in Bytes (sonst wird sie hier
+                mit estimate_size() bestimmt)
+        """
+        if size is None:
+            size = estimate_size(result)
+        with self._lock:
+            if version != self.version or size > self.max_bytes:
+                return
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (version, result, size)
+            self._bytes += size
+
+            # Am längsten nicht genutzte Einträge verdrängen
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def _remove(self, key):
+        _, _, size = self._entries.pop(key)
+        self._bytes -= size
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self):
+        """Gibt Treffer, Fehlschläge, Verdrängungen und Füllstand zurück."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "version": self.version,
+            }
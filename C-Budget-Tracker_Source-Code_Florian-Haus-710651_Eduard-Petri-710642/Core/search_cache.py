@@ -0,0 +1,185 @@
+import re
+import unicodedata
+from functools import lru_cache
+
+from Core.dates import date_key_range
+from Core.query_cache import QueryCache
+from Core.search_query import parse_query
+
+# Wörter eines Suchbegriffs, wie sie DatabaseManager._search_query bildet
+WORD = re.compile(r"\w+")
+
+
+def cache_key(search_term, fulltext=True):
+    """
+    Schlüssel eines Suchbegriffs im Cache.
+
+    Reine Wortsuchen über den Volltextindex unterscheiden weder Groß- und
+    Kleinschreibung noch Leerzeichen, sie werden daher vereinheitlicht
+    ("Rewe  Markt" -> "rewe markt"). Alle anderen Begriffe (Filter, LIKE-Suche)
+    bleiben unverändert, weil dort beides das Ergebnis ändern kann.
+    """
+    search_term = str(search_term)
+    if fulltext and _is_plain(search_term):
+        return " ".join(search_term.lower().split())
+    return search_term
+
+
+def fold(text):
+    """
+    Bereitet Text wie der Tokenizer des Volltextindex auf.
+
+    'unicode61 remove_diacritics 2' vergleicht klein geschrieben und ohne
+    diakritische Zeichen ("Bäcker" -> "backer").
+    """
+    decomposed = unicodedata.normalize("NFD", str(text).lower())
+    return "".join(char for char in decomposed if not unicodedata.combining(char))
+
+
+def _words(text):
+    return WORD.findall(fold(text))
+
+
+def _is_plain(term):
+    """
+    True für eine reine Wortsuche, deren Treffer sich in Python prüfen lassen.
+
+    Ausgeschlossen sind Filter und Phrasen der Suchsprache, Zahlen (Suche nach
+    ID) und Datumsanfänge (Zeiträume) sowie "_", das der Volltextindex als
+    Trennzeichen liest.
+    """
+    term = str(term).strip()
+    return (
+        bool(_words(term))
+        and "_" not in term
+        and not term.isdigit()
+        and date_key_range(term) is None
+        and not parse_query(term).is_structured
+    )
+
+
+def refines(cached_term, search_term):
+    """
+    Prüft, ob die Treffer von `search_term` in denen von `cached_term` liegen.
+
+    Die Volltextsuche verlangt für jedes Wort einen Wortanfang in Name oder
+    Kategorie. Ist jedes Wort der alten Suche der Anfang eines Worts der
+    neuen ("kau" -> "kaufland", "rewe" -> "rewe mar"), findet die neue Suche
+    nur Zeilen, die auch die alte gefunden hat.
+    """
+    if cached_term == search_term:
+        return False
+    if not _is_plain(search_term) or not _is_plain(cached_term):
+        return False
+    new_words = _words(search_term)
+    return all(
+        any(word.startswith(old) for word in new_words) for old in _words(cached_term)
+    )
+
+
+@lru_cache(maxsize=4096)
+def _row_words(name, category):
+    return _words(f"{name or ''} {category or ''}")
+
+
+def matches(row, search_term):
+    """Prüft eine Zeile (Format von search_transactions) wie die Volltextsuche."""
+    return _matches_words(_row_words(row[2], row[3]), _words(search_term))
+
+
+def _matches_words(row_words, prefixes):
+    return all(any(word.startswith(prefix) for word in row_words) for prefix in prefixes)
+
+
+def filter_rows(rows, search_term):
+    """
+    Filtert Treffer auf die Zeilen, die `search_term` finden würde.
+
+    Namen und Kategorien wiederholen sich in einem Haushaltsbuch ständig,
+    daher wird jedes Paar nur einmal geprüft.
+    """
+    prefixes = _words(search_term)
+    verdicts = {}
+    result = []
+    for row in rows:
+        pair = (row[2], row[3])
+        verdict = verdicts.get(pair)
+        if verdict is None:
+            verdict = verdicts[pair] = _matches_words(_row_words(*pair), prefixes)
+        if verdict:
+            result.append(row)
+    return result
+
+
+class SearchCache(QueryCache):
+    """
+    LRU-Cache für Suchergebnisse mit Verfeinerung im Speicher.
+
+    Schlüssel ist der normalisierte Suchbegriff, jeder Eintrag gehört wie im
+    QueryCache zu einer Datenversion und verfällt mit dem nächsten
+    Schreibzugriff. Verlängert der Benutzer einen Begriff ("kau" ->
+    "kaufland"), werden die Treffer der kürzeren Suche in Python gefiltert,
+    statt die Datenbank erneut zu fragen. Die Reihenfolge der kürzeren Suche
+    bleibt dabei erhalten.
+    """
+
+    def __init__(self, max_entries=64, max_bytes=8 * 1024 * 1024):
+        super().__init__(max_entries=max_entries, max_bytes=max_bytes)
+        self.refinements = 0
+
+    def lookup(self, search_term, fulltext=True):
+        """
+        Sucht die Treffer eines Begriffs im Cache.
+
+        Args:
+            fulltext (bool): Die Suche läuft über den Volltextindex; nur dann
+                darf aus den Treffern einer kürzeren Suche gefiltert werden
+
+        Returns:
+            list: Treffer oder None, wenn die Datenbank gefragt werden muss
+        """
+        key = cache_key(search_term, fulltext)
+        found, rows = self.get(key)
+        if found:
+            return list(rows)
+        if not fulltext:
+            return None
+
+        superset = self._find_superset(key)
+        if superset is None:
+            return None
+        version, cached_rows, cached_size = superset
+        rows = filter_rows(cached_rows, key)
+        with self._lock:
+            self.refinements += 1
+        # Größe anteilig statt mit estimate_size() über alle Zeilen
+        size = cached_size * len(rows) // max(len(cached_rows), 1)
+        self.put(key, version, rows, size)
+        return list(rows)
+
+    def _find_superset(self, key):
+        """
+        Kleinste gültige Trefferliste, aus der sich `key` filtern lässt.
+
+        Returns:
+            tuple: (Version, Treffer, Größe) oder None
+        """
+        with self._lock:
+            candidates = [
+                (version, rows, size)
+                for term, (version, rows, size) in self._entries.items()
+                if version == self.version and refines(term, key)
+            ]
+        if not candidates:
+            return None
+        return min(candidates, key=lambda candidate: len(candidate[1]))
+
+    def store(self, search_term, version, rows, fulltext=True, size=None):
+        """Speichert die Treffer eines Begriffs, gelesen zur Datenversion `version`."""
+        self.put(cache_key(search_term, fulltext), version, rows, size)
+
+    def stats(self):
+        stats = super().stats()
+        with self._lock:
+            stats["refinements"] = self.refinements
+        return stats
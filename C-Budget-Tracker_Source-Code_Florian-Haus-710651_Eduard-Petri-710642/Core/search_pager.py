@@ -0,0 +1,137 @@
+from Core.query_cache import estimate_size
+
+
+class SearchPager:
+    """
+    Blättert durch die Treffer einer Suche ("Weitere Treffer laden").
+
+    Jeder Aufruf von fetch() liefert höchstens `page_size` Treffer. Liegen
+    alle Treffer des Begriffs (oder eines kürzeren, siehe Core.search_cache)
+    im Such-Cache, kommen die Seiten von dort. Suchen nach Relevanz
+    (Volltext, unscharf) lesen bei der ersten Seite einmal die IDs aller
+    Treffer (DatabaseManager.search_hit_ids()); jede Seite liest dann nur
+    ihre Zeilen, und die Anzahl ist bekannt. Filter und LIKE-Suche blättern
+    per Keyset-Paging und zählen mit einer eigenen Abfrage.
+    Wird so die letzte Seite erreicht, landen die Treffer im Such-Cache,
+    solange sie dessen Speichergrenze nicht überschreiten.
+
+    fetch() und count() dürfen in einem Hintergrund-Thread laufen, aber
+    nicht gleichzeitig mit einem weiteren fetch() derselben Suche.
+    """
+
+    def __init__(self, db_manager, search_term, fuzzy=False, page_size=200):
+        """
+        Args:
+            db_manager (DatabaseManager): Datenbank mit Such-Cache
+            fuzzy (bool): Unscharfe Suche (Trigrammindex)
+            page_size (int): Treffer pro Seite
+        """
+        self.db_manager = db_manager
+        self.search_term = search_term
+        self.fuzzy = fuzzy
+        self.page_size = page_size
+        self.loaded = 0  # Bisher gelieferte Treffer
+        self.has_more = True
+
+        self._after = None  # Fortsetzung der Datenbank-Seiten
+        self._ranked = False  # search_hit_ids() schon gelesen
+        self._hits = None  # IDs einer Suche nach Relevanz (search_hit_ids())
+        self._position = 0  # Nächste ID in _hits
+        cache = db_manager.search_cache
+        self._version = cache.version
+        self._rows = None if fuzzy else cache.lookup(search_term, db_manager.fts_enabled)
+        # Gelesene Treffer für den Such-Cache (None: zu groß oder aus dem Cache)
+        self._collected = None if fuzzy or self._rows is not None else []
+        self._size = 0
+
+    def fetch(self, cancelled=None):
+        """
+        Liest die nächste Seite.
+
+        Args:
+            cancelled (callable): Bricht die Abfrage ab; die Seite gilt dann
+                als nicht gelesen. Ohne Angabe gilt die Prüfung aus
+                DatabaseManager.cancellable() (z.B. im DataLoader)
+
+        Returns:
+            list: Zeilen im Format von search_transactions(), leer nach der
+            letzten Seite
+        """
+        if not self.has_more:
+            return []
+        if self._rows is not None:
+            page = self._rows[self.loaded : self.loaded + self.page_size]
+            self.loaded += len(page)
+            self.has_more = self.loaded < len(self._rows)
+            return page
+
+        cancelled = self.db_manager.cancel_check(cancelled)
+        if not self._rank(cancelled):
+            return []
+        if self._hits is not None:
+            page = self._fetch_hits(cancelled)
+            if page is None:
+                return []
+        else:
+            page, after = self.db_manager.search_transactions_page(
+                self.search_term, self.page_size, self._after, cancelled=cancelled
+            )
+            if cancelled is not None and cancelled():
+                return []
+            self._after = after
+            self.has_more = after is not None
+        self.loaded += len(page)
+        self._collect(page)
+        return page
+
+    def _rank(self, cancelled):
+        """Liest einmal pro Suche die Trefferliste, False nach Abbruch."""
+        if not self._ranked:
+            hits = self.db_manager.search_hit_ids(self.search_term, self.fuzzy, cancelled)
+            if cancelled is not None and cancelled():
+                return False
+            self._hits = hits
+            self._ranked = True
+        return True
+
+    def _fetch_hits(self, cancelled):
+        """Liest die Zeilen der nächsten Seite aus der Trefferliste (None nach Abbruch)."""
+        end = self._position + self.page_size
+        ids = self._hits[self._position : end]
+        rows = self.db_manager.fetch_transactions_by_ids(ids, cancelled=cancelled)
+        if cancelled is not None and cancelled():
+            return None
+        self._position = min(end, len(self._hits))
+        self.has_more = self._position < len(self._hits)
+        # Inzwischen gelöschte Treffer fehlen
+        return [rows[transaction_id] for transaction_id in ids if transaction_id in rows]
+
+    def _collect(self, page):
+        if self._collected is None:
+            return
+        cache = self.db_manager.search_cache
+        self._size += estimate_size(page)
+        if self._size > cache.max_bytes:
+            self._collected = None
+            return
+        self._collected.extend(page)
+        if not self.has_more:
+            cache.store(
+                self.search_term,
+                self._version,
+                self._collected,
+                self.db_manager.fts_enabled,
+                self._size,
+            )
+            self._collected = None
+
+    def count(self, cancelled=None):
+        """Gesamtzahl der Treffer, None nach einem Abbruch."""
+        if self._rows is not None:
+            return len(self._rows)
+        cancelled = self.db_manager.cancel_check(cancelled)
+        if not self._rank(cancelled):
+            return None
+        if self._hits is not None:
+            return len(self._hits)
+        return self.db_manager.count_search_results(self.search_term, cancelled=cancelled)
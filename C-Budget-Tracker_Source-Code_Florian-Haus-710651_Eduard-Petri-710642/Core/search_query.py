@@ -0,0 +1,249 @@
+import re
+from dataclasses import dataclass
+
+from Core.dates import date_key_range
+from Core.money import to_cents
+
+# Kleine Suchsprache der Suchleiste, z.B.
+#
+#     cat:Lebensmittel amount>50 from:2024-03 to:2024-03 "Rewe Markt"
+#
+# - cat:Name        Kategorie beginnt mit Name (ohne Groß-/Kleinschreibung),
+#                   mit Leerzeichen in Anführungszeichen: cat:"Essen gehen"
+# - amount>50       Betrag in Euro, auch <, >=, <= und =
+# - from:2024-03    ab dem Anfang des Zeitraums (Jahr, Monat oder Tag)
+# - to:2024-03      bis einschließlich zum Ende des Zeitraums
+# - type:income     nur Einnahmen (auch einnahme), type:expense / ausgabe
+# - "Rewe Markt"    genau diese Wortfolge in Name oder Kategorie
+# - Rewe            Wortanfang in Name oder Kategorie
+#
+# Alle Teile müssen zutreffen (UND). Der Text wird in einen Syntaxbaum
+# (SearchQuery) zerlegt und daraus eine parametrisierte WHERE-Bedingung
+# erzeugt, die die Indizes auf Datum_Tag, Kategorie_FK, Transaktion und
+# Ausgabe_Einnahme sowie den Volltextindex nutzt.
+
+# Werte für type: -> gespeicherter Wert in Haupt.Ausgabe_Einnahme
+TYPE_VALUES = {
+    "expense": "0",
+    "ausgabe": "0",
+    "income": "1",
+    "einnahme": "1",
+}
+
+# Ein Teil des Suchtexts: Filter, Betragsvergleich, Phrase oder Wort.
+# Schließende Anführungszeichen sind optional, damit schon während der
+# Eingabe gesucht werden kann.
+TOKEN = re.compile(
+    r"""
+    (?P<field>cat|from|to|type):(?:"(?P<quoted>[^"]*)"?|(?P<value>\S*))
+    | amount(?P<operator>[<>]=?|=)(?P<amount>\S*)
+    | "(?P<phrase>[^"]*)"?
+    | (?P<word>\S+)
+    """,
+    re.VERBOSE | re.IGNORECASE,
+)
+
+
+@dataclass(frozen=True)
+class TextTerm:
+    """Wortanfang (phrase=False) oder genaue Wortfolge in Name oder Kategorie."""
+
+    text: str
+    phrase: bool = False
+
+
+@dataclass(frozen=True)
+class CategoryFilter:
+    """Kategoriename beginnt mit `name` (cat:)."""
+
+    name: str
+
+
+@dataclass(frozen=True)
+class AmountFilter:
+    """Vergleich des Betrags in Cent (amount>, amount< ...)."""
+
+    operator: str
+    cents: int
+
+
+@dataclass(frozen=True)
+class DateFilter:
+    """
+    Zeitraum auf dem Tagesschlüssel yyyymmdd (from: und to:).
+
+    Attributes:
+        start (int): erster Tag oder None
+        end (int): erster Tag danach (exklusiv) oder None
+    """
+
+    start: int = None
+    end: int = None
+
+
+@dataclass(frozen=True)
+class TypeFilter:
+    """Nur Ausgaben ("0") oder Einnahmen ("1") (type:)."""
+
+    value: str
+
+
+@dataclass(frozen=True)
+class SearchQuery:
+    """
+    Zerlegter Suchtext.
+
+    Attributes:
+        terms (tuple): Teile der Suche, alle müssen zutreffen
+        operators (bool): Der Text enthält Filter, auch noch unvollständige
+            wie "cat:" während der Eingabe
+    """
+
+    terms: tuple
+    operators: bool = False
+
+    @property
+    def is_structured(self):
+        """True, wenn die Suche mehr als einfache Wörter enthält."""
+        return self.operators or any(
+            not isinstance(term, TextTerm) or term.phrase for term in self.terms
+        )
+
+
+def parse_query(text):
+    """
+    Zerlegt einen Suchtext in eine SearchQuery.
+
+    Filter ohne Wert (z.B. "amount>" während der Eingabe) werden übergangen.
+    Filter mit ungültigem Wert (z.B. "from:März") werden als gewöhnliches
+    Wort gesucht, damit nichts stillschweigend wegfällt.
+    """
+    terms = []
+    operators = False
+    for match in TOKEN.finditer(str(text)):
+        token = match.group(0)
+        field = (match.group("field") or "").lower()
+        if match.group("word") is not None:
+            terms.append(TextTerm(token))
+        elif match.group("phrase") is not None:
+            if match.group("phrase").strip():
+                terms.append(TextTerm(match.group("phrase"), phrase=True))
+        elif match.group("operator"):
+            operators = True
+            if match.group("amount"):
+                terms.append(
+                    _amount_filter(match.group("operator"), match.group("amount"), token)
+                )
+        else:
+            operators = True
+            value = match.group("quoted")
+            if value is None:
+                value = match.group("value")
+            if value.strip():
+                terms.append(_field_filter(field, value.strip(), token))
+    return SearchQuery(tuple(terms), operators)
+
+
+def _amount_filter(operator, amount, token):
+    try:
+        return AmountFilter(operator, to_cents(amount.rstrip("€")))
+    except ValueError:
+        return TextTerm(token)
+
+
+def _field_filter(field, value, token):
+    if field == "cat":
+        return CategoryFilter(value)
+    if field == "type":
+        type_value = TYPE_VALUES.get(value.lower())
+        return TypeFilter(type_value) if type_value else TextTerm(token)
+    day_range = date_key_range(value)
+    if day_range is None:
+        return TextTerm(token)
+    if field == "from":
+        return DateFilter(start=day_range[0])
+    return DateFilter(end=day_range[1])  # to: schließt das Ende mit ein
+
+
+def _escape_like(text):
+    """Maskiert die LIKE-Platzhalter für ESCAPE '\\'."""
+    return re.sub(r"([\\%_])", r"\\\1", text)
+
+
+def compile_query(query, fulltext=True):
+    """
+    Erzeugt aus einer SearchQuery eine WHERE-Bedingung für TRANSACTION_ROWS.
+
+    Jeder Filter wird zu einer Bedingung, die über einen Index aufgelöst
+    werden kann (Tagesschlüssel, Kategorie, Betrag, Typ). Die Textteile
+    ergeben zusammen eine MATCH-Abfrage auf Haupt_FTS, ohne Volltextindex
+    eine LIKE-Bedingung (durchsucht dann die ganze Tabelle).
+
+    Ohne Statistiken (ANALYZE) schätzt SQLite jede Gleichheit auf einem
+    Index als sehr selektiv und würde z.B. für "type:income" alle Einnahmen
+    lesen, obwohl ein Monat gesucht wird. Ist der Zeitraum auf beiden Seiten
+    begrenzt, bestimmt er daher den Index: Betrag, Typ und Text werden mit
+    "+" bzw. CAST vom Index ausgenommen und nur noch geprüft. Die Kategorie
+    bleibt indiziert, sie bildet mit dem Tagesschlüssel idx_Haupt_Kategorie_Tag.
+
+    Args:
+        fulltext (bool): Volltextindex Haupt_FTS verwenden
+
+    Returns:
+        tuple: (SQL-Bedingung, Parameter). Ohne Bedingung (z.B. nur "cat:")
+        gibt es keine Treffer.
+    """
+    dates = [term for term in query.terms if isinstance(term, DateFilter)]
+    by_date = any(term.start is not None for term in dates) and any(
+        term.end is not None for term in dates
+    )
+    conditions = []
+    params = []
+    phrases = []
+    for term in query.terms:
+        if isinstance(term, TextTerm):
+            if fulltext:
+                # Anführungszeichen im Text werden für FTS5 verdoppelt
+                phrase = '"{}"'.format(term.text.replace('"', '""'))
+                phrases.append(phrase if term.phrase else phrase + "*")
+            else:
+                conditions.append(
+                    "(Haupt.Name_Transaktion LIKE ? ESCAPE '\\' "
+                    "OR Kategorie.Kategorie LIKE ? ESCAPE '\\')"
+                )
+                pattern = f"%{_escape_like(term.text)}%"
+                params.extend((pattern, pattern))
+        elif isinstance(term, CategoryFilter):
+            conditions.append(
+                "Haupt.Kategorie_FK IN (SELECT Kategorie_ID FROM Kategorie "
+                "WHERE Kategorie LIKE ? ESCAPE '\\')"
+            )
+            params.append(_escape_like(term.name) + "%")
+        elif isinstance(term, AmountFilter):
+            column = "+Haupt.Transaktion" if by_date else "Haupt.Transaktion"
+            conditions.append(f"{column} {term.operator} ?")
+            params.append(term.cents)
+        elif isinstance(term, DateFilter):
+            if term.start is not None:
+                conditions.append("Haupt.Datum_Tag >= ?")
+                params.append(term.start)
+            if term.end is not None:
+                conditions.append("Haupt.Datum_Tag < ?")
+                params.append(term.end)
+        elif isinstance(term, TypeFilter):
+            if by_date:
+                conditions.append("CAST(Haupt.Ausgabe_Einnahme AS INTEGER) = ?")
+                params.append(int(term.value))
+            else:
+                conditions.append("Haupt.Ausgabe_Einnahme = ?")
+                params.append(term.value)
+
+    if phrases:
+        column = "+Haupt.ID" if by_date else "Haupt.ID"
+        conditions.append(
+            f"{column} IN (SELECT rowid FROM Haupt_FTS WHERE Haupt_FTS MATCH ?)"
+        )
+        params.append(" ".join(phrases))
+    if not conditions:
+        return "0", []
+    return " AND ".join(conditions), params
@@ -1,12 +1,14 @@
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QComboBox
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 import matplotlib.pyplot as plt
+from Core.data_loader import load_data
 
 
 class BudgetBarChartView(QWidget):
-    def __init__(self, db_manager):
+    def __init__(self, db_manager, loader=None):
         super().__init__()
         self.db_manager = db_manager
+        self.loader = loader  # DataLoader für das Laden im Hintergrund (optional)
 
         # Layout einrichten
         layout = QVBoxLayout(self)
@@ -25,14 +27,20 @@ class BudgetBarChartView(QWidget):
 
         # Kategorien in die ComboBox einfügen und Diagramm zeichnen
         self.load_categories()
-        self.plot_bar_chart()  # Initialisiere Diagramm
+        self.update_chart()  # Initialisiere Diagramm
 
     def load_categories(self):
         """
-        Holt die Kategorien aus der Datenbank und fügt sie der ComboBox hinzu,
-        vermeidet Duplikate.
+        Holt die Kategorien aus der Datenbank und fügt sie der ComboBox hinzu.
+        """
+        load_data(
+            self.loader, (id(self), "categories"), self.fetch_categories, self.add_categories
+        )
+
+    def add_categories(self, categories):
+        """
+        Fügt Kategorien der ComboBox hinzu, vermeidet Duplikate.
         """
-        categories = self.fetch_categories()
         existing_items = set(
             self.category_combo.itemText(i) for i in range(self.category_combo.count())
         )
@@ -54,14 +62,29 @@ class BudgetBarChartView(QWidget):
         Aktualisiert das Diagramm basierend auf der ausgewählten Kategorie.
         """
         selected_category = self.category_combo.currentText()
-        self.plot_bar_chart(selected_category)
+        load_data(
+            self.loader,
+            (id(self), "chart"),
+            lambda: self.fetch_category_data(selected_category),
+            lambda data: self.plot_bar_chart(selected_category, data),
+        )
 
-    def plot_bar_chart(self, selected_category="Alle Kategorien"):
+    def on_data_changed(self, changes):
+        """
+        Aktualisiert Kategorienliste und Diagramm nur bei passenden Änderungen.
+        """
+        if changes.categories_changed:
+            self.load_categories()
+        if changes.transactions_changed or changes.categories_changed:
+            self.update_chart()
+
+    def plot_bar_chart(self, selected_category="Alle Kategorien", category_data=None):
         """
         Erstellt ein Diagramm, das basierend auf der ausgewählten Kategorie (oder allen Kategorien)
         das genutzte und verbleibende Budget anzeigt.
         """
-        category_data = self.fetch_category_data(selected_category)
+        if category_data is None:
+            category_data = self.fetch_category_data(selected_category)
         if not category_data:
             self.ax.text(
                 0.5,
@@ -153,28 +176,5 @@ class BudgetBarChartView(QWidget):
         Holt die Daten für die ausgewählte Kategorie oder alle Kategorien.
         """
         if selected_category == "Alle Kategorien":
-            query = """
-            SELECT 
-                Kategorie.Kategorie, 
-                Kategorie.Budget, 
-                COALESCE(SUM(Haupt.Transaktion), 0) AS UsedBudget
-            FROM Kategorie
-            LEFT JOIN Haupt ON Kategorie.Kategorie_ID = Haupt.Kategorie_FK
-            WHERE Kategorie.Budget > 0
-            GROUP BY Kategorie.Kategorie_ID, Kategorie.Kategorie, Kategorie.Budget
-            """
-        else:
-            query = """
-            SELECT 
-                Kategorie.Kategorie, 
-                Kategorie.Budget, 
-                COALESCE(SUM(Haupt.Transaktion), 0) AS UsedBudget
-            FROM Kategorie
-            LEFT JOIN Haupt ON Kategorie.Kategorie_ID = Haupt.Kategorie_FK
-            WHERE Kategorie.Kategorie = ? AND Kategorie.Budget > 0
-            GROUP BY Kategorie.Kategorie_ID, Kategorie.Kategorie, Kategorie.Budget
-            """
-            # Kategorie als Parameter übergeben
-            return self.db_manager.fetchall(query, (selected_category,))
-
-        return self.db_manager.fetchall(query)
+            return self.db_manager.fetch_category_budgets()
+        return self.db_manager.fetch_category_budgets(selected_category)
@@ -1,12 +1,15 @@
 from PySide6.QtWidgets import QWidget, QVBoxLayout
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 import matplotlib.pyplot as plt
+from datetime import datetime
+from Core.data_loader import load_data
 
 
 class BudgetDiagrammView(QWidget):
-    def __init__(self, db_manager):
+    def __init__(self, db_manager, loader=None):
         super().__init__()
         self.db_manager = db_manager
+        self.loader = loader  # DataLoader für das Laden im Hintergrund (optional)
 
         # Layout für das Widget
         layout = QVBoxLayout()
@@ -18,13 +21,14 @@ class BudgetDiagrammView(QWidget):
         layout.addWidget(self.canvas)
 
         # Initialisiere das Diagramm
-        self.plot_pie_chart()
+        self.update_chart()
 
-    def plot_pie_chart(self):
+    def plot_pie_chart(self, budget_data=None):
         """
         Plottet ein Kreisdiagramm für das monatliche Budget und die Ausgaben.
         """
-        budget_data = self.fetch_budget_data()
+        if budget_data is None:
+            budget_data = self.fetch_budget_data()
         if budget_data:
             labels, values = zip(*budget_data)
             self.ax.clear()
@@ -37,22 +41,13 @@ class BudgetDiagrammView(QWidget):
         Holt das Budget und die Ausgaben für den aktuellen Monat.
         """
         # Budget aus der Datenbank abrufen
-        budget_query = "SELECT SUM(Budget) FROM Kategorie"
-        budget_row = self.db_manager.execute(budget_query).fetchone()
-        if budget_row is None or budget_row[0] is None:
+        total_budget = self.db_manager.fetch_total_budget()
+        if total_budget is None:
             print("Fehler: Keine Kategorien mit Budgets gefunden.")
             return None
-        total_budget = budget_row[0]
 
-        # Ausgaben aus der Datenbank abrufen
-        expenses_query = """
-        SELECT SUM(Transaktion)
-        FROM Haupt
-        WHERE Ausgabe_Einnahme = '0'
-        AND strftime('%Y-%m', Datum) = strftime('%Y-%m', 'now')
-        """
-        expenses_row = self.db_manager.execute(expenses_query).fetchone()
-        expenses = expenses_row[0] if expenses_row[0] is not None else 0
+        # Ausgaben des aktuellen Monats aus der Summentabelle abrufen
+        expenses = self.db_manager.fetch_month_expenses()
 
         # Verbleibendes Budget berechnen
         remaining_budget = max(total_budget - expenses, 0)
@@ -64,5 +59,15 @@ class BudgetDiagrammView(QWidget):
         """
         Aktualisiert das Diagramm basierend auf den neuesten Daten.
         """
-        self.fetch_budget_data()
-        self.plot_pie_chart()
+        load_data(
+            self.loader, (id(self), "chart"), self.fetch_budget_data, self.plot_pie_chart
+        )
+
+    def on_data_changed(self, changes):
+        """
+        Zeichnet das Diagramm nur neu, wenn Budgets oder Transaktionen des
+        aktuellen Monats betroffen sind.
+        """
+        current_month = datetime.now().strftime("%Y-%m")
+        if changes.categories_changed or changes.touches_month(current_month):
+            self.update_chart()
@@ -1,12 +1,14 @@
 from PySide6.QtWidgets import QWidget, QVBoxLayout
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 import matplotlib.pyplot as plt
+from Core.data_loader import load_data
 
 
 class DiagrammView(QWidget):
-    def __init__(self, db_manager):
+    def __init__(self, db_manager, loader=None):
         super().__init__()
         self.db_manager = db_manager
+        self.loader = loader  # DataLoader für das Laden im Hintergrund (optional)
 
         layout = QVBoxLayout()
         self.setLayout(layout)
@@ -15,14 +17,15 @@ class DiagrammView(QWidget):
         self.canvas = FigureCanvas(self.figure)
         layout.addWidget(self.canvas)
 
-        self.plot_pie_chart()
+        self.update_chart()
 
-    def plot_pie_chart(self):
+    def plot_pie_chart(self, category_data=None):
         """
         Plottet ein Kreisdiagramm basierend auf den Ausgaben nach Kategorien.
         Zeigt eine Nachricht an, wenn keine Daten vorhanden sind.
         """
-        category_data = self.fetch_expenses_per_category()
+        if category_data is None:
+            category_data = self.fetch_expenses_per_category()
 
         self.ax.clear()  # Lösche den aktuellen Plot
 
@@ -73,4 +76,17 @@ class DiagrammView(QWidget):
         """
         Aktualisiert das Diagramm basierend auf den neuesten Daten.
         """
-        self.plot_pie_chart()
+        load_data(
+            self.loader,
+            (id(self), "chart"),
+            self.fetch_expenses_per_category,
+            self.plot_pie_chart,
+        )
+
+    def on_data_changed(self, changes):
+        """
+        Zeichnet das Diagramm nur neu, wenn sich Ausgaben oder Kategorienamen
+        geändert haben können.
+        """
+        if changes.transactions_changed or changes.categories_changed:
+            self.update_chart()
@@ -0,0 +1,83 @@
+from PySide6.QtWidgets import QProgressDialog
+from PySide6.QtCore import QThread, Signal, Qt
+from Core.importer import import_file
+
+
+class ImportWorker(QThread):
+    # Importierte Zeilen, Fortschritt in Prozent
+    progress = Signal(int, int)
+    # Anzahl der insgesamt importierten Transaktionen
+    finished_import = Signal(int)
+    # Übersprungene Datensätze: Liste von (Nummer, Fehlermeldung)
+    skipped_rows = Signal(list)
+    # Fehlermeldung
+    failed = Signal(str)
+
+    def __init__(self, db_manager, path, chunk_size=1000):
+        super().__init__()
+        self.db_manager = db_manager
+        self.path = path
+        self.chunk_size = chunk_size
+
+    def run(self):
+        skipped = []
+        try:
+            imported = import_file(
+                self.db_manager,
+                self.path,
+                chunk_size=self.chunk_size,
+                progress=self.report_progress,
+                skipped=skipped,
+            )
+        except Exception as e:
+            print(f"Fehler beim Import: {e}")
+            self.failed.emit(str(e))
+            return
+        if skipped:
+            self.skipped_rows.emit(skipped)
+        self.finished_import.emit(imported)
+
+    def report_progress(self, imported, bytes_read, total_bytes):
+        percent = int(bytes_read * 100 / total_bytes) if total_bytes else 100
+        self.progress.emit(imported, percent)
+
+
+class ImportProgressDialog(QProgressDialog):
+    """Zeigt den Fortschritt eines laufenden Imports an."""
+
+    def __init__(self, worker, parent=None):
+        super().__init__("Kontoauszug wird importiert...", None, 0, 100, parent)
+        self.setWindowTitle("Import")
+        self.setWindowModality(Qt.WindowModal)
+        self.setMinimumDuration(0)
+        self.setAutoClose(False)
+        self.setAutoReset(False)
+
+        self.skipped = []
+        self.worker = worker
+        self.worker.progress.connect(self.on_progress)
+        self.worker.skipped_rows.connect(self.on_skipped)
+        self.worker.finished_import.connect(self.on_finished)
+        self.worker.failed.connect(self.on_failed)
+
+    def on_progress(self, imported, percent):
+        self.setValue(percent)
+        self.setLabelText(f"{imported} Transaktionen importiert...")
+
+    def on_skipped(self, skipped):
+        self.skipped = skipped
+
+    def on_finished(self, imported):
+        self.setValue(100)
+        text = f"Import abgeschlossen: {imported} Transaktionen."
+        if self.skipped:
+            numbers = ", ".join(str(number) for number, _ in self.skipped[:5])
+            if len(self.skipped) > 5:
+                numbers += ", ..."
+            text += f"\n{len(self.skipped)} Datensätze übersprungen (Nr. {numbers})."
+        self.setLabelText(text)
+        self.setCancelButtonText("Schließen")
+
+    def on_failed(self, message):
+        self.setLabelText(f"Import fehlgeschlagen: {message}")
+        self.setCancelButtonText("Schließen")
@@ -11,12 +11,17 @@ from PySide6.QtWidgets import (
     QMessageBox,
 )
 from PySide6.QtCore import Qt
+from concurrent.futures import Future
 
 
 class CategoryEditDialog(QDialog):
-    def __init__(self, db_manager):
+    def __init__(self, db_manager, change_notifier=None):
         super().__init__()
         self.db_manager = db_manager
+        # Im Writer-Modus sind Änderungen erst nach dem Commit des
+        # Writer-Threads sichtbar; die Liste lädt dann on_data_changed() neu
+        if change_notifier is not None:
+            change_notifier.changed.connect(self.on_data_changed)
         self.setWindowTitle("Kategorien Bearbeiten")
         self.resize(400, 300)
 
@@ -84,6 +89,11 @@ class CategoryEditDialog(QDialog):
 
         print(f"{len(categories)} Kategorien wurden geladen.")  
 
+    def on_data_changed(self, changes):
+        """Lädt die Liste neu, wenn sich Kategorien geändert haben (ChangeSet)."""
+        if changes.categories_changed:
+            self.load_categories()
+
     def on_category_selected(self):
         """Zeige die Details der ausgewählten Kategorie in den Bearbeitungsfeldern."""
         selected_item = self.category_list.currentItem()
@@ -126,10 +136,8 @@ class CategoryEditDialog(QDialog):
         # Update der Kategorie in der Datenbank
         query = "UPDATE Kategorie SET Kategorie = ?, Budget = ? WHERE Kategorie_ID = ?"
         self.db_manager.execute(query, (new_name, new_budget, category_id))
-        self.db_manager.connection.commit()
 
-        # Aktualisiere die Liste und schließe den Dialog
-        self.load_categories()
+        # Dialog schließen, ohne auf den Commit zu warten
         self.accept()
 
     def add_category(self):
@@ -161,10 +169,8 @@ class CategoryEditDialog(QDialog):
         # Neue Kategorie in die Datenbank einfügen
         query_insert = "INSERT INTO Kategorie (Kategorie, Budget) VALUES (?, ?)"
         self.db_manager.execute(query_insert, (new_name, new_budget))
-        self.db_manager.connection.commit()
 
-        # Aktualisiere die Liste und schließe den Dialog
-        self.load_categories()
+        # Dialog schließen, ohne auf den Commit zu warten
         self.accept()
 
     def delete_category(self):
@@ -191,9 +197,9 @@ class CategoryEditDialog(QDialog):
 
         # Lösche die Kategorie aus der Datenbank
         query = "DELETE FROM Kategorie WHERE Kategorie_ID = ?"
-        self.db_manager.execute(query, (category_id,))
-        self.db_manager.connection.commit()
+        result = self.db_manager.execute(query, (category_id,))
 
-        # Aktualisiere die Liste
-        self.load_categories()
+        # Aktualisiere die Liste (im Writer-Modus nach dem Commit, siehe oben)
+        if not isinstance(result, Future):
+            self.load_categories()
         QMessageBox.information(self, "Gelöscht", "Kategorie wurde gelöscht.")
@@ -4,20 +4,151 @@ from PySide6.QtWidgets import (
     QLineEdit,
     QLabel,
     QPushButton,
-    QListWidget,
-    QListWidgetItem,
+    QCheckBox,
+    QListView,
     QCalendarWidget,
 )
-from PySide6.QtGui import QColor, QFont
-from PySide6.QtCore import Qt
-from datetime import datetime
-from Features.Übersicht.view import TransactionWidget
+from PySide6.QtGui import QColor, QFont, QTextCharFormat
+from PySide6.QtCore import QAbstractListModel, QDate, QModelIndex, Qt, QTimer
+from Core.data_loader import load_data
+from Core.dates import day_label
+from Features.Übersicht.view import (
+    HEADER_ROW,
+    TRANSACTION_ROW,
+    TransactionDelegate,
+    TransactionListModel,
+)
+
+# Wartezeit nach dem letzten Tastendruck, bevor die Suche startet
+SEARCH_DELAY_MS = 250
+
+# Hilfetext zur Suchsprache (siehe Core.search_query)
+SEARCH_HELP = """Suchbegriffe und Filter lassen sich kombinieren:
+cat:Lebensmittel  Kategorie (Anfang des Namens)
+amount>50  Betrag über 50 € (auch <, >=, <=)
+from:2024-03  ab März 2024
+to:2024-03  bis Ende März 2024
+type:income / type:expense  nur Einnahmen / Ausgaben
+"Rewe Markt"  genau diese Wortfolge"""
+
+# Hintergrund der Kalendertage nach Höhe der Ausgaben (wenig -> viel);
+# Tage nur mit Einnahmen bekommen die erste Stufe
+HEAT_COLORS = ("#FFE5E5", "#FFB3B3", "#FF8080", "#FF4D4D")
+
+
+class SearchResultModel(QAbstractListModel):
+    """
+    Trefferliste der Suche, nach Tagen gruppiert.
+
+    Die Treffer kommen seitenweise (sortiert nach Relevanz) an. Jeder Tag hat
+    eine Überschrift; Treffer eines bereits angezeigten Tages kommen an das
+    Ende seiner Gruppe, neue Tage an das Ende der Liste. Gezeichnet wird mit
+    dem TransactionDelegate der Übersicht, die Rollen sind dieselben.
+    """
+
+    KindRole = TransactionListModel.KindRole
+    TransactionRole = TransactionListModel.TransactionRole
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []  # Liste von (Zeilenart, Überschrift oder Transaktion)
+        self._groups = {}  # Tagesschlüssel -> Zeilen der Gruppe (mit Überschrift)
+        self.group_by_day = True
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._rows)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or not 0 <= index.row() < len(self._rows):
+            return None
+        kind, value = self._rows[index.row()]
+
+        if role == self.KindRole:
+            return kind
+        if kind == HEADER_ROW:
+            return value if role == Qt.DisplayRole else None
+        if role == Qt.DisplayRole:
+            return value[2]  # Name der Transaktion
+        if role == Qt.UserRole:
+            return value[0]
+        if role == self.TransactionRole:
+            return value
+        return None
+
+    def flags(self, index):
+        if self.data(index, self.KindRole) == TRANSACTION_ROW:
+            return Qt.ItemIsEnabled | Qt.ItemIsSelectable
+        return Qt.NoItemFlags
+
+    def clear(self, group_by_day=True):
+        """Leert die Liste vor einer neuen Suche."""
+        self.beginResetModel()
+        self._rows = []
+        self._groups = {}
+        self.group_by_day = group_by_day
+        self.endResetModel()
+
+    def append_transactions(self, transactions):
+        """
+        Fügt eine Seite Treffer hinzu.
+
+        Neue Tage werden mit einem einzigen Einfügen angehängt. Kommen Treffer
+        zu bereits angezeigten Tagen hinzu, wird die Liste einmal pro Seite
+        neu angeordnet (Auswahl und Position bleiben erhalten).
+        """
+        if not transactions:
+            return
+        if not self.group_by_day:
+            self._append_rows([(TRANSACTION_ROW, trans) for trans in transactions])
+            return
+
+        new_days = {}  # Neue Tage dieser Seite (Reihenfolge des Auftretens)
+        regroup = False
+        for trans in transactions:
+            day = trans[6]
+            group = self._groups.get(day)
+            if group is None:
+                group = self._groups[day] = [(HEADER_ROW, day_label(day))]
+                new_days[day] = group
+            elif day not in new_days:
+                regroup = True  # Tag aus einer früheren Seite
+            group.append((TRANSACTION_ROW, trans))
+
+        if regroup:
+            self._regroup()
+        else:
+            self._append_rows([row for group in new_days.values() for row in group])
+
+    def _append_rows(self, rows):
+        first = len(self._rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(rows) - 1)
+        self._rows.extend(rows)
+        self.endInsertRows()
+
+    def _regroup(self):
+        """Baut die Zeilen aus den Gruppen neu auf und verschiebt die Indizes."""
+        self.layoutAboutToBeChanged.emit()
+        old_rows = self._rows
+        self._rows = [row for group in self._groups.values() for row in group]
+        position = {id(row): number for number, row in enumerate(self._rows)}
+        persistent = self.persistentIndexList()
+        self.changePersistentIndexList(
+            persistent,
+            [self.index(position[id(old_rows[index.row()])]) for index in persistent],
+        )
+        self.layoutChanged.emit()
+
+    def transaction_count(self):
+        return len(self._rows) - (len(self._groups) if self.group_by_day else 0)
 
 
 class SuchleisteView(QWidget):
-    def __init__(self, db_manager):
+    def __init__(self, db_manager, loader=None):
         super().__init__()
         self.db_manager = db_manager
+        self.loader = loader  # DataLoader für die Suche im Hintergrund (optional)
         self.setWindowTitle("Suchfenster")
         self.setMinimumSize(1500, 800)
         self.showMaximized
@@ -26,96 +157,227 @@ class SuchleisteView(QWidget):
 
         # Suchleisten Design
         title = QLabel("Suchleiste")
-        title.setFont(QFont("Arial", 18, QFont.Bold))  
-        title.setStyleSheet("color: #004A94;")  
+        title.setFont(QFont("Arial", 18, QFont.Bold))
+        title.setStyleSheet("color: #004A94;")
         layout.addWidget(title)
         self.search_input = QLineEdit()
-        self.search_input.setPlaceholderText("Suchbegriff eingeben...")
+        self.search_input.setPlaceholderText(
+            "Suchbegriff eingeben... (z.B. cat:Lebensmittel amount>50 from:2024-03)"
+        )
+        self.search_input.setToolTip(SEARCH_HELP)
+        # Suche während der Eingabe, erst nach einer kurzen Pause
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(SEARCH_DELAY_MS)
+        self.search_timer.timeout.connect(self.search_transactions)
+        self.search_input.textChanged.connect(self.on_search_text_changed)
         layout.addWidget(self.search_input)
 
+        # Suchmodus: unscharfe Suche über den Trigrammindex
+        self.fuzzy_input = QCheckBox("Unscharfe Suche (findet auch vertippte Namen)")
+        self.fuzzy_input.toggled.connect(self.on_search_mode_changed)
+        layout.addWidget(self.fuzzy_input)
+
         # Suchbutton
         search_button = QPushButton("Suchen")
         search_button.clicked.connect(self.search_transactions)
         layout.addWidget(search_button)
 
-        # Ergebnis Liste
-        self.result_list = QListWidget()
+        # Ergebnis Liste: Modell und Delegate wie in der Übersicht
+        self.result_model = SearchResultModel(self)
+        self.result_list = QListView()
+        self.result_list.setModel(self.result_model)
+        self.result_list.setItemDelegate(TransactionDelegate(self.result_list))
+        self.result_list.setVerticalScrollMode(QListView.ScrollPerPixel)
         layout.addWidget(self.result_list)
 
-        # Kalender Widget 
+        # Angezeigt wird nur die erste Seite, weitere Seiten auf Wunsch
+        self.pager = None  # SearchPager der aktuellen Suche
+        self.shown_date = None  # Im Kalender gewählter Tag, solange er angezeigt wird
+        self.total = None  # Anzahl aller Treffer (eigene Abfrage)
+        self.status_label = QLabel()
+        layout.addWidget(self.status_label)
+        self.more_button = QPushButton("Weitere Treffer laden")
+        self.more_button.clicked.connect(self.load_more)
+        self.more_button.hide()
+        layout.addWidget(self.more_button)
+
+        # Kalender Widget
         self.calendar = QCalendarWidget(self)
         self.calendar.clicked.connect(self.on_date_selected)
+        # Ausgaben je Tag des angezeigten Monats als Farbstufe (Heatmap)
+        self.calendar.currentPageChanged.connect(self.load_heatmap)
+        self.day_totals = {}  # Tagesschlüssel -> (Ausgaben, Einnahmen, Anzahl)
         layout.addWidget(self.calendar)
 
         self.setLayout(layout)
+        self.load_heatmap(self.calendar.yearShown(), self.calendar.monthShown())
 
+    def on_search_text_changed(self, text):
+        """
+        Startet die Suche nach der Wartezeit neu.
 
-    # Suchfunktion
+        Eine noch laufende Suche wird sofort abgebrochen, damit ihre Seiten
+        nicht mehr angezeigt werden und die Datenbank frei wird.
+        """
+        self.cancel_search()
+        if not text.strip():
+            self.search_timer.stop()
+            self.result_model.clear()
+            self.pager = self.shown_date = None
+            self.update_status()
+            return
+        self.search_timer.start()
+
+    def on_search_mode_changed(self):
+        """Wiederholt die aktuelle Suche im neuen Modus."""
+        if self.search_input.text().strip():
+            self.search_transactions()
+
+    def cancel_search(self):
+        if self.loader is not None:
+            self.loader.cancel((id(self), "search"))
+            self.loader.cancel((id(self), "count"))
+
+    # Suchfunktion (eine neue Suche ersetzt eine noch laufende)
     def search_transactions(self):
+        self.search_timer.stop()
         search_term = self.search_input.text()
+        if self.fuzzy_input.isChecked():
+            # Nach Ähnlichkeit sortiert, daher ohne Tagesüberschriften
+            self.start_search(search_term, group_by_day=False, fuzzy=True)
+        else:
+            self.start_search(search_term, group_by_day=True)
 
-        transactions = self.db_manager.search_transactions(search_term)
+    def start_search(self, search_term, group_by_day, fuzzy=False):
+        """
+        Sucht im Hintergrund und zeigt die erste Seite der Treffer an.
 
-        self.result_list.clear()
+        Weitere Seiten lädt erst der Button "Weitere Treffer laden". So
+        bleibt der Speicher pro Suche auch bei sehr kurzen Begriffen
+        begrenzt. Die Gesamtzahl wird erst nach der ersten Seite gezählt,
+        Suchen nach Relevanz kennen sie dann schon (siehe SearchPager).
+        """
+        self.cancel_search()
+        self.result_model.clear(group_by_day)
+        self.shown_date = None
+        self.pager = self.db_manager.search_pager(search_term, fuzzy=fuzzy)
+        self.total = None
+        self.update_status()
+        self.load_more()
 
-        # Gruppiere die Transaktionen nach Datum
-        grouped_transactions = {}
-        for trans in transactions:
-            id, amount, name, category, type_, date = trans
-            date_obj = datetime.strptime(
-                date, "%Y-%m-%d"
-            )  # Datum in datetime-Objekt umwandeln
-            formatted_date = date_obj.strftime(
-                "%d.%m.%Y"
-            )  # Formatierung: Tag.Monat.Jahr
-
-            # Gruppiere Transaktionen nach Datum
-            if formatted_date not in grouped_transactions:
-                grouped_transactions[formatted_date] = []
-            grouped_transactions[formatted_date].append((name, category, amount, type_))
-
-        # Füge die gruppierten Transaktionen zur Ergebnisliste hinzu
-        for date, transactions_on_date in grouped_transactions.items():
-            # Füge das Datum als Header hinzu
-            date_header = QListWidgetItem(date)
-            date_header.setFont(QFont("Arial", 14, QFont.Bold))
-            date_header.setBackground(QColor("#D3D3D3"))
-            date_header.setTextAlignment(Qt.AlignCenter)
-            self.result_list.addItem(date_header)
-
-            # Füge jede Transaktion unter dem Datum hinzu
-            for name, category, amount, type_ in transactions_on_date:
-                transaction_widget = TransactionWidget(name, category, amount, type_)
-
-                item = QListWidgetItem()
-                item.setSizeHint(transaction_widget.sizeHint())
-                self.result_list.addItem(item)
-                self.result_list.setItemWidget(item, transaction_widget)
+    def load_more(self):
+        """Lädt die nächste Seite der aktuellen Suche."""
+        pager = self.pager
+        if pager is None or not pager.has_more:
+            return
+        self.more_button.setEnabled(False)
+        load_data(self.loader, (id(self), "search"), pager.fetch, self.show_page)
+
+    def show_page(self, transactions):
+        self.result_model.append_transactions(transactions)
+        pager = self.pager
+        if self.total is None and pager is not None and pager.has_more:
+            load_data(self.loader, (id(self), "count"), pager.count, self.show_count)
+        self.update_status()
+
+    def show_count(self, total):
+        self.total = total
+        self.update_status()
+
+    def update_status(self):
+        """Zeigt die Zahl der Treffer und den Button für weitere Seiten."""
+        shown = self.result_model.transaction_count()
+        pager = self.pager
+        has_more = pager is not None and pager.has_more
+        if not shown and (pager is None or pager.loaded == 0 and has_more):
+            text = ""  # Keine Suche oder erste Seite noch nicht da
+        elif not shown:
+            text = "Keine Treffer"
+        elif self.total is not None and self.total > shown:
+            text = f"{shown:,} von {self.total:,} Treffern".replace(",", ".")
+        else:
+            text = f"{shown:,} Treffer".replace(",", ".")
+        self.status_label.setText(text)
+        self.more_button.setVisible(has_more)
+        self.more_button.setEnabled(True)
+
+    def shown_month(self):
+        """Angezeigter Monat des Kalenders als yyyy-MM."""
+        return f"{self.calendar.yearShown():04d}-{self.calendar.monthShown():02d}"
+
+    def load_heatmap(self, year, month):
+        """Lädt Ausgaben und Anzahl je Tag des Monats mit einer Abfrage."""
+        month_key = f"{year:04d}-{month:02d}"
+        load_data(
+            self.loader,
+            (id(self), "heatmap"),
+            lambda: self.db_manager.fetch_day_totals(month_key),
+            self.paint_heatmap,
+        )
+
+    def paint_heatmap(self, totals):
+        """
+        Färbt die Tage mit Buchungen nach der Höhe ihrer Ausgaben.
+
+        Die Stufe ergibt sich aus dem Anteil am teuersten Tag des Monats;
+        der Tooltip nennt Anzahl, Ausgaben und Einnahmen.
+        """
+        self.calendar.setDateTextFormat(QDate(), QTextCharFormat())  # alle zurücksetzen
+        self.day_totals = {row[0]: row[1:] for row in totals if row[0] is not None}
+        highest = max((expense for expense, _, _ in self.day_totals.values()), default=0)
+        for day_key, (expense, income, count) in self.day_totals.items():
+            year, rest = divmod(day_key, 10000)
+            date = QDate(year, *divmod(rest, 100))
+            level = int(expense / highest * (len(HEAT_COLORS) - 1)) if highest > 0 else 0
+            text_format = QTextCharFormat()
+            text_format.setBackground(QColor(HEAT_COLORS[level]))
+            text_format.setToolTip(
+                f"{count} Buchungen\nAusgaben {expense:.2f} €\nEinnahmen {income:.2f} €"
+            )
+            self.calendar.setDateTextFormat(date, text_format)
+
+    def on_data_changed(self, changes):
+        """
+        Aktualisiert Heatmap und Trefferliste nach Änderungen an den Buchungen.
+
+        Die aktuelle Suche beginnt über einen neuen SearchPager wieder mit
+        der ersten Seite und neuer Trefferzahl; wartet schon eine Suche auf
+        die Tipp-Pause, liest sie die neuen Daten ohnehin.
+        """
+        if changes.touches_month(self.shown_month()):
+            self.load_heatmap(self.calendar.yearShown(), self.calendar.monthShown())
+        pager = self.pager
+        if pager is not None and not self.search_timer.isActive():
+            self.start_search(
+                pager.search_term, group_by_day=not pager.fuzzy, fuzzy=pager.fuzzy
+            )
+        elif self.shown_date is not None and changes.touches_month(
+            self.shown_date.toString("yyyy-MM")
+        ):
+            self.on_date_selected(self.shown_date)
 
     # Funktion die aufgerufen wird, wenn Datum im Kalender ausgewählt wird
-    def on_date_selected(self):
-        # Wenn ein Datum im Kalender ausgewählt wird
-        selected_date = self.calendar.selectedDate().toString("yyyy-MM-dd")
+    def on_date_selected(self, date=None):
+        """Zeigt die Transaktionen des Tages (Gleichheit auf dem Tagesschlüssel)."""
+        if date is None:
+            date = self.calendar.selectedDate()
+        day_key = date.year() * 10000 + date.month() * 100 + date.day()
 
-        # Suche Transaktionen für das ausgewählte Datum
-        transactions = self.db_manager.search_transactions(selected_date)
+        # Ersetzt eine laufende Suche, Treffer ohne Überschriften
+        self.search_timer.stop()
+        self.cancel_search()
+        self.result_model.clear(group_by_day=False)
+        self.pager = self.total = None
+        self.shown_date = date
+        self.update_status()
+        load_data(
+            self.loader,
+            (id(self), "search"),
+            lambda: self.db_manager.fetch_day_transactions(day_key),
+            self.show_day,
+        )
 
-        # Transaktionen anzeigen
-        self.result_list.clear()
-        for trans in transactions:
-            id, amount, name, category, type_, date = trans
-            date_obj = datetime.strptime(
-                date, "%Y-%m-%d"
-            )  # Datum in datetime-Objekt umwandeln
-            formatted_date = date_obj.strftime(
-                "%d.%m.%Y"
-            )  # Formatierung: Tag.Monat.Jahr
-
-            # Erstelle das TransactionWidget mit den Transaktionsdetails
-            transaction_widget = TransactionWidget(name, category, amount, type_)
-
-            # Erstelle das QListWidgetItem und füge das Widget hinzu
-            item = QListWidgetItem()
-            item.setSizeHint(transaction_widget.sizeHint())
-            self.result_list.addItem(item)
-            self.result_list.setItemWidget(item, transaction_widget)
+    def show_day(self, transactions):
+        self.result_model.append_transactions(transactions)
+        self.update_status()
@@ -1,71 +1,574 @@
+from datetime import datetime
 from PySide6.QtWidgets import (
     QWidget,
     QVBoxLayout,
     QLabel,
-    QListWidget,
-    QListWidgetItem,
-    QHBoxLayout,
+    QListView,
+    QStyle,
+    QStyledItemDelegate,
 )
-from PySide6.QtGui import QFont
-from PySide6.QtCore import Qt
-from datetime import datetime
+from PySide6.QtGui import QColor, QFont
+from PySide6.QtCore import QAbstractListModel, QModelIndex, QRectF, QSize, Qt
+from Core.database import PAGE_SIZE
+from Core.dates import day_label, month_label
+from Core.data_loader import load_data
+
+
+# Zeilenarten im Modell der Übersicht
+MONTH_ROW = "month"
+HEADER_ROW = "header"
+TRANSACTION_ROW = "transaction"
+
+
+class TransactionListModel(QAbstractListModel):
+    """
+    Listenmodell über die Transaktionen, gegliedert in Monate und Tage.
+
+    Jede Zeile ist ein Monatsabschnitt, eine Datumsüberschrift oder eine
+    Transaktion. Es werden nur die Tupel aus der Datenbank gespeichert;
+    gezeichnet wird ausschließlich durch den TransactionDelegate, also nur für
+    sichtbare Zeilen.
+
+    Die Monatszeilen (mit Einnahmen, Ausgaben und Saldo) stammen aus einer
+    einzigen gruppierten Abfrage. Transaktionen enthält nur ein aufgeklappter
+    Monat, neueste zuerst (Datum_Tag DESC, ID DESC), und zwar seitenweise:
+    Weitere Seiten eines Monats lädt `fetch_more(monat)` nach, am Ende der
+    Liste über canFetchMore() und fetchMore() der QListView.
+    """
+
+    # Eigene Rollen für den Delegate
+    KindRole = Qt.UserRole + 1  # MONTH_ROW, HEADER_ROW oder TRANSACTION_ROW
+    # Tupel (ID, Betrag, Name, Kategorie, Typ, Datum, Tag)
+    TransactionRole = Qt.UserRole + 2
+    # Tupel (Monat, Einnahmen, Ausgaben, Saldo, Anzahl)
+    MonthRole = Qt.UserRole + 3
+    ExpandedRole = Qt.UserRole + 4
+
+    def __init__(self, parent=None, fetch_more=None):
+        """
+        Args:
+            fetch_more (callable): fetch_more(monat) lädt die nächste Seite
+                eines Monats und übergibt sie an append_month()
+        """
+        super().__init__(parent)
+        self.fetch_more = fetch_more
+        # Liste von (Zeilenart, Monatssummen, Überschrift oder Transaktion)
+        self._rows = []
+        self._row_by_id = {}  # Transaktions-ID -> Zeilennummer
+        self._row_by_month = {}  # Monat (yyyy-MM) -> Zeilennummer
+        self.expanded_months = set()
+        # Monate mit weiteren Seiten -> Sortierschlüssel der letzten Zeile
+        self._more = {}
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._rows)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or not 0 <= index.row() < len(self._rows):
+            return None
+        kind, value = self._rows[index.row()]
+
+        if role == self.KindRole:
+            return kind
+        if kind == MONTH_ROW:
+            if role == Qt.DisplayRole:
+                return month_label(value[0])
+            if role == self.MonthRole:
+                return value
+            if role == self.ExpandedRole:
+                return value[0] in self.expanded_months
+            return None
+        if kind == HEADER_ROW:
+            return value if role == Qt.DisplayRole else None
+        if role == Qt.DisplayRole:
+            return value[2]  # Name der Transaktion
+        if role == Qt.UserRole:
+            return value[0]  # Transaktions-ID wie bisher im QListWidgetItem
+        if role == self.TransactionRole:
+            return value
+        return None
+
+    def flags(self, index):
+        kind = self.data(index, self.KindRole)
+        if kind == TRANSACTION_ROW:
+            return Qt.ItemIsEnabled | Qt.ItemIsSelectable
+        if kind == MONTH_ROW:
+            return Qt.ItemIsEnabled  # Anklickbar zum Auf- und Zuklappen
+        # Datumsüberschriften sind weder auswählbar noch aktiv
+        return Qt.NoItemFlags
+
+    @staticmethod
+    def _day(trans):
+        # Tagesschlüssel yyyymmdd aus der Datenbank (Datum ohne Uhrzeit)
+        return trans[6]
+
+    @staticmethod
+    def _month(trans):
+        # Wie Kategorie_Monat.Monat: die ersten sieben Zeichen des Datums
+        return trans[5][:7]
+
+    @staticmethod
+    def _sort_key(trans):
+        # Sortierung innerhalb eines Monats: Tagesschlüssel und ID absteigend,
+        # wie fetch_month_page()
+        return (trans[6], trans[0])
+
+    @staticmethod
+    def _header(day):
+        return (HEADER_ROW, day_label(day))  # Format "dd.mm.yyyy"
+
+    def _build_rows(self, transactions):
+        """
+        Wandelt sortierte Transaktionen eines Monats in Zeilen um.
 
+        Da die Zeilen nach Datum sortiert sind, beginnt eine neue Datumsgruppe
+        genau dann, wenn sich der Tag gegenüber der vorherigen Zeile ändert.
+        """
+        rows = []
+        last_day = None
+        for position, trans in enumerate(transactions):
+            day = self._day(trans)
+            if position == 0 or day != last_day:
+                rows.append(self._header(day))
+                last_day = day
+            rows.append((TRANSACTION_ROW, trans))
+        return rows
+
+    def _reindex(self, start):
+        """Aktualisiert die Zeilennummern ab `start` nach Einfügen oder Entfernen."""
+        for row in range(start, len(self._rows)):
+            kind, value = self._rows[row]
+            if kind == TRANSACTION_ROW:
+                self._row_by_id[value[0]] = row
+            elif kind == MONTH_ROW:
+                self._row_by_month[value[0]] = row
+
+    def _insert_rows(self, row, rows):
+        if not rows:
+            return
+        self.beginInsertRows(QModelIndex(), row, row + len(rows) - 1)
+        self._rows[row:row] = rows
+        self._reindex(row)
+        self.endInsertRows()
+
+    def _remove_rows(self, first, last):
+        if last < first:
+            return
+        self.beginRemoveRows(QModelIndex(), first, last)
+        for kind, value in self._rows[first : last + 1]:
+            if kind == TRANSACTION_ROW:
+                del self._row_by_id[value[0]]
+            elif kind == MONTH_ROW:
+                del self._row_by_month[value[0]]
+        del self._rows[first : last + 1]
+        self._reindex(first)
+        self.endRemoveRows()
+
+    def _content_range(self, month):
+        """Erste und letzte Zeile unter der Monatszeile (leer: last < first)."""
+        first = self._row_by_month[month] + 1
+        last = first
+        while last < len(self._rows) and self._rows[last][0] != MONTH_ROW:
+            last += 1
+        return first, last - 1
+
+    def set_months(self, totals, month_transactions=None, incomplete=()):
+        """
+        Ersetzt den Inhalt durch die Monatsabschnitte.
+
+        Args:
+            totals (list): Tupel (Monat, Einnahmen, Ausgaben, Saldo, Anzahl),
+                neuester Monat zuerst
+            month_transactions (dict): Monat -> geladene Transaktionen der
+                aufgeklappten Monate
+            incomplete (set): Monate, von denen weitere Seiten folgen
+        """
+        month_transactions = month_transactions or {}
+        rows = []
+        self._more = {}
+        for month_totals in totals:
+            month = month_totals[0]
+            rows.append((MONTH_ROW, tuple(month_totals)))
+            if month in self.expanded_months:
+                transactions = month_transactions.get(month, [])
+                rows.extend(self._build_rows(transactions))
+                if month in incomplete and transactions:
+                    self._more[month] = self._sort_key(transactions[-1])
+
+        self.beginResetModel()
+        self._rows = rows
+        self._row_by_id = {}
+        self._row_by_month = {}
+        self._reindex(0)
+        self.endResetModel()
+
+    def set_month_totals(self, totals):
+        """
+        Überträgt neue Monatssummen ohne Neuaufbau der Liste.
 
-class TransactionWidget(QWidget):
-    def __init__(self, name, category, amount, type_):
-        super().__init__()
+        Geänderte Monate werden aktualisiert, neue Monate an ihrer Position
+        eingefügt und Monate ohne Transaktionen samt Inhalt entfernt.
+        """
+        totals = {month_totals[0]: tuple(month_totals) for month_totals in totals}
+        for month in [month for month in self._row_by_month if month not in totals]:
+            first, last = self._content_range(month)
+            self._remove_rows(first - 1, last)
+            self._more.pop(month, None)
+
+        for month, month_totals in totals.items():
+            row = self._row_by_month.get(month)
+            if row is None:
+                # Hinter den Inhalt des nächstneueren Monats
+                newer = [other for other in self._row_by_month if other > month]
+                row = self._content_range(min(newer))[1] + 1 if newer else 0
+                self._insert_rows(row, [(MONTH_ROW, month_totals)])
+            elif self._rows[row][1] != month_totals:
+                self._rows[row] = (MONTH_ROW, month_totals)
+                index = self.index(row)
+                self.dataChanged.emit(index, index)
+
+    def expand_month(self, month, transactions, has_more=False):
+        """
+        Klappt einen Monat auf und zeigt die erste Seite seiner (sortierten)
+        Transaktionen.
 
-        # Styling für das Widget (grauer, abgerundeter Block)
-        self.setStyleSheet(
-            """
-            background-color: #E0E0E0;  /* Hellgrau */
-            border-radius: 10px;
-            padding: 10px;
+        Args:
+            has_more (bool): Ob weitere Seiten folgen (siehe append_month())
+        """
+        self.expanded_months.add(month)
+        self._more.pop(month, None)
+        if month not in self._row_by_month:
+            return
+        first, last = self._content_range(month)
+        self._remove_rows(first, last)
+        self._insert_rows(first, self._build_rows(transactions))
+        if has_more and transactions:
+            self._more[month] = self._sort_key(transactions[-1])
+        self._month_changed(month)
+
+    def append_month(self, month, after, transactions, has_more):
+        """
+        Hängt die nächste Seite an die geladenen Transaktionen eines Monats an.
+
+        Args:
+            after (tuple): Fortsetzung, mit der die Seite gelesen wurde; passt
+                sie nicht mehr (Monat zugeklappt oder neu geladen), wird die
+                Seite verworfen
+            has_more (bool): Ob danach weitere Seiten folgen
+
+        Returns:
+            bool: True, wenn die Seite übernommen wurde
         """
+        if not self._is_shown(month) or self._more.get(month) != after:
+            return False
+        del self._more[month]
+        row = self._content_range(month)[1] + 1
+        rows = self._build_rows(transactions)
+        previous = self._rows[row - 1]
+        if (
+            rows
+            and previous[0] == TRANSACTION_ROW
+            and self._day(previous[1]) == self._day(transactions[0])
+        ):
+            rows = rows[1:]  # Tag geht weiter: keine zweite Überschrift
+        self._insert_rows(row, rows)
+        if has_more and transactions:
+            self._more[month] = self._sort_key(transactions[-1])
+        return True
+
+    def month_after(self, month):
+        """Fortsetzung für die nächste Seite eines Monats (None: vollständig geladen)."""
+        return self._more.get(month)
+
+    def incomplete_months(self):
+        """Aufgeklappte Monate mit weiteren Seiten, neuester zuerst."""
+        return sorted(self._more, reverse=True)
+
+    def month_end(self, month):
+        """Letzte Zeile eines Monatsabschnitts (Monatszeile, falls leer)."""
+        return self._content_range(month)[1]
+
+    def loaded_count(self, month):
+        """Anzahl der geladenen Transaktionen eines Monats."""
+        if not self._is_shown(month):
+            return 0
+        first, last = self._content_range(month)
+        return sum(
+            1 for kind, _ in self._rows[first : last + 1] if kind == TRANSACTION_ROW
         )
 
-        # Hauptlayout des Blocks
-        main_layout = QHBoxLayout()
-        main_layout.setSpacing(10)  
-        main_layout.setContentsMargins(10, 10, 10, 10) 
+    def canFetchMore(self, parent=QModelIndex()):
+        if parent.isValid() or self.fetch_more is None:
+            return False
+        return bool(self._more)
+
+    def fetchMore(self, parent=QModelIndex()):
+        # Die QListView fragt am Listenende: weiter mit dem untersten Monat
+        if self.canFetchMore(parent):
+            self.fetch_more(self.incomplete_months()[-1])
+
+    def collapse_month(self, month):
+        """Klappt einen Monat zu und entfernt seine Transaktionen aus dem Modell."""
+        self.expanded_months.discard(month)
+        self._more.pop(month, None)
+        if month not in self._row_by_month:
+            return
+        first, last = self._content_range(month)
+        self._remove_rows(first, last)
+        self._month_changed(month)
+
+    def _month_changed(self, month):
+        index = self.index(self._row_by_month[month])
+        self.dataChanged.emit(index, index)
+
+    def months(self):
+        """Gibt die Monate der Liste zurück, neuester zuerst."""
+        return sorted(self._row_by_month, reverse=True)
+
+    def apply_changes(self, ids, rows):
+        """
+        Überträgt Änderungen einzelner Transaktionen ohne Neuaufbau der Liste.
+
+        Args:
+            ids (iterable): IDs der geänderten Transaktionen
+            rows (dict): Aktuelle Zeilen dieser IDs aus der Datenbank; gelöschte
+                IDs fehlen
+
+        Nur die betroffenen Zeilen und Datumsüberschriften werden eingefügt,
+        geändert oder entfernt, sodass die View Auswahl und Position behält.
+        Transaktionen zugeklappter Monate und hinter der letzten geladenen
+        Seite werden nicht eingefügt, letztere kommen mit ihrer Seite. Die
+        Monatszeilen müssen vorher mit set_month_totals() aktualisiert sein.
+        """
+        for trans_id in ids:
+            trans = rows.get(trans_id)
+            if trans is None or not self._is_loaded(trans):
+                self.remove_transaction(trans_id)
+            elif trans_id in self._row_by_id:
+                self.update_transaction(trans)
+            else:
+                self.insert_transaction(trans)
+
+    def _is_shown(self, month):
+        return month in self.expanded_months and month in self._row_by_month
+
+    def _is_loaded(self, trans):
+        """Prüft, ob die Transaktion in den geladenen Seiten ihres Monats liegt."""
+        month = self._month(trans)
+        if not self._is_shown(month):
+            return False
+        after = self._more.get(month)
+        return after is None or self._sort_key(trans) >= after
+
+    def _insert_position(self, key, first, last):
+        """Erste Zeile im Monat, deren Transaktion (bzw. Tag) älter ist als `key`."""
+        low, high = first, last + 1
+        while low < high:
+            middle = (low + high) // 2
+            kind, value = self._rows[middle]
+            if kind == HEADER_ROW:
+                # Auf jede Überschrift folgt mindestens eine Transaktion
+                value = self._rows[middle + 1][1]
+            if self._sort_key(value) > key:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def insert_transaction(self, trans):
+        """Fügt eine Transaktion an ihrer Position ein, bei Bedarf mit Überschrift."""
+        day = self._day(trans)
+        first, last = self._content_range(self._month(trans))
+        row = self._insert_position(self._sort_key(trans), first, last)
+        previous = self._rows[row - 1]
+
+        if previous[0] == TRANSACTION_ROW and self._day(previous[1]) == day:
+            new_rows = [(TRANSACTION_ROW, trans)]
+        elif (
+            row <= last
+            and self._rows[row][0] == HEADER_ROW
+            and self._day(self._rows[row + 1][1]) == day
+        ):
+            # Neueste Transaktion einer bestehenden Gruppe: hinter die Überschrift
+            row += 1
+            new_rows = [(TRANSACTION_ROW, trans)]
+        else:
+            new_rows = [self._header(day), (TRANSACTION_ROW, trans)]
+        self._insert_rows(row, new_rows)
+
+    def remove_transaction(self, transaction_id):
+        """Entfernt eine Transaktion, bei leerer Gruppe auch die Überschrift."""
+        row = self._row_by_id.get(transaction_id)
+        if row is None:
+            return
+        first = row
+        last_in_group = (
+            row + 1 == len(self._rows) or self._rows[row + 1][0] != TRANSACTION_ROW
+        )
+        if self._rows[row - 1][0] == HEADER_ROW and last_in_group:
+            first = row - 1  # Letzte Transaktion des Tages: Überschrift mit entfernen
+        self._remove_rows(first, row)
+
+    def update_transaction(self, trans):
+        """Ändert eine Transaktion; verschoben wird sie nur bei neuer Sortierung."""
+        row = self._row_by_id[trans[0]]
+        if self._sort_key(self._rows[row][1]) != self._sort_key(trans):
+            self.remove_transaction(trans[0])
+            self.insert_transaction(trans)
+            return
+        self._rows[row] = (TRANSACTION_ROW, trans)
+        index = self.index(row)
+        self.dataChanged.emit(index, index)
+
+    def index_for_id(self, transaction_id):
+        """Gibt den Index der Transaktion zurück (ungültig, falls unbekannt)."""
+        row = self._row_by_id.get(transaction_id)
+        if row is None:
+            return QModelIndex()
+        return self.index(row)
+
+    def index_for_month(self, month):
+        """Gibt den Index der Monatszeile zurück (ungültig, falls unbekannt)."""
+        row = self._row_by_month.get(month)
+        if row is None:
+            return QModelIndex()
+        return self.index(row)
+
+    def transaction_count(self):
+        return len(self._row_by_id)
+
+
+class TransactionDelegate(QStyledItemDelegate):
+    """
+    Zeichnet Monatsabschnitte, Datumsüberschriften und Transaktionen direkt
+    mit dem QPainter.
+
+    Transaktionen erscheinen als grauer, abgerundeter Block mit Name und
+    Kategorie links und dem Betrag rechts, ohne pro Zeile eigene Widgets,
+    Layouts und Stylesheets anzulegen. Monatszeilen zeigen Einnahmen,
+    Ausgaben und Saldo sowie einen Pfeil für auf- bzw. zugeklappt.
+    """
+
+    MONTH_HEIGHT = 56
+    MONTH_TOTAL_WIDTH = 170  # Breite je Summe in der Monatszeile
+    HEADER_HEIGHT = 60  # 40 px Überschrift + 2 x 10 px Abstand
+    TRANSACTION_HEIGHT = 74
+    MARGIN = 4  # Abstand des Blocks zum Zeilenrand
+    PADDING = 14  # Innenabstand im Block
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.month_font = QFont("Arial", 16, QFont.Bold)
+        self.total_font = QFont("Arial", 12, QFont.Bold)
+        self.header_font = QFont("Arial", 16, QFont.Bold)
+        self.name_font = QFont("Arial", 14, QFont.Bold)
+        self.category_font = QFont("Arial", 12)
+        self.amount_font = QFont("Arial", 14, QFont.Bold)
+
+    def row_height(self, kind):
+        if kind == MONTH_ROW:
+            return self.MONTH_HEIGHT
+        if kind == HEADER_ROW:
+            return self.HEADER_HEIGHT
+        return self.TRANSACTION_HEIGHT
+
+    def sizeHint(self, option, index):
+        kind = index.data(TransactionListModel.KindRole)
+        return QSize(option.rect.width(), self.row_height(kind))
+
+    def paint(self, painter, option, index):
+        painter.save()
+        painter.setRenderHint(painter.RenderHint.Antialiasing)
+        kind = index.data(TransactionListModel.KindRole)
+        if kind == MONTH_ROW:
+            self.paint_month(painter, option, index)
+        elif kind == HEADER_ROW:
+            painter.setFont(self.header_font)
+            painter.setPen(QColor("#004A94"))
+            painter.drawText(option.rect, Qt.AlignCenter, index.data(Qt.DisplayRole))
+        else:
+            self.paint_transaction(
+                painter, option, index.data(TransactionListModel.TransactionRole)
+            )
+        painter.restore()
+
+    def paint_month(self, painter, option, index):
+        month, income, expense, net, count = index.data(TransactionListModel.MonthRole)
+        expanded = index.data(TransactionListModel.ExpandedRole)
+        rect = QRectF(option.rect).adjusted(
+            self.MARGIN, self.MARGIN, -self.MARGIN, -self.MARGIN
+        )
+
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(QColor("#D6E6F5"))
+        painter.drawRoundedRect(rect, 10, 10)
+        content = rect.adjusted(self.PADDING, 0, -self.PADDING, 0)
+
+        # Linker Bereich: Pfeil und Monatsname
+        painter.setFont(self.month_font)
+        painter.setPen(QColor("#004A94"))
+        arrow = "▾" if expanded else "▸"
+        painter.drawText(
+            content, Qt.AlignLeft | Qt.AlignVCenter, f"{arrow}  {index.data()}"
+        )
+
+        # Rechter Bereich: Einnahmen, Ausgaben und Saldo
+        painter.setFont(self.total_font)
+        totals = (
+            (f"Saldo {net:.2f} €", "green" if net >= 0 else "red"),
+            (f"Ausgaben {expense:.2f} €", "red"),
+            (f"Einnahmen {income:.2f} €", "green"),
+        )
+        column = QRectF(content)
+        for text, color in totals:
+            column.setLeft(column.right() - self.MONTH_TOTAL_WIDTH)
+            painter.setPen(QColor(color))
+            painter.drawText(column, Qt.AlignRight | Qt.AlignVCenter, text)
+            column.moveRight(column.left())
+
+    def paint_transaction(self, painter, option, trans):
+        id, amount, name, category, type_, date, day = trans
+        rect = QRectF(option.rect).adjusted(
+            self.MARGIN, self.MARGIN, -self.MARGIN, -self.MARGIN
+        )
+
+        # Hintergrund: hellgrau, bei Auswahl hellblau
+        selected = option.state & QStyle.State_Selected
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(QColor("#B3D9FF" if selected else "#E0E0E0"))
+        painter.drawRoundedRect(rect, 10, 10)
+
+        content = rect.adjusted(
+            self.PADDING, self.PADDING / 2, -self.PADDING, -self.PADDING / 2
+        )
+        top_half = QRectF(
+            content.left(), content.top(), content.width(), content.height() / 2
+        )
+        bottom_half = top_half.translated(0, content.height() / 2)
 
         # Linker Bereich: Name und Kategorie
-        text_layout = QVBoxLayout()
-        name_label = QLabel(name)
-        name_label.setFont(QFont("Arial", 14, QFont.Bold))
-        name_label.setStyleSheet("color: black;")
-
-        # Kategorie Label
-        category_label = QLabel(category)
-        category_label.setFont(QFont("Arial", 12))
-        category_label.setStyleSheet("color: gray;")
-
-        text_layout.addWidget(name_label)
-        text_layout.addWidget(category_label)
-
-        # Rechter Bereich: Betrag
-        amount_label = QLabel(f"{amount:.2f} €")
-        amount_label.setFont(QFont("Arial", 14, QFont.Bold))
-        amount_label.setAlignment(
-            Qt.AlignRight | Qt.AlignVCenter
-        )  
-        if type_ == 1:  # Einnahme
-            amount_label.setStyleSheet("color: green;")
-        else:  # Ausgabe
-            amount_label.setStyleSheet("color: red;")
-
-        # Elemente ins Hauptlayout einfügen
-        main_layout.addLayout(text_layout)  
-        main_layout.addWidget(amount_label)  
-
-        # Hauptlayout setzen
-        self.setLayout(main_layout)
+        painter.setFont(self.name_font)
+        painter.setPen(QColor("black"))
+        painter.drawText(top_half, Qt.AlignLeft | Qt.AlignVCenter, name)
+        painter.setFont(self.category_font)
+        painter.setPen(QColor("gray"))
+        painter.drawText(
+            bottom_half, Qt.AlignLeft | Qt.AlignVCenter, category or ""
+        )
+
+        # Rechter Bereich: Betrag (Einnahme grün, Ausgabe rot)
+        painter.setFont(self.amount_font)
+        painter.setPen(QColor("green" if type_ == 1 else "red"))
+        painter.drawText(content, Qt.AlignRight | Qt.AlignVCenter, f"{amount:.2f} €")
 
 
 class UebersichtView(QWidget):
-    def __init__(self, db_manager):
+    def __init__(self, db_manager, loader=None):
         super().__init__()
         self.db_manager = db_manager
+        self.loader = loader  # DataLoader für das Laden im Hintergrund (optional)
         self.setMinimumWidth(400)
 
         # Layout einrichten
@@ -85,11 +588,21 @@ class UebersichtView(QWidget):
         self.balance_label.setStyleSheet("color: #4CAF50; font-weight: bold;")
         main_layout.addWidget(self.balance_label)
 
-        # Transaktionsliste
-        self.transaction_list = QListWidget()
+        # Transaktionsliste: Modell und Delegate, gezeichnet werden nur sichtbare Zeilen
+        self.transaction_model = TransactionListModel(
+            self, fetch_more=self.load_more_month
+        )
+        self.transaction_list = QListView()
+        self.transaction_list.setModel(self.transaction_model)
+        self.transaction_list.setItemDelegate(
+            TransactionDelegate(self.transaction_list)
+        )
         self.transaction_list.setSelectionMode(
-            QListWidget.SingleSelection
+            QListView.SingleSelection
         )  # Nur ein Element kann ausgewählt werden
+        # Zeilenhöhen schrittweise berechnen, statt alle auf einmal
+        self.transaction_list.setLayoutMode(QListView.Batched)
+        self.transaction_list.setVerticalScrollMode(QListView.ScrollPerPixel)
         self.transaction_list.setStyleSheet(
             """
             background-color: #FFFFFF; 
@@ -97,9 +610,11 @@ class UebersichtView(QWidget):
             selection-background-color: #B3D9FF;  /* Markierung bei Auswahl */
         """
         )
-        self.transaction_list.setAlternatingRowColors(
-            True
-        )  
+        self.transaction_list.clicked.connect(self.on_item_clicked)
+        # Weitere Seiten laden, sobald das Ende eines Monats sichtbar wird
+        self.transaction_list.verticalScrollBar().valueChanged.connect(
+            self.fetch_visible_pages
+        )
         main_layout.addWidget(self.transaction_list)
 
         # Layout anwenden
@@ -108,106 +623,285 @@ class UebersichtView(QWidget):
         # Initalisiere Kontostand
         self.balance = 0.0 
 
+        # Geänderte Transaktionen, deren Zeilen noch geladen werden
+        self.changed_ids = set()
+        # Monat -> Fortsetzung der Seite, die gerade geladen wird
+        self.pending_pages = {}
+        # Scrollkorrektur beim Einfügen und Entfernen oberhalb der sichtbaren Zeile
+        self.anchor_row = None
+        self.scroll_shift = 0
+        self.transaction_model.rowsInserted.connect(self._on_rows_inserted)
+        self.transaction_model.rowsAboutToBeRemoved.connect(
+            self._on_rows_about_to_be_removed
+        )
+
         # Lade Transaktionen und berechne den Kontostand
         self.load_transactions()
 
-    def load_transactions(self):
-        transactions = self.db_manager.fetch_transactions()
-        self.transaction_list.clear()
-
-        # Gruppiere Transaktionen nach Datum
-        grouped_transactions = {}
-
-        for trans in transactions:
-            id, amount, name, category, type_, date = trans
-            # Entferne den Zeitanteil, falls vorhanden
-            date_obj = datetime.strptime(
-                date.split(" ")[0], "%Y-%m-%d"
-            )  # Nur das Datum ohne Zeit
-            formatted_date = date_obj.strftime(
-                "%d.%m.%Y"
-            )  # Datum im Format "dd.mm.yyyy"
-
-            if formatted_date not in grouped_transactions:
-                grouped_transactions[formatted_date] = []
-
-            grouped_transactions[formatted_date].append(trans)
-
-        # Sortiere die Datumsgruppen absteigend
-        sorted_dates = sorted(
-            grouped_transactions.keys(),
-            key=lambda x: datetime.strptime(x, "%d.%m.%Y"),
-            reverse=True,
-        )
-
-        # Durchlaufe die gruppierten Transaktionen und füge sie zur Liste hinzu
-        total_balance = 0.0  
-
-        for date in sorted_dates:
-            # Füge das Datum als Header hinzu
-            date_header = QLabel(date)
-            date_header.setFont(QFont("Arial", 16, QFont.Bold))
-            date_header.setFixedHeight(40) 
-            date_header.setAlignment(Qt.AlignCenter)  
-            date_header.setStyleSheet(
-                "color: #004A94; margin: 10px 0;"  
-            )
-
-            # Erstelle ein QListWidgetItem und füge das QLabel als Widget hinzu
-            item = QListWidgetItem()
-            item.setSizeHint(date_header.sizeHint())  
-            item.setFlags(
-                item.flags() & ~Qt.ItemIsSelectable & ~Qt.ItemIsEnabled
-            )  # Deaktivieren von Auswahl und Interaktivität
-            self.transaction_list.addItem(item)  
-            self.transaction_list.setItemWidget(
-                item, date_header
-            )  # Setze das Datum als Widget
-            item.setData(
-                Qt.UserRole, "no-hover"
-            )  
-
-            # Füge Transaktionen unter dem Datum hinzu
-            for trans in grouped_transactions[date]:
-                id, amount, name, category, type_, date = trans
-
-                # Erstelle das TransactionWidget für jede Transaktion
-                transaction_widget = TransactionWidget(name, category, amount, type_)
-
-                # Erstelle ein QListWidgetItem für die Transaktion
-                item = QListWidgetItem()
-                item.setSizeHint(
-                    transaction_widget.sizeHint()
-                ) 
-
-                # Speichere die Transaktions-ID im Item
-                item.setData(Qt.UserRole, id)
-
-                # Füge das Widget zum Item hinzu
-                self.transaction_list.addItem(item)
-                self.transaction_list.setItemWidget(item, transaction_widget)
-
-                # Berechne den Kontostand
-                if type_ == 1:  # Einnahme
-                    total_balance += amount
-                else:  # Ausgabe
-                    total_balance -= amount
-
-            # Füge nach jeder Gruppe einen Abstand hinzu
-            self.transaction_list.addItem(
-                QListWidgetItem()
-            )  # Leeres Item für den Abstand
-
-        # Setze den aktuellen Kontostand
-        self.balance_label.setText(f"Kontostand: {total_balance:.2f} €")
+    def update_balance(self, balance=None):
+        """Zeigt den von der Datenbank berechneten Kontostand an."""
+        if balance is None:
+            balance = self.db_manager.fetch_balance()
+        self.balance = balance
+        self.balance_label.setText(f"Kontostand: {self.balance:.2f} €")
 
         # Ändere die Farbe des Kontostands basierend auf dem Wert
-        if total_balance < 0:
+        if self.balance < 0:
             self.balance_label.setStyleSheet("color: red; font-weight: bold;")
         else:
             self.balance_label.setStyleSheet("color: #4CAF50; font-weight: bold;")
 
-    # Funktion zum uptaden der Grafen
-    def update_list(self):
-        self.load_transactions()
-        self.transaction_list.repaint()
+    def fetch_data(self, months=None):
+        """
+        Liest Kontostand, Monatssummen und die ersten Seiten der aufgeklappten
+        Monate (läuft mit Loader im Hintergrund).
+
+        Ohne aufgeklappte Monate wird der aktuelle Monat geöffnet, bzw. der
+        neueste Monat mit Transaktionen.
+
+        Args:
+            months (dict): Aufgeklappte Monate -> Anzahl zu lesender Zeilen
+                (None: Standardmonat mit einer Seite)
+        """
+        totals = self.db_manager.fetch_month_totals()
+        if months is None:
+            known = {month_totals[0] for month_totals in totals}
+            current = datetime.now().strftime("%Y-%m")
+            if current in known:
+                months = {current: PAGE_SIZE}
+            else:
+                months = {totals[0][0]: PAGE_SIZE} if totals else {}
+        month_transactions = {
+            month: self.db_manager.fetch_month_page(month, limit)
+            for month, limit in months.items()
+        }
+        incomplete = {
+            month
+            for month, limit in months.items()
+            if len(month_transactions[month]) == limit
+        }
+        return (
+            self.db_manager.fetch_balance(),
+            totals,
+            set(months),
+            month_transactions,
+            incomplete,
+        )
+
+    def load_transactions(self, keep_position=False):
+        """
+        Lädt Kontostand, Monatsabschnitte und Transaktionsliste neu.
+
+        Args:
+            keep_position (bool): Die aufgeklappten Monate erneut lesen und die
+                Scrollposition beibehalten, statt mit dem Standardmonat oben
+                zu beginnen
+        """
+        # Bereits nachgeladene Seiten werden wieder mitgelesen
+        model = self.transaction_model
+        months = (
+            {
+                month: max(PAGE_SIZE, model.loaded_count(month))
+                for month in model.expanded_months
+            }
+            if keep_position
+            else None
+        )
+        scroll_value = (
+            self.transaction_list.verticalScrollBar().value() if keep_position else 0
+        )
+        load_data(
+            self.loader,
+            (id(self), "transactions"),
+            lambda: self.fetch_data(months),
+            lambda data: self.show_transactions(data, scroll_value),
+        )
+
+    def show_transactions(self, data, scroll_value=0):
+        balance, totals, months, month_transactions, incomplete = data
+        # Kontostand zuerst, unabhängig von der Länge der Liste
+        self.update_balance(balance)
+
+        # Auswahl über das Neuladen hinweg beibehalten
+        selected_id = self.selected_transaction_id()
+        self.pending_pages.clear()
+        self.transaction_model.expanded_months = set(months)
+        self.transaction_model.set_months(totals, month_transactions, incomplete)
+        if selected_id is not None:
+            self.select_transaction(selected_id)
+        self.transaction_list.verticalScrollBar().setValue(scroll_value)
+        self.fetch_visible_pages()
+
+    def on_item_clicked(self, index):
+        """Klappt einen Monat beim Klick auf seine Zeile auf oder zu."""
+        month_totals = index.data(TransactionListModel.MonthRole)
+        if month_totals is not None:
+            self.toggle_month(month_totals[0])
+
+    def toggle_month(self, month):
+        """
+        Klappt einen Monat auf oder zu.
+
+        Beim Aufklappen wird nur die erste Seite dieses Monats gelesen, den
+        Rest lädt load_more_month() beim Scrollen nach. Zugeklappte Monate
+        belegen im Modell nur ihre Monatszeile.
+        """
+        model = self.transaction_model
+        self.pending_pages.pop(month, None)
+        if month in model.expanded_months:
+            model.collapse_month(month)
+            return
+
+        def show(transactions):
+            model.expand_month(month, transactions, len(transactions) == PAGE_SIZE)
+            self.fetch_visible_pages()
+
+        load_data(
+            self.loader,
+            (id(self), "month", month),
+            lambda: self.db_manager.fetch_month_page(month, PAGE_SIZE),
+            show,
+        )
+
+    def load_more_month(self, month):
+        """
+        Lädt die nächste Seite eines aufgeklappten Monats.
+
+        Die Seite setzt per Keyset (Datum_Tag, ID) an der letzten geladenen
+        Zeile an. Eine Seite, die schon geladen wird, wird nicht erneut
+        angefragt.
+        """
+        model = self.transaction_model
+        after = model.month_after(month)
+        if after is None or self.pending_pages.get(month) == after:
+            return
+        self.pending_pages[month] = after
+
+        def show(transactions):
+            if self.pending_pages.get(month) == after:
+                del self.pending_pages[month]
+            has_more = len(transactions) == PAGE_SIZE
+            model.append_month(month, after, transactions, has_more)
+            self.fetch_visible_pages()
+
+        load_data(
+            self.loader,
+            (id(self), "month", month),
+            lambda: self.db_manager.fetch_month_page(month, PAGE_SIZE, after),
+            show,
+        )
+
+    def fetch_visible_pages(self, *args):
+        """Lädt weiter, wo das Ende eines unvollständigen Monats sichtbar ist."""
+        if not self.transaction_list.isVisible():
+            return
+        model = self.transaction_model
+        viewport = self.transaction_list.viewport()
+        bottom = self.transaction_list.indexAt(viewport.rect().bottomLeft())
+        if bottom.isValid():
+            last_visible = bottom.row()
+        elif self.transaction_list.verticalScrollBar().maximum() == 0:
+            last_visible = model.rowCount() - 1  # Liste kürzer als die Ansicht
+        else:
+            return  # Layout läuft noch, der nächste Scrollwert prüft erneut
+        for month in model.incomplete_months():
+            if model.month_end(month) <= last_visible:
+                self.load_more_month(month)
+
+    def load_changes(self, ids):
+        """
+        Lädt nur die geänderten Transaktionen und überträgt sie ins Modell.
+
+        Die Monatssummen kommen aus einer gruppierten Abfrage über die
+        Summentabelle. Noch nicht angekommene IDs früherer Änderungen werden
+        mit abgefragt, da eine neue Anfrage die ältere im Loader ersetzt.
+        """
+        self.changed_ids |= set(ids)
+        ids = frozenset(self.changed_ids)
+        load_data(
+            self.loader,
+            (id(self), "changes"),
+            lambda: (
+                self.db_manager.fetch_balance(),
+                self.db_manager.fetch_month_totals(),
+                self.db_manager.fetch_transactions_by_ids(ids),
+            ),
+            lambda data: self.show_changes(ids, data),
+        )
+
+    def show_changes(self, ids, data):
+        balance, totals, rows = data
+        self.changed_ids -= ids
+        self.update_balance(balance)
+
+        # Zeilen oberhalb der sichtbaren Zeile verschieben den Inhalt: Die
+        # Scrollposition wird um deren Höhe korrigiert
+        scroll_bar = self.transaction_list.verticalScrollBar()
+        viewport = self.transaction_list.viewport()
+        top = self.transaction_list.indexAt(viewport.rect().topLeft())
+        self.anchor_row = top.row() if top.isValid() else None
+        self.scroll_shift = 0
+        # Erst die Monatszeilen, damit neue Transaktionen ihren Monat finden
+        self.transaction_model.set_month_totals(totals)
+        self.transaction_model.apply_changes(ids, rows)
+        if self.scroll_shift:
+            scroll_bar.setValue(scroll_bar.value() + self.scroll_shift)
+        self.anchor_row = None
+
+    def _rows_height(self, first, last):
+        delegate = self.transaction_list.itemDelegate()
+        model = self.transaction_model
+        return sum(
+            delegate.row_height(model.index(row).data(model.KindRole))
+            for row in range(first, last + 1)
+        )
+
+    def _on_rows_inserted(self, parent, first, last):
+        if self.anchor_row is not None and first <= self.anchor_row:
+            self.scroll_shift += self._rows_height(first, last)
+            self.anchor_row += last - first + 1
+
+    def _on_rows_about_to_be_removed(self, parent, first, last):
+        if self.anchor_row is not None and last < self.anchor_row:
+            self.scroll_shift -= self._rows_height(first, last)
+            self.anchor_row -= last - first + 1
+
+    def selected_transaction_id(self):
+        """Gibt die ID der ausgewählten Transaktion zurück oder None."""
+        index = self.transaction_list.currentIndex()
+        selection = self.transaction_list.selectionModel()
+        if not index.isValid() or not selection.isSelected(index):
+            return None
+        return index.data(Qt.UserRole)
+
+    def select_transaction(self, transaction_id):
+        """Wählt die Transaktion mit der ID aus (False, falls sie fehlt)."""
+        index = self.transaction_model.index_for_id(transaction_id)
+        if not index.isValid():
+            return False
+        self.transaction_list.setCurrentIndex(index)
+        return True
+
+    # Funktion zum uptaden der Liste
+    def update_list(self, changes=None):
+        """
+        Aktualisiert die Liste nach einer Änderung.
+
+        Ohne ChangeSet, bei geänderten Kategorien (Namen können viele Zeilen
+        betreffen) oder sehr vielen Transaktionen werden die aufgeklappten
+        Monate neu gelesen. Sonst werden nur die Monatssummen und die
+        betroffenen Zeilen geändert.
+        """
+        if (
+            changes is None
+            or changes.categories_changed
+            or len(changes.transaction_ids) > PAGE_SIZE
+        ):
+            self.load_transactions(keep_position=True)
+        else:
+            self.load_changes(changes.transaction_ids)
+
+    def on_data_changed(self, changes):
+        """Lädt die Liste nur neu, wenn Transaktionen oder Kategorien geändert wurden."""
+        if changes.transactions_changed or changes.categories_changed:
+            self.update_list(changes)
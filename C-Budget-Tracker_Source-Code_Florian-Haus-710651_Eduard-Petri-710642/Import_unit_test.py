@@ -0,0 +1,72 @@
+import os
+import unittest
+from PySide6.QtWidgets import QApplication
+from Core.database import DatabaseManager
+from Features.Import.view import ImportWorker, ImportProgressDialog
+
+
+class TestImportWorker(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        if not QApplication.instance():
+            cls.app = QApplication([])
+
+    def setUp(self):
+        self.db_path = "test_import_view_database.db"
+        self.csv_path = "test_import_view.csv"
+        with open(self.csv_path, "w", encoding="utf-8") as f:
+            f.write("Datum;Name;Betrag\n")
+            for day in range(1, 21):
+                f.write(f"{day:02d}.03.2025;Einkauf {day};-{day},50\n")
+        self.db_manager = DatabaseManager(self.db_path)
+
+    def tearDown(self):
+        self.db_manager.close()
+        os.remove(self.db_path)
+        os.remove(self.csv_path)
+
+    def test_worker_reports_progress(self):
+        """Der Worker meldet Fortschritt pro Block und die Gesamtanzahl."""
+        worker = ImportWorker(self.db_manager, self.csv_path, chunk_size=5)
+        dialog = ImportProgressDialog(worker)
+        progress = []
+        finished = []
+        worker.progress.connect(lambda rows, percent: progress.append((rows, percent)))
+        worker.finished_import.connect(finished.append)
+
+        # run() direkt aufrufen, damit der Test synchron bleibt
+        worker.run()
+
+        self.assertEqual([rows for rows, _ in progress], [5, 10, 15, 20])
+        self.assertEqual(progress[-1][1], 100)
+        self.assertEqual(finished, [20])
+        self.assertEqual(dialog.value(), 100)
+
+    def test_skipped_rows_are_shown(self):
+        """Übersprungene Datensätze stehen in der Abschlussmeldung."""
+        with open(self.csv_path, "a", encoding="utf-8") as f:
+            f.write("kein Datum;Einkauf;-1,00\n")
+            f.write("21.03.2025;Einkauf 21;-1,00\n")
+        worker = ImportWorker(self.db_manager, self.csv_path, chunk_size=5)
+        dialog = ImportProgressDialog(worker)
+        finished = []
+        worker.finished_import.connect(finished.append)
+
+        worker.run()
+
+        self.assertEqual(finished, [21])
+        self.assertIn("1 Datensätze übersprungen (Nr. 21)", dialog.labelText())
+
+    def test_worker_reports_errors(self):
+        """Fehler beim Import werden über das Signal `failed` gemeldet."""
+        worker = ImportWorker(self.db_manager, "gibt_es_nicht.csv")
+        errors = []
+        worker.failed.connect(errors.append)
+
+        worker.run()
+
+        self.assertEqual(len(errors), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,6 +4,7 @@ from PySide6.QtWidgets import QApplication
 from Features.Kategorien_Budget_Editor.view import CategoryEditDialog
 from PySide6.QtCore import Qt
 from unittest.mock import patch
+from Core.events import CategoryChanged, ChangeSet
 
 
 class MockDbManager:
@@ -163,6 +164,30 @@ class TestCategoryEditDialog(unittest.TestCase):
         self.assertEqual(result[0], "Lebensmittel 2")
         self.assertEqual(result[1], 600)
 
+    def test_reload_on_category_change(self):
+        """Testet, ob die Liste nach einem gemeldeten Commit neu geladen wird."""
+        self.cursor.execute(
+            "INSERT INTO Kategorie (Kategorie, Budget) VALUES ('Urlaub', 800)"
+        )
+        category_id = self.cursor.lastrowid
+        self.connection.commit()
+
+        self.dialog.on_data_changed(ChangeSet())
+        names = [
+            self.dialog.category_list.item(row).data(Qt.UserRole)["name"]
+            for row in range(self.dialog.category_list.count())
+        ]
+        self.assertNotIn("Urlaub", names)
+
+        self.dialog.on_data_changed(
+            ChangeSet([CategoryChanged("inserted", frozenset({category_id}))])
+        )
+        names = [
+            self.dialog.category_list.item(row).data(Qt.UserRole)["name"]
+            for row in range(self.dialog.category_list.count())
+        ]
+        self.assertIn("Urlaub", names)
+
     def test_delete_non_existent_category(self):
         """Testet das Löschen einer nicht existierenden Kategorie."""
         # Setze eine ungültige Auswahl
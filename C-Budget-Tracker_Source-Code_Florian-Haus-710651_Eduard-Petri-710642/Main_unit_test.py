@@ -1,12 +1,15 @@
 import unittest
 import sqlite3
-from PySide6.QtWidgets import QApplication
+from unittest.mock import patch
+from PySide6.QtWidgets import QApplication, QMessageBox
 from Core.database import DatabaseManager
 from Features.Kategorien_Budget_Editor.view import CategoryEditDialog
 from Features.Transaktionen_bearbeiten.view import TransactionDialog
 import os
+import _Main
 from _Main import MainPage
-from PySide6.QtCore import QDate
+from PySide6.QtCore import QDate, QObject, Signal
+import tempfile
 import time
 
 
@@ -185,6 +188,84 @@ class TestMainPage(unittest.TestCase):
             len(self.main_page.kreisdiagramm_view.ax.patches) > initial_pie_chart_data
         )
 
+    def test_views_refresh_on_change_events(self):
+        """Testet, ob mehrere Schreibzugriffe zu einer einzigen Aktualisierung führen."""
+        with patch.object(self.main_page.uebersicht, "update_list") as update_list:
+            self.db_manager.execute(
+                "UPDATE Haupt SET Name_Transaktion = 'Einkauf' WHERE ID = 1"
+            )
+            self.db_manager.execute(
+                "UPDATE Kategorie SET Budget = 500 WHERE Kategorie_ID = 1"
+            )
+            QApplication.processEvents()
+            QApplication.processEvents()
+
+        update_list.assert_called_once()
+
+    def test_read_does_not_refresh_views(self):
+        """Testet, ob reine Leseabfragen keine Aktualisierung auslösen."""
+        with patch.object(self.main_page.uebersicht, "update_list") as update_list:
+            self.db_manager.execute("SELECT * FROM Haupt")
+            QApplication.processEvents()
+            QApplication.processEvents()
+
+        update_list.assert_not_called()
+
+    def test_delete_uses_selected_transaction_id(self):
+        """Testet, ob Löschen die in der Übersicht ausgewählte ID verwendet."""
+        self.main_page.data_loader.wait(5000)
+        QApplication.processEvents()
+        transaction_id = self.fetchall("SELECT MIN(ID) FROM Haupt")[0][0]
+        self.assertTrue(self.main_page.uebersicht.select_transaction(transaction_id))
+
+        with patch(
+            "_Main.QMessageBox.question", return_value=QMessageBox.No
+        ) as question:
+            self.main_page.delete_transaction(None)
+
+        self.assertIn(f"ID {transaction_id} ", question.call_args[0][2])
+        self.assertTrue(
+            self.fetchall("SELECT ID FROM Haupt WHERE ID = ?", (transaction_id,))
+        )
+
+    def test_shutdown_closes_database(self):
+        """Testet, ob main() beim Beenden die Datenbank schließt und die Messwerte speichert."""
+
+        class FakeApplication(QObject):
+            aboutToQuit = Signal()
+
+            def __init__(self, argv):
+                super().__init__()
+
+            def exec(self):
+                self.aboutToQuit.emit()  # Sofort beenden
+                return 0
+
+        with tempfile.TemporaryDirectory() as directory:
+            stats_path = os.path.join(directory, "stats.json")
+            managers = []
+
+            def create_manager(path, **kwargs):
+                managers.append(
+                    DatabaseManager(os.path.join(directory, "main.db"), **kwargs)
+                )
+                return managers[-1]
+
+            with patch("_Main.QApplication", FakeApplication), patch(
+                "_Main.DatabaseManager", side_effect=create_manager
+            ), patch.object(MainPage, "showMaximized"), patch(
+                "sys.exit"
+            ) as exit_, patch.dict(
+                os.environ, {"BUDGET_QUERY_STATS": stats_path}
+            ):
+                _Main.main()
+
+            exit_.assert_called_once_with(0)
+            self.assertTrue(os.path.exists(stats_path))
+            # Verbindung geschlossen: weitere Abfragen schlagen fehl
+            with self.assertRaises(sqlite3.ProgrammingError):
+                managers[0].connection.execute("SELECT 1")
+
     def add_transaction_automatically(self):
         dialog = TransactionDialog(
             title="Transaktion Hinzufügen", db_manager=self.db_manager
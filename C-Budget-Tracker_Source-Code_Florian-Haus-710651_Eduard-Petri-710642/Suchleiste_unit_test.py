@@ -11,9 +11,12 @@ from PySide6.QtWidgets import (
     QListWidgetItem,
     QCalendarWidget,
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import QDate, Qt
 from datetime import datetime
-from unittest.mock import patch
+from unittest.mock import MagicMock
+from Core.events import ChangeSet, TransactionsDeleted, TransactionsUpdated
+from Core.search_pager import SearchPager
+from Features.Suchleiste.view import SuchleisteView as LiveSuchleisteView
 
 
 # Simuliere eine einfache Datenbankabfrage
@@ -212,5 +215,213 @@ class TestSuchleisteView(unittest.TestCase):
         )
 
 
+# Unittest Klasse für die Live-Suche der echten Suchleiste
+class TestLiveSearch(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        TestSuchleisteView.ensure_qapplication()
+
+    def setUp(self):
+        self.db_manager = MagicMock()
+        # Zwei Seiten; die zweite enthält einen weiteren Treffer vom 25.01.
+        self.pages = [
+            [
+                (1, 50.0, "Einkauf", "Lebensmittel", 0, "2025-01-25", 20250125),
+                (2, 20.0, "Einkauf Markt", "Lebensmittel", 0, "2025-01-24", 20250124),
+            ],
+            [
+                (3, 10.0, "Einkauf Bäcker", "Lebensmittel", 0, "2025-01-25", 20250125),
+                (4, 15.0, "Einkauf Kiosk", "Lebensmittel", 0, "2025-01-20", 20250120),
+                (5, 12.0, "Einkauf Apotheke", "Lebensmittel", 0, "2025-01-24", 20250124),
+            ],
+        ]
+        # Seitenweise Suche: jede Seite einzeln, Fortsetzung ist die Seitennummer
+        self.db_manager.search_cache.lookup.return_value = None
+        self.db_manager.search_cache.version = 0
+        self.db_manager.search_cache.max_bytes = 1_000_000
+        self.db_manager.search_transactions_page.side_effect = self.page
+        self.db_manager.count_search_results.return_value = 5
+        # Unscharfe Suche: Trefferliste in der Reihenfolge der Seiten
+        self.db_manager.search_hit_ids.side_effect = (
+            lambda term, fuzzy=False, cancelled=None: (
+                [row[0] for page in self.pages for row in page] if fuzzy else None
+            )
+        )
+        self.db_manager.fetch_transactions_by_ids.side_effect = (
+            lambda ids, cancelled=None: {
+                row[0]: row for page in self.pages for row in page if row[0] in ids
+            }
+        )
+        self.db_manager.cancel_check.side_effect = lambda cancelled=None: cancelled
+        self.db_manager.search_pager.side_effect = (
+            lambda term, fuzzy=False: SearchPager(self.db_manager, term, fuzzy)
+        )
+        self.widget = LiveSuchleisteView(self.db_manager)
+
+    def page(self, term, page_size, after, cancelled=None):
+        number = after or 0
+        more = number + 1 < len(self.pages)
+        return self.pages[number], (number + 1 if more else None)
+
+    def tearDown(self):
+        self.widget.deleteLater()
+
+    def rows(self):
+        model = self.widget.result_model
+        return [model.index(row).data() for row in range(model.rowCount())]
+
+    def test_search_waits_for_typing_pause(self):
+        """Testet, ob erst nach der Wartezeit und nur einmal gesucht wird."""
+        for text in ("E", "Ei", "Ein"):
+            self.widget.search_input.setText(text)
+        self.assertTrue(self.widget.search_timer.isActive())
+        self.db_manager.search_pager.assert_not_called()
+
+        self.widget.search_timer.timeout.emit()
+        self.db_manager.search_pager.assert_called_once()
+        self.assertEqual(self.db_manager.search_pager.call_args.args, ("Ein",))
+
+        # Leere Eingabe: keine Suche, Liste leer
+        self.widget.search_input.setText("")
+        self.assertFalse(self.widget.search_timer.isActive())
+        self.assertEqual(self.rows(), [])
+
+    def test_only_first_page_is_loaded(self):
+        """Testet, ob erst der Button weitere Seiten lädt."""
+        self.widget.search_input.setText("Einkauf")
+        self.widget.search_transactions()
+
+        self.assertEqual(self.widget.result_model.transaction_count(), 2)
+        self.db_manager.search_transactions_page.assert_called_once()
+        self.assertEqual(self.widget.status_label.text(), "2 von 5 Treffern")
+        self.assertFalse(self.widget.more_button.isHidden())
+
+        self.widget.more_button.click()
+        self.assertEqual(self.widget.result_model.transaction_count(), 5)
+        self.assertEqual(self.widget.status_label.text(), "5 Treffer")
+        self.assertTrue(self.widget.more_button.isHidden())
+
+    def test_pages_are_grouped_by_day(self):
+        """Testet, ob Treffer späterer Seiten in ihre Tagesgruppe einsortiert werden."""
+        self.widget.search_input.setText("Einkauf")
+        self.widget.search_transactions()
+        self.widget.load_more()
+
+        self.assertEqual(
+            self.rows(),
+            [
+                "25.01.2025", "Einkauf", "Einkauf Bäcker",
+                "24.01.2025", "Einkauf Markt", "Einkauf Apotheke",
+                "20.01.2025", "Einkauf Kiosk",
+            ],
+        )
+        self.assertEqual(self.widget.result_model.transaction_count(), 5)
+
+    def test_selection_survives_later_pages(self):
+        """Testet, ob die Auswahl beim Einsortieren weiterer Seiten erhalten bleibt."""
+        second_page = self.pages.pop()
+        self.widget.search_transactions()
+        model = self.widget.result_model
+        self.widget.result_list.setCurrentIndex(model.index(3))  # "Einkauf Markt"
+
+        model.append_transactions(second_page)
+
+        self.assertEqual(self.widget.result_list.currentIndex().data(Qt.UserRole), 2)
+        self.assertEqual(self.widget.result_list.currentIndex().row(), 4)
+
+    def test_fuzzy_search_mode(self):
+        """Testet, ob die unscharfe Suche den Trigrammindex nutzt und nicht gruppiert."""
+        self.widget.search_input.setText("Einkuaf")
+        self.widget.fuzzy_input.setChecked(True)  # sucht sofort im neuen Modus
+        self.widget.load_more()
+
+        self.assertEqual(
+            self.db_manager.search_pager.call_args, (("Einkuaf",), {"fuzzy": True})
+        )
+        self.assertEqual(
+            self.db_manager.search_hit_ids.call_args.args[:2], ("Einkuaf", True)
+        )
+        self.db_manager.search_transactions_page.assert_not_called()
+        self.db_manager.count_search_results.assert_not_called()
+        self.assertEqual(
+            self.rows(),
+            [
+                "Einkauf", "Einkauf Markt", "Einkauf Bäcker",
+                "Einkauf Kiosk", "Einkauf Apotheke",
+            ],
+        )
+
+    def test_calendar_heatmap(self):
+        """Testet, ob der angezeigte Monat mit einer Abfrage eingefärbt wird."""
+        self.db_manager.fetch_day_totals.return_value = [
+            (20250120, 15.0, 0.0, 1),
+            (20250124, 32.0, 0.0, 2),
+            (20250125, 60.0, 100.0, 2),
+        ]
+        self.db_manager.fetch_day_totals.reset_mock()
+        calendar = self.widget.calendar
+        calendar.setCurrentPage(2025, 1)
+
+        self.db_manager.fetch_day_totals.assert_called_once_with("2025-01")
+        self.assertEqual(set(self.widget.day_totals), {20250120, 20250124, 20250125})
+        shading = [
+            calendar.dateTextFormat(QDate(2025, 1, day)).background().color().name()
+            for day in (20, 25)
+        ]
+        self.assertEqual(shading, ["#ffe5e5", "#ff4d4d"])
+        self.assertIn("2 Buchungen", calendar.dateTextFormat(QDate(2025, 1, 25)).toolTip())
+        # Tage ohne Buchungen bleiben unverändert
+        self.assertEqual(
+            calendar.dateTextFormat(QDate(2025, 1, 21)).background().style(), Qt.NoBrush
+        )
+
+    def test_date_selected_uses_day_key(self):
+        """Testet, ob ein Klick auf einen Tag dessen Transaktionen nach Tagesschlüssel holt."""
+        self.db_manager.fetch_day_transactions.return_value = self.pages[1][:1]
+        self.widget.calendar.clicked.emit(QDate(2025, 1, 25))
+
+        self.db_manager.fetch_day_transactions.assert_called_once_with(20250125)
+        self.db_manager.search_pager.assert_not_called()
+        self.assertEqual(self.rows(), ["Einkauf Bäcker"])
+        self.assertEqual(self.widget.status_label.text(), "1 Treffer")
+
+    def test_changes_rerun_search(self):
+        """Testet, ob Änderungen an den Buchungen die aktuelle Suche neu laden."""
+        self.widget.search_input.setText("Einkauf")
+        self.widget.search_transactions()
+        self.widget.more_button.click()
+        self.assertEqual(self.widget.status_label.text(), "5 Treffer")
+
+        # Gelöschter Treffer: erste Seite und Anzahl werden neu gelesen
+        del self.pages[0][1]
+        self.db_manager.count_search_results.return_value = 4
+        self.widget.on_data_changed(
+            ChangeSet([TransactionsDeleted(frozenset({2}), frozenset(), frozenset({"2025-01"}))])
+        )
+
+        self.assertEqual(self.db_manager.search_pager.call_count, 2)
+        self.assertEqual(self.db_manager.search_pager.call_args.args, ("Einkauf",))
+        self.assertEqual(self.rows(), ["25.01.2025", "Einkauf"])
+        self.assertEqual(self.widget.status_label.text(), "1 von 4 Treffern")
+        self.assertFalse(self.widget.more_button.isHidden())
+
+    def test_changes_reload_selected_day(self):
+        """Testet, ob ein angezeigter Tag nur bei Änderungen in seinem Monat neu lädt."""
+        self.db_manager.fetch_day_transactions.return_value = self.pages[1][:1]
+        self.widget.calendar.clicked.emit(QDate(2025, 1, 25))
+
+        def change(month):
+            event = TransactionsUpdated(frozenset({3}), frozenset(), frozenset({month}))
+            self.widget.on_data_changed(ChangeSet([event]))
+
+        change("2025-02")
+        self.db_manager.fetch_day_transactions.assert_called_once()
+        self.db_manager.fetch_day_transactions.return_value = []
+        change("2025-01")
+        self.assertEqual(self.db_manager.fetch_day_transactions.call_count, 2)
+        self.assertEqual(self.rows(), [])
+        self.db_manager.search_pager.assert_not_called()
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -7,6 +7,7 @@ from PySide6.QtWidgets import (
     QVBoxLayout,
     QHBoxLayout,
     QMessageBox,
+    QFileDialog,
 )
 from PySide6.QtGui import QIcon
 from Features.Suchleiste.view import SuchleisteView
@@ -15,9 +16,12 @@ from Features.Kategorien_Budget_Editor.view import CategoryEditDialog
 from Features.Transaktionen_bearbeiten.view import TransactionDialog
 from Features.Diagramm_Ausgabe.view import DiagrammView
 from PySide6.QtCore import Qt
-from Core.database import DatabaseManager
+from Core.change_notifier import ChangeNotifier
+from Core.data_loader import DataLoader
+from Core.database import TRANSACTION_FIELDS, DatabaseManager
 from Features.Budget_insgesamt.view import BudgetDiagrammView
 from Features.Budget_Kategorie.view import BudgetBarChartView
+from Features.Import.view import ImportWorker, ImportProgressDialog
 
 
 class MainPage(QMainWindow):
@@ -30,7 +34,9 @@ class MainPage(QMainWindow):
 
         # Die Referenzen für die Ansicht und den Controller
         self.db_manager = db_manager
-        self.uebersicht_view = UebersichtView(self.db_manager)
+        # Alle Views lesen ihre Daten im Hintergrund (Thread-Pool)
+        self.data_loader = DataLoader(self.db_manager, self)
+        self.uebersicht_view = UebersichtView(self.db_manager, self.data_loader)
 
         icon_path = "Resources/Logo-_Sparkassen-App_–_die_mobile_Filiale.ico"
         self.setWindowIcon(QIcon(icon_path))
@@ -49,9 +55,11 @@ class MainPage(QMainWindow):
         top_layout = QHBoxLayout()
 
         # Diagramme nebeneinander oben
-        self.kreisdiagramm_view = DiagrammView(self.db_manager)  # Erstes Kreisdiagramm
+        self.kreisdiagramm_view = DiagrammView(
+            self.db_manager, self.data_loader
+        )  # Erstes Kreisdiagramm
         self.budgetdiagramm_view = BudgetDiagrammView(
-            self.db_manager
+            self.db_manager, self.data_loader
         )  # Zweites Kreisdiagramm
 
         # Beide Diagramme erhalten denselben Platz
@@ -66,12 +74,12 @@ class MainPage(QMainWindow):
 
         # Das dritte Diagramm darunter
         self.budget_chart_view = BudgetBarChartView(
-            self.db_manager
+            self.db_manager, self.data_loader
         )  # Instanziiere das Säulendiagramm
         left_layout.addWidget(self.budget_chart_view)  # Füge das Säulendiagramm hinzu
 
         # Übersicht
-        self.uebersicht = UebersichtView(self.db_manager)
+        self.uebersicht = UebersichtView(self.db_manager, self.data_loader)
         main_layout.addWidget(left_widget, 3)  # Left-Widget nimmt mehr Platz
         main_layout.addWidget(
             self.uebersicht, 2
@@ -80,6 +88,17 @@ class MainPage(QMainWindow):
         # Toolbar mit Buttons oben
         self.create_toolbar()
 
+        # Änderungs-Ereignisse der Datenbank: Jede Ansicht entscheidet selbst,
+        # ob sie neu laden muss (mehrere Ereignisse pro Durchlauf zusammengefasst)
+        self.change_notifier = ChangeNotifier(self.db_manager, self)
+        for view in (
+            self.uebersicht,
+            self.kreisdiagramm_view,
+            self.budgetdiagramm_view,
+            self.budget_chart_view,
+        ):
+            self.change_notifier.changed.connect(view.on_data_changed)
+
     # Toolbar mit Buttons oben
     def create_toolbar(self):
         toolbar = QToolBar("Aktionen")
@@ -106,6 +125,11 @@ class MainPage(QMainWindow):
         category_button.setFixedSize(150, 30)
         category_button.clicked.connect(self.open_category_editor)
         toolbar.addWidget(category_button) 
+
+        import_button = QPushButton("Importieren")
+        import_button.setFixedSize(150, 30)
+        import_button.clicked.connect(self.open_import_dialog)
+        toolbar.addWidget(import_button)
         toolbar.addWidget(QWidget())  
         search_button = QPushButton("Suche")
         search_button.setFixedSize(100, 30)
@@ -114,28 +138,19 @@ class MainPage(QMainWindow):
 
     # Öffnen des Kategorien-Editors
     def open_category_editor(self):
-        dialog = CategoryEditDialog(self.db_manager)
-        if dialog.exec():  # Dialog wird modal geöffnet
-            self.update_view()  # Aktualisiere Hauptansicht, wenn der Dialog geschlossen wurde
-            self.update_charts()  # Aktualisiere Hauptansicht, wenn der Dialog geschlossen wurde
+        dialog = CategoryEditDialog(self.db_manager, self.change_notifier)
+        dialog.exec()  # Dialog wird modal geöffnet, Änderungen melden sich selbst
 
     # Öffnen des Transaktionsdialogs zum Bearbeiten
     def edit_transaction(self):
-        selected_item = self.uebersicht.transaction_list.currentItem()
-        if not selected_item:
+        # ID der in der Übersicht ausgewählten Transaktion
+        transaction_id = self.uebersicht.selected_transaction_id()
+        if transaction_id is None:
             print("Keine Transaktion ausgewählt!")
             return
 
-        # Abrufen der ID aus dem ausgewählten Item
-        transaction_id = selected_item.data(Qt.UserRole)
-        if not transaction_id:
-            print("Keine gültige ID gefunden!")
-            return
-
-        # Abrufen der Transaktionsdaten über die ID
-        query = "SELECT * FROM Haupt WHERE id = ?"
-        cursor = self.db_manager.execute(query, (transaction_id,))
-        transaction_data = cursor.fetchone()
+        # Abrufen der Transaktionsdaten über die ID (Betrag in Euro)
+        transaction_data = self.get_transaction_row(transaction_id)
 
         # Transaktionsdialog mit den Daten füllen
         if transaction_data:
@@ -144,31 +159,35 @@ class MainPage(QMainWindow):
             )
             if dialog.exec():
                 print("Transaktion erfolgreich bearbeitet.")
-                self.update_view()
         else:
             print("Fehler beim Abrufen der Transaktionsdaten.")
 
+    # Transaktion als Tupel in der Spaltenreihenfolge von 'Haupt' für den Dialog
+    def get_transaction_row(self, transaction_id):
+        transaction = self.db_manager.fetch_transaction_by_id(transaction_id)
+        if not transaction:
+            return None
+        return (transaction["ID"],) + tuple(
+            transaction[field] for field in TRANSACTION_FIELDS
+        )
+
     # Abrufen der ausgewählten Transaktionsdaten
     def get_selected_transaction_data(self, item_text):
         parts = item_text.split(":")
         name_part = parts[0].strip()
-        query = "SELECT * FROM Haupt WHERE Name_Transaktion = ?"
+        query = "SELECT ID FROM Haupt WHERE Name_Transaktion = ?"
         cursor = self.db_manager.execute(query, (name_part,))
-        return cursor.fetchone() if cursor else None
+        row = cursor.fetchone() if cursor else None
+        return self.get_transaction_row(row[0]) if row else None
 
     # Löschen der ausgewählten Transaktion
     def delete_transaction(self, transaction_id):
-        selected_item = self.uebersicht.transaction_list.currentItem()
-        if not selected_item:
+        # ID der in der Übersicht ausgewählten Transaktion
+        transaction_id = self.uebersicht.selected_transaction_id()
+        if transaction_id is None:
             print("Keine Transaktion ausgewählt!")
             return
 
-        # ID der ausgewählten Transaktion abrufen
-        transaction_id = selected_item.data(Qt.UserRole)
-        if not transaction_id:
-            print("Keine gültige ID gefunden!")
-            return
-
         # Warnmeldung anzeigen, um das Löschen zu bestätigen
         confirm = QMessageBox.question(
             self,
@@ -183,17 +202,32 @@ class MainPage(QMainWindow):
             return
 
         # Löschoperation in der Datenbank
-        query = "DELETE FROM Haupt WHERE id = ?"
         try:
-            self.db_manager.execute(query, (transaction_id,))
+            self.db_manager.delete_transaction(transaction_id)
             print(f"Transaktion mit ID {transaction_id} erfolgreich gelöscht.")
-            self.update_view()  # Ansicht aktualisieren
         except Exception as e:
             print(f"Fehler beim Löschen der Transaktion: {e}")
 
+    # Import eines Kontoauszugs (CSV oder CAMT.053) im Hintergrund
+    def open_import_dialog(self):
+        path, _ = QFileDialog.getOpenFileName(
+            self,
+            "Kontoauszug importieren",
+            "",
+            "Kontoauszüge (*.csv *.xml);;CSV-Dateien (*.csv);;CAMT.053 (*.xml)",
+        )
+        if not path:
+            return
+
+        self.import_worker = ImportWorker(self.db_manager, path)
+        self.import_dialog = ImportProgressDialog(self.import_worker, self)
+        self.import_dialog.show()
+        self.import_worker.start()
+
     # Öffnen des Sufhcfensters
     def open_search_window(self):
-        self.search_window = SuchleisteView(self.db_manager)
+        self.search_window = SuchleisteView(self.db_manager, self.data_loader)
+        self.change_notifier.changed.connect(self.search_window.on_data_changed)
         self.search_window.show()
 
     # Hinzuüfgen einer Transaktion
@@ -201,7 +235,6 @@ class MainPage(QMainWindow):
         dialog = TransactionDialog("Neue Transaktion", self.db_manager)
         if dialog.exec():  # exec() für den Dialog anzeigen
             print("Transaktion hinzugefügt")
-        self.update_view()  # Aktualisierung der Liste
 
     # Aktualisierung der Diagramme
     def update_charts(self):
@@ -227,13 +260,18 @@ def main():
     app = QApplication([])
 
     # Initialisiere die Datenbank (fiktiver Pfad zur DB-Datei)
+    # Mit "--wal" laufen alle Schreibzugriffe im Hintergrund-Thread (WAL-Modus)
     db_manager = DatabaseManager(
-        "dingsbums.db"
+        "dingsbums.db", background_writer="--wal" in sys.argv
     )  # Stellen Sie sicher, dass die Datenbankdatei existiert
 
     # Hauptseite laden
     main_page = MainPage(db_manager)
     main_page.showMaximized()
+    # Offene Hintergrund-Abfragen vor dem Beenden abschließen, danach die
+    # Datenbank schließen (Writer-Thread, Lese-Pool, BUDGET_QUERY_STATS)
+    app.aboutToQuit.connect(main_page.data_loader.shutdown)
+    app.aboutToQuit.connect(db_manager.close)
 
     # Starte die Event-Schleife der Anwendung
     sys.exit(app.exec())
@@ -0,0 +1,108 @@
+import os
+import sqlite3
+import threading
+import unittest
+
+from Core.background_writer import BackgroundWriter
+from Core.database import DatabaseManager
+
+
+def insert(name):
+    """Auftrag, der eine Zeile einfügt und deren ID liefert."""
+    return lambda conn: conn.execute("INSERT INTO Haupt (Name) VALUES (?)", (name,)).lastrowid
+
+
+class TestBackgroundWriter(unittest.TestCase):
+    def setUp(self):
+        """Erstellt eine Testdatenbank mit einer einfachen Tabelle."""
+        self.db_path = "test_writer_database.db"
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("CREATE TABLE Haupt (ID INTEGER PRIMARY KEY, Name TEXT UNIQUE)")
+        self.commits = 0
+        self.writer = BackgroundWriter(self.db_path, on_commit=self.count_commit)
+
+    def tearDown(self):
+        self.writer.close()
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(self.db_path + suffix):
+                os.remove(self.db_path + suffix)
+
+    def count_commit(self, conn):
+        self.commits += 1
+
+    def count_rows(self):
+        with sqlite3.connect(self.db_path) as conn:
+            return conn.execute("SELECT COUNT(*) FROM Haupt").fetchone()[0]
+
+    def test_submit_returns_future(self):
+        """Das Future liefert nach dem Commit das Ergebnis des Auftrags."""
+        future = self.writer.submit(insert("Kino"))
+
+        self.assertEqual(future.result(timeout=5), 1)
+        self.assertEqual(self.count_rows(), 1)
+
+    def test_queued_writes_are_group_committed(self):
+        """Bereits wartende Aufträge werden gemeinsam in einem Commit geschrieben."""
+        # Writer blockieren, bis alle Aufträge eingestellt sind
+        release = threading.Event()
+        self.writer.submit(lambda conn: release.wait(5))
+        futures = [self.writer.submit(insert(f"T{i}")) for i in range(10)]
+        release.set()
+        for future in futures:
+            future.result(timeout=5)
+
+        self.assertEqual(self.count_rows(), 10)
+        self.assertLess(self.commits, 11)
+
+    def test_failed_job_does_not_affect_batch(self):
+        """Ein fehlerhafter Auftrag wird verworfen, die übrigen werden gespeichert."""
+        release = threading.Event()
+        self.writer.submit(lambda conn: release.wait(5))
+        ok = self.writer.submit(insert("A"))
+        duplicate = self.writer.submit(insert("A"))
+        other = self.writer.submit(insert("B"))
+        release.set()
+
+        ok.result(timeout=5)
+        other.result(timeout=5)
+        with self.assertRaises(sqlite3.IntegrityError):
+            duplicate.result(timeout=5)
+        self.assertEqual(self.count_rows(), 2)
+
+
+class TestDatabaseManagerWriterMode(unittest.TestCase):
+    def setUp(self):
+        self.db_path = "test_writer_mode_database.db"
+        self.db_manager = DatabaseManager(self.db_path, background_writer=True)
+
+    def tearDown(self):
+        self.db_manager.close()
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(self.db_path + suffix):
+                os.remove(self.db_path + suffix)
+
+    def test_writer_mode_uses_wal(self):
+        """Im Writer-Modus läuft die Datenbank im WAL-Modus."""
+        mode = self.db_manager.fetchall("PRAGMA journal_mode")[0][0]
+        self.assertEqual(mode.lower(), "wal")
+
+    def test_add_transaction_in_writer_mode(self):
+        """Schreibzugriffe laufen über den Writer-Thread und sind nach commit() sichtbar."""
+        future = self.db_manager.add_transaction(
+            {
+                "Transaktion": 12.5,
+                "Name_Transaktion": "Bäcker",
+                "Kategorie_FK": 0,
+                "Ausgabe_Einnahme": "0",
+                "Datum": "2025-01-20",
+            }
+        )
+        transaction_id = future.result(timeout=5)["lastrowid"]
+        self.db_manager.commit()
+
+        transaction = self.db_manager.fetch_transaction_by_id(transaction_id)
+        self.assertEqual(transaction["Name_Transaktion"], "Bäcker")
+
+
+if __name__ == "__main__":
+    unittest.main()
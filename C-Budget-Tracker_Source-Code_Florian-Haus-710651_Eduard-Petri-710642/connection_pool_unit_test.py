@@ -0,0 +1,53 @@
+import os
+import sqlite3
+import threading
+import unittest
+
+from Core.connection_pool import ConnectionPool
+
+
+class TestConnectionPool(unittest.TestCase):
+    def setUp(self):
+        """Erstellt eine leere Testdatenbank und einen kleinen Pool."""
+        self.db_path = "test_pool_database.db"
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("CREATE TABLE IF NOT EXISTS Haupt (ID INTEGER PRIMARY KEY)")
+        self.pool = ConnectionPool(self.db_path, max_size=2, timeout=0.2)
+
+    def tearDown(self):
+        self.pool.close()
+        os.remove(self.db_path)
+
+    def test_checkout_reuses_connection(self):
+        """Eine zurückgegebene Verbindung wird beim nächsten Checkout wiederverwendet."""
+        conn = self.pool.checkout()
+        self.pool.checkin(conn)
+        self.assertIs(self.pool.checkout(), conn)
+
+        stats = self.pool.stats()
+        self.assertEqual(stats["misses"], 1)
+        self.assertEqual(stats["hits"], 1)
+
+    def test_pool_is_bounded(self):
+        """Ist das Limit erreicht, wird keine weitere Verbindung geöffnet."""
+        first = self.pool.checkout()
+        second = self.pool.checkout()
+        self.assertIsNot(first, second)
+
+        with self.assertRaises(sqlite3.OperationalError):
+            self.pool.checkout()
+
+        # Eine zurückgegebene Verbindung wird an den Wartenden übergeben
+        threading.Timer(0.05, self.pool.checkin, args=(first,)).start()
+        self.assertIs(self.pool.checkout(), first)
+        self.assertEqual(self.pool.stats()["open"], 2)
+
+    def test_connections_are_read_only(self):
+        """Verbindungen aus dem Lese-Pool dürfen nicht schreiben."""
+        with self.pool.connection() as conn:
+            with self.assertRaises(sqlite3.OperationalError):
+                conn.execute("INSERT INTO Haupt (ID) VALUES (1)")
+
+
+if __name__ == "__main__":
+    unittest.main()
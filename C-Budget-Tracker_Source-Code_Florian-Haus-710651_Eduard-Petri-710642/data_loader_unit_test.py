@@ -0,0 +1,135 @@
+import os
+import tempfile
+import threading
+import time
+import unittest
+
+from PySide6.QtWidgets import QApplication
+
+from Core.data_loader import DataLoader, load_data
+from Core.database import DatabaseManager
+from Features.Diagramm_Ausgabe.view import DiagrammView
+
+
+class FakeDbManager:
+    """Liefert feste Ausgaben pro Kategorie, optional erst nach einem Signal."""
+
+    def __init__(self):
+        self.release = threading.Event()
+        self.release.set()
+        self.started = threading.Event()
+        self.threads = []
+
+    def fetch_expenses_per_category(self):
+        self.threads.append(threading.current_thread())
+        self.started.set()
+        self.release.wait(5)
+        return [("Lebensmittel", 200.0), ("Freizeit", 100.0)]
+
+
+class TestDataLoader(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        if not QApplication.instance():
+            cls.app = QApplication([])
+
+    def setUp(self):
+        self.db_manager = FakeDbManager()
+        self.loader = DataLoader(self.db_manager, max_threads=1)
+
+    def tearDown(self):
+        self.loader.shutdown()
+
+    def finish(self):
+        """Wartet auf alle Threads und stellt die Ergebnisse im GUI-Thread zu."""
+        self.loader.wait(5000)
+        QApplication.processEvents()
+
+    def test_result_is_delivered_in_gui_thread(self):
+        """Die Abfrage läuft im Pool, das Ergebnis kommt im GUI-Thread an."""
+        received = []
+        self.loader.load(
+            "chart",
+            self.db_manager.fetch_expenses_per_category,
+            lambda result: received.append((result, threading.current_thread())),
+        )
+        self.finish()
+
+        self.assertEqual(len(received), 1)
+        self.assertEqual(received[0][0][0], ("Lebensmittel", 200.0))
+        self.assertIs(received[0][1], threading.main_thread())
+        self.assertIsNot(self.db_manager.threads[0], threading.main_thread())
+
+    def test_superseded_requests(self):
+        """Neuere Anfragen mit demselben Schlüssel ersetzen ältere."""
+        received = []
+        self.db_manager.release.clear()
+        # Läuft bereits und blockiert den einzigen Thread
+        self.loader.load("chart", self.db_manager.fetch_expenses_per_category, received.append)
+        self.assertTrue(self.db_manager.started.wait(5))
+        # Wartet noch und wird vor dem Start ersetzt
+        self.loader.load("chart", lambda: "wartend", received.append)
+        self.loader.load("chart", lambda: "neu", received.append)
+        self.db_manager.release.set()
+        self.finish()
+
+        self.assertEqual(received, ["neu"])
+        stats = self.loader.stats()
+        self.assertEqual(
+            (stats["delivered"], stats["skipped"], stats["discarded"]), (1, 1, 1)
+        )
+
+    def test_cancel_and_errors(self):
+        """Abgebrochene Anfragen werden verworfen, Fehler an den Fehler-Callback gemeldet."""
+        received, errors = [], []
+        self.loader.load("a", lambda: 1, received.append)
+        self.loader.cancel("a")
+        self.loader.load("b", lambda: 1 / 0, received.append, errors.append)
+        self.finish()
+
+        self.assertEqual(received, [])
+        self.assertIsInstance(errors[0], ZeroDivisionError)
+
+    def test_superseded_query_is_interrupted(self):
+        """Eine ersetzte Anfrage bricht ihre laufende SQLite-Abfrage ab."""
+        # Läuft ohne Abbruch mehrere Sekunden
+        slow_query = (
+            "WITH RECURSIVE Zahl(x) AS (SELECT 1 UNION ALL SELECT x + 1 FROM Zahl "
+            "WHERE x < 100000000) SELECT COUNT(*) FROM Zahl"
+        )
+        received = []
+        with tempfile.TemporaryDirectory() as directory:
+            db_manager = DatabaseManager(os.path.join(directory, "loader.db"), query_cache_kib=0)
+            loader = DataLoader(db_manager, max_threads=2)
+            start = time.perf_counter()
+            loader.load("chart", lambda: db_manager._query(slow_query), received.append)
+            time.sleep(0.1)
+            loader.load("chart", lambda: db_manager._query("SELECT 'neu'"), received.append)
+            loader.wait(30000)
+            QApplication.processEvents()
+            duration = time.perf_counter() - start
+            loader.shutdown()
+            db_manager.close()
+
+        self.assertEqual(received, [[("neu",)]])
+        self.assertEqual(loader.stats()["discarded"], 1)
+        self.assertLess(duration, 2)
+
+    def test_load_data_without_loader(self):
+        """Ohne Loader wird direkt geladen (wie bisher im GUI-Thread)."""
+        received = []
+        load_data(None, "chart", lambda: 42, received.append)
+        self.assertEqual(received, [42])
+
+    def test_view_loads_in_background(self):
+        """Eine View mit Loader zeichnet, sobald die Daten angekommen sind."""
+        view = DiagrammView(self.db_manager, self.loader)
+        self.finish()
+
+        self.assertEqual(len(view.ax.patches), 2)
+        self.assertIsNot(self.db_manager.threads[-1], threading.main_thread())
+        view.deleteLater()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,1009 @@
+"""
+Benchmarks für die Datenbankschicht.
+
+Aufruf aus diesem Ordner, z.B.:
+    python database_benchmark.py indexes --rows 1000000
+"""
+
+import argparse
+import contextlib
+import functools
+import io
+import os
+import random
+import sqlite3
+import statistics
+import tempfile
+import time
+import tracemalloc
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+
+from Core.database import TRANSACTION_FIELDS, DatabaseManager
+from Core.dates import date_key_range, day_label
+from Core.importer import import_file
+from Core.migrations import MIGRATIONS, migrate
+
+CATEGORIES = [
+    "Lebensmittel",
+    "Freizeit",
+    "Miete",
+    "Versicherung",
+    "Mobilität",
+    "Gesundheit",
+    "Kleidung",
+    "Gehalt",
+]
+
+# Letzte Schema-Version, in der Beträge als Euro (Gleitkommazahl) gespeichert werden
+EURO_SCHEMA_VERSION = 4
+
+NAMES = [
+    "Kaufland",
+    "Rewe",
+    "Aldi",
+    "Kino",
+    "Tankstelle",
+    "Apotheke",
+    "Miete Wohnung",
+    "Gehalt Firma",
+    "Restaurant",
+    "Bahn Ticket",
+]
+
+
+def generate_rows(count, seed=42, days=5 * 365):
+    """Erzeugt zufällige Transaktionen als Tupel im Format der Tabelle 'Haupt'."""
+    rng = random.Random(seed)
+    start = date.today() - timedelta(days=days)
+    for _ in range(count):
+        yield (
+            round(rng.uniform(1, 500), 2),
+            rng.choice(NAMES),
+            rng.randint(1, len(CATEGORIES)),
+            "1" if rng.random() < 0.15 else "0",
+            (start + timedelta(days=rng.randint(0, days))).isoformat(),
+        )
+
+
+def build_ledger(path, rows, schema_version=1):
+    """
+    Legt eine Testdatenbank mit `rows` Transaktionen an.
+
+    Es werden nur die Migrationen bis `schema_version` angewendet, damit sich
+    der Zustand vor und nach einer Migration vergleichen lässt. Die Beträge
+    werden in Euro eingefügt und ab Version 5 von der Migration in Cent
+    umgerechnet, wie bei einer bestehenden Datenbank.
+    """
+    conn = sqlite3.connect(path)
+    migrate(
+        conn,
+        [m for m in MIGRATIONS if m[0] <= min(schema_version, EURO_SCHEMA_VERSION)],
+    )
+    conn.executemany(
+        "INSERT INTO Kategorie (Kategorie, Budget) VALUES (?, ?)",
+        [(name, 500) for name in CATEGORIES],
+    )
+    conn.executemany(
+        """
+        INSERT INTO Haupt (Transaktion, Name_Transaktion, Kategorie_FK, Ausgabe_Einnahme, Datum)
+        VALUES (?, ?, ?, ?, ?)
+        """,
+        generate_rows(rows),
+    )
+    conn.commit()
+    if schema_version > EURO_SCHEMA_VERSION:
+        migrate(conn, [m for m in MIGRATIONS if m[0] <= schema_version])
+    return conn
+
+
+def time_query(conn, query, params=(), repeat=5):
+    """Führt eine Abfrage mehrfach aus und gibt den Median der Laufzeit in ms zurück."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        conn.execute(query, params).fetchall()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def query_plan(conn, query, params=()):
+    """Gibt den Ausführungsplan einer Abfrage als Liste von Zeilen zurück."""
+    return [row[3] for row in conn.execute(f"EXPLAIN QUERY PLAN {query}", params)]
+
+
+# Aggregat-Abfragen der Anwendung (DatabaseManager und Diagramm-Views)
+AGGREGATE_QUERIES = {
+    "fetch_expenses_per_category": """
+        SELECT Kategorie.Kategorie, SUM(Haupt.Transaktion)
+        FROM Haupt
+        LEFT JOIN Kategorie ON Haupt.Kategorie_FK = Kategorie.Kategorie_ID
+        WHERE Haupt.Ausgabe_Einnahme = 0
+        GROUP BY Kategorie.Kategorie
+    """,
+    "BudgetBarChartView.fetch_category_data": """
+        SELECT Kategorie.Kategorie, Kategorie.Budget, COALESCE(SUM(Haupt.Transaktion), 0)
+        FROM Kategorie
+        LEFT JOIN Haupt ON Kategorie.Kategorie_ID = Haupt.Kategorie_FK
+        WHERE Kategorie.Budget > 0
+        GROUP BY Kategorie.Kategorie_ID, Kategorie.Kategorie, Kategorie.Budget
+    """,
+    "BudgetDiagrammView.fetch_budget_data": """
+        SELECT SUM(Transaktion)
+        FROM Haupt
+        WHERE Ausgabe_Einnahme = '0'
+        AND strftime('%Y-%m', Datum) = strftime('%Y-%m', 'now')
+    """,
+}
+
+
+def report_queries(conn, queries, label):
+    print(f"\n=== {label} ===")
+    results = {}
+    for name, query in queries.items():
+        results[name] = time_query(conn, query)
+        print(f"{name}: {results[name]:.1f} ms")
+        for line in query_plan(conn, query):
+            print(f"    {line}")
+    return results
+
+
+def benchmark_indexes(rows):
+    """Vergleicht Ausführungspläne und Laufzeiten vor und nach der Index-Migration."""
+    with tempfile.TemporaryDirectory() as tmp:
+        conn = build_ledger(os.path.join(tmp, "ledger.db"), rows, schema_version=1)
+        before = report_queries(conn, AGGREGATE_QUERIES, "ohne Indizes")
+
+        start = time.perf_counter()
+        migrate(conn)
+        print(f"\nMigration dauerte {time.perf_counter() - start:.1f} s")
+
+        after = report_queries(conn, AGGREGATE_QUERIES, "mit Indizes")
+        conn.close()
+
+    print("\n=== Vergleich ===")
+    for name in AGGREGATE_QUERIES:
+        print(f"{name}: {before[name]:.1f} ms -> {after[name]:.1f} ms")
+
+
+def benchmark_bulk_insert(rows, chunk_size):
+    """Vergleicht das zeilenweise Einfügen mit `add_transactions`."""
+    with tempfile.TemporaryDirectory() as tmp:
+        db_manager = DatabaseManager(os.path.join(tmp, "per_row.db"))
+        start = time.perf_counter()
+        # Erfolgsmeldungen von add_transaction unterdrücken
+        with contextlib.redirect_stdout(io.StringIO()):
+            for row in generate_rows(rows):
+                db_manager.add_transaction(dict(zip(TRANSACTION_FIELDS, row)))
+        per_row = time.perf_counter() - start
+        db_manager.close()
+
+        db_manager = DatabaseManager(os.path.join(tmp, "bulk.db"))
+        start = time.perf_counter()
+        result = db_manager.add_transactions(generate_rows(rows), chunk_size=chunk_size)
+        bulk = time.perf_counter() - start
+        db_manager.close()
+
+    chunks = result["chunk_timings"]
+    print(f"\nZeilenweise (add_transaction): {per_row:.2f} s, {rows / per_row:,.0f} Zeilen/s")
+    print(f"Blockweise (add_transactions): {bulk:.2f} s, {rows / bulk:,.0f} Zeilen/s")
+    print(
+        f"{len(chunks)} Blöcke à {chunk_size} Zeilen, "
+        f"Median {statistics.median(chunks) * 1000:.1f} ms pro Block"
+    )
+    print(f"Faktor: {per_row / bulk:.1f}x")
+
+
+def benchmark_aggregates(rows, repeat=5):
+    """
+    Vergleicht die Diagramm-Abfragen über die gesamte Historie (nur Indizes)
+    mit den Abfragen auf der Summentabelle 'Kategorie_Monat'.
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "aggregates.db")
+        build_ledger(path, rows, schema_version=MIGRATIONS[-1][0]).close()
+        db_manager = DatabaseManager(path)
+        months = db_manager.fetchall("SELECT COUNT(*) FROM Kategorie_Monat")[0][0]
+        print(f"\n{rows:,} Transaktionen, {months:,} Zeilen in Kategorie_Monat")
+
+        with db_manager.read_pool.connection() as conn:
+            before = {name: time_query(conn, query) for name, query in AGGREGATE_QUERIES.items()}
+
+        methods = {
+            "fetch_expenses_per_category": db_manager.fetch_expenses_per_category,
+            "BudgetBarChartView.fetch_category_data": db_manager.fetch_category_budgets,
+            "BudgetDiagrammView.fetch_budget_data": db_manager.fetch_month_expenses,
+        }
+        for name, method in methods.items():
+            timings = []
+            for _ in range(repeat):
+                start = time.perf_counter()
+                method()
+                timings.append((time.perf_counter() - start) * 1000)
+            print(f"{name}: {before[name]:.1f} ms -> {statistics.median(timings):.2f} ms")
+
+        start = time.perf_counter()
+        db_manager.rebuild_aggregates()
+        print(f"Neuaufbau der Summentabelle: {time.perf_counter() - start:.2f} s")
+        db_manager.close()
+
+
+# Suchbegriffe: häufiger Name, Präfix einer Kategorie, seltener Name, Monat
+SEARCH_TERMS = ["Kino", "Lebens", "Zahnarzt", "2024-05"]
+
+
+def benchmark_search(row_counts, repeat=5):
+    """Vergleicht die LIKE-Suche mit der Volltextsuche (FTS5) bei mehreren Tabellengrößen."""
+    with tempfile.TemporaryDirectory() as tmp:
+        for rows in row_counts:
+            path = os.path.join(tmp, f"search_{rows}.db")
+            conn = build_ledger(path, rows, schema_version=MIGRATIONS[-1][0])
+            # Einige seltene Buchungen, wie sie eine gezielte Suche finden soll
+            conn.executemany(
+                """
+                INSERT INTO Haupt (Transaktion, Name_Transaktion, Kategorie_FK, Ausgabe_Einnahme, Datum)
+                VALUES (?, ?, ?, ?, ?)
+                """,
+                [(8000, "Zahnarzt Dr. Müller", 6, "0", "2024-03-12")] * 20,
+            )
+            conn.commit()
+            conn.close()
+
+            db_manager = DatabaseManager(path)
+            print(f"\n=== {rows:,} Zeilen ===")
+            for term in SEARCH_TERMS:
+                timings = {}
+                for label, search in (
+                    ("LIKE", db_manager.search_transactions_like),
+                    ("FTS5", db_manager.search_transactions),
+                ):
+                    durations = []
+                    for _ in range(repeat):
+                        start = time.perf_counter()
+                        hits = len(search(term))
+                        durations.append((time.perf_counter() - start) * 1000)
+                    timings[label] = statistics.median(durations)
+                print(
+                    f"{term!r:>12} ({hits:,} Treffer): LIKE {timings['LIKE']:.1f} ms, "
+                    f"FTS5 {timings['FTS5']:.1f} ms"
+                )
+            db_manager.close()
+
+
+def filter_queries():
+    """Suchen der Suchsprache für benchmark_filters (Zeitraum im Vorjahr)."""
+    month = f"{date.today().year - 1}-03"
+    return [
+        f"cat:Lebensmittel amount>50 from:{month} to:{month}",
+        f"from:{month} to:{month}",
+        f"type:income from:{month} to:{month}",
+        f"Tankstelle from:{month} to:{month}",
+        "cat:Gesundheit",
+        "amount>495",
+        "type:income amount<5",
+        '"Bahn Ticket" amount>490',
+    ]
+
+
+def benchmark_filters(rows, repeat=5):
+    """
+    Vergleicht die Filter der Suchsprache mit und ohne Indizes.
+
+    "ohne Index" ist dieselbe Abfrage mit "Haupt NOT INDEXED", also ein
+    Durchlauf der ganzen Tabelle wie bei der bisherigen LIKE-Suche.
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "filters.db")
+        build_ledger(path, rows, schema_version=MIGRATIONS[-1][0]).close()
+        db_manager = DatabaseManager(path)
+        conn = sqlite3.connect(path)
+        print(f"{rows:,} Zeilen")
+        for term in filter_queries():
+            query, params, _ = db_manager._search_query(term)
+            full_scan = query.replace("FROM Haupt\n", "FROM Haupt NOT INDEXED\n", 1)
+            hits = len(conn.execute(query, params).fetchall())
+            indexed = time_query(conn, query, params, repeat)
+            scanned = time_query(conn, full_scan, params, repeat)
+            print(
+                f"{term!r:>52} ({hits:,} Treffer): ohne Index {scanned:.1f} ms, "
+                f"mit Index {indexed:.1f} ms"
+            )
+            for line in query_plan(conn, query, params):
+                print(f"    {line}")
+        conn.close()
+        db_manager.close()
+
+
+def search_all(db_manager, term, fuzzy=False):
+    """Liest alle Treffer einer Suche Seite für Seite über den SearchPager."""
+    pager = db_manager.search_pager(term, fuzzy=fuzzy)
+    rows = []
+    while pager.has_more:
+        rows.extend(pager.fetch())
+    return rows
+
+
+def benchmark_fuzzy(rows, merchants=20_000, repeat=5):
+    """
+    Misst die unscharfe Suche über den Trigrammindex gegen LIKE.
+
+    Neben den Namen aus NAMES gibt es `merchants` weitere Händler, damit der
+    Index nicht nur eine Handvoll Wörter enthält. Zusätzlich wird gemessen,
+    wie viel die Trigger beim Einfügen kosten.
+    """
+    rng = random.Random(7)
+    names = NAMES + [f"{rng.choice(NAMES)} Filiale {number}" for number in range(merchants)]
+
+    def ledger_rows(count):
+        for row in generate_rows(count):
+            yield (row[0], rng.choice(names), *row[2:])
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "fuzzy.db")
+        db_manager = DatabaseManager(path)
+        for name in CATEGORIES:
+            db_manager.add_category(name, 500)
+        start = time.perf_counter()
+        db_manager.add_transactions(ledger_rows(rows))
+        duration = time.perf_counter() - start
+        words = db_manager.fetchall("SELECT COUNT(*) FROM Suchwort")[0][0]
+        trigrams = db_manager.fetchall("SELECT COUNT(*) FROM Suchwort_Trigramm")[0][0]
+        print(
+            f"{rows:,} Zeilen in {duration:.1f} s eingefügt, "
+            f"{words:,} Suchwörter, {trigrams:,} Trigramm-Einträge"
+        )
+
+        # Einfügen ohne die Trigger des Trigrammindex zum Vergleich
+        conn = sqlite3.connect(path)
+        triggers = conn.execute(
+            "SELECT name, sql FROM sqlite_master WHERE name LIKE 'trg_%Suchwort%'"
+        ).fetchall()
+        timings = {}
+        for label in ("mit Trigrammindex", "ohne Trigrammindex"):
+            start = time.perf_counter()
+            conn.executemany(
+                """
+                INSERT INTO Haupt (Transaktion, Name_Transaktion, Kategorie_FK, Ausgabe_Einnahme, Datum)
+                VALUES (?, ?, ?, ?, ?)
+                """,
+                ledger_rows(50_000),
+            )
+            timings[label] = time.perf_counter() - start
+            conn.rollback()
+            if label == "mit Trigrammindex":
+                for name, _ in triggers:
+                    conn.execute(f"DROP TRIGGER {name}")
+        for _, sql in triggers:
+            conn.execute(sql)
+        conn.commit()
+        conn.close()
+        print(
+            "50.000 Zeilen einfügen: "
+            + ", ".join(f"{label} {seconds:.2f} s" for label, seconds in timings.items())
+        )
+
+        for term in ("Kauflnad", "Tankstele Filiale 123", "Apoteke", "Lebensmitel"):
+            db_manager.query_cache.clear()
+            durations = {"Trigramme": [], "Treffer": [], "LIKE": []}
+            for _ in range(repeat):
+                for label, search in (
+                    ("Trigramme", db_manager.fuzzy_matches),
+                    ("Treffer", functools.partial(search_all, db_manager, fuzzy=True)),
+                    ("LIKE", db_manager.search_transactions_like),
+                ):
+                    db_manager.query_cache.clear()
+                    start = time.perf_counter()
+                    result = search(term)
+                    durations[label].append((time.perf_counter() - start) * 1000)
+                    if label == "Trigramme":
+                        best = f"{result[0][0]!r} ({result[0][1]:.2f})" if result else "-"
+                    elif label == "Treffer":
+                        hits = len(result)
+                    else:
+                        like_hits = len(result)
+            print(
+                f"{term!r:>24}: ähnlichster Name {best}, "
+                f"Top-10 in {statistics.median(durations['Trigramme']):.1f} ms, "
+                f"{hits:,} Transaktionen in {statistics.median(durations['Treffer']):.1f} ms "
+                f"(LIKE: {like_hits:,} Treffer in {statistics.median(durations['LIKE']):.1f} ms)"
+            )
+        db_manager.close()
+
+
+def benchmark_search_cache(rows, terms=("Kaufland", "Tankstelle", "Apotheke")):
+    """
+    Tippt Suchbegriffe Buchstabe für Buchstabe mit und ohne Such-Cache.
+
+    Ohne Cache fragt jeder Tastendruck die Datenbank. Mit Cache geht nur der
+    erste in Frage kommende Präfix an die Datenbank (die ersten zwei
+    Buchstaben, wie sie der Volltextindex mit prefix = '2 3' bedient), alle
+    längeren Präfixe werden aus dessen Treffern gefiltert.
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "search_cache.db")
+        build_ledger(path, rows, schema_version=MIGRATIONS[-1][0]).close()
+        print(f"\n=== {rows:,} Zeilen ===")
+        for term in terms:
+            prefixes = [term[:length] for length in range(2, len(term) + 1)]
+            timings = {}
+            for label, search_cache_kib in (("ohne Cache", 0), ("mit Cache", 64 * 1024)):
+                db_manager = DatabaseManager(
+                    path, query_cache_kib=0, search_cache_kib=search_cache_kib
+                )
+                durations = []
+                for prefix in prefixes:
+                    start = time.perf_counter()
+                    hits = len(db_manager.search_transactions(prefix))
+                    durations.append((time.perf_counter() - start) * 1000)
+                timings[label] = durations
+                refinements = db_manager.search_cache_stats()["refinements"]
+                db_manager.close()
+            print(
+                f"{term!r:>12} ({hits:,} Treffer): "
+                + ", ".join(
+                    f"{label} erster {values[0]:.0f} ms, "
+                    f"danach Median {statistics.median(values[1:]):.1f} ms"
+                    for label, values in timings.items()
+                )
+                + f" ({refinements} verfeinert)"
+            )
+
+
+def benchmark_calendar(rows, repeat=5):
+    """
+    Misst die Kalenderansicht der Suchleiste.
+
+    Bisher lieferte ein Klick auf einen Tag die Suche nach "yyyy-MM-dd"
+    (Volltextsuche plus Datumsbereich), eine Übersicht über den Monat gab es
+    nicht. Jetzt: eine gruppierte Abfrage je Monatsseite und eine Abfrage auf
+    Gleichheit des Tagesschlüssels je Klick.
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "calendar.db")
+        build_ledger(path, rows, schema_version=MIGRATIONS[-1][0]).close()
+        db_manager = DatabaseManager(path, query_cache_kib=0, search_cache_kib=0)
+        month = f"{date.today().year - 1}-05"
+        day = f"{month}-03"
+        day_key = date_key_range(day)[0]
+        print(f"\n=== {rows:,} Zeilen, {month} ===")
+
+        for label, fetch in (
+            ("Monat (Summen je Tag)", lambda: db_manager.fetch_day_totals(month)),
+            ("Tag per Suche (bisher)", lambda: db_manager.search_transactions(day)),
+            ("Tag per Tagesschlüssel", lambda: db_manager.fetch_day_transactions(day_key)),
+        ):
+            durations = []
+            for _ in range(repeat):
+                start = time.perf_counter()
+                result = fetch()
+                durations.append((time.perf_counter() - start) * 1000)
+            print(
+                f"{label:>24}: {len(result):,} Zeilen in "
+                f"{statistics.median(durations):.2f} ms"
+            )
+        db_manager.close()
+
+
+def benchmark_paging(rows, terms=("Ka", "Kaufland", "type:income", "~Kauflnad")):
+    """
+    Vergleicht die Suche am Stück mit der ersten Seite plus Trefferzahl.
+
+    Bisher las die Suchleiste alle Treffer auf einmal; jetzt zeigt sie die
+    erste Seite des SearchPagers. Suchen nach Relevanz lesen dafür einmal
+    ihre Trefferliste und zählen sie, Filter blättern per Keyset-Paging und
+    zählen in einer eigenen Abfrage. Gemessen werden Dauer und
+    Spitzenverbrauch an Python-Speicher.
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "paging.db")
+        build_ledger(path, rows, schema_version=MIGRATIONS[-1][0]).close()
+        db_manager = DatabaseManager(path, query_cache_kib=0, search_cache_kib=0)
+        print(f"\n=== {rows:,} Zeilen ===")
+
+        def measure(fetch):
+            tracemalloc.start()
+            start = time.perf_counter()
+            result = fetch()
+            duration = (time.perf_counter() - start) * 1000
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            return result, duration, peak / 1024 / 1024
+
+        for term in terms:
+            fuzzy = term.startswith("~")
+            term = term.lstrip("~")
+            if fuzzy:
+                search = functools.partial(search_all, db_manager, fuzzy=True)
+            else:
+                search = db_manager.search_transactions
+
+            rows_found, full_ms, full_mb = measure(lambda: search(term))
+            pager = db_manager.search_pager(term, fuzzy=fuzzy)
+            page, page_ms, page_mb = measure(pager.fetch)
+            _, next_ms, _ = measure(pager.fetch)
+            total, count_ms, _ = measure(pager.count)
+            assert page == rows_found[: len(page)] and total == len(rows_found)
+            print(
+                f"{'~' * fuzzy + term!r}: am Stück {len(rows_found):,} Zeilen in "
+                f"{full_ms:.0f} ms ({full_mb:.1f} MB), erste Seite {page_ms:.0f} ms "
+                f"({page_mb:.2f} MB), nächste Seite {next_ms:.0f} ms, "
+                f"Anzahl {count_ms:.0f} ms"
+            )
+        db_manager.close()
+
+
+def table_size(conn, table):
+    """Gibt den Speicherbedarf einer Tabelle in Bytes zurück (dbstat oder geschätzt)."""
+    try:
+        return conn.execute(
+            "SELECT SUM(pgsize) FROM dbstat WHERE name = ?", (table,)
+        ).fetchone()[0]
+    except sqlite3.OperationalError:
+        # Ohne dbstat: Größe der gesamten Datei
+        page_size = conn.execute("PRAGMA page_size").fetchone()[0]
+        return page_size * conn.execute("PRAGMA page_count").fetchone()[0]
+
+
+# Summen über die gesamte Historie, ohne Umweg über die Summentabelle
+CENTS_QUERIES = {
+    "SUM(Transaktion)": "SELECT SUM(Transaktion) FROM Haupt",
+    "SUM je Kategorie": """
+        SELECT Kategorie_FK, SUM(Transaktion) FROM Haupt
+        WHERE Ausgabe_Einnahme = '0' GROUP BY Kategorie_FK
+    """,
+}
+
+
+def benchmark_cents(rows, repeat=5):
+    """
+    Vergleicht Summen und Speicherbedarf vor und nach der Umstellung auf Cent.
+
+    Vorher: Beträge als Gleitkommazahl in Euro. Nachher: ganze Cent (INTEGER).
+    Zusätzlich wird der Rundungsfehler der Gleitkomma-Summe gezeigt.
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        conn = build_ledger(
+            os.path.join(tmp, "cents.db"), rows, schema_version=EURO_SCHEMA_VERSION
+        )
+        exact = sum(Decimal(str(row[0])) for row in generate_rows(rows))
+
+        def measure(label):
+            print(f"\n=== {label} ===")
+            timings = {}
+            for name, query in CENTS_QUERIES.items():
+                timings[name] = time_query(conn, query, repeat=repeat)
+                print(f"{name}: {timings[name]:.1f} ms")
+            size = table_size(conn, "Haupt")
+            print(f"Haupt: {size / 1024 / 1024:.1f} MB, {size / rows:.1f} Bytes pro Zeile")
+            return timings, size
+
+        before, size_before = measure("Euro (REAL)")
+        float_sum = conn.execute("SELECT SUM(Transaktion) FROM Haupt").fetchone()[0]
+
+        start = time.perf_counter()
+        migrate(conn)
+        conn.execute("VACUUM")
+        print(f"\nMigration (mit VACUUM) dauerte {time.perf_counter() - start:.1f} s")
+
+        after, size_after = measure("Cent (INTEGER)")
+        cent_sum = conn.execute("SELECT SUM(Transaktion) FROM Haupt").fetchone()[0]
+        conn.close()
+
+    print("\n=== Vergleich ===")
+    for name in CENTS_QUERIES:
+        print(f"{name}: {before[name]:.1f} ms -> {after[name]:.1f} ms")
+    print(f"Haupt: {size_before / rows:.1f} -> {size_after / rows:.1f} Bytes pro Zeile")
+    print(f"Exakte Summe: {exact} EUR")
+    print(f"Summe REAL: {float_sum!r} (Abweichung {Decimal(repr(float_sum)) - exact})")
+    print(f"Summe Cent: {cent_sum / 100:.2f} (Abweichung {Decimal(cent_sum) / 100 - exact})")
+
+
+def benchmark_dates(rows, repeat=5):
+    """
+    Vergleicht Monatsfilter über strftime() auf dem Text-Datum mit
+    Bereichsabfragen auf dem Tagesschlüssel Datum_Tag (Migration 6).
+    """
+    month = date.today().replace(day=1)
+    start = month.year * 10000 + month.month * 100
+    queries = {
+        "strftime(Datum)": (
+            "SELECT COUNT(*), SUM(Transaktion) FROM Haupt "
+            "WHERE strftime('%Y-%m', Datum) = strftime('%Y-%m', 'now')",
+            (),
+        ),
+        "Datum LIKE": (
+            "SELECT COUNT(*), SUM(Transaktion) FROM Haupt WHERE Datum LIKE ?",
+            (month.strftime("%Y-%m") + "%",),
+        ),
+        "Datum_Tag Bereich": (
+            "SELECT COUNT(*), SUM(Transaktion) FROM Haupt "
+            "WHERE Datum_Tag >= ? AND Datum_Tag < ?",
+            (start, start + 100),
+        ),
+    }
+    with tempfile.TemporaryDirectory() as tmp:
+        conn = build_ledger(
+            os.path.join(tmp, "dates.db"), rows, schema_version=MIGRATIONS[-1][0]
+        )
+        print(f"\n=== {rows:,} Zeilen, Monat {month:%Y-%m} ===")
+        for name, (query, params) in queries.items():
+            count = conn.execute(query, params).fetchone()[0]
+            duration = time_query(conn, query, params, repeat=repeat)
+            print(f"{name}: {duration:.2f} ms ({count:,} Zeilen)")
+            for line in query_plan(conn, query, params):
+                print(f"    {line}")
+        conn.close()
+
+
+def benchmark_overview(rows, edits=20):
+    """
+    Misst die Zeit von einer Änderung bis zur aktualisierten Übersicht.
+
+    Zuerst wird der Start der Übersicht (Monatssummen und Standardmonat) mit
+    dem Lesen der ganzen Tabelle verglichen. Danach werden alle Monate
+    aufgeklappt, jeweils eine Transaktion geändert und die Liste entweder nur
+    für diese Zeile aktualisiert oder der geladene Bereich komplett neu gelesen.
+    """
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PySide6.QtWidgets import QApplication
+
+    from Core.events import ChangeSet
+    from Features.Übersicht.view import UebersichtView
+
+    app = QApplication.instance() or QApplication([])
+    rng = random.Random(7)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "overview.db")
+        build_ledger(path, rows, schema_version=MIGRATIONS[-1][0]).close()
+        db_manager = DatabaseManager(path)
+        events = []
+        db_manager.subscribe(events.extend)
+
+        print(f"\n=== {rows:,} Zeilen ===")
+        start = time.perf_counter()
+        db_manager.fetch_transactions()
+        print(f"Ganze Tabelle lesen (bisher): {(time.perf_counter() - start) * 1000:.0f} ms")
+
+        start = time.perf_counter()
+        view = UebersichtView(db_manager)
+        model = view.transaction_model
+        print(
+            f"Start mit Monatssummen und einem Monat: "
+            f"{(time.perf_counter() - start) * 1000:.0f} ms "
+            f"({len(model.months())} Monate, {model.transaction_count():,} Zeilen)"
+        )
+        view.resize(500, 800)
+        view.show()
+
+        start = time.perf_counter()
+        for month in model.months():
+            if month not in model.expanded_months:
+                view.toggle_month(month)
+        app.processEvents()
+        print(f"Alle Monate aufklappen: {(time.perf_counter() - start) * 1000:.0f} ms")
+
+        def edit(refresh):
+            # Name und bei jeder zweiten Änderung das Datum (Zeile wandert)
+            transaction_id = rng.randint(1, rows)
+            data = db_manager.fetch_transaction_by_id(transaction_id)
+            data["Name_Transaktion"] = f"Geändert {rng.random():.6f}"
+            if rng.random() < 0.5:
+                day = date.today() - timedelta(days=rng.randint(0, 1000))
+                data["Datum"] = day.isoformat()
+            events.clear()
+            start = time.perf_counter()
+            db_manager.update_transaction(transaction_id, data)
+            refresh(ChangeSet(events))
+            app.processEvents()
+            return (time.perf_counter() - start) * 1000
+
+        for name, refresh in (
+            ("Nur geänderte Zeilen", view.update_list),
+            ("Geladenen Bereich neu lesen", lambda changes: view.update_list()),
+        ):
+            durations = [edit(refresh) for _ in range(edits)]
+            print(
+                f"{name}: Median {statistics.median(durations):.1f} ms, "
+                f"Maximum {max(durations):.1f} ms "
+                f"({model.transaction_count():,} Zeilen geladen)"
+            )
+
+        view.close()
+        db_manager.close()
+
+
+def benchmark_live_search(rows, term="Tankstelle", keystroke_ms=80):
+    """
+    Simuliert das Tippen eines Suchbegriffs in der Suchleiste.
+
+    Bisher lief jede Suche am Stück im GUI-Thread. Die Live-Suche wartet auf
+    eine Tipp-Pause, sucht im Hintergrund und zeigt die Treffer seitenweise.
+    Gemessen wird die längste Blockade der Event-Schleife beim Tippen sowie
+    die Zeit bis zur ersten Seite und bis die Trefferzahl angezeigt wird.
+    """
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PySide6.QtCore import QEventLoop, QTimer
+    from PySide6.QtWidgets import QApplication
+
+    from Core.data_loader import DataLoader
+    from Features.Suchleiste.view import SuchleisteView
+
+    app = QApplication.instance() or QApplication([])
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "live_search.db")
+        build_ledger(path, rows, schema_version=MIGRATIONS[-1][0]).close()
+        db_manager = DatabaseManager(path, query_cache_kib=0, search_cache_kib=0)
+        prefixes = [term[:length] for length in range(1, len(term) + 1)]
+        print(f"\n=== {rows:,} Zeilen, Eingabe {term!r} ===")
+
+        # Bisher: jede Suche blockiert die Oberfläche bis zum letzten Treffer
+        durations = []
+        for prefix in prefixes:
+            start = time.perf_counter()
+            hits = len(db_manager.search_transactions(prefix))
+            durations.append((time.perf_counter() - start) * 1000)
+        print(
+            f"Suche im GUI-Thread (bisher): Median {statistics.median(durations):.0f} ms, "
+            f"Maximum {max(durations):.0f} ms pro Tastendruck ({hits:,} Treffer)"
+        )
+
+        loader = DataLoader(db_manager)
+        view = SuchleisteView(db_manager, loader)
+        model = view.result_model
+        loop = QEventLoop()
+        times = {"last": time.perf_counter(), "longest": 0.0}
+
+        def tick():
+            # Herzschlag alle 1 ms: Lücken zeigen, wie lange die Oberfläche stand
+            now = time.perf_counter()
+            times["longest"] = max(times["longest"], now - times["last"])
+            times["last"] = now
+            if "typed" not in times:
+                return
+            if "first_page" not in times and model.rowCount():
+                times["first_page"] = now
+            if view.total is not None and not loader.stats()["active"]:
+                times["done"] = now
+                loop.quit()
+
+        def type_text(prefix, last):
+            view.search_input.setText(prefix)
+            if last:
+                times["typed"] = time.perf_counter()
+
+        heartbeat = QTimer()
+        heartbeat.setInterval(1)
+        heartbeat.timeout.connect(tick)
+        heartbeat.start()
+        for position, prefix in enumerate(prefixes):
+            QTimer.singleShot(
+                position * keystroke_ms,
+                lambda prefix=prefix, last=position == len(prefixes) - 1: type_text(
+                    prefix, last
+                ),
+            )
+        QTimer.singleShot(60_000, loop.quit)  # Sicherheitsgrenze
+        loop.exec()
+        heartbeat.stop()
+
+        typed = times["typed"]
+        longest = times["longest"]
+        first_page = times.get("first_page", typed)
+        done = times.get("done", time.perf_counter())
+
+        stats = loader.stats()
+        print(
+            f"Live-Suche: längste Blockade {longest * 1000:.0f} ms, "
+            f"erste Seite nach {(first_page - typed) * 1000:.0f} ms "
+            f"(inkl. {view.search_timer.interval()} ms Wartezeit), "
+            f"{model.transaction_count():,} von {view.total or 0:,} Treffern "
+            f"nach {(done - typed) * 1000:.0f} ms"
+        )
+        print(
+            f"Anfragen: {stats['submitted']} gestartet, {stats['delivered']} angezeigt, "
+            f"{stats['discarded']} verworfen"
+        )
+        loader.shutdown()
+        view.close()
+        db_manager.close()
+
+
+def group_with_strptime(transactions):
+    """Bisherige Gruppierung der Übersicht: strptime pro Zeile und beim Sortieren."""
+    grouped_transactions = {}
+    for trans in transactions:
+        date = trans[5]
+        date_obj = datetime.strptime(date.split(" ")[0], "%Y-%m-%d")
+        formatted_date = date_obj.strftime("%d.%m.%Y")
+        grouped_transactions.setdefault(formatted_date, []).append(trans)
+    sorted_dates = sorted(
+        grouped_transactions.keys(),
+        key=lambda x: datetime.strptime(x, "%d.%m.%Y"),
+        reverse=True,
+    )
+    return [(date, grouped_transactions[date]) for date in sorted_dates]
+
+
+def group_with_day_key(transactions):
+    """Gruppierung über den Tagesschlüssel aus SQL und die gecachte Überschrift."""
+    groups = []
+    last_day = None
+    for trans in transactions:
+        if trans[6] != last_day:
+            last_day = trans[6]
+            groups.append((day_label(last_day), []))
+        groups[-1][1].append(trans)
+    return groups
+
+
+def benchmark_grouping(rows, repeat=5):
+    """
+    Vergleicht die Gruppierung nach Tagen in Python (strptime pro Zeile) mit
+    der Gruppierung über den vorsortierten Tagesschlüssel Datum_Tag.
+    """
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from Features.Übersicht.view import TransactionListModel
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "grouping.db")
+        build_ledger(path, rows, schema_version=MIGRATIONS[-1][0]).close()
+        db_manager = DatabaseManager(path)
+        transactions = db_manager.fetch_transactions_page(rows)
+        totals = db_manager.fetch_month_totals()
+        db_manager.close()
+
+    month_transactions = {}
+    for trans in transactions:
+        month_transactions.setdefault(trans[5][:7], []).append(trans)
+
+    def build_model(transactions):
+        # Alle Monate aufgeklappt, wie die bisherige flache Liste
+        model.expanded_months = set(month_transactions)
+        model.set_months(totals, month_transactions)
+        return None
+
+    def measure(function):
+        durations = []
+        for _ in range(repeat):
+            day_label.cache_clear()
+            start = time.perf_counter()
+            result = function(transactions)
+            durations.append((time.perf_counter() - start) * 1000)
+        return statistics.median(durations), result
+
+    model = TransactionListModel()
+    print(f"\n=== {len(transactions):,} Zeilen ===")
+    for name, function in (
+        ("strptime pro Zeile (bisher)", group_with_strptime),
+        ("Tagesschlüssel + day_label", group_with_day_key),
+        ("Modell der Übersicht", build_model),
+    ):
+        duration, result = measure(function)
+        groups = f" ({len(result):,} Tage)" if result else ""
+        print(f"{name}: {duration:.1f} ms{groups}")
+
+
+def write_statement_csv(path, rows):
+    """Schreibt einen CSV-Kontoauszug im Format einer deutschen Bank."""
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("Buchungstag;Beguenstigter/Zahlungspflichtiger;Betrag;Kategorie\n")
+        for amount, name, category_id, type_, day in generate_rows(rows):
+            sign = "" if type_ == "1" else "-"
+            german_day = ".".join(reversed(day.split("-")))
+            german_amount = f"{amount:.2f}".replace(".", ",")
+            category = CATEGORIES[category_id - 1]
+            f.write(f"{german_day};{name};{sign}{german_amount};{category}\n")
+
+
+def benchmark_import(rows):
+    """
+    Importiert Kontoauszüge mit `rows` und `4 * rows` Zeilen und vergleicht den
+    Spitzenverbrauch an Python-Speicher (tracemalloc).
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        for count in (rows, rows * 4):
+            csv_path = os.path.join(tmp, f"auszug_{count}.csv")
+            write_statement_csv(csv_path, count)
+            size_mb = os.path.getsize(csv_path) / 1024 / 1024
+
+            db_manager = DatabaseManager(os.path.join(tmp, f"import_{count}.db"))
+            tracemalloc.start()
+            start = time.perf_counter()
+            imported = import_file(db_manager, csv_path)
+            duration = time.perf_counter() - start
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            db_manager.close()
+
+            print(
+                f"{imported:,} Zeilen ({size_mb:.1f} MB): {duration:.2f} s, "
+                f"{imported / duration:,.0f} Zeilen/s, Spitze {peak / 1024 / 1024:.1f} MB"
+            )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmarks für die Datenbankschicht")
+    subparsers = parser.add_subparsers(dest="benchmark", required=True)
+
+    indexes = subparsers.add_parser("indexes", help="Aggregat-Abfragen mit/ohne Indizes")
+    indexes.add_argument("--rows", type=int, default=1_000_000)
+
+    bulk = subparsers.add_parser("bulk", help="Zeilenweises vs. blockweises Einfügen")
+    bulk.add_argument("--rows", type=int, default=10_000)
+    bulk.add_argument("--chunk-size", type=int, default=1000)
+
+    importer = subparsers.add_parser("import", help="Speicherbedarf des CSV-Imports")
+    importer.add_argument("--rows", type=int, default=100_000)
+
+    aggregates = subparsers.add_parser("aggregates", help="Diagramm-Abfragen mit Summentabelle")
+    aggregates.add_argument("--rows", type=int, default=1_000_000)
+
+    search = subparsers.add_parser("search", help="LIKE-Suche vs. Volltextsuche")
+    search.add_argument("--rows", type=int, nargs="+", default=[100_000, 1_000_000])
+
+    cents = subparsers.add_parser("cents", help="Summen und Zeilengröße: Euro (REAL) vs. Cent")
+    cents.add_argument("--rows", type=int, default=1_000_000)
+
+    dates = subparsers.add_parser("dates", help="Monatsfilter: strftime vs. Tagesschlüssel")
+    dates.add_argument("--rows", type=int, default=1_000_000)
+
+    grouping = subparsers.add_parser("grouping", help="Tagesgruppen: strptime vs. Tagesschlüssel")
+    grouping.add_argument("--rows", type=int, default=100_000)
+
+    overview = subparsers.add_parser("overview", help="Übersicht: Änderung bis Anzeige")
+    overview.add_argument("--rows", type=int, default=50_000)
+    overview.add_argument("--edits", type=int, default=20)
+
+    live_search = subparsers.add_parser("livesearch", help="Suche beim Tippen")
+    live_search.add_argument("--rows", type=int, default=1_000_000)
+
+    filters = subparsers.add_parser("filters", help="Suchsprache: Filter mit/ohne Indizes")
+    filters.add_argument("--rows", type=int, default=1_000_000)
+
+    fuzzy = subparsers.add_parser("fuzzy", help="Unscharfe Suche über Trigramme")
+    fuzzy.add_argument("--rows", type=int, default=1_000_000)
+
+    search_cache = subparsers.add_parser("searchcache", help="Such-Cache beim Tippen")
+    search_cache.add_argument("--rows", type=int, default=1_000_000)
+
+    calendar = subparsers.add_parser("calendar", help="Kalender: Heatmap und Tagesauswahl")
+    calendar.add_argument("--rows", type=int, default=1_000_000)
+
+    paging = subparsers.add_parser("paging", help="Suche seitenweise statt am Stück")
+    paging.add_argument("--rows", type=int, default=1_000_000)
+
+    args = parser.parse_args()
+    if args.benchmark == "indexes":
+        benchmark_indexes(args.rows)
+    elif args.benchmark == "bulk":
+        benchmark_bulk_insert(args.rows, args.chunk_size)
+    elif args.benchmark == "import":
+        benchmark_import(args.rows)
+    elif args.benchmark == "aggregates":
+        benchmark_aggregates(args.rows)
+    elif args.benchmark == "search":
+        benchmark_search(args.rows)
+    elif args.benchmark == "cents":
+        benchmark_cents(args.rows)
+    elif args.benchmark == "dates":
+        benchmark_dates(args.rows)
+    elif args.benchmark == "grouping":
+        benchmark_grouping(args.rows)
+    elif args.benchmark == "overview":
+        benchmark_overview(args.rows, args.edits)
+    elif args.benchmark == "livesearch":
+        benchmark_live_search(args.rows)
+    elif args.benchmark == "filters":
+        benchmark_filters(args.rows)
+    elif args.benchmark == "fuzzy":
+        benchmark_fuzzy(args.rows)
+    elif args.benchmark == "searchcache":
+        benchmark_search_cache(args.rows)
+    elif args.benchmark == "calendar":
+        benchmark_calendar(args.rows)
+    elif args.benchmark == "paging":
+        benchmark_paging(args.rows)
+
+
+if __name__ == "__main__":
+    main()
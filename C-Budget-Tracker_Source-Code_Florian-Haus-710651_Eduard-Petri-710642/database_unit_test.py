@@ -2,7 +2,7 @@ import unittest
 import sqlite3
 from datetime import datetime
 import os
-from Core.database import DatabaseManager
+from Core.database import TRANSACTION_ROWS, DatabaseManager, date_key_range
 
 
 class TestDatabaseManager(unittest.TestCase):
@@ -96,6 +96,507 @@ class TestDatabaseManager(unittest.TestCase):
         self.assertGreater(len(results), 0)
         self.assertEqual(results[0][2], "Kino")
 
+    def test_search_transactions_fulltext(self):
+        """Testet die Präfixsuche über den Volltextindex inklusive Kategorienamen."""
+        self.assertTrue(self.db_manager.fts_enabled)
+
+        # Präfix des Namens und Präfix der Kategorie
+        names = [row[2] for row in self.db_manager.search_transactions("Kaf")]
+        self.assertEqual(names, ["Kaffee"])
+        names = [row[2] for row in self.db_manager.search_transactions("freiz")]
+        self.assertIn("Kino", names)
+
+        # Eine exakt passende ID steht vor den Namenstreffern
+        results = self.db_manager.search_transactions("1")
+        self.assertEqual(results[0][0], 1)
+
+    def test_search_index_follows_category_changes(self):
+        """Testet, ob die Trigger den Volltextindex bei Umbenennungen aktualisieren."""
+        category_id = self.db_manager.add_category("Urlaub")
+        self.db_manager.add_transactions([(80, "Hotel", category_id, "0", "2025-02-01")])
+        self.assertEqual(
+            [row[2] for row in self.db_manager.search_transactions("urlaub")], ["Hotel"]
+        )
+
+        self.db_manager.execute(
+            "UPDATE Kategorie SET Kategorie = 'Reisen' WHERE Kategorie_ID = ?",
+            (category_id,),
+        )
+        self.assertEqual(self.db_manager.search_transactions("urlaub"), [])
+        self.assertEqual(
+            [row[2] for row in self.db_manager.search_transactions("reise")], ["Hotel"]
+        )
+
+    def test_day_key(self):
+        """Testet, ob der Tagesschlüssel beim Einfügen und Ändern gesetzt wird."""
+        result = self.db_manager.add_transactions([(12, "Bäckerei", 1, "0", "2024-05-03")])
+        transaction_id = result["ids"][0]
+        query = "SELECT Datum_Tag FROM Haupt WHERE ID = ?"
+        self.assertEqual(self.db_manager.fetchall(query, (transaction_id,)), [(20240503,)])
+
+        # Auch ein Datum mit Uhrzeit ergibt denselben Tag
+        self.db_manager.execute(
+            "UPDATE Haupt SET Datum = '2024-06-01 10:15:00' WHERE ID = ?", (transaction_id,)
+        )
+        self.assertEqual(self.db_manager.fetchall(query, (transaction_id,)), [(20240601,)])
+
+        ids = [row[0] for row in self.db_manager.search_transactions("2024-6")]
+        self.assertIn(transaction_id, ids)
+        self.db_manager.delete_transaction(transaction_id)
+
+    def test_date_search_uses_day_key_index(self):
+        """Testet, ob die Suche nach einem Zeitraum den Index auf Datum_Tag nutzt."""
+        self.assertEqual(date_key_range("2024"), (20240000, 20250000))
+        self.assertEqual(date_key_range("2024-05"), (20240500, 20240600))
+        self.assertEqual(date_key_range("2024-5-3"), (20240503, 20240504))
+        self.assertIsNone(date_key_range("Mai 2024"))
+
+        plan = self.db_manager.fetchall(
+            "EXPLAIN QUERY PLAN SELECT ID FROM Haupt WHERE Datum_Tag >= ? AND Datum_Tag < ?",
+            date_key_range("2024-05"),
+        )
+        self.assertIn("idx_Haupt_Datum_Tag", plan[0][3])
+
+    def test_fetch_transactions_page(self):
+        """Testet, ob die Seiten lückenlos und ohne Doppelte nach Datum absteigend kommen."""
+        # Zwei Buchungen am selben Tag, damit die ID als zweiter Schlüssel zählt
+        self.db_manager.add_transactions(
+            [(1500, name, 1, "0", "2023-06-15") for name in ("Seite A", "Seite B")]
+        )
+
+        pages, after = [], None
+        while True:
+            page = self.db_manager.fetch_transactions_page(3, after)
+            pages.extend(page)
+            if len(page) < 3:
+                break
+            after = (page[-1][5], page[-1][0])
+
+        expected = self.db_manager.fetchall(
+            "SELECT ID FROM Haupt ORDER BY Datum DESC, ID DESC"
+        )
+        self.assertEqual([row[0] for row in pages], [row[0] for row in expected])
+        # Wie fetch_transactions(), zusätzlich mit dem Tagesschlüssel
+        self.assertEqual(pages[0][6], int(pages[0][5][:10].replace("-", "")))
+
+        plan = self.db_manager.fetchall(
+            "EXPLAIN QUERY PLAN SELECT ID FROM Haupt WHERE (Datum, ID) < (?, ?) "
+            "ORDER BY Datum DESC, ID DESC LIMIT 3",
+            ("2023-06-15", 10),
+        )
+        self.assertIn("idx_Haupt_Datum_ID", plan[0][3])
+        self.assertNotIn("TEMP B-TREE", " ".join(row[3] for row in plan))
+
+    def test_fetch_transactions_by_ids(self):
+        """Testet, ob nur die angefragten Zeilen im Format der Übersicht kommen."""
+        ids = [row[0] for row in self.db_manager.fetch_transactions_page(2)]
+        rows = self.db_manager.fetch_transactions_by_ids(ids + [999999])
+
+        self.assertEqual(set(rows), set(ids))
+        expected = {row[0]: row for row in self.db_manager.fetch_transactions()}
+        for transaction_id in ids:
+            self.assertEqual(rows[transaction_id][:6], expected[transaction_id])
+
+    def test_fetch_month_totals(self):
+        """Testet Einnahmen, Ausgaben und Saldo je Monat aus der Summentabelle."""
+        self.db_manager.add_transactions(
+            [(1000, "Gehalt", 1, "1", "2023-06-01"), (250.5, "Einkauf", 1, "0", "2023-06-20")]
+        )
+
+        totals = self.db_manager.fetch_month_totals()
+        months = [row[0] for row in totals]
+        self.assertEqual(months, sorted(months, reverse=True))
+
+        # Vergleich mit der direkt aus 'Haupt' berechneten Summe
+        expected = self.db_manager.fetchall(
+            "SELECT "
+            "SUM(CASE WHEN Ausgabe_Einnahme = 1 THEN Transaktion ELSE 0 END), "
+            "SUM(CASE WHEN Ausgabe_Einnahme = 1 THEN 0 ELSE Transaktion END), "
+            "COUNT(*) FROM Haupt WHERE substr(Datum, 1, 7) = '2023-06'"
+        )[0]
+        month, income, expense, net, count = totals[months.index("2023-06")]
+        self.assertAlmostEqual(income, expected[0] / 100)
+        self.assertAlmostEqual(expense, expected[1] / 100)
+        self.assertAlmostEqual(net, income - expense)
+        self.assertEqual(count, expected[2])
+
+    def test_unpadded_date(self):
+        """Testet, ob ein Datum ohne führende Nullen im Monat und im Kalender erscheint."""
+        self.db_manager.add_transaction(
+            {
+                "Transaktion": 7.5,
+                "Name_Transaktion": "Ohne Null",
+                "Kategorie_FK": 1,
+                "Ausgabe_Einnahme": "0",
+                "Datum": "2019-04-3",
+            }
+        )
+        ids = self.db_manager.add_transactions([(2.5, "Auch ohne", 1, "0", "2019-4-03")])["ids"]
+        query = "SELECT MAX(ID) FROM Haupt WHERE Name_Transaktion = 'Ohne Null'"
+        ids.append(self.db_manager.fetchall(query)[0][0])
+        try:
+            page = self.db_manager.fetch_month_page("2019-04")
+            self.assertEqual({row[0] for row in page}, set(ids))
+            self.assertEqual({row[5] for row in page}, {"2019-04-03"})
+            totals = self.db_manager.fetch_day_totals("2019-04")
+            self.assertEqual(totals, [(20190403, 10.0, 0.0, 2)])
+
+            self.db_manager.update_transaction(
+                ids[0],
+                {
+                    "Transaktion": 2.5,
+                    "Name_Transaktion": "Auch ohne",
+                    "Kategorie_FK": 1,
+                    "Ausgabe_Einnahme": "0",
+                    "Datum": "2019-4-5",
+                },
+            )
+            days = [row[0] for row in self.db_manager.fetch_day_totals("2019-04")]
+            self.assertEqual(days, [20190403, 20190405])
+            with self.assertRaises(ValueError):
+                self.db_manager.validate_transaction((1, "Kino", 1, "0", "2019-04-31"))
+        finally:
+            for transaction_id in ids:
+                self.db_manager.delete_transaction(transaction_id)
+
+    def test_fetch_month_page(self):
+        """Testet, ob die Seiten eines Monats nach Tag und ID absteigend aufeinander folgen."""
+        self.db_manager.add_transactions(
+            [
+                (1000, "Juni", 1, "1", "2023-06-30"),
+                (1000, "Juni", 1, "1", "2023-06-30"),
+                (1000, "Juni früh", 1, "1", "2023-06-01"),
+                (1000, "Juli", 1, "1", "2023-07-01"),
+                (1000, "Dezember", 1, "1", "2023-12-31"),
+            ]
+        )
+
+        expected = self.db_manager.fetchall(
+            "SELECT ID FROM Haupt WHERE substr(Datum, 1, 7) = '2023-06' "
+            "ORDER BY Datum_Tag DESC, ID DESC"
+        )
+        rows, after = [], None
+        while True:
+            page = self.db_manager.fetch_month_page("2023-06", limit=2, after=after)
+            self.assertLessEqual(len(page), 2)
+            rows += page
+            if len(page) < 2:
+                break
+            after = (page[-1][6], page[-1][0])
+        self.assertEqual([row[0] for row in rows], [row[0] for row in expected])
+        self.assertEqual(rows[0][2], "Juni")
+        # Jahreswechsel: Dezember endet vor dem Januar des Folgejahres
+        december = self.db_manager.fetch_month_page("2023-12")
+        self.assertIn("Dezember", [row[2] for row in december])
+
+        # Die Fortsetzung sucht im Tagesindex, ohne nachträgliche Sortierung
+        plan = self.db_manager.fetchall(
+            "EXPLAIN QUERY PLAN SELECT ID FROM Haupt WHERE Datum_Tag >= ? "
+            "AND (Datum_Tag, ID) < (?, ?) ORDER BY Datum_Tag DESC, ID DESC LIMIT 2",
+            (20230600, 20230630, 10),
+        )
+        self.assertIn("idx_Haupt_Datum_Tag", plan[0][3])
+        self.assertNotIn("TEMP B-TREE", " ".join(row[3] for row in plan))
+
+    def read_pages(self, pager):
+        """Liest alle Seiten eines SearchPagers."""
+        pages = []
+        while pager.has_more:
+            pages.append(pager.fetch())
+        return pages
+
+    def test_search_pager(self):
+        """Testet, ob die Suche seitenweise dieselben Treffer wie am Stück liefert."""
+        self.db_manager.search_cache.clear()
+        expected = self.db_manager.search_transactions("")
+        self.db_manager.search_cache.clear()
+        pages = self.read_pages(self.db_manager.search_pager("", page_size=2))
+
+        self.assertTrue(all(len(page) <= 2 for page in pages))
+        self.assertEqual([row for page in pages for row in page], expected)
+
+        # Die Trefferliste kommt als array direkt aus dem Cursor, am Abfrage-Cache vorbei
+        expected = [row[0] for row in self.db_manager.search_transactions("Kino")]
+        before = self.db_manager.cache_stats()
+        hits = self.db_manager.search_hit_ids("Kino")
+        self.assertEqual(hits.typecode, "q")
+        self.assertEqual(list(hits), expected)
+        self.assertEqual(self.db_manager.cache_stats(), before)
+
+        # Abgebrochene Abfrage: SQLite unterbricht sie, die Seite fehlt noch
+        self.db_manager.search_cache.clear()
+        pager = self.db_manager.search_pager("Kino")
+        with self.db_manager.cancellable(lambda: True):
+            self.assertEqual(pager.fetch(), [])
+            self.assertIsNone(pager.count())
+        self.assertTrue(pager.has_more)
+        # Die Verbindung ist wieder im Pool und ohne Abbruch-Prüfung nutzbar
+        self.assertEqual(pager.fetch(), self.db_manager.search_transactions("Kino"))
+
+    def test_search_transactions_like_fallback(self):
+        """Testet, ob ohne FTS5 die LIKE-Suche dieselben Treffer liefert."""
+        expected = self.db_manager.search_transactions("Kino")
+        self.db_manager.fts_enabled = False
+        try:
+            results = self.db_manager.search_transactions("Kino")
+        finally:
+            self.db_manager.fts_enabled = True
+        self.assertEqual(results, expected)
+
+    def test_search_transactions_page(self):
+        """Testet, ob die Seiten aneinandergereiht die ganze Suche ergeben."""
+        ids = self.db_manager.add_transactions(
+            [(10 + i, f"Kaufland {i}", 1 + i % 2, str(i % 2), "2024-03-01") for i in range(5)]
+        )["ids"]
+
+        def all_pages(fetch_page, term):
+            rows, after = fetch_page(term, 2)
+            while after is not None:
+                page, after = fetch_page(term, 2, after)
+                self.assertLessEqual(len(page), 2)
+                rows.extend(page)
+            return rows
+
+        try:
+            self.db_manager.search_cache.clear()
+            search = self.db_manager.search_transactions_page
+            for term in ("kauf", "Lebensmittel", "cat:Freizeit", "type:income from:2024-03", "xyz"):
+                expected = self.db_manager.search_transactions(term)
+                self.db_manager.search_cache.clear()
+                pager = self.db_manager.search_pager(term, page_size=2)
+                pages = self.read_pages(pager)
+                self.assertEqual([row for page in pages for row in page], expected, term)
+                self.assertEqual(pager.count(), len(expected))
+                self.assertEqual(self.db_manager.count_search_results(term), len(expected))
+
+            # Volltext-Begriffe sucht search_transactions_page() per LIKE
+            self.db_manager.fts_enabled = False
+            try:
+                for term in ("Kaufland", "kauf", "cat:Freizeit"):
+                    expected = self.db_manager.search_transactions(term)
+                    self.assertEqual(all_pages(search, term), expected, term)
+            finally:
+                self.db_manager.fts_enabled = True
+
+            expected = self.db_manager.search_pager("Kaufladn", fuzzy=True, page_size=100).fetch()
+            pager = self.db_manager.search_pager("Kaufladn", fuzzy=True, page_size=2)
+            pages = self.read_pages(pager)
+            self.assertEqual([row for page in pages for row in page], expected)
+            self.assertEqual(pager.count(), len(expected))
+            self.assertEqual(
+                list(self.db_manager.search_hit_ids("Kaufladn", fuzzy=True)),
+                [row[0] for row in expected],
+            )
+
+            # Abgebrochen: keine Zeilen, keine Fortsetzung, keine Anzahl
+            self.assertEqual(search("kauf", 2, cancelled=lambda: True), ([], None))
+            self.assertIsNone(self.db_manager.count_search_results("kauf", lambda: True))
+        finally:
+            for transaction_id in ids:
+                self.db_manager.delete_transaction(transaction_id)
+
+    def test_structured_search(self):
+        """Testet die Filter der Suchsprache (cat:, amount, from:, to:, type:)."""
+        result = self.db_manager.add_transactions(
+            [
+                (60, "Rewe Markt", 1, "0", "2024-03-05"),
+                (20, "Rewe Markt", 1, "0", "2024-03-20"),
+                (75, "Markt Rewe", 1, "0", "2024-04-02"),
+                (900, "Gehalt", 2, "1", "2024-03-28"),
+            ]
+        )
+        ids = result["ids"]
+
+        def search(term):
+            return [row[0] for row in self.db_manager.search_transactions(term)]
+
+        try:
+            # Neueste zuerst
+            self.assertEqual(
+                search("cat:lebens amount>50 from:2024-03 to:2024"), [ids[2], ids[0]]
+            )
+            self.assertEqual(search("cat:LEBENSMITTEL from:2024-03 to:2024-03"), ids[1::-1])
+            self.assertEqual(search("amount<=20 from:2024 to:2024"), [ids[1]])
+            self.assertEqual(search("type:income from:2024-03-28 to:2024-03-28"), [ids[3]])
+            # Phrase in genau dieser Reihenfolge, Wörter als Präfix
+            self.assertEqual(search('"rewe markt" to:2024'), ids[1::-1])
+            self.assertEqual(search("mark rew to:2024"), [ids[2], ids[1], ids[0]])
+            # Unvollständige Filter liefern noch nichts
+            self.assertEqual(search("cat:"), [])
+
+            # Ohne FTS5 dieselben Treffer über LIKE
+            self.db_manager.fts_enabled = False
+            try:
+                self.assertEqual(search('"rewe markt" to:2024'), ids[1::-1])
+            finally:
+                self.db_manager.fts_enabled = True
+        finally:
+            for transaction_id in ids:
+                self.db_manager.delete_transaction(transaction_id)
+
+    def test_structured_search_uses_indexes(self):
+        """Testet per EXPLAIN, dass kein Filter der Suchsprache die Tabelle ganz liest."""
+        for term, index in (
+            ("cat:lebens", "idx_Haupt_Kategorie"),
+            ("amount>50", "idx_Haupt_Transaktion"),
+            ("amount<50", "idx_Haupt_Transaktion"),
+            ("from:2024-03", "idx_Haupt_Datum_Tag"),
+            ("to:2024-03", "idx_Haupt_Datum_Tag"),
+            ("type:income", "idx_Haupt_Typ_"),
+            ('"rewe markt"', "INTEGER PRIMARY KEY"),
+            # Mit begrenztem Zeitraum bestimmt dieser den Index
+            ("cat:lebens from:2024-03 to:2024-03", "idx_Haupt_Kategorie_Tag"),
+            ("type:income amount>50 rewe from:2024-03 to:2024-03", "idx_Haupt_Datum_Tag"),
+        ):
+            with self.subTest(term=term):
+                query, params, _ = self.db_manager._search_query(term)
+                plan = [
+                    row[3]
+                    for row in self.db_manager.fetchall(
+                        "EXPLAIN QUERY PLAN " + query, params
+                    )
+                ]
+                haupt = [line for line in plan if line.startswith(("SCAN", "SEARCH"))]
+                self.assertIn(index, haupt[0])
+                # Kein Durchlauf von Haupt oder Kategorie (auch nicht über einen Index)
+                scans = [
+                    line
+                    for line in plan
+                    if line.split()[:2] in (["SCAN", "Haupt"], ["SCAN", "Kategorie"])
+                ]
+                self.assertEqual(scans, [], plan)
+
+    def test_day_totals(self):
+        """Testet die Summen je Tag für den Kalender und die Transaktionen eines Tages."""
+        ids = self.db_manager.add_transactions(
+            [
+                (30, "Kaufland", 1, "0", "2019-02-01"),
+                (12.5, "Kino", 2, "0", "2019-02-01"),
+                (100, "Gehalt", 2, "1", "2019-02-01"),
+                (40, "Kaufhof", 2, "0", "2019-02-28"),
+                (5, "Kiosk", 2, "0", "2019-03-01"),
+            ]
+        )["ids"]
+        try:
+            self.assertEqual(
+                self.db_manager.fetch_day_totals("2019-02"),
+                [(20190201, 42.5, 100.0, 3), (20190228, 40.0, 0.0, 1)],
+            )
+            self.assertEqual(self.db_manager.fetch_day_totals("Februar"), [])
+
+            rows = self.db_manager.fetch_day_transactions(20190201)
+            self.assertEqual([row[0] for row in rows], [ids[2], ids[1], ids[0]])
+
+            # Monat nur aus dem abdeckenden Index, Tag über Gleichheit ohne Sortierung
+            for query, params, index in (
+                (
+                    "SELECT Datum_Tag, SUM(CASE WHEN CAST(Ausgabe_Einnahme AS INTEGER) = 1 "
+                    "THEN 0 ELSE Transaktion END), COUNT(*) FROM Haupt "
+                    "WHERE Datum_Tag >= ? AND Datum_Tag < ? GROUP BY Datum_Tag",
+                    (20190200, 20190300),
+                    "COVERING INDEX idx_Haupt_Tag_Typ_Betrag",
+                ),
+                (
+                    TRANSACTION_ROWS + "WHERE Haupt.Datum_Tag = ? ORDER BY Haupt.ID DESC",
+                    (20190201,),
+                    "idx_Haupt_Datum_Tag (Datum_Tag=?)",
+                ),
+            ):
+                plan = self.db_manager.fetchall(f"EXPLAIN QUERY PLAN {query}", params)
+                details = " ".join(row[3] for row in plan)
+                self.assertIn(index, details)
+                self.assertNotIn("TEMP B-TREE", details)
+        finally:
+            for transaction_id in ids:
+                self.db_manager.delete_transaction(transaction_id)
+
+    def test_search_cache(self):
+        """Testet die Verfeinerung im Such-Cache gegen die Suche in der Datenbank."""
+        ids = self.db_manager.add_transactions(
+            [
+                (30, "Kaufland Berlin", 1, "0", "2024-02-01"),
+                (40, "Kaufhof", 2, "0", "2024-02-02"),
+            ]
+        )["ids"]
+        try:
+            cache = self.db_manager.search_cache
+            cache.clear()
+            pages = self.read_pages(self.db_manager.search_pager("kau", page_size=1))
+            found = {row[0] for page in pages for row in page}
+            self.assertTrue(set(ids) <= found)
+            refinements = cache.stats()["refinements"]
+
+            for term in ("kauf", "Kaufland", "kaufland berl", "kaufh"):
+                refined = self.db_manager.search_transactions(term)
+                cache.clear()
+                expected = self.db_manager.search_transactions(term)
+                self.assertCountEqual(refined, expected, term)
+                cache.clear()
+                self.db_manager.search_transactions("kau")
+            self.assertEqual(cache.stats()["refinements"], refinements + 4)
+
+            # Ein Schreibzugriff macht die gespeicherten Treffer ungültig
+            self.db_manager.execute(
+                "UPDATE Haupt SET Name_Transaktion = 'Kaufpark' WHERE ID = ?", (ids[1],)
+            )
+            names = [row[2] for row in self.db_manager.search_transactions("kau")]
+            self.assertIn("Kaufpark", names)
+            self.assertNotIn("Kaufhof", names)
+        finally:
+            for transaction_id in ids:
+                self.db_manager.delete_transaction(transaction_id)
+
+    def test_fuzzy_search(self):
+        """Testet die unscharfe Suche und die Pflege des Trigrammindex durch Trigger."""
+        ids = self.db_manager.add_transactions(
+            [
+                (30, "Kaufland", 1, "0", "2024-02-01"),
+                (40, "Kaufland", 2, "0", "2024-02-02"),
+            ]
+        )["ids"]
+        try:
+            self.assertEqual(self.db_manager.fuzzy_matches("kaufladn")[0][0], "kaufland")
+            # Ähnlichster Name zuerst, darin die neueste Transaktion zuerst
+            hits = self.db_manager.search_hit_ids("Kaufladn", fuzzy=True)
+            self.assertEqual(list(hits[:2]), [ids[1], ids[0]])
+            # Tippfehler im Kategorienamen findet alle Transaktionen der Kategorie
+            results = self.db_manager.search_pager("Freizet", fuzzy=True).fetch()
+            names = [row[2] for row in results]
+            self.assertIn("Kino", names)
+            pages = self.read_pages(
+                self.db_manager.search_pager("kaufladn", fuzzy=True, page_size=1)
+            )
+            self.assertEqual([row[0] for page in pages for row in page], list(hits))
+
+            # Umbenennen und Löschen halten Anzahl und Trigramme aktuell
+            count = "SELECT Anzahl FROM Suchwort WHERE Wort = ?"
+            self.assertEqual(self.db_manager.fetchall(count, ("kaufland",)), [(2,)])
+            self.db_manager.execute(
+                "UPDATE Haupt SET Name_Transaktion = 'Kaufhof' WHERE ID = ?", (ids[0],)
+            )
+            self.db_manager.delete_transaction(ids[1])
+            self.assertEqual(self.db_manager.fetchall(count, ("kaufland",)), [])
+            self.assertEqual(self.db_manager.fuzzy_matches("kaufladn")[0][0], "kaufhof")
+            orphans = self.db_manager.fetchall(
+                "SELECT COUNT(*) FROM Suchwort_Trigramm WHERE Suchwort_ID NOT IN "
+                "(SELECT Suchwort_ID FROM Suchwort)"
+            )
+            self.assertEqual(orphans, [(0,)])
+        finally:
+            for transaction_id in ids:
+                self.db_manager.delete_transaction(transaction_id)
+
+    def test_fuzzy_search_uses_indexes(self):
+        """Testet per EXPLAIN, dass die unscharfe Suche 'Haupt' nicht durchläuft."""
+        query, params = self.db_manager._fuzzy_query("kaufladn")
+        plan = [
+            row[3] for row in self.db_manager.fetchall("EXPLAIN QUERY PLAN " + query, params)
+        ]
+        self.assertTrue(any("SEARCH Suchwort_Trigramm" in line for line in plan), plan)
+        self.assertTrue(any("idx_Haupt_Name" in line for line in plan), plan)
+        scans = [line for line in plan if line.split()[:2] == ["SCAN", "Haupt"]]
+        self.assertEqual(scans, [], plan)
+
     def test_fetch_expenses_per_category(self):
         """Testet die Methode `fetch_expenses_per_category`."""
         expenses = self.db_manager.fetch_expenses_per_category()
@@ -105,6 +606,136 @@ class TestDatabaseManager(unittest.TestCase):
         self.assertEqual(expenses[0][0], "Freizeit")
         self.assertEqual(expenses[1][0], "Lebensmittel")
 
+    def test_category_month_aggregates(self):
+        """Testet, ob die Trigger die Summentabelle bei Änderungen an 'Haupt' pflegen."""
+        raw_query = """
+        SELECT Kategorie.Kategorie, SUM(Haupt.Transaktion) / 100.0
+        FROM Haupt
+        LEFT JOIN Kategorie ON Haupt.Kategorie_FK = Kategorie.Kategorie_ID
+        WHERE Haupt.Ausgabe_Einnahme = 0
+        GROUP BY Kategorie.Kategorie
+        """
+        month = "2024-03"
+        result = self.db_manager.add_transactions(
+            [(30, "Bäcker", 1, "0", f"{month}-05"), (70, "Gehalt", 2, "1", f"{month}-28")]
+        )
+        self.assertEqual(self.db_manager.fetch_month_expenses(month), 30)
+
+        bakery_id = result["ids"][0]
+        self.db_manager.execute(
+            "UPDATE Haupt SET Transaktion = 4500 WHERE ID = ?", (bakery_id,)  # in Cent
+        )
+        self.assertEqual(self.db_manager.fetch_month_expenses(month), 45)
+        self.assertEqual(
+            self.db_manager.fetch_expenses_per_category(),
+            self.db_manager.fetchall(raw_query),
+        )
+
+        for transaction_id in result["ids"]:
+            self.db_manager.execute("DELETE FROM Haupt WHERE ID = ?", (transaction_id,))
+        self.assertEqual(self.db_manager.fetch_month_expenses(month), 0)
+        self.assertEqual(
+            self.db_manager.fetchall(
+                "SELECT * FROM Kategorie_Monat WHERE Monat = ?", (month,)
+            ),
+            [],
+        )
+
+    def test_amounts_stored_in_cents(self):
+        """Testet, ob Beträge als ganze Cent gespeichert und exakt summiert werden."""
+        query = "SELECT SUM(Summe), typeof(SUM(Summe)) FROM Kategorie_Monat"
+        before = self.db_manager.fetchall(query)[0][0]
+        result = self.db_manager.add_transactions(
+            [(0.1, "Gebühr", 1, "0", "2025-03-01")] * 3
+        )
+
+        total, type_ = self.db_manager.fetchall(query)[0]
+        self.assertEqual((total - before, type_), (30, "integer"))
+        transaction = self.db_manager.fetch_transaction_by_id(result["ids"][0])
+        self.assertEqual(transaction["Transaktion"], 0.1)
+
+        for transaction_id in result["ids"]:
+            self.db_manager.delete_transaction(transaction_id)
+
+    def test_fetch_balance(self):
+        """Testet, ob der Kontostand Einnahmen minus Ausgaben ergibt."""
+        expected = sum(
+            amount if type_ == 1 else -amount
+            for _, amount, _, _, type_, _ in self.db_manager.fetch_transactions()
+        )
+        self.assertAlmostEqual(self.db_manager.fetch_balance(), expected)
+
+        result = self.db_manager.add_transactions([(25, "Rückzahlung", 1, "1", "2025-03-01")])
+        self.assertAlmostEqual(self.db_manager.fetch_balance(), expected + 25)
+        self.db_manager.execute("DELETE FROM Haupt WHERE ID = ?", (result["ids"][0],))
+
+    def test_rebuild_aggregates(self):
+        """Testet, ob der Neuaufbau dieselbe Summentabelle ergibt."""
+        query = "SELECT * FROM Kategorie_Monat ORDER BY 1, 2, 3"
+        before = self.db_manager.fetchall(query)
+        self.db_manager.execute("DELETE FROM Kategorie_Monat")
+
+        self.db_manager.rebuild_aggregates()
+
+        self.assertEqual(self.db_manager.fetchall(query), before)
+
+    def test_fetch_uses_read_pool(self):
+        """Testet, ob wiederholte Abfragen Verbindungen aus dem Lese-Pool wiederverwenden."""
+        # Abfrage-Cache leeren, damit beide Abfragen die Datenbank erreichen
+        self.db_manager.query_cache.bump_version()
+        before = self.db_manager.pool_stats()
+        self.db_manager.fetch_transactions()
+        self.db_manager.fetch_expenses_per_category()
+        after = self.db_manager.pool_stats()
+
+        self.assertGreaterEqual(after["hits"], before["hits"] + 1)
+        self.assertLessEqual(after["open"], after["max_size"])
+
+    def test_query_cache(self):
+        """Testet, ob Leseabfragen zwischengespeichert und nach Schreibzugriffen erneuert werden."""
+        self.db_manager.fetch_balance()
+        before = self.db_manager.cache_stats()
+        balance = self.db_manager.fetch_balance()
+        after = self.db_manager.cache_stats()
+        self.assertEqual(after["hits"], before["hits"] + 1)
+
+        result = self.db_manager.add_transactions([(15, "Erstattung", 1, "1", "2025-03-02")])
+        self.assertGreater(self.db_manager.cache_stats()["version"], after["version"])
+        self.assertAlmostEqual(self.db_manager.fetch_balance(), balance + 15)
+
+        self.db_manager.execute("DELETE FROM Haupt WHERE ID = ?", (result["ids"][0],))
+        self.assertAlmostEqual(self.db_manager.fetch_balance(), balance)
+
+    def test_query_profiler(self):
+        """Testet, ob Lese- und Schreibabfragen mit Laufzeit und Zeilen erfasst werden."""
+        self.db_manager.profiler.reset()
+        self.db_manager.query_cache.bump_version()
+        rows = self.db_manager.fetch_transactions()
+        self.db_manager.execute("UPDATE Haupt SET Datum = Datum WHERE ID = -1")
+
+        stats = self.db_manager.query_stats()
+        read = [entry for key, entry in stats.items() if key.startswith("SELECT")]
+        self.assertEqual(sum(entry["rows"] for entry in read), len(rows))
+        write = stats["UPDATE Haupt SET Datum = Datum WHERE ID = ?"]
+        self.assertEqual((write["calls"], write["rows"]), (1, 0))
+
+        # Mit Schwelle 0 landet jede Abfrage samt Plan im Slow-Query-Log
+        self.db_manager.profiler.slow_ms = 0
+        self.db_manager.query_cache.bump_version()
+        self.db_manager.fetch_transactions()
+        self.assertTrue(self.db_manager.profiler.slow_queries[-1]["plan"])
+        self.db_manager.profiler.slow_ms = 100
+
+    def test_schema_migrations_applied(self):
+        """Testet, ob beim Start die Migrationen laufen und die Indizes anlegen."""
+        version = self.db_manager.fetchall("PRAGMA user_version")[0][0]
+        self.assertEqual(version, self.db_manager.schema_version)
+
+        plan = self.db_manager.fetchall(
+            "EXPLAIN QUERY PLAN SELECT SUM(Transaktion) FROM Haupt WHERE Ausgabe_Einnahme = 0 GROUP BY Kategorie_FK"
+        )
+        self.assertIn("idx_Haupt_Typ_Kategorie", plan[0][3])
+
     def test_add_transaction(self):
         """Testet die Methode `add_transaction`."""
         transaction_data = {
@@ -125,6 +756,38 @@ class TestDatabaseManager(unittest.TestCase):
         transactions = self.db_manager.fetch_transactions()
         self.assertGreater(len(transactions), 3)  # Es gibt nun mehr als 3 Transaktionen
 
+    def test_add_transactions(self):
+        """Testet das blockweise Einfügen mit `add_transactions`."""
+        rows = (
+            (10 + i, f"Import {i}", 2, "0", "2025-01-15")
+            for i in range(5)
+        )
+        result = self.db_manager.add_transactions(rows, chunk_size=2)
+
+        self.assertEqual(len(result["ids"]), 5)
+        self.assertEqual(len(result["chunk_timings"]), 3)
+        inserted = self.db_manager.fetch_transaction_by_id(result["ids"][-1])
+        self.assertEqual(inserted["Name_Transaktion"], "Import 4")
+
+    def test_add_transactions_validation(self):
+        """Testet, ob ungültige Zeilen beim blockweisen Einfügen abgelehnt werden."""
+        rows = [
+            {
+                "Transaktion": 20,
+                "Name_Transaktion": "Gültig",
+                "Kategorie_FK": 1,
+                "Ausgabe_Einnahme": "0",
+                "Datum": "2025-01-15",
+            },
+            (-5, "Negativ", 1, "0", "2025-01-15"),
+        ]
+        with self.assertRaises(ValueError):
+            self.db_manager.add_transactions(rows)
+
+        # Der fehlerhafte Block wurde nicht geschrieben
+        names = [t[2] for t in self.db_manager.fetch_transactions()]
+        self.assertNotIn("Gültig", names)
+
     def test_update_transaction(self):
         """Testet die Methode `update_transaction`."""
         transaction_data = {
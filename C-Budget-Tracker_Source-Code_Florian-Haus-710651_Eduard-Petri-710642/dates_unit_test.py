@@ -0,0 +1,29 @@
+import unittest
+
+from Core.dates import UNKNOWN_DAY_LABEL, day_label, month_label
+
+
+class TestDates(unittest.TestCase):
+    def test_day_label(self):
+        """Testet die Formatierung des Tagesschlüssels als dd.mm.yyyy."""
+        self.assertEqual(day_label(20250126), "26.01.2025")
+        self.assertEqual(day_label(20241201), "01.12.2024")
+        self.assertEqual(day_label(None), UNKNOWN_DAY_LABEL)
+
+    def test_day_label_is_cached(self):
+        """Testet, ob wiederholte Tage aus dem Zwischenspeicher kommen."""
+        day_label.cache_clear()
+        for _ in range(3):
+            day_label(20250126)
+        info = day_label.cache_info()
+        self.assertEqual((info.hits, info.misses), (2, 1))
+
+    def test_month_label(self):
+        """Testet den Monatsnamen der Monatsabschnitte."""
+        self.assertEqual(month_label("2025-01"), "Januar 2025")
+        self.assertEqual(month_label("2024-12"), "Dezember 2024")
+        self.assertEqual(month_label("2024-13"), "2024-13")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,130 @@
+import sqlite3
+import unittest
+
+from PySide6.QtWidgets import QApplication
+
+from Core.change_notifier import ChangeNotifier
+from Core.events import (
+    CategoryChanged,
+    ChangeSet,
+    TransactionsDeleted,
+    TransactionsInserted,
+    TransactionsUpdated,
+    collect_changes,
+    setup_change_log,
+)
+from Core.migrations import migrate
+
+
+class TestChangeEvents(unittest.TestCase):
+    def setUp(self):
+        """Erstellt eine Datenbank im Speicher mit Änderungsprotokoll."""
+        self.connection = sqlite3.connect(":memory:")
+        migrate(self.connection)
+        setup_change_log(self.connection)
+
+    def tearDown(self):
+        self.connection.close()
+
+    def write(self, query, params=()):
+        self.connection.execute(query, params)
+        self.connection.commit()
+        return collect_changes(self.connection)
+
+    def test_transaction_events(self):
+        """Einfügen, Ändern und Löschen liefern typisierte Ereignisse mit Kategorie und Monat."""
+        events = self.write(
+            """
+            INSERT INTO Haupt (Transaktion, Name_Transaktion, Kategorie_FK, Ausgabe_Einnahme, Datum)
+            VALUES (10, 'Kino', 2, '0', '2025-01-15')
+            """
+        )
+        self.assertEqual(
+            events,
+            [TransactionsInserted(frozenset({1}), frozenset({2}), frozenset({"2025-01"}))],
+        )
+
+        events = self.write("UPDATE Haupt SET Kategorie_FK = 3, Datum = '2025-02-01'")
+        self.assertEqual(
+            events,
+            [
+                TransactionsUpdated(
+                    frozenset({1}), frozenset({2, 3}), frozenset({"2025-01", "2025-02"})
+                )
+            ],
+        )
+
+        events = self.write("DELETE FROM Haupt")
+        self.assertIsInstance(events[0], TransactionsDeleted)
+        self.assertEqual(events[0].months, frozenset({"2025-02"}))
+
+        # Das Protokoll ist nach dem Auslesen leer
+        self.assertEqual(collect_changes(self.connection), [])
+
+    def test_category_events(self):
+        events = self.write("INSERT INTO Kategorie (Kategorie, Budget) VALUES ('Urlaub', 100)")
+        self.assertEqual(events, [CategoryChanged("inserted", frozenset({1}))])
+
+    def test_rolled_back_changes_are_not_reported(self):
+        """Zurückgerollte Änderungen erzeugen keine Ereignisse."""
+        self.connection.execute("INSERT INTO Kategorie (Kategorie, Budget) VALUES ('X', 0)")
+        self.connection.rollback()
+        self.assertEqual(collect_changes(self.connection), [])
+
+    def test_change_set(self):
+        changes = ChangeSet(
+            [
+                TransactionsInserted(frozenset({1}), frozenset({2}), frozenset({"2025-01"})),
+                CategoryChanged("updated", frozenset({4})),
+            ]
+        )
+        self.assertTrue(changes.transactions_changed)
+        self.assertTrue(changes.categories_changed)
+        self.assertTrue(changes.touches_month("2025-01"))
+        self.assertFalse(changes.touches_month("2025-02"))
+        self.assertFalse(ChangeSet())
+
+
+class FakeDbManager:
+    """Minimaler DatabaseManager, der Ereignisse von Hand auslöst."""
+
+    def __init__(self):
+        self.subscribers = []
+
+    def subscribe(self, callback):
+        self.subscribers.append(callback)
+
+    def unsubscribe(self, callback):
+        self.subscribers.remove(callback)
+
+    def publish(self, events):
+        for callback in self.subscribers:
+            callback(events)
+
+
+class TestChangeNotifier(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        if not QApplication.instance():
+            cls.app = QApplication([])
+
+    def test_events_are_coalesced(self):
+        """Mehrere Ereignisse in einem Durchlauf werden als ein ChangeSet gemeldet."""
+        db_manager = FakeDbManager()
+        notifier = ChangeNotifier(db_manager)
+        received = []
+        notifier.changed.connect(received.append)
+
+        db_manager.publish([CategoryChanged("inserted", frozenset({1}))])
+        db_manager.publish([CategoryChanged("updated", frozenset({2}))])
+        self.assertEqual(received, [])
+
+        QApplication.processEvents()
+        QApplication.processEvents()
+
+        self.assertEqual(len(received), 1)
+        self.assertEqual(received[0].category_ids, {1, 2})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,133 @@
+import os
+import unittest
+from unittest.mock import patch
+
+from Core.database import DatabaseManager
+from Core.importer import CategoryResolver, import_file, parse_amount, parse_date
+
+CSV_CONTENT = """Buchungstag;Beguenstigter/Zahlungspflichtiger;Betrag;Kategorie
+20.01.2025;Kaufland;-45,90;Lebensmittel
+21.01.2025;Firma GmbH;2.500,00;Gehalt
+22.01.2025;Kino;-12,00;
+"""
+
+CAMT_CONTENT = """<?xml version="1.0" encoding="UTF-8"?>
+<Document xmlns="urn:iso:std:iso:20022:tech:xsd:camt.053.001.02">
+  <BkToCstmrStmt>
+    <Stmt>
+      <Ntry>
+        <Amt Ccy="EUR">19.99</Amt>
+        <CdtDbtInd>DBIT</CdtDbtInd>
+        <BookgDt><Dt>2025-02-03</Dt></BookgDt>
+        <NtryDtls><TxDtls><RltdPties><Cdtr><Nm>Apotheke</Nm></Cdtr></RltdPties></TxDtls></NtryDtls>
+      </Ntry>
+      <Ntry>
+        <Amt Ccy="EUR">100.00</Amt>
+        <CdtDbtInd>CRDT</CdtDbtInd>
+        <BookgDt><Dt>2025-02-04</Dt></BookgDt>
+        <NtryDtls><TxDtls><RltdPties><Dbtr><Nm>Erstattung</Nm></Dbtr></RltdPties></TxDtls></NtryDtls>
+      </Ntry>
+    </Stmt>
+  </BkToCstmrStmt>
+</Document>
+"""
+
+
+class TestImporter(unittest.TestCase):
+    def setUp(self):
+        """Erstellt eine leere Testdatenbank mit einer vorhandenen Kategorie."""
+        self.db_path = "test_import_database.db"
+        self.db_manager = DatabaseManager(self.db_path)
+        self.lebensmittel_id = self.db_manager.add_category("Lebensmittel", 300)
+        self.files = []
+
+    def tearDown(self):
+        self.db_manager.close()
+        os.remove(self.db_path)
+        for path in self.files:
+            os.remove(path)
+
+    def write_file(self, name, content):
+        with open(name, "w", encoding="utf-8") as f:
+            f.write(content)
+        self.files.append(name)
+        return name
+
+    def test_parse_amount_and_date(self):
+        """Deutsche und englische Schreibweisen werden erkannt."""
+        self.assertEqual(parse_amount("1.234,56"), 1234.56)
+        self.assertEqual(parse_amount("-1,234.56"), -1234.56)
+        self.assertEqual(parse_amount("12,5 €"), 12.5)
+        self.assertEqual(parse_date("20.01.2025"), "2025-01-20")
+        self.assertEqual(parse_date("2025-01-20T10:00:00"), "2025-01-20")
+
+    def test_import_csv(self):
+        """CSV-Zeilen werden abgebildet und Kategorien über den Cache aufgelöst."""
+        progress = []
+        path = self.write_file("test_import.csv", CSV_CONTENT)
+        imported = import_file(
+            self.db_manager,
+            path,
+            chunk_size=2,
+            progress=lambda *args: progress.append(args),
+        )
+
+        self.assertEqual(imported, 3)
+        self.assertEqual([p[0] for p in progress], [2, 3])
+        self.assertEqual(progress[-1][1], progress[-1][2])
+
+        rows = self.db_manager.fetchall(
+            "SELECT Transaktion, Name_Transaktion, Kategorie_FK, Ausgabe_Einnahme, Datum FROM Haupt ORDER BY ID"
+        )
+        # Beträge werden in Cent gespeichert
+        self.assertEqual(rows[0], (4590, "Kaufland", self.lebensmittel_id, "0", "2025-01-20"))
+        self.assertEqual(rows[1][3], "1")
+
+        # Unbekannte und fehlende Kategorien werden angelegt
+        categories = {name for _, name in self.db_manager.fetchall("SELECT Kategorie_ID, Kategorie FROM Kategorie")}
+        self.assertEqual(categories, {"Lebensmittel", "Gehalt", "Sonstiges"})
+
+    def test_import_camt053(self):
+        """Buchungen aus einem CAMT.053-Auszug werden importiert."""
+        path = self.write_file("test_import.xml", CAMT_CONTENT)
+        imported = import_file(self.db_manager, path)
+
+        self.assertEqual(imported, 2)
+        rows = self.db_manager.fetchall(
+            "SELECT Transaktion, Name_Transaktion, Ausgabe_Einnahme, Datum FROM Haupt ORDER BY ID"
+        )
+        self.assertEqual(rows[0], (1999, "Apotheke", "0", "2025-02-03"))
+        self.assertEqual(rows[1], (10000, "Erstattung", "1", "2025-02-04"))
+
+    def test_unreadable_rows_are_skipped(self):
+        """Eine unlesbare Zeile mitten in der Datei wird übersprungen und gemeldet."""
+        lines = CSV_CONTENT.splitlines()
+        lines.insert(2, "31.02.2025;Kaputt;-1,00;Lebensmittel")
+        lines.insert(4, "22.01.2025;Ohne Betrag;;")
+        path = self.write_file("test_import.csv", "\n".join(lines) + "\n")
+        skipped = []
+        imported = import_file(self.db_manager, path, chunk_size=2, skipped=skipped)
+
+        self.assertEqual(imported, 3)
+        self.assertEqual([number for number, _ in skipped], [2, 4])
+        self.assertIn("31.02.2025", skipped[0][1])
+        rows = self.db_manager.fetchall("SELECT Name_Transaktion FROM Haupt ORDER BY ID")
+        self.assertEqual(rows, [("Kaufland",), ("Firma GmbH",), ("Kino",)])
+
+    def test_category_creation_fails(self):
+        """Eine Kategorie, die nicht angelegt werden kann, bricht den Import ab."""
+        path = self.write_file("test_import.csv", CSV_CONTENT)
+        with patch.object(self.db_manager, "add_category", return_value=None):
+            with self.assertRaisesRegex(ValueError, "'Gehalt'"):
+                import_file(self.db_manager, path, chunk_size=10)
+
+            # Der Fehlschlag wird nicht als Kategorie-ID zwischengespeichert
+            resolver = CategoryResolver(self.db_manager)
+            for _ in range(2):
+                with self.assertRaisesRegex(ValueError, "'Gehalt'"):
+                    resolver.resolve("Gehalt")
+        self.assertEqual(self.db_manager.fetchall("SELECT COUNT(*) FROM Haupt"), [(0,)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,215 @@
+import os
+import sqlite3
+import unittest
+
+from Core.migrations import MIGRATIONS, get_schema_version, migrate
+
+
+class TestMigrations(unittest.TestCase):
+    def setUp(self):
+        """Erstellt eine leere Testdatenbank."""
+        self.db_path = "test_migrations_database.db"
+        self.connection = sqlite3.connect(self.db_path)
+
+    def tearDown(self):
+        self.connection.close()
+        os.remove(self.db_path)
+
+    def test_migrate_empty_database(self):
+        """Eine leere Datenbank erhält Tabellen, Indizes und die aktuelle Version."""
+        version = migrate(self.connection)
+
+        self.assertEqual(version, MIGRATIONS[-1][0])
+        self.assertEqual(get_schema_version(self.connection), version)
+
+        tables = {
+            row[0]
+            for row in self.connection.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'table'"
+            )
+        }
+        self.assertTrue({"Haupt", "Kategorie"} <= tables)
+
+        indexes = {
+            row[1] for row in self.connection.execute("PRAGMA index_list('Haupt')")
+        }
+        self.assertIn("idx_Haupt_Typ_Kategorie", indexes)
+
+    def test_search_index_is_filled(self):
+        """Vorhandene Transaktionen landen beim Anlegen in Volltextindex und Summentabelle."""
+        migrate(self.connection, MIGRATIONS[:2])
+        self.connection.execute(
+            "INSERT INTO Kategorie (Kategorie, Budget) VALUES ('Freizeit', 100)"
+        )
+        self.connection.execute(
+            """
+            INSERT INTO Haupt (Transaktion, Name_Transaktion, Kategorie_FK, Ausgabe_Einnahme, Datum)
+            VALUES (12, 'Kino', 1, '0', '2025-01-15')
+            """
+        )
+        self.connection.commit()
+
+        migrate(self.connection)
+
+        rows = self.connection.execute(
+            "SELECT rowid, Kategorie FROM Haupt_FTS WHERE Haupt_FTS MATCH 'kino'"
+        ).fetchall()
+        self.assertEqual(rows, [(1, "Freizeit")])
+
+        # Auch die Summentabelle wird aus den vorhandenen Transaktionen gefüllt
+        months = self.connection.execute("SELECT * FROM Kategorie_Monat").fetchall()
+        self.assertEqual(months, [(1, "2025-01", "0", 1200, 1)])
+
+    def test_amounts_are_converted_to_cents(self):
+        """Beträge einer alten Datenbank (REAL) werden exakt in Cent umgerechnet."""
+        self.connection.execute(
+            """
+            CREATE TABLE Haupt (
+                ID INTEGER PRIMARY KEY AUTOINCREMENT,
+                Transaktion REAL,
+                Name_Transaktion TEXT,
+                Kategorie_FK INTEGER,
+                Ausgabe_Einnahme INTEGER,
+                Datum TEXT
+            )
+            """
+        )
+        self.connection.executemany(
+            "INSERT INTO Haupt (Transaktion, Name_Transaktion, Kategorie_FK, Ausgabe_Einnahme, Datum) VALUES (?, ?, 1, 0, '2025-01-15')",
+            [(0.285, "Kaffee"), (12.5, "Kino"), (0.1, "Gebühr"), (None, "Ohne Betrag")],
+        )
+        self.connection.execute("DELETE FROM Haupt WHERE Name_Transaktion = 'Ohne Betrag'")
+        self.connection.commit()
+
+        migrate(self.connection)
+
+        rows = self.connection.execute(
+            "SELECT ID, Transaktion, typeof(Transaktion) FROM Haupt ORDER BY ID"
+        ).fetchall()
+        self.assertEqual(rows, [(1, 29, "integer"), (2, 1250, "integer"), (3, 10, "integer")])
+        months = self.connection.execute(
+            "SELECT Summe, typeof(Summe) FROM Kategorie_Monat"
+        ).fetchall()
+        self.assertEqual(months, [(1289, "integer")])
+
+        # Indizes, Trigger und der AUTOINCREMENT-Zähler bleiben erhalten
+        indexes = {
+            row[1] for row in self.connection.execute("PRAGMA index_list('Haupt')")
+        }
+        self.assertIn("idx_Haupt_Typ_Kategorie", indexes)
+        self.connection.execute(
+            "INSERT INTO Haupt (Transaktion, Name_Transaktion, Kategorie_FK, Ausgabe_Einnahme, Datum) VALUES (100, 'Bäcker', 1, 0, '2025-01-16')"
+        )
+        self.assertEqual(
+            self.connection.execute("SELECT MAX(ID) FROM Haupt").fetchone()[0], 5
+        )
+        self.assertEqual(
+            self.connection.execute("SELECT Summe FROM Kategorie_Monat").fetchone()[0], 1389
+        )
+        fts = self.connection.execute(
+            "SELECT rowid FROM Haupt_FTS WHERE Haupt_FTS MATCH 'bäcker'"
+        ).fetchall()
+        self.assertEqual(fts, [(5,)])
+
+    def test_day_key_is_filled(self):
+        """Vorhandene und neue Transaktionen erhalten den Tagesschlüssel yyyymmdd."""
+        migrate(self.connection, MIGRATIONS[:5])
+        self.connection.executemany(
+            "INSERT INTO Haupt (Transaktion, Name_Transaktion, Kategorie_FK, Ausgabe_Einnahme, Datum) VALUES (100, ?, 1, '0', ?)",
+            [("Kino", "2025-01-26 19:47:36.644668"), ("Kaffee", "2025-02-03"), ("Alt", "03.02.2025")],
+        )
+        self.connection.commit()
+
+        migrate(self.connection)
+        self.connection.execute(
+            "INSERT INTO Haupt (Transaktion, Name_Transaktion, Kategorie_FK, Ausgabe_Einnahme, Datum) VALUES (100, 'Neu', 1, '0', '2025-03-04')"
+        )
+
+        days = self.connection.execute("SELECT Datum_Tag FROM Haupt ORDER BY ID").fetchall()
+        self.assertEqual(days, [(20250126,), (20250203,), (None,), (20250304,)])
+        indexes = {
+            row[1] for row in self.connection.execute("PRAGMA index_list('Haupt')")
+        }
+        self.assertIn("idx_Haupt_Datum_Tag", indexes)
+        self.assertNotIn("idx_Haupt_Datum", indexes)
+
+    def test_unpadded_dates_are_fixed(self):
+        """Daten ohne führende Nullen erhalten Nullen, Tagesschlüssel und ihren Monat."""
+        migrate(self.connection, MIGRATIONS[:10])
+        self.connection.executemany(
+            "INSERT INTO Haupt (Transaktion, Name_Transaktion, Kategorie_FK, Ausgabe_Einnahme, Datum) VALUES (100, ?, 1, '0', ?)",
+            [("Kino", "2024-05-3"), ("Kaffee", "2024-5-03 10:00:00"), ("Alt", "03.02.2025")],
+        )
+        self.connection.commit()
+
+        migrate(self.connection)
+
+        rows = self.connection.execute("SELECT Datum, Datum_Tag FROM Haupt ORDER BY ID").fetchall()
+        self.assertEqual(
+            rows,
+            [
+                ("2024-05-03", 20240503),
+                ("2024-05-03 10:00:00", 20240503),
+                ("03.02.2025", None),
+            ],
+        )
+        months = self.connection.execute(
+            "SELECT Monat, Summe, Anzahl FROM Kategorie_Monat WHERE Monat LIKE '2024-%'"
+        ).fetchall()
+        self.assertEqual(months, [("2024-05", 200, 2)])
+
+    def test_trigram_index_is_filled(self):
+        """Vorhandene Namen werden mit ihren Trigrammen in 'Suchwort' übernommen."""
+        migrate(self.connection, MIGRATIONS[:8])
+        self.connection.execute(
+            "INSERT INTO Kategorie (Kategorie, Budget) VALUES ('Kino', 100)"
+        )
+        self.connection.executemany(
+            "INSERT INTO Haupt (Transaktion, Name_Transaktion, Kategorie_FK, Ausgabe_Einnahme, Datum) VALUES (100, ?, 1, '0', '2025-01-15')",
+            [("KINO",), ("Kino",), ("Rewe",)],
+        )
+        self.connection.commit()
+
+        migrate(self.connection)
+
+        words = self.connection.execute(
+            "SELECT Wort, Anzahl, Trigramme FROM Suchwort ORDER BY Wort"
+        ).fetchall()
+        self.assertEqual(words, [("kino", 3, 4), ("rewe", 1, 4)])
+        trigrams = self.connection.execute(
+            """
+            SELECT Trigramm FROM Suchwort_Trigramm
+            JOIN Suchwort USING (Suchwort_ID) WHERE Wort = 'kino' ORDER BY Trigramm
+            """
+        ).fetchall()
+        self.assertEqual(trigrams, [(" ki",), ("ino",), ("kin",), ("no ",)])
+
+    def test_migrate_is_idempotent(self):
+        """Ein zweiter Durchlauf wendet keine Migration erneut an."""
+        calls = []
+        migrations = [(1, "Test", lambda conn: calls.append(1))]
+
+        migrate(self.connection, migrations)
+        migrate(self.connection, migrations)
+
+        self.assertEqual(calls, [1])
+
+    def test_failed_migration_is_rolled_back(self):
+        """Eine fehlerhafte Migration wird zurückgerollt und die Version bleibt stehen."""
+
+        def broken(conn):
+            conn.execute("CREATE TABLE Temp (ID INTEGER)")
+            conn.execute("SELECT * FROM GibtEsNicht")
+
+        version = migrate(self.connection, [(1, "Kaputt", broken)])
+
+        self.assertEqual(version, 0)
+        self.assertEqual(get_schema_version(self.connection), 0)
+        tables = self.connection.execute(
+            "SELECT name FROM sqlite_master WHERE name = 'Temp'"
+        ).fetchall()
+        self.assertEqual(tables, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
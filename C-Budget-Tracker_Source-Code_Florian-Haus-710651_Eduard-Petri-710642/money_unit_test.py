@@ -0,0 +1,28 @@
+import unittest
+
+from Core.money import from_cents, to_cents
+
+
+class TestMoney(unittest.TestCase):
+    def test_to_cents(self):
+        """Beträge werden kaufmännisch auf ganze Cent gerundet."""
+        self.assertEqual(to_cents(12.5), 1250)
+        self.assertEqual(to_cents("45,90"), 4590)
+        self.assertEqual(to_cents(0.285), 29)
+        self.assertEqual(to_cents(100), 10000)
+        self.assertIsNone(to_cents(None))
+
+    def test_invalid_amount(self):
+        """Ungültige Beträge führen zu einem ValueError."""
+        for amount in ("abc", "", float("nan")):
+            with self.assertRaises(ValueError):
+                to_cents(amount)
+
+    def test_from_cents(self):
+        """Cent werden in Euro umgerechnet."""
+        self.assertEqual(from_cents(4590), 45.9)
+        self.assertIsNone(from_cents(None))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+import json
+import os
+import tempfile
+import unittest
+
+from Core.profiler import QueryProfiler, fingerprint
+
+
+class TestQueryProfiler(unittest.TestCase):
+    def setUp(self):
+        self.profiler = QueryProfiler(enabled=True, slow_ms=50)
+
+    def test_fingerprint(self):
+        """Dieselbe Abfrage mit anderen Literalen ergibt denselben Fingerabdruck."""
+        first = fingerprint("SELECT * FROM Haupt WHERE ID = 5 AND Name_Transaktion = 'Kino'")
+        second = fingerprint("SELECT *  FROM Haupt\n WHERE ID = 17 AND Name_Transaktion = 'Miete'")
+
+        self.assertEqual(first, second)
+        self.assertEqual(first, "SELECT * FROM Haupt WHERE ID = ? AND Name_Transaktion = ?")
+        self.assertEqual(fingerprint("SELECT Kategorie_FK FROM t1"), "SELECT Kategorie_FK FROM t1")
+
+    def test_stats(self):
+        """Aufrufe, Gesamtlaufzeit, p95 und Zeilen werden pro Abfrage summiert."""
+        for duration in range(1, 21):
+            self.profiler.record("SELECT * FROM Haupt WHERE ID = ?", duration, rows=1)
+        self.profiler.record("SELECT 1", 0.5, rows=1)
+
+        stats = self.profiler.stats()
+        self.assertEqual(list(stats)[0], "SELECT * FROM Haupt WHERE ID = ?")
+        entry = stats["SELECT * FROM Haupt WHERE ID = ?"]
+        self.assertEqual(entry["calls"], 20)
+        self.assertEqual(entry["total_ms"], 210)
+        self.assertEqual(entry["p95_ms"], 19)
+        self.assertEqual(entry["rows"], 20)
+
+    def test_slow_query_log(self):
+        """Langsame Abfragen werden mit Ausführungsplan protokolliert."""
+        calls = []
+
+        def explain():
+            calls.append(True)
+            return ["SCAN Haupt"]
+
+        self.profiler.record("SELECT * FROM Haupt", 10, explain=explain)
+        self.profiler.record("SELECT * FROM Haupt", 80, params=("x",), explain=explain)
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(len(self.profiler.slow_queries), 1)
+        entry = self.profiler.slow_queries[0]
+        self.assertEqual(entry["plan"], ["SCAN Haupt"])
+        self.assertEqual(entry["duration_ms"], 80)
+
+    def test_disabled(self):
+        """Ein abgeschalteter Profiler sammelt nichts."""
+        profiler = QueryProfiler(enabled=False)
+        profiler.record("SELECT 1", 500)
+        self.assertEqual(profiler.stats(), {})
+
+    def test_reset_and_dump(self):
+        """Die Messwerte lassen sich als JSON speichern und zurücksetzen."""
+        self.profiler.record("SELECT 1", 60, rows=1)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "stats.json")
+            self.profiler.dump(path)
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+
+        self.assertEqual(data["queries"]["SELECT ?"]["calls"], 1)
+        self.assertEqual(len(data["slow_queries"]), 1)
+
+        self.profiler.reset()
+        self.assertEqual(self.profiler.stats(), {})
+        self.assertEqual(len(self.profiler.slow_queries), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
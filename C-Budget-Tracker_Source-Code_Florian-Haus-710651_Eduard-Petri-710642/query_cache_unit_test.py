@@ -0,0 +1,66 @@
+import unittest
+
+from Core.query_cache import QueryCache, estimate_size
+
+
+class TestQueryCache(unittest.TestCase):
+    def setUp(self):
+        self.cache = QueryCache(max_entries=2, max_bytes=10_000)
+
+    def test_hit_and_miss(self):
+        """Ein gespeichertes Ergebnis wird bis zum nächsten Schreibzugriff geliefert."""
+        self.assertEqual(self.cache.get("a"), (False, None))
+        self.cache.put("a", self.cache.version, [(1, "Kino")])
+
+        self.assertEqual(self.cache.get("a"), (True, [(1, "Kino")]))
+        stats = self.cache.stats()
+        self.assertEqual((stats["hits"], stats["misses"]), (1, 1))
+
+    def test_version_invalidates_entries(self):
+        """Nach einer neuen Datenversion gelten alte Einträge als veraltet."""
+        self.cache.put("a", self.cache.version, [(1,)])
+        self.cache.bump_version()
+
+        self.assertEqual(self.cache.get("a"), (False, None))
+        self.assertEqual(self.cache.stats()["invalidations"], 1)
+        self.assertEqual(self.cache.stats()["entries"], 0)
+
+    def test_outdated_result_is_not_stored(self):
+        """Ein Ergebnis, das vor einem Schreibzugriff gelesen wurde, wird verworfen."""
+        version = self.cache.version
+        self.cache.bump_version()
+        self.cache.put("a", version, [(1,)])
+
+        self.assertEqual(self.cache.stats()["entries"], 0)
+
+    def test_lru_eviction(self):
+        """Bei voller Belegung wird der am längsten nicht genutzte Eintrag verdrängt."""
+        self.cache.put("a", 0, [(1,)])
+        self.cache.put("b", 0, [(2,)])
+        self.cache.get("a")
+        self.cache.put("c", 0, [(3,)])
+
+        self.assertTrue(self.cache.get("a")[0])
+        self.assertFalse(self.cache.get("b")[0])
+        self.assertEqual(self.cache.stats()["evictions"], 1)
+
+    def test_memory_bound(self):
+        """Die geschätzte Größe aller Einträge bleibt unter der Grenze."""
+        rows = [(i, f"Transaktion {i}") for i in range(50)]
+        self.cache.max_entries = 100
+        for key in range(10):
+            self.cache.put(key, 0, list(rows))
+
+        stats = self.cache.stats()
+        self.assertLessEqual(stats["bytes"], stats["max_bytes"])
+        self.assertLess(stats["entries"], 10)
+
+        # Zu große Ergebnisse werden gar nicht gespeichert
+        huge = [(i, "x" * 100) for i in range(1000)]
+        self.assertGreater(estimate_size(huge), self.cache.max_bytes)
+        self.cache.put("huge", 0, huge)
+        self.assertFalse(self.cache.get("huge")[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+import unittest
+
+from Core.search_cache import SearchCache, cache_key, matches, refines
+
+# Zeilen im Format von search_transactions()
+ROWS = [
+    (1, 3.5, "Kaufland Berlin", "Lebensmittel", 0, "2024-02-01", 20240201),
+    (2, 9.0, "Kaufhof", "Kleidung", 0, "2024-02-02", 20240202),
+    (3, 4.2, "Bäckerei Kauz", "Lebensmittel", 0, "2024-02-03", 20240203),
+]
+
+
+class TestSearchCache(unittest.TestCase):
+    def setUp(self):
+        self.cache = SearchCache(max_entries=4, max_bytes=10_000)
+
+    def test_cache_key(self):
+        """Reine Wortsuchen werden vereinheitlicht, Filter und LIKE-Suchen nicht."""
+        self.assertEqual(cache_key("  Kaufland   Berlin "), "kaufland berlin")
+        self.assertEqual(cache_key('cat:"Essen  gehen"'), 'cat:"Essen  gehen"')
+        self.assertEqual(cache_key("Kaufland ", fulltext=False), "Kaufland ")
+
+    def test_refines(self):
+        """Nur Verlängerungen reiner Wortsuchen werden aus dem Cache gefiltert."""
+        self.assertTrue(refines("kau", "kaufland"))
+        self.assertTrue(refines("kau", "kaufland berlin"))
+        self.assertTrue(refines("bäck", "backerei"))
+        self.assertFalse(refines("kaufland", "kau"))
+        self.assertFalse(refines("kau", "kau"))
+        self.assertFalse(refines("kau", "kau cat:Lebensmittel"))
+        self.assertFalse(refines("kau", '"kau markt"'))
+        self.assertFalse(refines("20", "2024"))
+        self.assertFalse(refines("2024", "2024-05"))
+        self.assertFalse(refines("kau", "kau_f"))
+
+    def test_matches(self):
+        """Jedes Wort muss Wortanfang in Name oder Kategorie sein, ohne Akzente."""
+        self.assertTrue(matches(ROWS[0], "kauf berl"))
+        self.assertTrue(matches(ROWS[0], "lebensm kaufl"))
+        self.assertTrue(matches(ROWS[2], "backer"))
+        self.assertFalse(matches(ROWS[0], "land"))
+        self.assertFalse(matches(ROWS[1], "kaufl"))
+
+    def test_lookup_refines_cached_superset(self):
+        """Die Treffer eines längeren Begriffs kommen gefiltert aus dem Cache."""
+        self.assertIsNone(self.cache.lookup("kau"))
+        self.cache.store("Kau", self.cache.version, ROWS)
+
+        self.assertEqual(self.cache.lookup("kau "), ROWS)
+        self.assertEqual(self.cache.lookup("kauf"), ROWS[:2])
+        self.assertEqual(self.cache.lookup("Kaufland"), ROWS[:1])
+        stats = self.cache.stats()
+        self.assertEqual(stats["refinements"], 2)
+        # Verfeinerte Ergebnisse werden selbst gespeichert
+        self.assertEqual(stats["entries"], 3)
+
+        # Ohne Volltextsuche (LIKE) wird nicht verfeinert
+        self.assertIsNone(self.cache.lookup("kaufhof", fulltext=False))
+
+    def test_write_invalidates(self):
+        """Nach einem Schreibzugriff wird weder geliefert noch verfeinert."""
+        self.cache.store("kau", self.cache.version, ROWS)
+        self.cache.bump_version()
+
+        self.assertIsNone(self.cache.lookup("kaufland"))
+        self.assertIsNone(self.cache.lookup("kau"))
+        self.assertEqual(self.cache.stats()["refinements"], 0)
+
+    def test_memory_bound(self):
+        """Große Trefferlisten verdrängen ältere oder werden nicht gespeichert."""
+        rows = [ROWS[0]] * 100
+        self.cache.store("kau", 0, rows)
+        self.cache.store("berlin", 0, rows)
+        stats = self.cache.stats()
+        self.assertLessEqual(stats["bytes"], stats["max_bytes"])
+
+        self.cache.store("kino", 0, rows * 10)
+        self.assertIsNone(self.cache.lookup("kino"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,138 @@
+import unittest
+
+from Core.search_cache import SearchCache
+from Core.search_pager import SearchPager
+
+# Zeilen im Format von search_transactions()
+ROWS = [
+    (i, 1.5, f"Kaufland {i}", "Lebensmittel", 0, "2024-02-01", 20240201) for i in range(1, 8)
+]
+
+
+class FakeDatabase:
+    """Liefert ROWS seitenweise wie DatabaseManager.search_transactions_page()."""
+
+    def __init__(self, max_bytes=1_000_000):
+        self.search_cache = SearchCache(max_bytes=max_bytes)
+        self.fts_enabled = True
+        self.pages = 0
+        self.counts = 0
+
+        self.ranked = False  # Begriffe wie eine Volltextsuche nach Relevanz
+        self.rankings = 0
+        self.deleted = set()  # IDs, die fetch_transactions_by_ids() nicht mehr findet
+
+    def search_hit_ids(self, search_term, fuzzy=False, cancelled=None):
+        if not (fuzzy or self.ranked):
+            return None
+        self.rankings += 1
+        return [row[0] for row in reversed(ROWS)]
+
+    def fetch_transactions_by_ids(self, ids, cancelled=None):
+        self.pages += 1
+        return {row[0]: row for row in ROWS if row[0] in ids and row[0] not in self.deleted}
+
+    def search_transactions_page(self, search_term, page_size, after=None, cancelled=None):
+        self.pages += 1
+        start = after or 0
+        end = start + page_size
+        return list(ROWS[start:end]), end if end < len(ROWS) else None
+
+    def count_search_results(self, search_term, cancelled=None):
+        self.counts += 1
+        return len(ROWS)
+
+    def cancel_check(self, cancelled=None):
+        return cancelled
+
+
+class TestSearchPager(unittest.TestCase):
+    def setUp(self):
+        self.db = FakeDatabase()
+
+    def read_all(self, pager):
+        pages = []
+        while pager.has_more:
+            pages.append(pager.fetch())
+        return pages
+
+    def test_pages_from_database(self):
+        """Die Seiten kommen nacheinander aus der Datenbank, danach ist Schluss."""
+        pager = SearchPager(self.db, "kauf", page_size=3)
+        pages = self.read_all(pager)
+
+        self.assertEqual([len(page) for page in pages], [3, 3, 1])
+        self.assertEqual([row for page in pages for row in page], ROWS)
+        self.assertEqual(pager.loaded, len(ROWS))
+        self.assertEqual(pager.fetch(), [])
+        self.assertEqual(self.db.pages, 3)
+        self.assertEqual(pager.count(), len(ROWS))
+
+    def test_complete_result_is_cached(self):
+        """Nach der letzten Seite blättert eine neue Suche im Such-Cache."""
+        self.read_all(SearchPager(self.db, "kauf", page_size=3))
+        self.db.pages = 0
+
+        pager = SearchPager(self.db, "Kauf ", page_size=5)
+        self.assertEqual([row for page in self.read_all(pager) for row in page], ROWS)
+        self.assertEqual(pager.count(), len(ROWS))
+        self.assertEqual((self.db.pages, self.db.counts), (0, 0))
+
+        # Verlängerter Begriff: Treffer aus dem Cache gefiltert
+        pager = SearchPager(self.db, "kaufland 3")
+        self.assertEqual(pager.fetch(), [ROWS[2]])
+        self.assertFalse(pager.has_more)
+
+    def test_partial_or_large_result_is_not_cached(self):
+        """Nur gelesene Seiten unterhalb der Speichergrenze landen im Cache."""
+        SearchPager(self.db, "kauf", page_size=3).fetch()
+        self.assertIsNone(self.db.search_cache.lookup("kauf"))
+
+        self.db = FakeDatabase(max_bytes=100)
+        self.read_all(SearchPager(self.db, "kauf", page_size=3))
+        self.assertIsNone(self.db.search_cache.lookup("kauf"))
+
+    def test_fuzzy_bypasses_cache(self):
+        """Die unscharfe Suche liest immer aus der Datenbank."""
+        self.read_all(SearchPager(self.db, "kaufladn", fuzzy=True, page_size=4))
+        self.assertIsNone(self.db.search_cache.lookup("kaufladn"))
+        self.assertEqual(self.db.pages, 2)
+
+    def test_ranked_hits_are_read_once(self):
+        """Suchen nach Relevanz lesen die Trefferliste einmal und zählen sie."""
+        self.db.ranked = True
+        pager = SearchPager(self.db, "kauf", page_size=3)
+        self.assertEqual(pager.fetch(), ROWS[:-4:-1])
+        self.assertEqual(pager.count(), len(ROWS))
+        pages = [pager.fetch(), pager.fetch()]
+
+        self.assertEqual(pages, [ROWS[3:0:-1], ROWS[:1]])
+        self.assertFalse(pager.has_more)
+        self.assertEqual((self.db.rankings, self.db.counts, self.db.pages), (1, 0, 3))
+
+        # Vor der ersten Seite gezählt: fetch() nutzt dieselbe Liste
+        pager = SearchPager(self.db, "kaufland", fuzzy=True, page_size=3)
+        self.assertEqual(pager.count(), len(ROWS))
+        self.assertEqual(pager.fetch(), ROWS[:-4:-1])
+        self.assertEqual(self.db.rankings, 2)
+
+    def test_deleted_hits_are_skipped(self):
+        """Inzwischen gelöschte Treffer fehlen auf ihrer Seite."""
+        self.db.ranked = True
+        pager = SearchPager(self.db, "kauf", page_size=3)
+        pager.count()
+        self.db.deleted.add(ROWS[-1][0])
+        self.assertEqual(pager.fetch(), ROWS[-2:-4:-1])
+        self.assertTrue(pager.has_more)
+
+    def test_cancelled_fetch(self):
+        """Eine abgebrochene Seite zählt nicht als gelesen."""
+        pager = SearchPager(self.db, "kauf", page_size=3)
+        self.assertEqual(pager.fetch(cancelled=lambda: True), [])
+        self.assertEqual(pager.loaded, 0)
+        self.assertTrue(pager.has_more)
+        self.assertEqual(pager.fetch(), ROWS[:3])
+
+
+if __name__ == "__main__":
+    unittest.main()
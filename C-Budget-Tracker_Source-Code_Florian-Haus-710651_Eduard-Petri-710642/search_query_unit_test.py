@@ -0,0 +1,89 @@
+import unittest
+
+from Core.search_query import (
+    AmountFilter,
+    CategoryFilter,
+    DateFilter,
+    SearchQuery,
+    TextTerm,
+    TypeFilter,
+    compile_query,
+    parse_query,
+)
+
+
+class TestSearchQuery(unittest.TestCase):
+    def test_parse_operators(self):
+        """Testet, ob jeder Filter im passenden Knoten landet."""
+        query = parse_query(
+            'cat:"Essen gehen" amount>50 amount<=12,5 from:2024-03 to:2024-3 type:Einnahme'
+        )
+        self.assertEqual(
+            query.terms,
+            (
+                CategoryFilter("Essen gehen"),
+                AmountFilter(">", 5000),
+                AmountFilter("<=", 1250),
+                DateFilter(start=20240300),
+                DateFilter(end=20240400),
+                TypeFilter("1"),
+            ),
+        )
+        self.assertTrue(query.is_structured)
+
+    def test_parse_text(self):
+        """Testet Wörter und Phrasen; ein offenes Anführungszeichen gilt bis zum Ende."""
+        self.assertEqual(
+            parse_query('Rewe "Markt Berlin" "offen').terms,
+            (TextTerm("Rewe"), TextTerm("Markt Berlin", True), TextTerm("offen", True)),
+        )
+        self.assertEqual(
+            parse_query("Rewe Kino"), SearchQuery((TextTerm("Rewe"), TextTerm("Kino")))
+        )
+        self.assertFalse(parse_query("Rewe Kino").is_structured)
+
+    def test_incomplete_and_invalid_filters(self):
+        """Filter ohne Wert werden übergangen, ungültige als Wort gesucht."""
+        query = parse_query("cat: amount>")
+        self.assertEqual(query.terms, ())
+        self.assertTrue(query.is_structured)
+
+        self.assertEqual(
+            parse_query("from:März type:alles amount>viel").terms,
+            (TextTerm("from:März"), TextTerm("type:alles"), TextTerm("amount>viel")),
+        )
+
+    def test_compile_query(self):
+        """Testet die erzeugte Bedingung und ihre Parameter."""
+        condition, params = compile_query(
+            parse_query('cat:Le_ben amount>50 from:2024 Re"we "Markt Berlin"')
+        )
+        self.assertIn("Kategorie LIKE ? ESCAPE", condition)
+        self.assertIn("Haupt.Transaktion > ?", condition)
+        self.assertIn("Haupt.Datum_Tag >= ?", condition)
+        self.assertIn("Haupt_FTS MATCH ?", condition)
+        # Anführungszeichen im Wort werden für FTS5 verdoppelt
+        self.assertEqual(
+            params, ["Le\\_ben%", 5000, 20240000, '"Re""we"* "Markt Berlin"']
+        )
+
+        # Ohne Volltextindex: LIKE über Name und Kategorie
+        condition, params = compile_query(parse_query("50%"), fulltext=False)
+        self.assertNotIn("MATCH", condition)
+        self.assertEqual(params, ["%50\\%%", "%50\\%%"])
+
+        # Begrenzter Zeitraum: Betrag, Typ und Text ohne Index
+        condition, params = compile_query(
+            parse_query("type:income amount>50 Rewe from:2024-03 to:2024-03")
+        )
+        self.assertIn("CAST(Haupt.Ausgabe_Einnahme AS INTEGER) = ?", condition)
+        self.assertIn("+Haupt.Transaktion > ?", condition)
+        self.assertIn("+Haupt.ID IN", condition)
+        self.assertEqual(params, [1, 5000, 20240300, 20240400, '"Rewe"*'])
+
+        # Ohne Bedingung keine Treffer
+        self.assertEqual(compile_query(parse_query("cat:")), ("0", []))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,7 +1,18 @@
+import os
 import unittest
-from unittest.mock import MagicMock
-from PySide6.QtWidgets import QApplication, QLabel
-from Features.Übersicht.view import UebersichtView, TransactionWidget
+from unittest.mock import MagicMock, patch
+from PySide6.QtWidgets import QApplication
+from PySide6.QtCore import Qt
+from Core.database import PAGE_SIZE, DatabaseManager
+from Core.events import CategoryChanged, ChangeSet, TransactionsUpdated
+from Features.Übersicht.view import (
+    HEADER_ROW,
+    MONTH_ROW,
+    TRANSACTION_ROW,
+    TransactionDelegate,
+    TransactionListModel,
+    UebersichtView,
+)
 
 
 class TestUebersichtView(unittest.TestCase):
@@ -19,15 +30,45 @@ class TestUebersichtView(unittest.TestCase):
         self.db_manager = MagicMock()
 
         # Beispiel-Datenbankantwort mit Transaktionen
-        self.db_manager.fetch_transactions.return_value = [
-            (1, 50.0, "Einnahme1", "Kategorie1", 1, "2025-01-25 10:00:00"),
-            (2, 30.0, "Ausgabe1", "Kategorie2", 0, "2025-01-25 12:00:00"),
-            (3, 20.0, "Einnahme2", "Kategorie1", 1, "2025-01-24 09:00:00")
+        self.transactions = [
+            (1, 50.0, "Einnahme1", "Kategorie1", 1, "2025-01-25 10:00:00", 20250125),
+            (2, 30.0, "Ausgabe1", "Kategorie2", 0, "2025-01-25 12:00:00", 20250125),
+            (3, 20.0, "Einnahme2", "Kategorie1", 1, "2025-01-24 09:00:00", 20250124)
         ]
+        self.db_manager.fetch_month_totals.side_effect = self.fetch_month_totals
+        self.db_manager.fetch_month_page.side_effect = self.fetch_month_page
+        self.db_manager.fetch_transactions_by_ids.side_effect = lambda ids: {
+            t[0]: t for t in self.transactions if t[0] in ids
+        }
+        # Der Kontostand wird von der Datenbank berechnet
+        self.db_manager.fetch_balance.return_value = 40.0
 
         # Erstelle das UebersichtView mit dem gemockten DatabaseManager
         self.view = UebersichtView(self.db_manager)
 
+    def fetch_month_totals(self):
+        # Summen je Monat wie aus der Summentabelle, neuester Monat zuerst
+        totals = {}
+        for t in self.transactions:
+            income, expense, count = totals.get(t[5][:7], (0.0, 0.0, 0))
+            if t[4] == 1:
+                income += t[1]
+            else:
+                expense += t[1]
+            totals[t[5][:7]] = (income, expense, count + 1)
+        return [
+            (month, income, expense, income - expense, count)
+            for month, (income, expense, count) in sorted(totals.items(), reverse=True)
+        ]
+
+    def fetch_month_page(self, month, limit=PAGE_SIZE, after=None):
+        # Seite eines Monats wie in der Datenbank: Tagesschlüssel und ID absteigend
+        rows = [t for t in self.transactions if t[5][:7] == month]
+        rows = sorted(rows, key=lambda t: (t[6], t[0]), reverse=True)
+        if after is not None:
+            rows = [t for t in rows if (t[6], t[0]) < after]
+        return rows[:limit]
+
     def tearDown(self):
         # Bereinige nach jedem Test
         self.view.deleteLater()
@@ -46,32 +87,266 @@ class TestUebersichtView(unittest.TestCase):
         # Lade die Transaktionen
         self.view.load_transactions()
 
-        # Gib die Anzahl der Items aus
-        item_count = self.view.transaction_list.count()
-        print(f"Anzahl der Items in der Liste: {item_count}")
+        model = self.view.transaction_model
+        item_count = model.rowCount()
+        for row in range(item_count):
+            index = model.index(row)
+            print(f"Item {row}: {index.data(TransactionListModel.KindRole)} {index.data()}")
+
+        # 1 Monat + 2 Datumseinträge + 3 Transaktionen
+        self.assertEqual(item_count, 6)
+        self.assertEqual(model.transaction_count(), 3)
+
+    def test_transaction_rows(self):
+        # Überprüfe Reihenfolge und Inhalt der Zeilen im Modell
+        self.view.load_transactions()
+        model = self.view.transaction_model
+
+        month = model.index(0)
+        self.assertEqual(month.data(TransactionListModel.KindRole), MONTH_ROW)
+        self.assertEqual(month.data(), "Januar 2025")
+        self.assertTrue(month.data(TransactionListModel.ExpandedRole))
+        self.assertFalse(model.flags(month) & Qt.ItemIsSelectable)
+
+        header = model.index(1)
+        self.assertEqual(header.data(TransactionListModel.KindRole), HEADER_ROW)
+        self.assertEqual(header.data(), "25.01.2025")
+        self.assertFalse(model.flags(header) & Qt.ItemIsSelectable)
+
+        # Dritte Zeile sollte die neueste Transaktion sein
+        transaction = model.index(2)
+        self.assertEqual(transaction.data(TransactionListModel.KindRole), TRANSACTION_ROW)
+        self.assertEqual(transaction.data(), "Ausgabe1")
+        self.assertEqual(transaction.data(Qt.UserRole), 2)
+        self.assertEqual(model.index(3).data(), "Einnahme1")
+        self.assertEqual(model.index(4).data(), "24.01.2025")
+        self.assertEqual(model.index(5).data(), "Einnahme2")
+
+    def test_month_totals(self):
+        # Einnahmen, Ausgaben und Saldo der Monatszeile stammen aus der Abfrage
+        self.view.load_transactions()
+        month = self.view.transaction_model.index_for_month("2025-01")
+        self.assertEqual(
+            month.data(TransactionListModel.MonthRole), ("2025-01", 70.0, 30.0, 40.0, 3)
+        )
+
+    def test_only_expanded_months_are_loaded(self):
+        # Beim Start werden nur die Summen und ein Monat gelesen
+        self.transactions.append(
+            (4, 10.0, "Dezember", "Kategorie1", 0, "2024-12-01", 20241201)
+        )
+        self.db_manager.fetch_month_page.reset_mock()
+        self.view.load_transactions()
+        self.assertEqual(self.rows()[0], "Januar 2025")
+        self.assertEqual(self.rows()[-1], "Dezember 2024")
+        self.db_manager.fetch_month_page.assert_called_once_with("2025-01", PAGE_SIZE)
+
+        # Aufklappen liest nur den angeklickten Monat
+        model = self.view.transaction_model
+        self.view.on_item_clicked(model.index_for_month("2024-12"))
+        self.assertEqual(self.rows()[-3:], ["Dezember 2024", "01.12.2024", "Dezember"])
+        self.db_manager.fetch_month_page.assert_called_with("2024-12", PAGE_SIZE)
+
+        # Zuklappen entfernt die Transaktionen wieder aus dem Modell
+        self.view.toggle_month("2025-01")
+        self.assertEqual(
+            self.rows(), ["Januar 2025", "Dezember 2024", "01.12.2024", "Dezember"]
+        )
+        self.assertFalse(
+            model.index_for_month("2025-01").data(TransactionListModel.ExpandedRole)
+        )
+        self.assertEqual(model.transaction_count(), 1)
+
+    def test_select_transaction_by_id(self):
+        # Die Auswahl erfolgt über die Transaktions-ID und bleibt beim Neuladen erhalten
+        self.view.load_transactions()
+        self.assertIsNone(self.view.selected_transaction_id())
+
+        self.assertTrue(self.view.select_transaction(3))
+        self.assertEqual(self.view.selected_transaction_id(), 3)
+        self.assertFalse(self.view.select_transaction(99))
+
+        self.view.load_transactions()
+        self.assertEqual(self.view.selected_transaction_id(), 3)
+
+    def test_delegate_paints_visible_rows(self):
+        # Der Delegate zeichnet Überschriften und Transaktionen ohne eigene Widgets
+        self.view.load_transactions()
+        self.view.resize(400, 600)
+        self.view.select_transaction(2)
+
+        image = self.view.transaction_list.viewport().grab()
+
+        self.assertFalse(image.isNull())
+        delegate = self.view.transaction_list.itemDelegate()
+        self.assertIsInstance(delegate, TransactionDelegate)
+
+    def rows(self):
+        model = self.view.transaction_model
+        return [model.index(row).data() for row in range(model.rowCount())]
+
+    def change(self, *ids, categories=False):
+        # Änderungen melden wie der ChangeNotifier
+        events = [TransactionsUpdated(frozenset(ids), frozenset(), frozenset())]
+        if categories:
+            events.append(CategoryChanged("updated", frozenset({1})))
+        self.view.on_data_changed(ChangeSet(events))
+
+    def test_incremental_updates(self):
+        # Einfügen, Ändern und Löschen betreffen nur die geänderten Zeilen
+        self.view.load_transactions()
+        months = self.db_manager.fetch_month_page.call_count
+
+        self.transactions.append(
+            (4, 10.0, "Neu", "Kategorie1", 0, "2025-01-26", 20250126)
+        )
+        self.change(4)
+        self.assertEqual(
+            self.rows(),
+            [
+                "Januar 2025",
+                "26.01.2025", "Neu",
+                "25.01.2025", "Ausgabe1", "Einnahme1",
+                "24.01.2025", "Einnahme2",
+            ],
+        )
+
+        # Name geändert: Zeile bleibt, Datum geändert: Zeile wechselt die Gruppe
+        self.transactions[2] = (
+            3, 20.0, "Einnahme2 neu", "Kategorie1", 1, "2025-01-24 09:00:00", 20250124
+        )
+        self.transactions[0] = (
+            1, 50.0, "Einnahme1", "Kategorie1", 1, "2025-01-24 10:00:00", 20250124
+        )
+        self.change(1, 3)
+        self.assertEqual(
+            self.rows(),
+            [
+                "Januar 2025",
+                "26.01.2025", "Neu",
+                "25.01.2025", "Ausgabe1",
+                "24.01.2025", "Einnahme2 neu", "Einnahme1",
+            ],
+        )
+
+        # Letzte Transaktion eines Tages gelöscht: Überschrift verschwindet
+        del self.transactions[1]
+        self.change(2)
+        self.assertEqual(
+            self.rows(),
+            [
+                "Januar 2025",
+                "26.01.2025", "Neu",
+                "24.01.2025", "Einnahme2 neu", "Einnahme1",
+            ],
+        )
+
+        # Die Liste wurde nicht erneut komplett gelesen
+        self.assertEqual(self.db_manager.fetch_month_page.call_count, months)
+        self.assertEqual(self.view.transaction_model.transaction_count(), 3)
+        self.assertEqual(self.view.changed_ids, set())
+
+    def test_incremental_update_keeps_selection(self):
+        # Die Auswahl bleibt bei Änderungen anderer Zeilen erhalten
+        self.view.load_transactions()
+        self.view.select_transaction(3)
+
+        self.transactions.append(
+            (4, 10.0, "Neu", "Kategorie1", 0, "2025-01-26", 20250126)
+        )
+        self.change(4)
+
+        self.assertEqual(self.view.selected_transaction_id(), 3)
 
-        # Überprüfe jedes einzelne Item in der Liste
-        for index in range(item_count):
-            item = self.view.transaction_list.item(index)
-            widget = self.view.transaction_list.itemWidget(item)
-            if widget:
-                # Gib den Text des Widgets (TransactionWidget oder QLabel) aus
-                print(f"Item {index}: {widget.findChild(QLabel).text() if isinstance(widget, TransactionWidget) else 'Datum: ' + widget.text()}")
+    def test_changes_in_collapsed_months(self):
+        # Neue Monate erscheinen zugeklappt, ihre Transaktionen erst beim Aufklappen
+        model = self.view.transaction_model
+        self.view.load_transactions()
 
-        # Überprüfe, ob die Anzahl der Items 5 ist (2 Datumseinträge + 3 Transaktionen)
-        self.assertEqual(item_count, 7)
+        self.transactions.append(
+            (4, 10.0, "Alt", "Kategorie1", 0, "2024-12-01", 20241201)
+        )
+        self.change(4)
+        self.assertEqual(self.rows()[-1], "Dezember 2024")
+        self.assertEqual(model.transaction_count(), 3)
+
+        self.view.toggle_month("2024-12")
+        self.assertEqual(self.rows()[-2:], ["01.12.2024", "Alt"])
+
+        # Letzte Transaktion eines Monats gelöscht: Monatszeile verschwindet
+        del self.transactions[-1]
+        self.change(4)
+        self.assertNotIn("Dezember 2024", self.rows())
+        self.assertEqual(model.months(), ["2025-01"])
+
+    def test_rows_without_valid_date(self):
+        # Buchungen ohne gültiges Datum (Tagesschlüssel NULL) bilden eine eigene Gruppe
+        self.transactions.append((4, 5.0, "Alt", "Kategorie1", 0, "01.01.2020", None))
+        self.view.load_transactions()
+        self.view.toggle_month("01.01.2")
 
+        self.assertEqual(self.rows()[-2:], ["Ohne Datum", "Alt"])
 
-    def test_transaction_widget_display(self):
-        # Überprüfe, ob die Transaktionen korrekt im Widget angezeigt werden
+    def test_category_change_reloads_loaded_rows(self):
+        # Geänderte Kategorien laden die aufgeklappten Monate neu
         self.view.load_transactions()
-        
-        # Prüfe, ob der erste Transaktionseintrag das erwartete Widget hat
-        item = self.view.transaction_list.item(1)  # Zweites Item sollte eine Transaktion sein
-        transaction_widget = self.view.transaction_list.itemWidget(item)
-        
-        self.assertIsInstance(transaction_widget, TransactionWidget)
-        self.assertEqual(transaction_widget.findChild(QLabel).text(), "Einnahme1")
+        self.db_manager.fetch_month_page.reset_mock()
+
+        self.change(categories=True)
+
+        self.db_manager.fetch_month_page.assert_called_once_with("2025-01", PAGE_SIZE)
+        self.assertEqual(self.view.transaction_model.transaction_count(), 3)
+
+    @patch("Features.Übersicht.view.PAGE_SIZE", 2)
+    def test_month_pages(self):
+        # Ein aufgeklappter Monat wird seitenweise über fetchMore() nachgeladen
+        self.transactions += [
+            (4, 5.0, "Vier", "Kategorie1", 0, "2025-01-24 08:00:00", 20250124),
+            (5, 5.0, "Fünf", "Kategorie1", 0, "2025-01-02", 20250102),
+            (7, 5.0, "Sieben", "Kategorie1", 0, "2025-01-25 18:00:00", 20250125),
+        ]
+        model = self.view.transaction_model
+        self.view.load_transactions()
+        self.assertEqual(
+            self.rows(), ["Januar 2025", "25.01.2025", "Sieben", "Ausgabe1"]
+        )
+        self.assertTrue(model.canFetchMore())
+
+        # Die nächste Seite setzt den Tag fort, ohne zweite Überschrift
+        model.fetchMore()
+        self.db_manager.fetch_month_page.assert_called_with(
+            "2025-01", 2, (20250125, 2)
+        )
+        self.assertEqual(
+            self.rows()[1:],
+            ["25.01.2025", "Sieben", "Ausgabe1", "Einnahme1", "24.01.2025", "Vier"],
+        )
+        model.fetchMore()
+        self.assertEqual(model.transaction_count(), 6)
+        self.assertTrue(model.canFetchMore())
+
+        # Änderungen hinter der letzten Seite kommen erst mit ihrer Seite
+        self.transactions.append(
+            (6, 5.0, "Sechs", "Kategorie1", 0, "2025-01-01", 20250101)
+        )
+        self.change(6)
+        self.assertNotIn("Sechs", self.rows())
+
+        # Neuladen liest die bereits geladenen Seiten wieder mit
+        self.view.load_transactions(keep_position=True)
+        self.db_manager.fetch_month_page.assert_called_with("2025-01", 6)
+        self.assertEqual(model.transaction_count(), 6)
+
+        model.fetchMore()
+        self.assertEqual(self.rows()[-2:], ["01.01.2025", "Sechs"])
+        self.assertFalse(model.canFetchMore())
+
+        # Neu aufgeklappt beginnt der Monat wieder mit der ersten Seite
+        self.view.toggle_month("2025-01")
+        self.assertFalse(model.canFetchMore())
+        self.view.toggle_month("2025-01")
+        self.assertEqual(model.transaction_count(), 2)
+        self.assertTrue(model.canFetchMore())
 
     def test_balance_style_positive(self):
         # Überprüfe den Stil des Kontostands bei positivem Wert
@@ -80,11 +355,81 @@ class TestUebersichtView(unittest.TestCase):
 
     def test_balance_style_negative(self):
         # Füge eine negative Transaktion hinzu und überprüfe den Stil
-        self.db_manager.fetch_transactions.return_value.append(
-            (4, 100.0, "Ausgabe2", "Kategorie3", 0, "2025-01-24 15:00:00")
+        self.transactions.append(
+            (4, 100.0, "Ausgabe2", "Kategorie3", 0, "2025-01-24 15:00:00", 20250124)
         )
+        self.db_manager.fetch_balance.return_value = -60.0
         self.view.load_transactions()
         self.assertEqual(self.view.balance_label.styleSheet(), "color: red; font-weight: bold;")
 
+    def test_balance_without_transaction_list(self):
+        # Der Kontostand wird auch ohne Neuaufbau der Liste aktualisiert
+        self.db_manager.fetch_balance.return_value = 12.5
+        self.view.update_balance()
+        self.assertEqual(self.view.balance_label.text(), "Kontostand: 12.50 €")
+
+
+class TestUebersichtDatabase(unittest.TestCase):
+    """Monatssummen und aufgeklappte Monate mit einer echten Datenbank."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        self.db_path = "test_uebersicht_database.db"
+        self.db_manager = DatabaseManager(self.db_path)
+        category_id = self.db_manager.add_category("Lebensmittel", 300)
+        # Auch Daten ohne führende Nullen gehören zu ihrem Monat
+        self.db_manager.add_transaction(
+            {
+                "Transaktion": 7.5,
+                "Name_Transaktion": "Bäcker",
+                "Kategorie_FK": category_id,
+                "Ausgabe_Einnahme": "0",
+                "Datum": "2024-05-3",
+            }
+        )
+        self.db_manager.add_transactions(
+            [
+                (100, "Gehalt", category_id, "1", "2024-5-20"),
+                (12.25, "Markt", category_id, "0", "2024-05-31"),
+                (3, "Kiosk", category_id, "0", "2024-05-03 18:00:00"),
+                (4, "Kaffee", category_id, "0", "2024-05-03"),
+                (9, "April", category_id, "0", "2024-04-30"),
+            ]
+        )
+
+    def tearDown(self):
+        self.db_manager.close()
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(self.db_path + suffix):
+                os.remove(self.db_path + suffix)
+
+    @patch("Features.Übersicht.view.PAGE_SIZE", 2)
+    def test_month_total_matches_paged_rows(self):
+        # Die Summen der Monatszeile stimmen mit den Zeilen aller Seiten überein
+        view = UebersichtView(self.db_manager)
+        model = view.transaction_model
+        if "2024-05" not in model.expanded_months:
+            view.toggle_month("2024-05")
+        while model.canFetchMore():
+            model.fetchMore()
+
+        month, income, expense, _, count = model.index_for_month("2024-05").data(
+            TransactionListModel.MonthRole
+        )
+        rows = [
+            model.index(row).data(TransactionListModel.TransactionRole)
+            for row in range(model.rowCount())
+        ]
+        rows = [trans for trans in rows if trans is not None and trans[5][:7] == month]
+        self.assertEqual(len(rows), count)
+        self.assertAlmostEqual(sum(t[1] for t in rows if t[4] == 1), income)
+        self.assertAlmostEqual(sum(t[1] for t in rows if t[4] != 1), expense)
+        self.assertEqual((count, income, expense), (5, 100.0, 26.75))
+        view.deleteLater()
+
+
 if __name__ == "__main__":
     unittest.main()